@@ -0,0 +1,244 @@
+# coding: utf-8
+
+# asyncio API loading flight files. Files are read and decoded by codec
+# functions running in an executor, records are passed to the event loop
+# by chunks through bounded queues, so a slow consumer stops readers
+# instead of letting decoded records pile up in memory.
+#
+# asyncio has no non-blocking file I/O, so blocking reads are moved out of
+# the event loop instead.
+
+import asyncio
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from registry import CODECS, Codec
+
+
+# Number of records passed to the event loop at once
+CHUNK_SIZE = 1000
+
+# Number of chunks decoded ahead of the consumer
+MAX_CHUNKS = 4
+
+# Number of files read at once by `aload_many()`
+MAX_FILES = 16
+
+
+class Failure:
+    """
+    Exception raised by a producer, passed through a queue to be raised by
+    the consumer.
+
+    """
+    __slots__ = ('exception', )
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+# Marks the end of records in a queue
+DONE = object()
+
+
+def get_codec(codec):
+    if isinstance(codec, Codec):
+        return codec
+
+    try:
+        return CODECS[codec]
+    except KeyError:
+        raise ValueError("Unknown codec '{}'".format(codec))
+
+
+def iter_chunks(items, chunk_size):
+    items = iter(items)
+
+    while True:
+        chunk = list(islice(items, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def produce(iter_load, path, chunk_size, loop, queue, stop):
+    """
+    Put chunks of records of file `path` to asyncio `queue` from another
+    thread, waiting while the queue is full.
+
+    """
+    def put(value):
+        asyncio.run_coroutine_threadsafe(queue.put(value), loop).result()
+
+    try:
+        for chunk in iter_chunks(iter_load(path), chunk_size):
+            if stop.is_set():
+                return
+
+            put(chunk)
+    except Exception as e:
+        if not stop.is_set():
+            put(Failure(e))
+    else:
+        if not stop.is_set():
+            put(DONE)
+
+
+def load_chunks(load, path, chunk_size):
+    return list(iter_chunks(load(path), chunk_size))
+
+
+async def aiter_chunks(
+    path, codec, executor=None, chunk_size=CHUNK_SIZE, max_chunks=MAX_CHUNKS,
+):
+    """
+    Iterate over chunks of records of file `path` encoded by `codec`.
+
+    Records are streamed by `codec.iter_load()` in a thread of `executor`,
+    the default executor of the loop if it is `None`. Process executors
+    can not stream to the loop, the whole file is decoded by `codec.load()`
+    in a worker process then.
+
+    """
+    codec = get_codec(codec)
+    path = str(path)
+    loop = asyncio.get_running_loop()
+
+    if isinstance(executor, ProcessPoolExecutor) or codec.iter_load is None:
+        chunks = await loop.run_in_executor(
+            executor, load_chunks, codec.load, path, chunk_size,
+        )
+
+        for chunk in chunks:
+            yield chunk
+
+        return
+
+    queue = asyncio.Queue(maxsize=max_chunks)
+    stop = threading.Event()
+    producer = loop.run_in_executor(
+        executor, produce,
+        codec.iter_load, path, chunk_size, loop, queue, stop,
+    )
+
+    try:
+        while True:
+            chunk = await queue.get()
+
+            if chunk is DONE:
+                break
+
+            if isinstance(chunk, Failure):
+                raise chunk.exception
+
+            yield chunk
+    finally:
+        # If the consumer stopped early, the producer puts nothing after it
+        # notices the stop. Emptying the queue lets the put it may be
+        # blocked on finish, so it can be joined.
+        stop.set()
+
+        while not queue.empty():
+            queue.get_nowait()
+
+        await producer
+
+
+async def aload(path, codec, **kwargs):
+    """
+    Iterate over records of file `path` encoded by `codec`, a registered
+    `Codec` or its name:
+
+        async for flight in aload(path, codec='json_lines'):
+            ...
+
+    See `aiter_chunks()` for arguments.
+
+    """
+    chunks = aiter_chunks(path, codec, **kwargs)
+
+    try:
+        async for chunk in chunks:
+            for item in chunk:
+                yield item
+    finally:
+        # Join the producer when this iterator is closed early
+        await chunks.aclose()
+
+
+async def aload_many(paths, codec, max_files=MAX_FILES, **kwargs):
+    """
+    Iterate over records of all `paths` reading at most `max_files` of them
+    at once. Records of every file keep their order, records of different
+    files are interleaved by chunks.
+
+    """
+    max_chunks = kwargs.get('max_chunks', MAX_CHUNKS)
+    queue = asyncio.Queue(maxsize=max_chunks)
+    semaphore = asyncio.Semaphore(max_files)
+
+    async def pump(path):
+        async with semaphore:
+            chunks = aiter_chunks(path, codec, **kwargs)
+
+            try:
+                async for chunk in chunks:
+                    await queue.put(chunk)
+            finally:
+                # Join the producer of the file when the pump is cancelled
+                # instead of leaving it to garbage collection
+                await chunks.aclose()
+
+    pumps = [asyncio.ensure_future(pump(path)) for path in paths]
+
+    async def pump_all():
+        try:
+            await asyncio.gather(*pumps)
+        except Exception as e:
+            await queue.put(Failure(e))
+        else:
+            await queue.put(DONE)
+
+    task = asyncio.ensure_future(pump_all())
+
+    try:
+        while True:
+            chunk = await queue.get()
+
+            if chunk is DONE:
+                break
+
+            if isinstance(chunk, Failure):
+                raise chunk.exception
+
+            for item in chunk:
+                yield item
+    finally:
+        # Files still being read are abandoned if one of them failed or
+        # the consumer stopped early
+        for pump_task in pumps:
+            pump_task.cancel()
+
+        task.cancel()
+        await asyncio.gather(task, *pumps, return_exceptions=True)
+
+
+async def acollect(records):
+    return [item async for item in records]
+
+
+def load(path, codec, **kwargs):
+    """
+    Load all records of file `path` through `aload()`, e.g. to benchmark
+    it against blocking loaders.
+
+    """
+    return asyncio.run(acollect(aload(path, codec, **kwargs)))
+
+
+def load_many(paths, codec, **kwargs):
+    return asyncio.run(acollect(aload_many(paths, codec, **kwargs)))
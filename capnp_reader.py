@@ -0,0 +1,95 @@
+# coding: utf-8
+
+# Zero-copy reading of Cap'n Proto flight books. Files are memory-mapped
+# and records are exposed as lazy views, so only fields which are actually
+# accessed are decoded.
+
+import mmap
+
+from collections.abc import Mapping
+from contextlib import contextmanager
+
+from converters import get_capnp_converter
+from schema_cache import get_capnp_schemas
+
+
+TRAVERSAL_LIMIT_IN_WORDS = 2 ** 61
+
+
+class FlightView(Mapping):
+    """
+    Read-only mapping of Flight field names to values of a Cap'n Proto
+    struct. Values are decoded on access and are not cached, Cap'n Proto
+    readers are cheap to access repeatedly.
+
+    Views keep a reference to the buffer their struct is read from, so a
+    memory-mapped file stays mapped while any of its views exists.
+
+    """
+    __slots__ = ('flight', 'converter', 'buf')
+
+    def __init__(self, flight, converter, buf=None):
+        self.flight = flight
+        self.converter = converter
+        self.buf = buf
+
+    def __getitem__(self, name):
+        return self.converter.get_value(self.flight, name)
+
+    def __iter__(self):
+        return iter(self.converter.mapping.names)
+
+    def __len__(self):
+        return len(self.converter.mapping.names)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.to_dict())
+
+    def to_dict(self):
+        return self.converter.from_message(self.flight)
+
+
+def map_file(path):
+    """
+    Map file `path` to memory read-only. The file is unmapped when the
+    returned object is garbage collected.
+
+    """
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@contextmanager
+def open_flight_book(buf, packed=False):
+    """
+    Read flight book from buffer `buf`, e.g. a memory-mapped file.
+
+    Unpacked messages are read in place, without copying. Packed ones have to
+    be unpacked, which makes a copy, but the file still is not read through a
+    file object.
+
+    """
+    schemas = get_capnp_schemas()
+
+    if packed:
+        yield schemas.FlightBook.from_bytes_packed(
+            buf, traversal_limit_in_words=TRAVERSAL_LIMIT_IN_WORDS,
+        )
+    else:
+        with schemas.FlightBook.from_bytes(
+            buf, traversal_limit_in_words=TRAVERSAL_LIMIT_IN_WORDS,
+        ) as flight_book:
+            yield flight_book
+
+
+def iter_views(path, packed=False):
+    """
+    Iterate over lazy views of flights stored in file `path`.
+
+    """
+    converter = get_capnp_converter()
+    buf = map_file(path)
+
+    with open_flight_book(buf, packed=packed) as flight_book:
+        for flight in flight_book.flights:
+            yield FlightView(flight, converter, buf)
@@ -0,0 +1,310 @@
+# coding: utf-8
+
+from collections import OrderedDict
+from itertools import islice
+
+import numpy as np
+
+from schematics.types import FloatType, IntType
+
+from schemas import Flight
+
+
+class NumericColumn:
+    """
+    Column of numbers stored as NumPy array along with mask of nulls.
+
+    """
+    __slots__ = ('values', 'mask')
+
+    def __init__(self, values, mask):
+        self.values = values
+        self.mask = mask
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def from_list(cls, values, dtype):
+        # NaN is treated as null, as pandas does
+        mask = np.fromiter(
+            (x is None or x != x for x in values),
+            dtype=bool, count=len(values),
+        )
+        array = np.fromiter(
+            (0 if is_null else x for x, is_null in zip(values, mask)),
+            dtype=dtype, count=len(values),
+        )
+        return cls(array, mask)
+
+    @classmethod
+    def concatenate(cls, columns):
+        return cls(
+            np.concatenate([x.values for x in columns]),
+            np.concatenate([x.mask for x in columns]),
+        )
+
+    def masked(self):
+        return np.ma.MaskedArray(self.values, mask=self.mask)
+
+    def to_list(self):
+        return [
+            None if is_null else value
+            for value, is_null in zip(self.values.tolist(), self.mask.tolist())
+        ]
+
+
+class DictionaryColumn:
+    """
+    Column of strings stored as array of codes pointing to a list of
+    distinct values. Code -1 stands for null.
+
+    """
+    __slots__ = ('codes', 'categories')
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def mask(self):
+        return self.codes == -1
+
+    @classmethod
+    def from_list(cls, values):
+        index = {}
+        codes = np.fromiter(
+            (
+                -1 if x is None else index.setdefault(x, len(index))
+                for x in values
+            ),
+            dtype=np.int32, count=len(values),
+        )
+        return cls(codes, list(index))
+
+    @classmethod
+    def concatenate(cls, columns):
+        index = {}
+        codes = []
+
+        for column in columns:
+            mapping = np.array(
+                [index.setdefault(x, len(index)) for x in column.categories],
+                dtype=np.int32,
+            )
+            codes.append(
+                np.where(column.codes == -1, -1, mapping[column.codes])
+                if len(mapping) else column.codes
+            )
+
+        return cls(np.concatenate(codes), list(index))
+
+    def decode(self):
+        values = np.array(self.categories + [None], dtype=object)
+        return values[self.codes]
+
+    def to_list(self):
+        return self.decode().tolist()
+
+
+NUMERIC_TYPES = OrderedDict([
+    (IntType, np.int64),
+    (FloatType, np.float64),
+])
+
+
+def get_numeric_dtype(field):
+    for field_type, dtype in NUMERIC_TYPES.items():
+        if isinstance(field, field_type):
+            return dtype
+
+    return None
+
+
+class FlightBatch:
+    """
+    Block of flights stored by columns: NumPy arrays with null masks for
+    numeric fields and dictionary-encoded arrays for string and date ones.
+
+    """
+
+    dtypes = OrderedDict(
+        (name, get_numeric_dtype(field))
+        for name, field in Flight.fields.items()
+    )
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+
+        return 0
+
+    def __getitem__(self, name):
+        column = self.columns[name]
+
+        if isinstance(column, NumericColumn):
+            return column.masked()
+
+        return column.decode()
+
+    @classmethod
+    def from_columns(cls, values):
+        """
+        Build batch from mapping of field names to lists of their values.
+
+        """
+        columns = OrderedDict()
+
+        for name, dtype in cls.dtypes.items():
+            if dtype is None:
+                columns[name] = DictionaryColumn.from_list(values[name])
+            else:
+                columns[name] = NumericColumn.from_list(values[name], dtype)
+
+        return cls(columns)
+
+    @classmethod
+    def from_null_bits(cls, names, columns, nulls):
+        """
+        Build batch from `columns` of values of fields `names`, in the same
+        order, and list of `nulls` of every record: bit N is set if field N
+        is null, its value is ignored then.
+
+        """
+        nulls = np.array(nulls, dtype=np.uint32)
+        values = dict(zip(names, columns))
+        positions = {name: i for i, name in enumerate(names)}
+        columns = OrderedDict()
+
+        for name, dtype in cls.dtypes.items():
+            mask = (nulls >> positions[name]) & 1 == 1
+            column_values = values.get(name, ())
+
+            if dtype is not None:
+                columns[name] = NumericColumn(
+                    np.array(column_values, dtype=dtype), mask,
+                )
+                continue
+
+            if mask.any():
+                column_values = [
+                    None if is_null else x
+                    for x, is_null in zip(column_values, mask.tolist())
+                ]
+
+            columns[name] = DictionaryColumn.from_list(column_values)
+
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, records, chunk_size=2 ** 16):
+        """
+        Build batch from iterable of flight dicts. Records are consumed by
+        chunks, so only `chunk_size` of them are held as Python objects at
+        a time.
+
+        """
+        records = iter(records)
+        batches = []
+
+        while True:
+            chunk = list(islice(records, chunk_size))
+
+            if not chunk:
+                break
+
+            batches.append(cls.from_columns({
+                name: [x.get(name) for x in chunk]
+                for name in cls.dtypes
+            }))
+
+        return cls.concatenate(batches)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        import pandas as pd
+
+        columns = OrderedDict()
+
+        for name, dtype in cls.dtypes.items():
+            series = df[name]
+            mask = series.isna().to_numpy()
+
+            if dtype is None:
+                codes, categories = pd.factorize(series)
+                columns[name] = DictionaryColumn(
+                    codes.astype(np.int32), [str(x) for x in categories],
+                )
+            else:
+                values = series.fillna(0).to_numpy(dtype=dtype)
+                columns[name] = NumericColumn(values, mask)
+
+        return cls(columns)
+
+    @classmethod
+    def concatenate(cls, batches):
+        if not batches:
+            return cls.from_columns({
+                name: []
+                for name in cls.dtypes
+            })
+
+        if len(batches) == 1:
+            return batches[0]
+
+        columns = OrderedDict()
+
+        for name, dtype in cls.dtypes.items():
+            parts = [x.columns[name] for x in batches]
+            column_type = DictionaryColumn if dtype is None else NumericColumn
+            columns[name] = column_type.concatenate(parts)
+
+        return cls(columns)
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        data = OrderedDict()
+
+        for name, column in self.columns.items():
+            if isinstance(column, NumericColumn):
+                if column.values.dtype.kind == 'i':
+                    data[name] = pd.arrays.IntegerArray(
+                        column.values, column.mask,
+                    )
+                else:
+                    data[name] = column.masked().filled(np.nan)
+            else:
+                data[name] = pd.Categorical.from_codes(
+                    column.codes, categories=column.categories,
+                )
+
+        return pd.DataFrame(data)
+
+    def to_columns(self):
+        """
+        Get mapping of field names to lists of their values, e.g. to
+        validate them by `Validator.validate_columns()`.
+
+        """
+        return OrderedDict(
+            (name, column.to_list())
+            for name, column in self.columns.items()
+        )
+
+    def to_records(self):
+        """
+        Iterate over flight dicts, e.g. to pass them to a row-based codec.
+
+        """
+        columns = self.to_columns()
+        names = list(columns)
+
+        for row in zip(*columns.values()):
+            yield dict(zip(names, row))
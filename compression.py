@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# Compression of data files chosen by their suffix, e.g. `data.jl.gz`.
+# Files are compressed and decompressed while they are written and read, so
+# streaming codecs stay streaming.
+
+import io
+
+from collections import OrderedDict
+from pathlib import Path
+
+
+# Names of compressions and suffixes of their files. zstd and lz4 need
+# `zstandard` and `lz4` packages, other ones are in the standard library.
+COMPRESSIONS = OrderedDict([
+    ('gzip', '.gz'),
+    ('bz2', '.bz2'),
+    ('xz', '.xz'),
+    ('zstd', '.zst'),
+    ('lz4', '.lz4'),
+])
+
+
+def open_gzip(path, mode):
+    import gzip
+    return gzip.open(path, mode)
+
+
+def open_bz2(path, mode):
+    import bz2
+    return bz2.open(path, mode)
+
+
+def open_xz(path, mode):
+    import lzma
+    return lzma.open(path, mode)
+
+
+def open_zstd(path, mode):
+    import zstandard
+
+    f = zstandard.open(path, mode.replace('t', ''))
+
+    if 't' in mode:
+        return io.TextIOWrapper(f)
+
+    return f
+
+
+def open_lz4(path, mode):
+    import lz4.frame
+    return lz4.frame.open(path, mode)
+
+
+OPENERS = {
+    'gzip': open_gzip,
+    'bz2': open_bz2,
+    'xz': open_xz,
+    'zstd': open_zstd,
+    'lz4': open_lz4,
+}
+
+
+def get_compression(path):
+    """
+    Get name of compression of file `path` or `None` for plain files.
+    Suffix of compression does not have to be the last one, so temporary
+    files like `data.jl.gz.1234` are recognized too.
+
+    """
+    suffixes = Path(path).suffixes
+
+    for name, suffix in COMPRESSIONS.items():
+        if suffix in suffixes:
+            return name
+
+    return None
+
+
+def is_available(name):
+    module_names = {
+        'zstd': 'zstandard',
+        'lz4': 'lz4.frame',
+    }
+
+    try:
+        __import__(module_names.get(name, 'zlib'))
+    except ImportError:
+        return False
+
+    return True
+
+
+def get_available():
+    return [name for name in COMPRESSIONS if is_available(name)]
+
+
+def open_file(path, mode='r', buffering=-1):
+    """
+    Open file `path` like `open()`, compressing or decompressing it if its
+    name has a suffix of compression.
+
+    Compressed files buffer data in their compressors, so `buffering` is
+    used for plain files only.
+
+    """
+    compression = get_compression(path)
+
+    if compression is None:
+        return open(path, mode, buffering=buffering)
+
+    if 'b' not in mode and 't' not in mode:
+        mode += 't'
+
+    return OPENERS[compression](str(path), mode)
@@ -0,0 +1,303 @@
+# coding: utf-8
+
+from functools import lru_cache
+from operator import attrgetter
+
+from fields import FIELD_NAMES, check_names, get_capnp_mapping
+
+
+def make_protobuf_assigner(field):
+    """
+    Make function setting value of a single protobuf field. Values are
+    coerced to the type of the field only when needed, e.g. integers
+    decoded by pandas as floats because of nulls in their column.
+
+    """
+    from google.protobuf.descriptor import FieldDescriptor
+
+    name = field.name
+
+    if field.cpp_type in (
+        FieldDescriptor.CPPTYPE_INT32, FieldDescriptor.CPPTYPE_INT64,
+        FieldDescriptor.CPPTYPE_UINT32, FieldDescriptor.CPPTYPE_UINT64,
+    ):
+        def assign(message, value):
+            if type(value) is not int:
+                value = int(value)
+            setattr(message, name, value)
+
+    elif field.cpp_type == FieldDescriptor.CPPTYPE_STRING:
+        def assign(message, value):
+            if type(value) is not str:
+                value = str(value)
+            setattr(message, name, value)
+
+    else:
+        # Floats and other fields take values as they are
+        def assign(message, value):
+            setattr(message, name, value)
+
+    return assign
+
+
+class ProtobufConverter:
+    """
+    Converter between flight dicts and protobuf messages built once from
+    message descriptor.
+
+    Unset optional fields are decoded as `None` instead of proto2 defaults
+    (0, ''), so decoding is the exact reverse of encoding, which skips
+    `None` values.
+
+    """
+
+    def __init__(self, message_class, names=FIELD_NAMES):
+        descriptor = message_class.DESCRIPTOR
+        check_names(descriptor.fields_by_name, names, 'protobuf')
+
+        self.message_class = message_class
+        self.assigners = {
+            name: make_protobuf_assigner(descriptor.fields_by_name[name])
+            for name in names
+        }
+        self.names = {
+            descriptor.fields_by_name[name]: name
+            for name in names
+        }
+        self.empty = dict.fromkeys(names)
+        self.positions = {
+            descriptor.fields_by_name[name]: i
+            for i, name in enumerate(names)
+        }
+        self.nulls = [None] * len(names)
+
+    def fill_message(self, message, item):
+        assigners = self.assigners
+
+        for key, value in item.items():
+            if value is not None:
+                assigners[key](message, value)
+
+        return message
+
+    def to_message(self, item):
+        return self.fill_message(self.message_class(), item)
+
+    def from_message(self, message):
+        result = self.empty.copy()
+        names = self.names
+
+        # Only fields which are set are listed, so there is no need to call
+        # HasField() for each of them
+        for field, value in message.ListFields():
+            result[names[field]] = value
+
+        return result
+
+    def get_values(self, message):
+        """
+        Get list of values of all fields of `message` in order of names.
+
+        """
+        result = self.nulls.copy()
+        positions = self.positions
+
+        for field, value in message.ListFields():
+            result[positions[field]] = value
+
+        return result
+
+    def make_reader(self, columns):
+        """
+        Make function converting message to dict of fields `columns` only.
+
+        """
+        columns = tuple(columns)
+
+        def read(message):
+            has_field = message.HasField
+            return {
+                name: getattr(message, name) if has_field(name) else None
+                for name in columns
+            }
+
+        return read
+
+    def to_messages(self, items, container):
+        """
+        Add messages built from `items` to repeated field `container`.
+
+        """
+        add = container.add
+
+        for item in items:
+            self.fill_message(add(), item)
+
+        return container
+
+    def from_messages(self, messages):
+        from_message = self.from_message
+        return [from_message(x) for x in messages]
+
+
+CAPNP_INTEGER_TYPES = frozenset([
+    'int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64',
+])
+CAPNP_FLOAT_TYPES = frozenset(['float32', 'float64'])
+
+
+def make_capnp_setter(name, type_name):
+    """
+    Make function setting value of a single Cap'n Proto field, coercing
+    values to the type of the field only when needed.
+
+    """
+    if type_name in CAPNP_INTEGER_TYPES:
+        def assign(flight, value):
+            if type(value) is not int:
+                value = int(value)
+            setattr(flight, name, value)
+
+    elif type_name in CAPNP_FLOAT_TYPES:
+        def assign(flight, value):
+            setattr(flight, name, value)
+
+    elif type_name == 'text':
+        def assign(flight, value):
+            if type(value) is not str:
+                value = str(value)
+            setattr(flight, name, value)
+
+    else:
+        def assign(flight, value):
+            setattr(flight, name, value)
+
+    return assign
+
+
+class CapnpConverter:
+    """
+    Converter between flight dicts and Cap'n Proto structs built once from
+    struct schema.
+
+    Nulls are stored as bits of `nulls_field` with bit N standing for field
+    N of `mapping`. Null fields keep their default values, so encoding never
+    needs to guess which placeholder a field can hold and decoding does not
+    compare values with placeholders.
+
+    """
+
+    def __init__(self, struct, mapping, nulls_field='nullFields'):
+        fields = struct.schema.fields
+
+        if len(mapping.names) > 32:
+            raise ValueError("Only 32 nullable fields are supported")
+
+        self.mapping = mapping
+        self.nulls_field = nulls_field
+        self.setters = {
+            name: make_capnp_setter(
+                foreign_name,
+                str(fields[foreign_name].proto.slot.type.which),
+            )
+            for name, foreign_name in mapping.to_foreign.items()
+        }
+        self.bits = {
+            name: 1 << i
+            for i, name in enumerate(mapping.names)
+        }
+        self.names_by_bit = {
+            bit: name
+            for name, bit in self.bits.items()
+        }
+        self.get_nulls = attrgetter(nulls_field)
+
+    def fill_message(self, flight, item):
+        setters = self.setters
+        bits = self.bits
+        nulls = 0
+
+        for key, value in item.items():
+            if value is None:
+                nulls |= bits[key]
+            else:
+                setters[key](flight, value)
+
+        if nulls:
+            setattr(flight, self.nulls_field, nulls)
+
+        return flight
+
+    def from_message(self, flight):
+        result = self.mapping.get_fields(flight)
+        nulls = self.get_nulls(flight)
+
+        # Visit only set bits: `nulls & -nulls` is the lowest of them
+        while nulls:
+            bit = nulls & -nulls
+            result[self.names_by_bit[bit]] = None
+            nulls ^= bit
+
+        return result
+
+    def get_values(self, flight):
+        """
+        Get list of values of all fields of `flight` in order of names.
+
+        """
+        result = list(self.mapping.get_values(flight))
+        nulls = self.get_nulls(flight)
+
+        while nulls:
+            bit = nulls & -nulls
+            result[bit.bit_length() - 1] = None
+            nulls ^= bit
+
+        return result
+
+    def get_value(self, flight, name):
+        if self.get_nulls(flight) & self.bits[name]:
+            return None
+
+        return self.mapping.getters[name](flight)
+
+    def make_getter(self, name):
+        """
+        Make function getting value of field `name` of a single flight.
+
+        """
+        bit = self.bits[name]
+        get_value = self.mapping.getters[name]
+        get_nulls = self.get_nulls
+
+        def get(flight):
+            return None if get_nulls(flight) & bit else get_value(flight)
+
+        return get
+
+    def make_reader(self, columns):
+        """
+        Make function converting struct to dict of fields `columns` only.
+
+        """
+        getters = [(name, self.make_getter(name)) for name in columns]
+
+        def read(flight):
+            return {
+                name: get_value(flight)
+                for name, get_value in getters
+            }
+
+        return read
+
+
+@lru_cache(maxsize=None)
+def get_capnp_converter():
+    from schema_cache import get_capnp_schemas
+    return CapnpConverter(get_capnp_schemas().Flight, get_capnp_mapping())
+
+
+@lru_cache(maxsize=None)
+def get_protobuf_converter():
+    import schemas_pb2
+    return ProtobufConverter(schemas_pb2.Flight)
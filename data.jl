@@ -0,0 +1,300 @@
+{"FL_DATE":"2017-01-05","AIRLINE_ID":9326,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":1932,"ORIGIN_AIRPORT_ID":8118,"ORIGIN_AIRPORT_SEQ_ID":7365,"ORIGIN_CITY_MARKET_ID":7738,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1538,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":465,"DEST_AIRPORT_ID":6387,"DEST_AIRPORT_SEQ_ID":7091,"DEST_CITY_MARKET_ID":9953,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4364,"DEST_STATE_NM":"UA","DEST_WAC":3749,"DEP_DELAY":6.0,"TAXI_OUT":-13.0,"WHEELS_OFF":NaN,"WHEELS_ON":-18.0,"TAXI_IN":77.0,"ARR_DELAY":88.0,"AIR_TIME":115.0,"DISTANCE":92.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":9059,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":3783,"ORIGIN_AIRPORT_ID":3585,"ORIGIN_AIRPORT_SEQ_ID":7531,"ORIGIN_CITY_MARKET_ID":4748,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1639,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4857,"DEST_AIRPORT_ID":1981,"DEST_AIRPORT_SEQ_ID":5451,"DEST_CITY_MARKET_ID":8206,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3111,"DEST_STATE_NM":"DL","DEST_WAC":4656,"DEP_DELAY":107.0,"TAXI_OUT":109.0,"WHEELS_OFF":198.0,"WHEELS_ON":NaN,"TAXI_IN":184.0,"ARR_DELAY":150.0,"AIR_TIME":120.0,"DISTANCE":178.0}
+{"FL_DATE":"2017-01-22","AIRLINE_ID":6140,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":8331,"ORIGIN_AIRPORT_ID":1769,"ORIGIN_AIRPORT_SEQ_ID":2683,"ORIGIN_CITY_MARKET_ID":8536,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":485,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":713,"DEST_AIRPORT_ID":5055,"DEST_AIRPORT_SEQ_ID":9719,"DEST_CITY_MARKET_ID":9473,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2763,"DEST_STATE_NM":"UA","DEST_WAC":3719,"DEP_DELAY":177.0,"TAXI_OUT":200.0,"WHEELS_OFF":83.0,"WHEELS_ON":196.0,"TAXI_IN":97.0,"ARR_DELAY":148.0,"AIR_TIME":166.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":8397,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":9198,"ORIGIN_AIRPORT_ID":3367,"ORIGIN_AIRPORT_SEQ_ID":6982,"ORIGIN_CITY_MARKET_ID":920,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9084,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8270,"DEST_AIRPORT_ID":6774,"DEST_AIRPORT_SEQ_ID":7946,"DEST_CITY_MARKET_ID":5846,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8823,"DEST_STATE_NM":"UA","DEST_WAC":5426,"DEP_DELAY":-13.0,"TAXI_OUT":142.0,"WHEELS_OFF":129.0,"WHEELS_ON":3.0,"TAXI_IN":184.0,"ARR_DELAY":45.0,"AIR_TIME":NaN,"DISTANCE":-2.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":274,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":4608,"ORIGIN_AIRPORT_ID":4089,"ORIGIN_AIRPORT_SEQ_ID":4402,"ORIGIN_CITY_MARKET_ID":1794,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4757,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2744,"DEST_AIRPORT_ID":2616,"DEST_AIRPORT_SEQ_ID":4182,"DEST_CITY_MARKET_ID":8641,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4825,"DEST_STATE_NM":"DL","DEST_WAC":5276,"DEP_DELAY":9.0,"TAXI_OUT":NaN,"WHEELS_OFF":87.0,"WHEELS_ON":46.0,"TAXI_IN":166.0,"ARR_DELAY":33.0,"AIR_TIME":90.0,"DISTANCE":-15.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":293,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":579,"ORIGIN_AIRPORT_ID":2626,"ORIGIN_AIRPORT_SEQ_ID":7302,"ORIGIN_CITY_MARKET_ID":8296,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3615,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8464,"DEST_AIRPORT_ID":7387,"DEST_AIRPORT_SEQ_ID":3657,"DEST_CITY_MARKET_ID":8584,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9435,"DEST_STATE_NM":"DL","DEST_WAC":6985,"DEP_DELAY":NaN,"TAXI_OUT":34.0,"WHEELS_OFF":58.0,"WHEELS_ON":NaN,"TAXI_IN":NaN,"ARR_DELAY":56.0,"AIR_TIME":86.0,"DISTANCE":13.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":9187,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":3566,"ORIGIN_AIRPORT_ID":9344,"ORIGIN_AIRPORT_SEQ_ID":7551,"ORIGIN_CITY_MARKET_ID":2811,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":614,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3284,"DEST_AIRPORT_ID":5685,"DEST_AIRPORT_SEQ_ID":1623,"DEST_CITY_MARKET_ID":3372,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9690,"DEST_STATE_NM":"AA","DEST_WAC":8067,"DEP_DELAY":150.0,"TAXI_OUT":109.0,"WHEELS_OFF":63.0,"WHEELS_ON":82.0,"TAXI_IN":-16.0,"ARR_DELAY":199.0,"AIR_TIME":124.0,"DISTANCE":66.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":3491,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":1580,"ORIGIN_AIRPORT_ID":6214,"ORIGIN_AIRPORT_SEQ_ID":8973,"ORIGIN_CITY_MARKET_ID":5634,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8725,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1071,"DEST_AIRPORT_ID":662,"DEST_AIRPORT_SEQ_ID":1388,"DEST_CITY_MARKET_ID":2180,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3490,"DEST_STATE_NM":"DL","DEST_WAC":5444,"DEP_DELAY":195.0,"TAXI_OUT":66.0,"WHEELS_OFF":54.0,"WHEELS_ON":134.0,"TAXI_IN":163.0,"ARR_DELAY":14.0,"AIR_TIME":177.0,"DISTANCE":-10.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":1200,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":2049,"ORIGIN_AIRPORT_ID":5586,"ORIGIN_AIRPORT_SEQ_ID":1880,"ORIGIN_CITY_MARKET_ID":9625,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9016,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9273,"DEST_AIRPORT_ID":1340,"DEST_AIRPORT_SEQ_ID":4371,"DEST_CITY_MARKET_ID":5979,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1873,"DEST_STATE_NM":"DL","DEST_WAC":4542,"DEP_DELAY":-9.0,"TAXI_OUT":-17.0,"WHEELS_OFF":-17.0,"WHEELS_ON":NaN,"TAXI_IN":182.0,"ARR_DELAY":NaN,"AIR_TIME":130.0,"DISTANCE":9.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":2743,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":2605,"ORIGIN_AIRPORT_ID":1685,"ORIGIN_AIRPORT_SEQ_ID":7129,"ORIGIN_CITY_MARKET_ID":6198,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4152,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7816,"DEST_AIRPORT_ID":5153,"DEST_AIRPORT_SEQ_ID":1641,"DEST_CITY_MARKET_ID":3402,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":447,"DEST_STATE_NM":"AA","DEST_WAC":4843,"DEP_DELAY":61.0,"TAXI_OUT":60.0,"WHEELS_OFF":-4.0,"WHEELS_ON":133.0,"TAXI_IN":8.0,"ARR_DELAY":180.0,"AIR_TIME":118.0,"DISTANCE":100.0}
+{"FL_DATE":"2017-01-22","AIRLINE_ID":5830,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":8874,"ORIGIN_AIRPORT_ID":3406,"ORIGIN_AIRPORT_SEQ_ID":5036,"ORIGIN_CITY_MARKET_ID":3264,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4601,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7339,"DEST_AIRPORT_ID":1483,"DEST_AIRPORT_SEQ_ID":9411,"DEST_CITY_MARKET_ID":5553,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":673,"DEST_STATE_NM":"DL","DEST_WAC":3061,"DEP_DELAY":196.0,"TAXI_OUT":57.0,"WHEELS_OFF":5.0,"WHEELS_ON":128.0,"TAXI_IN":3.0,"ARR_DELAY":-15.0,"AIR_TIME":82.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":1162,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":353,"ORIGIN_AIRPORT_ID":163,"ORIGIN_AIRPORT_SEQ_ID":4765,"ORIGIN_CITY_MARKET_ID":5885,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1654,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5376,"DEST_AIRPORT_ID":1264,"DEST_AIRPORT_SEQ_ID":8344,"DEST_CITY_MARKET_ID":2839,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5240,"DEST_STATE_NM":"DL","DEST_WAC":1752,"DEP_DELAY":193.0,"TAXI_OUT":55.0,"WHEELS_OFF":32.0,"WHEELS_ON":164.0,"TAXI_IN":NaN,"ARR_DELAY":139.0,"AIR_TIME":121.0,"DISTANCE":171.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":3366,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":7089,"ORIGIN_AIRPORT_ID":8807,"ORIGIN_AIRPORT_SEQ_ID":2587,"ORIGIN_CITY_MARKET_ID":796,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4139,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7319,"DEST_AIRPORT_ID":7048,"DEST_AIRPORT_SEQ_ID":9000,"DEST_CITY_MARKET_ID":4100,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7428,"DEST_STATE_NM":"AA","DEST_WAC":6484,"DEP_DELAY":23.0,"TAXI_OUT":-14.0,"WHEELS_OFF":86.0,"WHEELS_ON":-16.0,"TAXI_IN":NaN,"ARR_DELAY":15.0,"AIR_TIME":15.0,"DISTANCE":192.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":6518,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":2821,"ORIGIN_AIRPORT_ID":1463,"ORIGIN_AIRPORT_SEQ_ID":3827,"ORIGIN_CITY_MARKET_ID":7963,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5198,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7182,"DEST_AIRPORT_ID":3699,"DEST_AIRPORT_SEQ_ID":3906,"DEST_CITY_MARKET_ID":5128,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3688,"DEST_STATE_NM":"UA","DEST_WAC":6755,"DEP_DELAY":136.0,"TAXI_OUT":147.0,"WHEELS_OFF":145.0,"WHEELS_ON":-2.0,"TAXI_IN":145.0,"ARR_DELAY":20.0,"AIR_TIME":182.0,"DISTANCE":59.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":4909,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":2707,"ORIGIN_AIRPORT_ID":7615,"ORIGIN_AIRPORT_SEQ_ID":9742,"ORIGIN_CITY_MARKET_ID":1393,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9360,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2889,"DEST_AIRPORT_ID":2553,"DEST_AIRPORT_SEQ_ID":4106,"DEST_CITY_MARKET_ID":6992,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":855,"DEST_STATE_NM":"DL","DEST_WAC":6449,"DEP_DELAY":69.0,"TAXI_OUT":196.0,"WHEELS_OFF":166.0,"WHEELS_ON":114.0,"TAXI_IN":186.0,"ARR_DELAY":5.0,"AIR_TIME":1.0,"DISTANCE":15.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":1344,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":6265,"ORIGIN_AIRPORT_ID":7093,"ORIGIN_AIRPORT_SEQ_ID":6509,"ORIGIN_CITY_MARKET_ID":2700,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7995,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1953,"DEST_AIRPORT_ID":7066,"DEST_AIRPORT_SEQ_ID":9842,"DEST_CITY_MARKET_ID":8750,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4842,"DEST_STATE_NM":"DL","DEST_WAC":4067,"DEP_DELAY":123.0,"TAXI_OUT":NaN,"WHEELS_OFF":92.0,"WHEELS_ON":-13.0,"TAXI_IN":135.0,"ARR_DELAY":46.0,"AIR_TIME":52.0,"DISTANCE":31.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":5098,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":7314,"ORIGIN_AIRPORT_ID":2753,"ORIGIN_AIRPORT_SEQ_ID":8936,"ORIGIN_CITY_MARKET_ID":5849,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3424,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6280,"DEST_AIRPORT_ID":3356,"DEST_AIRPORT_SEQ_ID":4654,"DEST_CITY_MARKET_ID":1772,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":217,"DEST_STATE_NM":"UA","DEST_WAC":4857,"DEP_DELAY":174.0,"TAXI_OUT":146.0,"WHEELS_OFF":108.0,"WHEELS_ON":186.0,"TAXI_IN":108.0,"ARR_DELAY":174.0,"AIR_TIME":-20.0,"DISTANCE":163.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":5738,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":6544,"ORIGIN_AIRPORT_ID":5561,"ORIGIN_AIRPORT_SEQ_ID":9363,"ORIGIN_CITY_MARKET_ID":8066,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6266,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9125,"DEST_AIRPORT_ID":64,"DEST_AIRPORT_SEQ_ID":4549,"DEST_CITY_MARKET_ID":9801,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8372,"DEST_STATE_NM":"AA","DEST_WAC":7563,"DEP_DELAY":112.0,"TAXI_OUT":170.0,"WHEELS_OFF":58.0,"WHEELS_ON":95.0,"TAXI_IN":115.0,"ARR_DELAY":114.0,"AIR_TIME":NaN,"DISTANCE":89.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":5506,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":1110,"ORIGIN_AIRPORT_ID":8073,"ORIGIN_AIRPORT_SEQ_ID":4058,"ORIGIN_CITY_MARKET_ID":4766,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2558,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6510,"DEST_AIRPORT_ID":4428,"DEST_AIRPORT_SEQ_ID":2919,"DEST_CITY_MARKET_ID":1203,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4335,"DEST_STATE_NM":"UA","DEST_WAC":6737,"DEP_DELAY":119.0,"TAXI_OUT":98.0,"WHEELS_OFF":104.0,"WHEELS_ON":110.0,"TAXI_IN":NaN,"ARR_DELAY":170.0,"AIR_TIME":-3.0,"DISTANCE":148.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":324,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":2649,"ORIGIN_AIRPORT_ID":1525,"ORIGIN_AIRPORT_SEQ_ID":6586,"ORIGIN_CITY_MARKET_ID":4519,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8653,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3887,"DEST_AIRPORT_ID":5472,"DEST_AIRPORT_SEQ_ID":4409,"DEST_CITY_MARKET_ID":1124,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6033,"DEST_STATE_NM":"DL","DEST_WAC":8381,"DEP_DELAY":-8.0,"TAXI_OUT":147.0,"WHEELS_OFF":188.0,"WHEELS_ON":71.0,"TAXI_IN":39.0,"ARR_DELAY":82.0,"AIR_TIME":182.0,"DISTANCE":136.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":3643,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":4002,"ORIGIN_AIRPORT_ID":501,"ORIGIN_AIRPORT_SEQ_ID":6597,"ORIGIN_CITY_MARKET_ID":5187,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3112,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2714,"DEST_AIRPORT_ID":9489,"DEST_AIRPORT_SEQ_ID":7268,"DEST_CITY_MARKET_ID":9527,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4293,"DEST_STATE_NM":"DL","DEST_WAC":8628,"DEP_DELAY":179.0,"TAXI_OUT":163.0,"WHEELS_OFF":59.0,"WHEELS_ON":41.0,"TAXI_IN":32.0,"ARR_DELAY":58.0,"AIR_TIME":NaN,"DISTANCE":62.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":1638,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":907,"ORIGIN_AIRPORT_ID":9790,"ORIGIN_AIRPORT_SEQ_ID":382,"ORIGIN_CITY_MARKET_ID":3549,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8660,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7247,"DEST_AIRPORT_ID":5611,"DEST_AIRPORT_SEQ_ID":4499,"DEST_CITY_MARKET_ID":1935,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1561,"DEST_STATE_NM":"AA","DEST_WAC":6549,"DEP_DELAY":95.0,"TAXI_OUT":23.0,"WHEELS_OFF":40.0,"WHEELS_ON":98.0,"TAXI_IN":79.0,"ARR_DELAY":163.0,"AIR_TIME":107.0,"DISTANCE":34.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":758,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":7871,"ORIGIN_AIRPORT_ID":5236,"ORIGIN_AIRPORT_SEQ_ID":6278,"ORIGIN_CITY_MARKET_ID":9507,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2623,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":2495,"DEST_AIRPORT_ID":500,"DEST_AIRPORT_SEQ_ID":249,"DEST_CITY_MARKET_ID":6346,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":936,"DEST_STATE_NM":"UA","DEST_WAC":6218,"DEP_DELAY":0.0,"TAXI_OUT":195.0,"WHEELS_OFF":-17.0,"WHEELS_ON":NaN,"TAXI_IN":NaN,"ARR_DELAY":-10.0,"AIR_TIME":179.0,"DISTANCE":3.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":453,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":2136,"ORIGIN_AIRPORT_ID":4576,"ORIGIN_AIRPORT_SEQ_ID":3145,"ORIGIN_CITY_MARKET_ID":7333,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4391,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3983,"DEST_AIRPORT_ID":4022,"DEST_AIRPORT_SEQ_ID":987,"DEST_CITY_MARKET_ID":9633,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7021,"DEST_STATE_NM":"UA","DEST_WAC":9180,"DEP_DELAY":-5.0,"TAXI_OUT":120.0,"WHEELS_OFF":31.0,"WHEELS_ON":117.0,"TAXI_IN":149.0,"ARR_DELAY":NaN,"AIR_TIME":136.0,"DISTANCE":172.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":4122,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":2475,"ORIGIN_AIRPORT_ID":962,"ORIGIN_AIRPORT_SEQ_ID":3332,"ORIGIN_CITY_MARKET_ID":7015,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1495,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7687,"DEST_AIRPORT_ID":8211,"DEST_AIRPORT_SEQ_ID":6067,"DEST_CITY_MARKET_ID":1627,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8708,"DEST_STATE_NM":"AA","DEST_WAC":7264,"DEP_DELAY":81.0,"TAXI_OUT":94.0,"WHEELS_OFF":NaN,"WHEELS_ON":3.0,"TAXI_IN":63.0,"ARR_DELAY":NaN,"AIR_TIME":NaN,"DISTANCE":167.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":5132,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4265,"ORIGIN_AIRPORT_ID":6229,"ORIGIN_AIRPORT_SEQ_ID":1920,"ORIGIN_CITY_MARKET_ID":4977,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8237,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3366,"DEST_AIRPORT_ID":5409,"DEST_AIRPORT_SEQ_ID":5549,"DEST_CITY_MARKET_ID":8345,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1716,"DEST_STATE_NM":"AA","DEST_WAC":7351,"DEP_DELAY":123.0,"TAXI_OUT":193.0,"WHEELS_OFF":113.0,"WHEELS_ON":192.0,"TAXI_IN":170.0,"ARR_DELAY":74.0,"AIR_TIME":63.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":2071,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":714,"ORIGIN_AIRPORT_ID":4924,"ORIGIN_AIRPORT_SEQ_ID":8744,"ORIGIN_CITY_MARKET_ID":5139,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5778,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5330,"DEST_AIRPORT_ID":8522,"DEST_AIRPORT_SEQ_ID":8210,"DEST_CITY_MARKET_ID":142,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5196,"DEST_STATE_NM":"UA","DEST_WAC":5335,"DEP_DELAY":126.0,"TAXI_OUT":NaN,"WHEELS_OFF":102.0,"WHEELS_ON":73.0,"TAXI_IN":77.0,"ARR_DELAY":0.0,"AIR_TIME":185.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":8581,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":4128,"ORIGIN_AIRPORT_ID":4021,"ORIGIN_AIRPORT_SEQ_ID":9401,"ORIGIN_CITY_MARKET_ID":5549,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6596,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7612,"DEST_AIRPORT_ID":9802,"DEST_AIRPORT_SEQ_ID":5578,"DEST_CITY_MARKET_ID":8719,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2431,"DEST_STATE_NM":"DL","DEST_WAC":3624,"DEP_DELAY":8.0,"TAXI_OUT":85.0,"WHEELS_OFF":138.0,"WHEELS_ON":NaN,"TAXI_IN":NaN,"ARR_DELAY":48.0,"AIR_TIME":32.0,"DISTANCE":141.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":8625,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":1193,"ORIGIN_AIRPORT_ID":3562,"ORIGIN_AIRPORT_SEQ_ID":2841,"ORIGIN_CITY_MARKET_ID":8381,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6032,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4649,"DEST_AIRPORT_ID":3604,"DEST_AIRPORT_SEQ_ID":3284,"DEST_CITY_MARKET_ID":9799,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7409,"DEST_STATE_NM":"UA","DEST_WAC":6016,"DEP_DELAY":28.0,"TAXI_OUT":165.0,"WHEELS_OFF":NaN,"WHEELS_ON":45.0,"TAXI_IN":-18.0,"ARR_DELAY":177.0,"AIR_TIME":104.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":8357,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":6973,"ORIGIN_AIRPORT_ID":658,"ORIGIN_AIRPORT_SEQ_ID":5765,"ORIGIN_CITY_MARKET_ID":7512,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":91,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1967,"DEST_AIRPORT_ID":4959,"DEST_AIRPORT_SEQ_ID":8397,"DEST_CITY_MARKET_ID":5171,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9034,"DEST_STATE_NM":"DL","DEST_WAC":8612,"DEP_DELAY":189.0,"TAXI_OUT":112.0,"WHEELS_OFF":141.0,"WHEELS_ON":95.0,"TAXI_IN":109.0,"ARR_DELAY":15.0,"AIR_TIME":21.0,"DISTANCE":-18.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":9272,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":6896,"ORIGIN_AIRPORT_ID":6589,"ORIGIN_AIRPORT_SEQ_ID":4613,"ORIGIN_CITY_MARKET_ID":301,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6282,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7609,"DEST_AIRPORT_ID":4456,"DEST_AIRPORT_SEQ_ID":6106,"DEST_CITY_MARKET_ID":7888,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1909,"DEST_STATE_NM":"DL","DEST_WAC":5809,"DEP_DELAY":17.0,"TAXI_OUT":NaN,"WHEELS_OFF":46.0,"WHEELS_ON":12.0,"TAXI_IN":53.0,"ARR_DELAY":85.0,"AIR_TIME":111.0,"DISTANCE":87.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":4484,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":7960,"ORIGIN_AIRPORT_ID":3531,"ORIGIN_AIRPORT_SEQ_ID":8051,"ORIGIN_CITY_MARKET_ID":6585,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1056,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3378,"DEST_AIRPORT_ID":2452,"DEST_AIRPORT_SEQ_ID":3756,"DEST_CITY_MARKET_ID":429,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7861,"DEST_STATE_NM":"AA","DEST_WAC":6540,"DEP_DELAY":27.0,"TAXI_OUT":2.0,"WHEELS_OFF":-7.0,"WHEELS_ON":116.0,"TAXI_IN":-8.0,"ARR_DELAY":6.0,"AIR_TIME":153.0,"DISTANCE":151.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":1944,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":4568,"ORIGIN_AIRPORT_ID":2934,"ORIGIN_AIRPORT_SEQ_ID":7860,"ORIGIN_CITY_MARKET_ID":782,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1429,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2029,"DEST_AIRPORT_ID":7329,"DEST_AIRPORT_SEQ_ID":4821,"DEST_CITY_MARKET_ID":8321,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9931,"DEST_STATE_NM":"DL","DEST_WAC":1734,"DEP_DELAY":137.0,"TAXI_OUT":31.0,"WHEELS_OFF":45.0,"WHEELS_ON":117.0,"TAXI_IN":106.0,"ARR_DELAY":187.0,"AIR_TIME":34.0,"DISTANCE":139.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":7963,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":5684,"ORIGIN_AIRPORT_ID":4384,"ORIGIN_AIRPORT_SEQ_ID":925,"ORIGIN_CITY_MARKET_ID":8857,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1651,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8324,"DEST_AIRPORT_ID":4499,"DEST_AIRPORT_SEQ_ID":4430,"DEST_CITY_MARKET_ID":4037,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4200,"DEST_STATE_NM":"AA","DEST_WAC":6681,"DEP_DELAY":133.0,"TAXI_OUT":-6.0,"WHEELS_OFF":135.0,"WHEELS_ON":85.0,"TAXI_IN":102.0,"ARR_DELAY":48.0,"AIR_TIME":107.0,"DISTANCE":100.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":5545,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":2969,"ORIGIN_AIRPORT_ID":9512,"ORIGIN_AIRPORT_SEQ_ID":7392,"ORIGIN_CITY_MARKET_ID":8762,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5342,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":2213,"DEST_AIRPORT_ID":3493,"DEST_AIRPORT_SEQ_ID":5167,"DEST_CITY_MARKET_ID":8090,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2096,"DEST_STATE_NM":"AA","DEST_WAC":4202,"DEP_DELAY":142.0,"TAXI_OUT":159.0,"WHEELS_OFF":NaN,"WHEELS_ON":9.0,"TAXI_IN":31.0,"ARR_DELAY":148.0,"AIR_TIME":88.0,"DISTANCE":178.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":5003,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":1386,"ORIGIN_AIRPORT_ID":3679,"ORIGIN_AIRPORT_SEQ_ID":4591,"ORIGIN_CITY_MARKET_ID":5589,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8494,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":379,"DEST_AIRPORT_ID":1994,"DEST_AIRPORT_SEQ_ID":5405,"DEST_CITY_MARKET_ID":5686,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2348,"DEST_STATE_NM":"UA","DEST_WAC":9405,"DEP_DELAY":NaN,"TAXI_OUT":NaN,"WHEELS_OFF":6.0,"WHEELS_ON":43.0,"TAXI_IN":-8.0,"ARR_DELAY":0.0,"AIR_TIME":82.0,"DISTANCE":164.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":3966,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":5388,"ORIGIN_AIRPORT_ID":4484,"ORIGIN_AIRPORT_SEQ_ID":131,"ORIGIN_CITY_MARKET_ID":8442,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2063,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":4442,"DEST_AIRPORT_ID":6639,"DEST_AIRPORT_SEQ_ID":1493,"DEST_CITY_MARKET_ID":9448,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7792,"DEST_STATE_NM":"UA","DEST_WAC":6861,"DEP_DELAY":80.0,"TAXI_OUT":36.0,"WHEELS_OFF":120.0,"WHEELS_ON":133.0,"TAXI_IN":24.0,"ARR_DELAY":91.0,"AIR_TIME":-15.0,"DISTANCE":49.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":4289,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":6608,"ORIGIN_AIRPORT_ID":1700,"ORIGIN_AIRPORT_SEQ_ID":6120,"ORIGIN_CITY_MARKET_ID":1132,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8926,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8313,"DEST_AIRPORT_ID":9517,"DEST_AIRPORT_SEQ_ID":499,"DEST_CITY_MARKET_ID":5049,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2553,"DEST_STATE_NM":"AA","DEST_WAC":9491,"DEP_DELAY":191.0,"TAXI_OUT":195.0,"WHEELS_OFF":176.0,"WHEELS_ON":54.0,"TAXI_IN":197.0,"ARR_DELAY":193.0,"AIR_TIME":10.0,"DISTANCE":17.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":4839,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":9891,"ORIGIN_AIRPORT_ID":135,"ORIGIN_AIRPORT_SEQ_ID":8803,"ORIGIN_CITY_MARKET_ID":159,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9207,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7529,"DEST_AIRPORT_ID":498,"DEST_AIRPORT_SEQ_ID":7078,"DEST_CITY_MARKET_ID":9807,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6065,"DEST_STATE_NM":"DL","DEST_WAC":6655,"DEP_DELAY":-7.0,"TAXI_OUT":NaN,"WHEELS_OFF":145.0,"WHEELS_ON":-20.0,"TAXI_IN":192.0,"ARR_DELAY":15.0,"AIR_TIME":175.0,"DISTANCE":49.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":9310,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":7765,"ORIGIN_AIRPORT_ID":4017,"ORIGIN_AIRPORT_SEQ_ID":3930,"ORIGIN_CITY_MARKET_ID":1730,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1908,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5140,"DEST_AIRPORT_ID":6921,"DEST_AIRPORT_SEQ_ID":5674,"DEST_CITY_MARKET_ID":4154,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7125,"DEST_STATE_NM":"DL","DEST_WAC":6166,"DEP_DELAY":173.0,"TAXI_OUT":92.0,"WHEELS_OFF":40.0,"WHEELS_ON":112.0,"TAXI_IN":67.0,"ARR_DELAY":111.0,"AIR_TIME":144.0,"DISTANCE":67.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":1991,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":7869,"ORIGIN_AIRPORT_ID":3428,"ORIGIN_AIRPORT_SEQ_ID":6279,"ORIGIN_CITY_MARKET_ID":2863,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1634,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5499,"DEST_AIRPORT_ID":5392,"DEST_AIRPORT_SEQ_ID":4017,"DEST_CITY_MARKET_ID":7559,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":8072,"DEST_STATE_NM":"UA","DEST_WAC":3175,"DEP_DELAY":82.0,"TAXI_OUT":126.0,"WHEELS_OFF":48.0,"WHEELS_ON":18.0,"TAXI_IN":NaN,"ARR_DELAY":184.0,"AIR_TIME":NaN,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-06","AIRLINE_ID":7517,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":8226,"ORIGIN_AIRPORT_ID":4727,"ORIGIN_AIRPORT_SEQ_ID":2548,"ORIGIN_CITY_MARKET_ID":2528,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":308,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6498,"DEST_AIRPORT_ID":3742,"DEST_AIRPORT_SEQ_ID":8811,"DEST_CITY_MARKET_ID":6403,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6930,"DEST_STATE_NM":"AA","DEST_WAC":2934,"DEP_DELAY":41.0,"TAXI_OUT":NaN,"WHEELS_OFF":122.0,"WHEELS_ON":24.0,"TAXI_IN":-15.0,"ARR_DELAY":89.0,"AIR_TIME":-10.0,"DISTANCE":165.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":8259,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":8795,"ORIGIN_AIRPORT_ID":1266,"ORIGIN_AIRPORT_SEQ_ID":4062,"ORIGIN_CITY_MARKET_ID":6524,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":793,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1470,"DEST_AIRPORT_ID":9175,"DEST_AIRPORT_SEQ_ID":1550,"DEST_CITY_MARKET_ID":7847,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":200,"DEST_STATE_NM":"AA","DEST_WAC":5112,"DEP_DELAY":165.0,"TAXI_OUT":132.0,"WHEELS_OFF":123.0,"WHEELS_ON":61.0,"TAXI_IN":142.0,"ARR_DELAY":108.0,"AIR_TIME":121.0,"DISTANCE":81.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":6375,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":4562,"ORIGIN_AIRPORT_ID":5899,"ORIGIN_AIRPORT_SEQ_ID":2482,"ORIGIN_CITY_MARKET_ID":4251,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1371,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5907,"DEST_AIRPORT_ID":5507,"DEST_AIRPORT_SEQ_ID":2339,"DEST_CITY_MARKET_ID":4235,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6296,"DEST_STATE_NM":"DL","DEST_WAC":9265,"DEP_DELAY":18.0,"TAXI_OUT":44.0,"WHEELS_OFF":-2.0,"WHEELS_ON":117.0,"TAXI_IN":119.0,"ARR_DELAY":41.0,"AIR_TIME":121.0,"DISTANCE":162.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":1353,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":2509,"ORIGIN_AIRPORT_ID":943,"ORIGIN_AIRPORT_SEQ_ID":496,"ORIGIN_CITY_MARKET_ID":6642,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2253,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9780,"DEST_AIRPORT_ID":2117,"DEST_AIRPORT_SEQ_ID":8823,"DEST_CITY_MARKET_ID":8952,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2285,"DEST_STATE_NM":"DL","DEST_WAC":3317,"DEP_DELAY":81.0,"TAXI_OUT":194.0,"WHEELS_OFF":56.0,"WHEELS_ON":69.0,"TAXI_IN":54.0,"ARR_DELAY":NaN,"AIR_TIME":33.0,"DISTANCE":-15.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":9710,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":6106,"ORIGIN_AIRPORT_ID":7268,"ORIGIN_AIRPORT_SEQ_ID":4177,"ORIGIN_CITY_MARKET_ID":955,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2169,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1693,"DEST_AIRPORT_ID":1844,"DEST_AIRPORT_SEQ_ID":7132,"DEST_CITY_MARKET_ID":9610,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8262,"DEST_STATE_NM":"UA","DEST_WAC":6502,"DEP_DELAY":161.0,"TAXI_OUT":78.0,"WHEELS_OFF":112.0,"WHEELS_ON":163.0,"TAXI_IN":165.0,"ARR_DELAY":NaN,"AIR_TIME":31.0,"DISTANCE":124.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":7898,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3780,"ORIGIN_AIRPORT_ID":4386,"ORIGIN_AIRPORT_SEQ_ID":618,"ORIGIN_CITY_MARKET_ID":2749,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8239,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6725,"DEST_AIRPORT_ID":4485,"DEST_AIRPORT_SEQ_ID":6901,"DEST_CITY_MARKET_ID":6530,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2124,"DEST_STATE_NM":"AA","DEST_WAC":9168,"DEP_DELAY":NaN,"TAXI_OUT":105.0,"WHEELS_OFF":190.0,"WHEELS_ON":190.0,"TAXI_IN":42.0,"ARR_DELAY":NaN,"AIR_TIME":-10.0,"DISTANCE":193.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":3094,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":8225,"ORIGIN_AIRPORT_ID":3113,"ORIGIN_AIRPORT_SEQ_ID":8352,"ORIGIN_CITY_MARKET_ID":6305,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3813,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9602,"DEST_AIRPORT_ID":1057,"DEST_AIRPORT_SEQ_ID":5588,"DEST_CITY_MARKET_ID":849,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2897,"DEST_STATE_NM":"AA","DEST_WAC":4679,"DEP_DELAY":129.0,"TAXI_OUT":193.0,"WHEELS_OFF":3.0,"WHEELS_ON":183.0,"TAXI_IN":126.0,"ARR_DELAY":80.0,"AIR_TIME":70.0,"DISTANCE":-8.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":7818,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":4991,"ORIGIN_AIRPORT_ID":9645,"ORIGIN_AIRPORT_SEQ_ID":5199,"ORIGIN_CITY_MARKET_ID":2448,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4552,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9948,"DEST_AIRPORT_ID":5915,"DEST_AIRPORT_SEQ_ID":6802,"DEST_CITY_MARKET_ID":6407,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9532,"DEST_STATE_NM":"AA","DEST_WAC":606,"DEP_DELAY":-17.0,"TAXI_OUT":65.0,"WHEELS_OFF":74.0,"WHEELS_ON":-12.0,"TAXI_IN":129.0,"ARR_DELAY":NaN,"AIR_TIME":1.0,"DISTANCE":94.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":8194,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":2634,"ORIGIN_AIRPORT_ID":5326,"ORIGIN_AIRPORT_SEQ_ID":5913,"ORIGIN_CITY_MARKET_ID":3506,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9660,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6619,"DEST_AIRPORT_ID":5198,"DEST_AIRPORT_SEQ_ID":8334,"DEST_CITY_MARKET_ID":6896,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9976,"DEST_STATE_NM":"DL","DEST_WAC":617,"DEP_DELAY":176.0,"TAXI_OUT":189.0,"WHEELS_OFF":173.0,"WHEELS_ON":120.0,"TAXI_IN":181.0,"ARR_DELAY":-1.0,"AIR_TIME":48.0,"DISTANCE":12.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":9025,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":4306,"ORIGIN_AIRPORT_ID":3848,"ORIGIN_AIRPORT_SEQ_ID":3451,"ORIGIN_CITY_MARKET_ID":1620,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":772,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8392,"DEST_AIRPORT_ID":4937,"DEST_AIRPORT_SEQ_ID":3341,"DEST_CITY_MARKET_ID":8908,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":5566,"DEST_STATE_NM":"DL","DEST_WAC":8457,"DEP_DELAY":93.0,"TAXI_OUT":184.0,"WHEELS_OFF":-13.0,"WHEELS_ON":86.0,"TAXI_IN":122.0,"ARR_DELAY":NaN,"AIR_TIME":149.0,"DISTANCE":114.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":3021,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":1881,"ORIGIN_AIRPORT_ID":9625,"ORIGIN_AIRPORT_SEQ_ID":2131,"ORIGIN_CITY_MARKET_ID":9613,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4368,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3217,"DEST_AIRPORT_ID":906,"DEST_AIRPORT_SEQ_ID":5920,"DEST_CITY_MARKET_ID":7474,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5812,"DEST_STATE_NM":"AA","DEST_WAC":154,"DEP_DELAY":NaN,"TAXI_OUT":22.0,"WHEELS_OFF":121.0,"WHEELS_ON":NaN,"TAXI_IN":1.0,"ARR_DELAY":24.0,"AIR_TIME":NaN,"DISTANCE":33.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":4732,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":8289,"ORIGIN_AIRPORT_ID":6085,"ORIGIN_AIRPORT_SEQ_ID":5324,"ORIGIN_CITY_MARKET_ID":6423,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9738,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3073,"DEST_AIRPORT_ID":4866,"DEST_AIRPORT_SEQ_ID":9524,"DEST_CITY_MARKET_ID":6984,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":380,"DEST_STATE_NM":"DL","DEST_WAC":339,"DEP_DELAY":148.0,"TAXI_OUT":150.0,"WHEELS_OFF":196.0,"WHEELS_ON":161.0,"TAXI_IN":66.0,"ARR_DELAY":NaN,"AIR_TIME":159.0,"DISTANCE":106.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":9961,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":9018,"ORIGIN_AIRPORT_ID":8210,"ORIGIN_AIRPORT_SEQ_ID":7826,"ORIGIN_CITY_MARKET_ID":9830,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7375,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7720,"DEST_AIRPORT_ID":2710,"DEST_AIRPORT_SEQ_ID":4396,"DEST_CITY_MARKET_ID":8593,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9952,"DEST_STATE_NM":"UA","DEST_WAC":4246,"DEP_DELAY":-17.0,"TAXI_OUT":-9.0,"WHEELS_OFF":97.0,"WHEELS_ON":39.0,"TAXI_IN":33.0,"ARR_DELAY":65.0,"AIR_TIME":140.0,"DISTANCE":200.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":889,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5838,"ORIGIN_AIRPORT_ID":135,"ORIGIN_AIRPORT_SEQ_ID":4192,"ORIGIN_CITY_MARKET_ID":8866,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6206,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5317,"DEST_AIRPORT_ID":5541,"DEST_AIRPORT_SEQ_ID":5060,"DEST_CITY_MARKET_ID":9654,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1340,"DEST_STATE_NM":"DL","DEST_WAC":1965,"DEP_DELAY":190.0,"TAXI_OUT":12.0,"WHEELS_OFF":55.0,"WHEELS_ON":135.0,"TAXI_IN":-14.0,"ARR_DELAY":159.0,"AIR_TIME":173.0,"DISTANCE":109.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":9406,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":4957,"ORIGIN_AIRPORT_ID":4813,"ORIGIN_AIRPORT_SEQ_ID":6194,"ORIGIN_CITY_MARKET_ID":6889,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3261,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3795,"DEST_AIRPORT_ID":9960,"DEST_AIRPORT_SEQ_ID":692,"DEST_CITY_MARKET_ID":3945,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6467,"DEST_STATE_NM":"DL","DEST_WAC":3444,"DEP_DELAY":164.0,"TAXI_OUT":170.0,"WHEELS_OFF":72.0,"WHEELS_ON":NaN,"TAXI_IN":58.0,"ARR_DELAY":23.0,"AIR_TIME":-13.0,"DISTANCE":91.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":5602,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":5204,"ORIGIN_AIRPORT_ID":9893,"ORIGIN_AIRPORT_SEQ_ID":1828,"ORIGIN_CITY_MARKET_ID":9562,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4524,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":186,"DEST_AIRPORT_ID":5091,"DEST_AIRPORT_SEQ_ID":1417,"DEST_CITY_MARKET_ID":8060,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9923,"DEST_STATE_NM":"UA","DEST_WAC":4337,"DEP_DELAY":180.0,"TAXI_OUT":6.0,"WHEELS_OFF":111.0,"WHEELS_ON":13.0,"TAXI_IN":-8.0,"ARR_DELAY":-3.0,"AIR_TIME":152.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":345,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":147,"ORIGIN_AIRPORT_ID":572,"ORIGIN_AIRPORT_SEQ_ID":8814,"ORIGIN_CITY_MARKET_ID":5557,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":145,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3463,"DEST_AIRPORT_ID":7684,"DEST_AIRPORT_SEQ_ID":3279,"DEST_CITY_MARKET_ID":4363,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8545,"DEST_STATE_NM":"DL","DEST_WAC":3826,"DEP_DELAY":80.0,"TAXI_OUT":41.0,"WHEELS_OFF":159.0,"WHEELS_ON":64.0,"TAXI_IN":10.0,"ARR_DELAY":NaN,"AIR_TIME":143.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-06","AIRLINE_ID":3578,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4984,"ORIGIN_AIRPORT_ID":1603,"ORIGIN_AIRPORT_SEQ_ID":964,"ORIGIN_CITY_MARKET_ID":5143,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7261,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3784,"DEST_AIRPORT_ID":707,"DEST_AIRPORT_SEQ_ID":4690,"DEST_CITY_MARKET_ID":5642,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7251,"DEST_STATE_NM":"AA","DEST_WAC":3733,"DEP_DELAY":10.0,"TAXI_OUT":NaN,"WHEELS_OFF":NaN,"WHEELS_ON":2.0,"TAXI_IN":187.0,"ARR_DELAY":53.0,"AIR_TIME":114.0,"DISTANCE":43.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":529,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":3192,"ORIGIN_AIRPORT_ID":5338,"ORIGIN_AIRPORT_SEQ_ID":5734,"ORIGIN_CITY_MARKET_ID":5853,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6267,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6333,"DEST_AIRPORT_ID":1465,"DEST_AIRPORT_SEQ_ID":6982,"DEST_CITY_MARKET_ID":4006,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9912,"DEST_STATE_NM":"UA","DEST_WAC":1866,"DEP_DELAY":177.0,"TAXI_OUT":50.0,"WHEELS_OFF":65.0,"WHEELS_ON":74.0,"TAXI_IN":73.0,"ARR_DELAY":81.0,"AIR_TIME":110.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":4955,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":9287,"ORIGIN_AIRPORT_ID":2077,"ORIGIN_AIRPORT_SEQ_ID":8988,"ORIGIN_CITY_MARKET_ID":2450,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2495,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2640,"DEST_AIRPORT_ID":1306,"DEST_AIRPORT_SEQ_ID":4160,"DEST_CITY_MARKET_ID":3858,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2811,"DEST_STATE_NM":"DL","DEST_WAC":7751,"DEP_DELAY":89.0,"TAXI_OUT":70.0,"WHEELS_OFF":7.0,"WHEELS_ON":155.0,"TAXI_IN":155.0,"ARR_DELAY":116.0,"AIR_TIME":NaN,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":5833,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":8319,"ORIGIN_AIRPORT_ID":5822,"ORIGIN_AIRPORT_SEQ_ID":8252,"ORIGIN_CITY_MARKET_ID":6137,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3026,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":535,"DEST_AIRPORT_ID":4439,"DEST_AIRPORT_SEQ_ID":3444,"DEST_CITY_MARKET_ID":1023,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9230,"DEST_STATE_NM":"DL","DEST_WAC":4004,"DEP_DELAY":-8.0,"TAXI_OUT":54.0,"WHEELS_OFF":-19.0,"WHEELS_ON":14.0,"TAXI_IN":109.0,"ARR_DELAY":16.0,"AIR_TIME":-1.0,"DISTANCE":110.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":8839,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":7080,"ORIGIN_AIRPORT_ID":7199,"ORIGIN_AIRPORT_SEQ_ID":9517,"ORIGIN_CITY_MARKET_ID":8385,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5827,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7096,"DEST_AIRPORT_ID":1216,"DEST_AIRPORT_SEQ_ID":4538,"DEST_CITY_MARKET_ID":3363,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3412,"DEST_STATE_NM":"AA","DEST_WAC":2681,"DEP_DELAY":27.0,"TAXI_OUT":NaN,"WHEELS_OFF":136.0,"WHEELS_ON":158.0,"TAXI_IN":2.0,"ARR_DELAY":147.0,"AIR_TIME":67.0,"DISTANCE":156.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":295,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":7871,"ORIGIN_AIRPORT_ID":9046,"ORIGIN_AIRPORT_SEQ_ID":594,"ORIGIN_CITY_MARKET_ID":859,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5727,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7999,"DEST_AIRPORT_ID":1120,"DEST_AIRPORT_SEQ_ID":8376,"DEST_CITY_MARKET_ID":5224,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5105,"DEST_STATE_NM":"UA","DEST_WAC":5207,"DEP_DELAY":126.0,"TAXI_OUT":NaN,"WHEELS_OFF":197.0,"WHEELS_ON":NaN,"TAXI_IN":NaN,"ARR_DELAY":199.0,"AIR_TIME":26.0,"DISTANCE":37.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":4301,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":7989,"ORIGIN_AIRPORT_ID":6816,"ORIGIN_AIRPORT_SEQ_ID":197,"ORIGIN_CITY_MARKET_ID":4826,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":797,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7069,"DEST_AIRPORT_ID":7056,"DEST_AIRPORT_SEQ_ID":3562,"DEST_CITY_MARKET_ID":4560,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9266,"DEST_STATE_NM":"DL","DEST_WAC":9438,"DEP_DELAY":45.0,"TAXI_OUT":62.0,"WHEELS_OFF":4.0,"WHEELS_ON":113.0,"TAXI_IN":158.0,"ARR_DELAY":81.0,"AIR_TIME":18.0,"DISTANCE":158.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":619,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":4057,"ORIGIN_AIRPORT_ID":1295,"ORIGIN_AIRPORT_SEQ_ID":1156,"ORIGIN_CITY_MARKET_ID":632,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9339,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5362,"DEST_AIRPORT_ID":8527,"DEST_AIRPORT_SEQ_ID":2793,"DEST_CITY_MARKET_ID":9226,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":217,"DEST_STATE_NM":"DL","DEST_WAC":9055,"DEP_DELAY":192.0,"TAXI_OUT":22.0,"WHEELS_OFF":75.0,"WHEELS_ON":NaN,"TAXI_IN":190.0,"ARR_DELAY":40.0,"AIR_TIME":149.0,"DISTANCE":197.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":7240,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":2644,"ORIGIN_AIRPORT_ID":2207,"ORIGIN_AIRPORT_SEQ_ID":7246,"ORIGIN_CITY_MARKET_ID":739,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2842,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8035,"DEST_AIRPORT_ID":7837,"DEST_AIRPORT_SEQ_ID":138,"DEST_CITY_MARKET_ID":9437,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7277,"DEST_STATE_NM":"UA","DEST_WAC":2680,"DEP_DELAY":82.0,"TAXI_OUT":11.0,"WHEELS_OFF":15.0,"WHEELS_ON":64.0,"TAXI_IN":186.0,"ARR_DELAY":138.0,"AIR_TIME":39.0,"DISTANCE":89.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":7504,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":5097,"ORIGIN_AIRPORT_ID":2782,"ORIGIN_AIRPORT_SEQ_ID":8519,"ORIGIN_CITY_MARKET_ID":8312,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4630,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":2533,"DEST_AIRPORT_ID":106,"DEST_AIRPORT_SEQ_ID":5579,"DEST_CITY_MARKET_ID":1951,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8402,"DEST_STATE_NM":"UA","DEST_WAC":2932,"DEP_DELAY":92.0,"TAXI_OUT":116.0,"WHEELS_OFF":193.0,"WHEELS_ON":1.0,"TAXI_IN":4.0,"ARR_DELAY":15.0,"AIR_TIME":26.0,"DISTANCE":113.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":9726,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":3178,"ORIGIN_AIRPORT_ID":9674,"ORIGIN_AIRPORT_SEQ_ID":7373,"ORIGIN_CITY_MARKET_ID":8001,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2844,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":4478,"DEST_AIRPORT_ID":2956,"DEST_AIRPORT_SEQ_ID":452,"DEST_CITY_MARKET_ID":9117,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9013,"DEST_STATE_NM":"AA","DEST_WAC":7302,"DEP_DELAY":93.0,"TAXI_OUT":170.0,"WHEELS_OFF":-7.0,"WHEELS_ON":51.0,"TAXI_IN":99.0,"ARR_DELAY":4.0,"AIR_TIME":118.0,"DISTANCE":137.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":7828,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5235,"ORIGIN_AIRPORT_ID":2392,"ORIGIN_AIRPORT_SEQ_ID":5734,"ORIGIN_CITY_MARKET_ID":2249,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3541,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2552,"DEST_AIRPORT_ID":1695,"DEST_AIRPORT_SEQ_ID":1687,"DEST_CITY_MARKET_ID":6967,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6137,"DEST_STATE_NM":"UA","DEST_WAC":5270,"DEP_DELAY":81.0,"TAXI_OUT":NaN,"WHEELS_OFF":94.0,"WHEELS_ON":162.0,"TAXI_IN":128.0,"ARR_DELAY":197.0,"AIR_TIME":24.0,"DISTANCE":26.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":2513,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":8817,"ORIGIN_AIRPORT_ID":2022,"ORIGIN_AIRPORT_SEQ_ID":8785,"ORIGIN_CITY_MARKET_ID":5220,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9159,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5588,"DEST_AIRPORT_ID":9526,"DEST_AIRPORT_SEQ_ID":5240,"DEST_CITY_MARKET_ID":9214,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7937,"DEST_STATE_NM":"UA","DEST_WAC":6458,"DEP_DELAY":35.0,"TAXI_OUT":117.0,"WHEELS_OFF":132.0,"WHEELS_ON":-7.0,"TAXI_IN":138.0,"ARR_DELAY":64.0,"AIR_TIME":-13.0,"DISTANCE":72.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":9754,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":3427,"ORIGIN_AIRPORT_ID":4729,"ORIGIN_AIRPORT_SEQ_ID":3680,"ORIGIN_CITY_MARKET_ID":5138,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2878,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6369,"DEST_AIRPORT_ID":5738,"DEST_AIRPORT_SEQ_ID":9900,"DEST_CITY_MARKET_ID":3641,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5248,"DEST_STATE_NM":"DL","DEST_WAC":3339,"DEP_DELAY":55.0,"TAXI_OUT":NaN,"WHEELS_OFF":NaN,"WHEELS_ON":186.0,"TAXI_IN":19.0,"ARR_DELAY":182.0,"AIR_TIME":25.0,"DISTANCE":16.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":7160,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":8568,"ORIGIN_AIRPORT_ID":4542,"ORIGIN_AIRPORT_SEQ_ID":3418,"ORIGIN_CITY_MARKET_ID":3178,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2630,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1964,"DEST_AIRPORT_ID":7243,"DEST_AIRPORT_SEQ_ID":9584,"DEST_CITY_MARKET_ID":8555,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5470,"DEST_STATE_NM":"UA","DEST_WAC":5199,"DEP_DELAY":-15.0,"TAXI_OUT":24.0,"WHEELS_OFF":157.0,"WHEELS_ON":105.0,"TAXI_IN":NaN,"ARR_DELAY":14.0,"AIR_TIME":124.0,"DISTANCE":33.0}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":2259,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5711,"ORIGIN_AIRPORT_ID":1063,"ORIGIN_AIRPORT_SEQ_ID":6286,"ORIGIN_CITY_MARKET_ID":7786,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3228,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3947,"DEST_AIRPORT_ID":3378,"DEST_AIRPORT_SEQ_ID":83,"DEST_CITY_MARKET_ID":4982,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3104,"DEST_STATE_NM":"AA","DEST_WAC":1735,"DEP_DELAY":177.0,"TAXI_OUT":82.0,"WHEELS_OFF":94.0,"WHEELS_ON":127.0,"TAXI_IN":146.0,"ARR_DELAY":51.0,"AIR_TIME":75.0,"DISTANCE":172.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":6741,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":8995,"ORIGIN_AIRPORT_ID":3375,"ORIGIN_AIRPORT_SEQ_ID":3206,"ORIGIN_CITY_MARKET_ID":1070,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":342,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6449,"DEST_AIRPORT_ID":7484,"DEST_AIRPORT_SEQ_ID":7222,"DEST_CITY_MARKET_ID":9303,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8639,"DEST_STATE_NM":"AA","DEST_WAC":727,"DEP_DELAY":181.0,"TAXI_OUT":13.0,"WHEELS_OFF":157.0,"WHEELS_ON":75.0,"TAXI_IN":179.0,"ARR_DELAY":171.0,"AIR_TIME":NaN,"DISTANCE":156.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":5965,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5724,"ORIGIN_AIRPORT_ID":1921,"ORIGIN_AIRPORT_SEQ_ID":4022,"ORIGIN_CITY_MARKET_ID":2041,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5988,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2466,"DEST_AIRPORT_ID":4723,"DEST_AIRPORT_SEQ_ID":406,"DEST_CITY_MARKET_ID":7740,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1100,"DEST_STATE_NM":"UA","DEST_WAC":7062,"DEP_DELAY":NaN,"TAXI_OUT":108.0,"WHEELS_OFF":NaN,"WHEELS_ON":152.0,"TAXI_IN":80.0,"ARR_DELAY":119.0,"AIR_TIME":41.0,"DISTANCE":113.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":7825,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":7174,"ORIGIN_AIRPORT_ID":1914,"ORIGIN_AIRPORT_SEQ_ID":1102,"ORIGIN_CITY_MARKET_ID":3452,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6051,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1576,"DEST_AIRPORT_ID":5815,"DEST_AIRPORT_SEQ_ID":1732,"DEST_CITY_MARKET_ID":3210,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9681,"DEST_STATE_NM":"AA","DEST_WAC":59,"DEP_DELAY":40.0,"TAXI_OUT":NaN,"WHEELS_OFF":-5.0,"WHEELS_ON":123.0,"TAXI_IN":140.0,"ARR_DELAY":NaN,"AIR_TIME":50.0,"DISTANCE":102.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":3587,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":7827,"ORIGIN_AIRPORT_ID":7236,"ORIGIN_AIRPORT_SEQ_ID":8750,"ORIGIN_CITY_MARKET_ID":897,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7176,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4845,"DEST_AIRPORT_ID":9588,"DEST_AIRPORT_SEQ_ID":9666,"DEST_CITY_MARKET_ID":2992,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6518,"DEST_STATE_NM":"UA","DEST_WAC":6780,"DEP_DELAY":123.0,"TAXI_OUT":102.0,"WHEELS_OFF":36.0,"WHEELS_ON":-4.0,"TAXI_IN":106.0,"ARR_DELAY":9.0,"AIR_TIME":46.0,"DISTANCE":59.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":8868,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":1751,"ORIGIN_AIRPORT_ID":8223,"ORIGIN_AIRPORT_SEQ_ID":2261,"ORIGIN_CITY_MARKET_ID":7457,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9335,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8880,"DEST_AIRPORT_ID":6084,"DEST_AIRPORT_SEQ_ID":2051,"DEST_CITY_MARKET_ID":240,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1062,"DEST_STATE_NM":"DL","DEST_WAC":4642,"DEP_DELAY":NaN,"TAXI_OUT":108.0,"WHEELS_OFF":124.0,"WHEELS_ON":5.0,"TAXI_IN":134.0,"ARR_DELAY":158.0,"AIR_TIME":94.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":8680,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":716,"ORIGIN_AIRPORT_ID":3080,"ORIGIN_AIRPORT_SEQ_ID":2779,"ORIGIN_CITY_MARKET_ID":911,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1922,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8680,"DEST_AIRPORT_ID":4999,"DEST_AIRPORT_SEQ_ID":3286,"DEST_CITY_MARKET_ID":2653,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3561,"DEST_STATE_NM":"AA","DEST_WAC":8253,"DEP_DELAY":156.0,"TAXI_OUT":91.0,"WHEELS_OFF":14.0,"WHEELS_ON":187.0,"TAXI_IN":199.0,"ARR_DELAY":-6.0,"AIR_TIME":-15.0,"DISTANCE":52.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":7777,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":1113,"ORIGIN_AIRPORT_ID":3036,"ORIGIN_AIRPORT_SEQ_ID":3520,"ORIGIN_CITY_MARKET_ID":558,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5813,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8383,"DEST_AIRPORT_ID":2429,"DEST_AIRPORT_SEQ_ID":2932,"DEST_CITY_MARKET_ID":3703,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1098,"DEST_STATE_NM":"DL","DEST_WAC":5274,"DEP_DELAY":36.0,"TAXI_OUT":156.0,"WHEELS_OFF":160.0,"WHEELS_ON":7.0,"TAXI_IN":167.0,"ARR_DELAY":180.0,"AIR_TIME":100.0,"DISTANCE":178.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":4771,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":6235,"ORIGIN_AIRPORT_ID":574,"ORIGIN_AIRPORT_SEQ_ID":6268,"ORIGIN_CITY_MARKET_ID":7489,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3795,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1624,"DEST_AIRPORT_ID":4851,"DEST_AIRPORT_SEQ_ID":7146,"DEST_CITY_MARKET_ID":3292,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4077,"DEST_STATE_NM":"AA","DEST_WAC":8056,"DEP_DELAY":25.0,"TAXI_OUT":160.0,"WHEELS_OFF":132.0,"WHEELS_ON":139.0,"TAXI_IN":121.0,"ARR_DELAY":194.0,"AIR_TIME":140.0,"DISTANCE":16.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":2085,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":6368,"ORIGIN_AIRPORT_ID":7046,"ORIGIN_AIRPORT_SEQ_ID":1563,"ORIGIN_CITY_MARKET_ID":3303,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9756,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4332,"DEST_AIRPORT_ID":8335,"DEST_AIRPORT_SEQ_ID":1747,"DEST_CITY_MARKET_ID":5339,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8813,"DEST_STATE_NM":"DL","DEST_WAC":402,"DEP_DELAY":167.0,"TAXI_OUT":177.0,"WHEELS_OFF":47.0,"WHEELS_ON":52.0,"TAXI_IN":1.0,"ARR_DELAY":77.0,"AIR_TIME":NaN,"DISTANCE":13.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":9177,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":3818,"ORIGIN_AIRPORT_ID":8346,"ORIGIN_AIRPORT_SEQ_ID":462,"ORIGIN_CITY_MARKET_ID":6161,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1377,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":650,"DEST_AIRPORT_ID":7444,"DEST_AIRPORT_SEQ_ID":1373,"DEST_CITY_MARKET_ID":4811,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":696,"DEST_STATE_NM":"AA","DEST_WAC":1200,"DEP_DELAY":129.0,"TAXI_OUT":58.0,"WHEELS_OFF":NaN,"WHEELS_ON":71.0,"TAXI_IN":199.0,"ARR_DELAY":140.0,"AIR_TIME":114.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":4069,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3567,"ORIGIN_AIRPORT_ID":5092,"ORIGIN_AIRPORT_SEQ_ID":5015,"ORIGIN_CITY_MARKET_ID":8787,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9631,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7884,"DEST_AIRPORT_ID":4141,"DEST_AIRPORT_SEQ_ID":3772,"DEST_CITY_MARKET_ID":2418,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4254,"DEST_STATE_NM":"DL","DEST_WAC":3320,"DEP_DELAY":188.0,"TAXI_OUT":183.0,"WHEELS_OFF":139.0,"WHEELS_ON":NaN,"TAXI_IN":160.0,"ARR_DELAY":-11.0,"AIR_TIME":82.0,"DISTANCE":159.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":3602,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":4747,"ORIGIN_AIRPORT_ID":8381,"ORIGIN_AIRPORT_SEQ_ID":7305,"ORIGIN_CITY_MARKET_ID":5514,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3784,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8579,"DEST_AIRPORT_ID":7596,"DEST_AIRPORT_SEQ_ID":9112,"DEST_CITY_MARKET_ID":7511,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7507,"DEST_STATE_NM":"DL","DEST_WAC":8853,"DEP_DELAY":-17.0,"TAXI_OUT":34.0,"WHEELS_OFF":55.0,"WHEELS_ON":47.0,"TAXI_IN":48.0,"ARR_DELAY":-13.0,"AIR_TIME":140.0,"DISTANCE":92.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":3380,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":7409,"ORIGIN_AIRPORT_ID":4985,"ORIGIN_AIRPORT_SEQ_ID":1874,"ORIGIN_CITY_MARKET_ID":4041,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":494,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2223,"DEST_AIRPORT_ID":9769,"DEST_AIRPORT_SEQ_ID":423,"DEST_CITY_MARKET_ID":7213,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3726,"DEST_STATE_NM":"DL","DEST_WAC":2833,"DEP_DELAY":-18.0,"TAXI_OUT":-4.0,"WHEELS_OFF":NaN,"WHEELS_ON":127.0,"TAXI_IN":NaN,"ARR_DELAY":29.0,"AIR_TIME":119.0,"DISTANCE":46.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":6316,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":8661,"ORIGIN_AIRPORT_ID":8738,"ORIGIN_AIRPORT_SEQ_ID":7627,"ORIGIN_CITY_MARKET_ID":4571,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9221,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2181,"DEST_AIRPORT_ID":3413,"DEST_AIRPORT_SEQ_ID":8617,"DEST_CITY_MARKET_ID":421,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2372,"DEST_STATE_NM":"AA","DEST_WAC":5221,"DEP_DELAY":84.0,"TAXI_OUT":131.0,"WHEELS_OFF":108.0,"WHEELS_ON":-4.0,"TAXI_IN":-12.0,"ARR_DELAY":85.0,"AIR_TIME":119.0,"DISTANCE":-9.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":3184,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":6231,"ORIGIN_AIRPORT_ID":4909,"ORIGIN_AIRPORT_SEQ_ID":8486,"ORIGIN_CITY_MARKET_ID":375,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8780,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8743,"DEST_AIRPORT_ID":2661,"DEST_AIRPORT_SEQ_ID":3767,"DEST_CITY_MARKET_ID":1441,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":863,"DEST_STATE_NM":"UA","DEST_WAC":6596,"DEP_DELAY":-17.0,"TAXI_OUT":5.0,"WHEELS_OFF":-10.0,"WHEELS_ON":90.0,"TAXI_IN":24.0,"ARR_DELAY":35.0,"AIR_TIME":187.0,"DISTANCE":7.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":6633,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":2083,"ORIGIN_AIRPORT_ID":5537,"ORIGIN_AIRPORT_SEQ_ID":8292,"ORIGIN_CITY_MARKET_ID":7780,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6023,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9541,"DEST_AIRPORT_ID":4065,"DEST_AIRPORT_SEQ_ID":7260,"DEST_CITY_MARKET_ID":4258,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9279,"DEST_STATE_NM":"AA","DEST_WAC":6181,"DEP_DELAY":7.0,"TAXI_OUT":133.0,"WHEELS_OFF":68.0,"WHEELS_ON":NaN,"TAXI_IN":130.0,"ARR_DELAY":175.0,"AIR_TIME":8.0,"DISTANCE":175.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":7450,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":1497,"ORIGIN_AIRPORT_ID":5492,"ORIGIN_AIRPORT_SEQ_ID":608,"ORIGIN_CITY_MARKET_ID":4534,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5489,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9369,"DEST_AIRPORT_ID":2738,"DEST_AIRPORT_SEQ_ID":7043,"DEST_CITY_MARKET_ID":5106,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3987,"DEST_STATE_NM":"DL","DEST_WAC":6288,"DEP_DELAY":NaN,"TAXI_OUT":10.0,"WHEELS_OFF":-14.0,"WHEELS_ON":63.0,"TAXI_IN":149.0,"ARR_DELAY":55.0,"AIR_TIME":23.0,"DISTANCE":82.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":7420,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":1684,"ORIGIN_AIRPORT_ID":9220,"ORIGIN_AIRPORT_SEQ_ID":8008,"ORIGIN_CITY_MARKET_ID":9217,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":971,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4568,"DEST_AIRPORT_ID":597,"DEST_AIRPORT_SEQ_ID":4404,"DEST_CITY_MARKET_ID":5095,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":5528,"DEST_STATE_NM":"AA","DEST_WAC":7451,"DEP_DELAY":40.0,"TAXI_OUT":37.0,"WHEELS_OFF":196.0,"WHEELS_ON":-6.0,"TAXI_IN":NaN,"ARR_DELAY":80.0,"AIR_TIME":25.0,"DISTANCE":81.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":2855,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":7442,"ORIGIN_AIRPORT_ID":8822,"ORIGIN_AIRPORT_SEQ_ID":8628,"ORIGIN_CITY_MARKET_ID":2664,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4215,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8506,"DEST_AIRPORT_ID":7175,"DEST_AIRPORT_SEQ_ID":3095,"DEST_CITY_MARKET_ID":665,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6727,"DEST_STATE_NM":"DL","DEST_WAC":8379,"DEP_DELAY":93.0,"TAXI_OUT":-14.0,"WHEELS_OFF":NaN,"WHEELS_ON":171.0,"TAXI_IN":90.0,"ARR_DELAY":119.0,"AIR_TIME":109.0,"DISTANCE":139.0}
+{"FL_DATE":"2017-01-06","AIRLINE_ID":4378,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":7886,"ORIGIN_AIRPORT_ID":4679,"ORIGIN_AIRPORT_SEQ_ID":5691,"ORIGIN_CITY_MARKET_ID":7483,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4692,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5880,"DEST_AIRPORT_ID":8884,"DEST_AIRPORT_SEQ_ID":8925,"DEST_CITY_MARKET_ID":8702,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1188,"DEST_STATE_NM":"DL","DEST_WAC":6387,"DEP_DELAY":177.0,"TAXI_OUT":44.0,"WHEELS_OFF":20.0,"WHEELS_ON":8.0,"TAXI_IN":8.0,"ARR_DELAY":24.0,"AIR_TIME":NaN,"DISTANCE":166.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":7673,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4448,"ORIGIN_AIRPORT_ID":841,"ORIGIN_AIRPORT_SEQ_ID":8672,"ORIGIN_CITY_MARKET_ID":7739,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5829,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7174,"DEST_AIRPORT_ID":1811,"DEST_AIRPORT_SEQ_ID":5552,"DEST_CITY_MARKET_ID":5218,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4753,"DEST_STATE_NM":"AA","DEST_WAC":3756,"DEP_DELAY":92.0,"TAXI_OUT":89.0,"WHEELS_OFF":166.0,"WHEELS_ON":130.0,"TAXI_IN":18.0,"ARR_DELAY":64.0,"AIR_TIME":76.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":5209,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":2381,"ORIGIN_AIRPORT_ID":1878,"ORIGIN_AIRPORT_SEQ_ID":8708,"ORIGIN_CITY_MARKET_ID":3348,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5874,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8642,"DEST_AIRPORT_ID":2647,"DEST_AIRPORT_SEQ_ID":3332,"DEST_CITY_MARKET_ID":4900,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6553,"DEST_STATE_NM":"DL","DEST_WAC":8015,"DEP_DELAY":179.0,"TAXI_OUT":NaN,"WHEELS_OFF":NaN,"WHEELS_ON":19.0,"TAXI_IN":81.0,"ARR_DELAY":130.0,"AIR_TIME":132.0,"DISTANCE":103.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":1330,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":898,"ORIGIN_AIRPORT_ID":2282,"ORIGIN_AIRPORT_SEQ_ID":9113,"ORIGIN_CITY_MARKET_ID":7700,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1068,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3005,"DEST_AIRPORT_ID":4565,"DEST_AIRPORT_SEQ_ID":3183,"DEST_CITY_MARKET_ID":7546,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8377,"DEST_STATE_NM":"DL","DEST_WAC":4326,"DEP_DELAY":6.0,"TAXI_OUT":98.0,"WHEELS_OFF":166.0,"WHEELS_ON":14.0,"TAXI_IN":-14.0,"ARR_DELAY":76.0,"AIR_TIME":54.0,"DISTANCE":148.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":277,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":7195,"ORIGIN_AIRPORT_ID":5198,"ORIGIN_AIRPORT_SEQ_ID":9582,"ORIGIN_CITY_MARKET_ID":165,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6424,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":839,"DEST_AIRPORT_ID":9565,"DEST_AIRPORT_SEQ_ID":7318,"DEST_CITY_MARKET_ID":1595,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2020,"DEST_STATE_NM":"UA","DEST_WAC":287,"DEP_DELAY":NaN,"TAXI_OUT":122.0,"WHEELS_OFF":175.0,"WHEELS_ON":24.0,"TAXI_IN":-10.0,"ARR_DELAY":186.0,"AIR_TIME":159.0,"DISTANCE":190.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":2723,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":4812,"ORIGIN_AIRPORT_ID":9549,"ORIGIN_AIRPORT_SEQ_ID":9759,"ORIGIN_CITY_MARKET_ID":4200,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6403,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9723,"DEST_AIRPORT_ID":6751,"DEST_AIRPORT_SEQ_ID":2400,"DEST_CITY_MARKET_ID":5309,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9461,"DEST_STATE_NM":"UA","DEST_WAC":2058,"DEP_DELAY":144.0,"TAXI_OUT":NaN,"WHEELS_OFF":137.0,"WHEELS_ON":80.0,"TAXI_IN":-12.0,"ARR_DELAY":169.0,"AIR_TIME":195.0,"DISTANCE":48.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":4492,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":145,"ORIGIN_AIRPORT_ID":1960,"ORIGIN_AIRPORT_SEQ_ID":1751,"ORIGIN_CITY_MARKET_ID":7668,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3894,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3684,"DEST_AIRPORT_ID":1310,"DEST_AIRPORT_SEQ_ID":1775,"DEST_CITY_MARKET_ID":1582,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1869,"DEST_STATE_NM":"AA","DEST_WAC":4133,"DEP_DELAY":188.0,"TAXI_OUT":-8.0,"WHEELS_OFF":79.0,"WHEELS_ON":137.0,"TAXI_IN":37.0,"ARR_DELAY":126.0,"AIR_TIME":23.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":8397,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2808,"ORIGIN_AIRPORT_ID":5341,"ORIGIN_AIRPORT_SEQ_ID":8686,"ORIGIN_CITY_MARKET_ID":1155,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9429,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1629,"DEST_AIRPORT_ID":7383,"DEST_AIRPORT_SEQ_ID":1428,"DEST_CITY_MARKET_ID":11,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4607,"DEST_STATE_NM":"UA","DEST_WAC":4998,"DEP_DELAY":139.0,"TAXI_OUT":180.0,"WHEELS_OFF":78.0,"WHEELS_ON":145.0,"TAXI_IN":144.0,"ARR_DELAY":12.0,"AIR_TIME":170.0,"DISTANCE":73.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":7313,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":2545,"ORIGIN_AIRPORT_ID":4503,"ORIGIN_AIRPORT_SEQ_ID":1866,"ORIGIN_CITY_MARKET_ID":6115,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2309,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3654,"DEST_AIRPORT_ID":122,"DEST_AIRPORT_SEQ_ID":3770,"DEST_CITY_MARKET_ID":7906,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6692,"DEST_STATE_NM":"UA","DEST_WAC":5620,"DEP_DELAY":139.0,"TAXI_OUT":44.0,"WHEELS_OFF":NaN,"WHEELS_ON":111.0,"TAXI_IN":33.0,"ARR_DELAY":168.0,"AIR_TIME":68.0,"DISTANCE":-20.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":8304,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":7926,"ORIGIN_AIRPORT_ID":1482,"ORIGIN_AIRPORT_SEQ_ID":8462,"ORIGIN_CITY_MARKET_ID":4523,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6982,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2330,"DEST_AIRPORT_ID":1880,"DEST_AIRPORT_SEQ_ID":7203,"DEST_CITY_MARKET_ID":8488,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3530,"DEST_STATE_NM":"DL","DEST_WAC":5992,"DEP_DELAY":63.0,"TAXI_OUT":44.0,"WHEELS_OFF":18.0,"WHEELS_ON":NaN,"TAXI_IN":103.0,"ARR_DELAY":132.0,"AIR_TIME":67.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":2860,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4253,"ORIGIN_AIRPORT_ID":3770,"ORIGIN_AIRPORT_SEQ_ID":1198,"ORIGIN_CITY_MARKET_ID":6982,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6068,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1730,"DEST_AIRPORT_ID":75,"DEST_AIRPORT_SEQ_ID":6428,"DEST_CITY_MARKET_ID":5556,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6724,"DEST_STATE_NM":"DL","DEST_WAC":9643,"DEP_DELAY":45.0,"TAXI_OUT":173.0,"WHEELS_OFF":177.0,"WHEELS_ON":-1.0,"TAXI_IN":196.0,"ARR_DELAY":136.0,"AIR_TIME":68.0,"DISTANCE":163.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":1740,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":882,"ORIGIN_AIRPORT_ID":2803,"ORIGIN_AIRPORT_SEQ_ID":3692,"ORIGIN_CITY_MARKET_ID":8774,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6529,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":75,"DEST_AIRPORT_ID":1115,"DEST_AIRPORT_SEQ_ID":6503,"DEST_CITY_MARKET_ID":2503,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7769,"DEST_STATE_NM":"UA","DEST_WAC":6452,"DEP_DELAY":84.0,"TAXI_OUT":145.0,"WHEELS_OFF":162.0,"WHEELS_ON":35.0,"TAXI_IN":122.0,"ARR_DELAY":200.0,"AIR_TIME":181.0,"DISTANCE":190.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":8427,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":2186,"ORIGIN_AIRPORT_ID":7151,"ORIGIN_AIRPORT_SEQ_ID":5464,"ORIGIN_CITY_MARKET_ID":8543,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":651,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8232,"DEST_AIRPORT_ID":9417,"DEST_AIRPORT_SEQ_ID":4828,"DEST_CITY_MARKET_ID":8147,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4748,"DEST_STATE_NM":"DL","DEST_WAC":5473,"DEP_DELAY":46.0,"TAXI_OUT":152.0,"WHEELS_OFF":148.0,"WHEELS_ON":106.0,"TAXI_IN":78.0,"ARR_DELAY":NaN,"AIR_TIME":61.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":5005,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":1783,"ORIGIN_AIRPORT_ID":5308,"ORIGIN_AIRPORT_SEQ_ID":2118,"ORIGIN_CITY_MARKET_ID":171,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5806,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7120,"DEST_AIRPORT_ID":3946,"DEST_AIRPORT_SEQ_ID":8525,"DEST_CITY_MARKET_ID":1371,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7268,"DEST_STATE_NM":"AA","DEST_WAC":2761,"DEP_DELAY":170.0,"TAXI_OUT":151.0,"WHEELS_OFF":33.0,"WHEELS_ON":89.0,"TAXI_IN":22.0,"ARR_DELAY":NaN,"AIR_TIME":118.0,"DISTANCE":148.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":6226,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":818,"ORIGIN_AIRPORT_ID":3754,"ORIGIN_AIRPORT_SEQ_ID":5467,"ORIGIN_CITY_MARKET_ID":6870,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9830,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9495,"DEST_AIRPORT_ID":8379,"DEST_AIRPORT_SEQ_ID":1458,"DEST_CITY_MARKET_ID":5515,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2939,"DEST_STATE_NM":"AA","DEST_WAC":8473,"DEP_DELAY":104.0,"TAXI_OUT":185.0,"WHEELS_OFF":153.0,"WHEELS_ON":45.0,"TAXI_IN":52.0,"ARR_DELAY":NaN,"AIR_TIME":26.0,"DISTANCE":173.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":7123,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":4871,"ORIGIN_AIRPORT_ID":884,"ORIGIN_AIRPORT_SEQ_ID":7819,"ORIGIN_CITY_MARKET_ID":2877,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2066,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6542,"DEST_AIRPORT_ID":9025,"DEST_AIRPORT_SEQ_ID":163,"DEST_CITY_MARKET_ID":9293,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6254,"DEST_STATE_NM":"DL","DEST_WAC":1587,"DEP_DELAY":133.0,"TAXI_OUT":-2.0,"WHEELS_OFF":159.0,"WHEELS_ON":144.0,"TAXI_IN":125.0,"ARR_DELAY":36.0,"AIR_TIME":154.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":8647,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":2880,"ORIGIN_AIRPORT_ID":875,"ORIGIN_AIRPORT_SEQ_ID":6485,"ORIGIN_CITY_MARKET_ID":6790,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1501,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7405,"DEST_AIRPORT_ID":8848,"DEST_AIRPORT_SEQ_ID":8920,"DEST_CITY_MARKET_ID":5480,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3143,"DEST_STATE_NM":"UA","DEST_WAC":9763,"DEP_DELAY":79.0,"TAXI_OUT":54.0,"WHEELS_OFF":162.0,"WHEELS_ON":141.0,"TAXI_IN":128.0,"ARR_DELAY":108.0,"AIR_TIME":177.0,"DISTANCE":117.0}
+{"FL_DATE":"2017-01-22","AIRLINE_ID":360,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4517,"ORIGIN_AIRPORT_ID":2765,"ORIGIN_AIRPORT_SEQ_ID":5277,"ORIGIN_CITY_MARKET_ID":3599,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":538,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3591,"DEST_AIRPORT_ID":6356,"DEST_AIRPORT_SEQ_ID":4289,"DEST_CITY_MARKET_ID":4220,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6153,"DEST_STATE_NM":"AA","DEST_WAC":541,"DEP_DELAY":164.0,"TAXI_OUT":91.0,"WHEELS_OFF":197.0,"WHEELS_ON":179.0,"TAXI_IN":138.0,"ARR_DELAY":51.0,"AIR_TIME":47.0,"DISTANCE":19.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":9505,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":6386,"ORIGIN_AIRPORT_ID":1003,"ORIGIN_AIRPORT_SEQ_ID":1184,"ORIGIN_CITY_MARKET_ID":4264,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7436,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":660,"DEST_AIRPORT_ID":4406,"DEST_AIRPORT_SEQ_ID":5524,"DEST_CITY_MARKET_ID":71,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8117,"DEST_STATE_NM":"DL","DEST_WAC":7068,"DEP_DELAY":73.0,"TAXI_OUT":164.0,"WHEELS_OFF":29.0,"WHEELS_ON":200.0,"TAXI_IN":4.0,"ARR_DELAY":NaN,"AIR_TIME":160.0,"DISTANCE":73.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":7036,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":2017,"ORIGIN_AIRPORT_ID":6168,"ORIGIN_AIRPORT_SEQ_ID":851,"ORIGIN_CITY_MARKET_ID":7107,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3756,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7827,"DEST_AIRPORT_ID":6286,"DEST_AIRPORT_SEQ_ID":2833,"DEST_CITY_MARKET_ID":2181,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5684,"DEST_STATE_NM":"DL","DEST_WAC":8287,"DEP_DELAY":177.0,"TAXI_OUT":76.0,"WHEELS_OFF":103.0,"WHEELS_ON":27.0,"TAXI_IN":NaN,"ARR_DELAY":43.0,"AIR_TIME":10.0,"DISTANCE":122.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":81,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":3517,"ORIGIN_AIRPORT_ID":892,"ORIGIN_AIRPORT_SEQ_ID":5109,"ORIGIN_CITY_MARKET_ID":2426,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2563,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6850,"DEST_AIRPORT_ID":4398,"DEST_AIRPORT_SEQ_ID":2142,"DEST_CITY_MARKET_ID":1196,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6829,"DEST_STATE_NM":"AA","DEST_WAC":6433,"DEP_DELAY":105.0,"TAXI_OUT":-4.0,"WHEELS_OFF":42.0,"WHEELS_ON":154.0,"TAXI_IN":28.0,"ARR_DELAY":159.0,"AIR_TIME":120.0,"DISTANCE":-4.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":9406,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":5825,"ORIGIN_AIRPORT_ID":8656,"ORIGIN_AIRPORT_SEQ_ID":4568,"ORIGIN_CITY_MARKET_ID":2938,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":7104,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9433,"DEST_AIRPORT_ID":9176,"DEST_AIRPORT_SEQ_ID":3617,"DEST_CITY_MARKET_ID":2067,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7136,"DEST_STATE_NM":"UA","DEST_WAC":7023,"DEP_DELAY":93.0,"TAXI_OUT":80.0,"WHEELS_OFF":125.0,"WHEELS_ON":-7.0,"TAXI_IN":-8.0,"ARR_DELAY":200.0,"AIR_TIME":21.0,"DISTANCE":99.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":6115,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":7494,"ORIGIN_AIRPORT_ID":3293,"ORIGIN_AIRPORT_SEQ_ID":8952,"ORIGIN_CITY_MARKET_ID":7820,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3409,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9979,"DEST_AIRPORT_ID":3611,"DEST_AIRPORT_SEQ_ID":4632,"DEST_CITY_MARKET_ID":1734,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3719,"DEST_STATE_NM":"DL","DEST_WAC":8390,"DEP_DELAY":194.0,"TAXI_OUT":163.0,"WHEELS_OFF":NaN,"WHEELS_ON":158.0,"TAXI_IN":NaN,"ARR_DELAY":139.0,"AIR_TIME":-17.0,"DISTANCE":96.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":6877,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":1725,"ORIGIN_AIRPORT_ID":2763,"ORIGIN_AIRPORT_SEQ_ID":8281,"ORIGIN_CITY_MARKET_ID":836,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":283,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8126,"DEST_AIRPORT_ID":7951,"DEST_AIRPORT_SEQ_ID":6043,"DEST_CITY_MARKET_ID":8999,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9731,"DEST_STATE_NM":"UA","DEST_WAC":7143,"DEP_DELAY":40.0,"TAXI_OUT":-18.0,"WHEELS_OFF":-9.0,"WHEELS_ON":147.0,"TAXI_IN":145.0,"ARR_DELAY":-11.0,"AIR_TIME":14.0,"DISTANCE":159.0}
+{"FL_DATE":"2017-01-06","AIRLINE_ID":7407,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4123,"ORIGIN_AIRPORT_ID":8258,"ORIGIN_AIRPORT_SEQ_ID":6259,"ORIGIN_CITY_MARKET_ID":1522,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6284,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6007,"DEST_AIRPORT_ID":3450,"DEST_AIRPORT_SEQ_ID":617,"DEST_CITY_MARKET_ID":8681,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3239,"DEST_STATE_NM":"AA","DEST_WAC":3879,"DEP_DELAY":150.0,"TAXI_OUT":158.0,"WHEELS_OFF":102.0,"WHEELS_ON":185.0,"TAXI_IN":127.0,"ARR_DELAY":40.0,"AIR_TIME":34.0,"DISTANCE":177.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":168,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":5168,"ORIGIN_AIRPORT_ID":1458,"ORIGIN_AIRPORT_SEQ_ID":8656,"ORIGIN_CITY_MARKET_ID":2926,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6714,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":2299,"DEST_AIRPORT_ID":8914,"DEST_AIRPORT_SEQ_ID":711,"DEST_CITY_MARKET_ID":2297,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5877,"DEST_STATE_NM":"DL","DEST_WAC":3122,"DEP_DELAY":98.0,"TAXI_OUT":1.0,"WHEELS_OFF":73.0,"WHEELS_ON":NaN,"TAXI_IN":71.0,"ARR_DELAY":140.0,"AIR_TIME":NaN,"DISTANCE":195.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":6641,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":2840,"ORIGIN_AIRPORT_ID":4902,"ORIGIN_AIRPORT_SEQ_ID":3593,"ORIGIN_CITY_MARKET_ID":5407,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":835,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2982,"DEST_AIRPORT_ID":9849,"DEST_AIRPORT_SEQ_ID":7577,"DEST_CITY_MARKET_ID":5313,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9727,"DEST_STATE_NM":"UA","DEST_WAC":4449,"DEP_DELAY":163.0,"TAXI_OUT":-17.0,"WHEELS_OFF":172.0,"WHEELS_ON":49.0,"TAXI_IN":197.0,"ARR_DELAY":78.0,"AIR_TIME":157.0,"DISTANCE":43.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":8486,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":9291,"ORIGIN_AIRPORT_ID":4326,"ORIGIN_AIRPORT_SEQ_ID":171,"ORIGIN_CITY_MARKET_ID":96,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2444,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1272,"DEST_AIRPORT_ID":9797,"DEST_AIRPORT_SEQ_ID":4055,"DEST_CITY_MARKET_ID":9125,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2175,"DEST_STATE_NM":"DL","DEST_WAC":2275,"DEP_DELAY":167.0,"TAXI_OUT":29.0,"WHEELS_OFF":135.0,"WHEELS_ON":9.0,"TAXI_IN":-12.0,"ARR_DELAY":49.0,"AIR_TIME":17.0,"DISTANCE":-18.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":7475,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":6515,"ORIGIN_AIRPORT_ID":5070,"ORIGIN_AIRPORT_SEQ_ID":2191,"ORIGIN_CITY_MARKET_ID":6418,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5732,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7786,"DEST_AIRPORT_ID":3042,"DEST_AIRPORT_SEQ_ID":4407,"DEST_CITY_MARKET_ID":131,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":871,"DEST_STATE_NM":"DL","DEST_WAC":978,"DEP_DELAY":0.0,"TAXI_OUT":98.0,"WHEELS_OFF":NaN,"WHEELS_ON":42.0,"TAXI_IN":80.0,"ARR_DELAY":168.0,"AIR_TIME":79.0,"DISTANCE":198.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":4536,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":3575,"ORIGIN_AIRPORT_ID":2647,"ORIGIN_AIRPORT_SEQ_ID":1485,"ORIGIN_CITY_MARKET_ID":5413,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9114,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3354,"DEST_AIRPORT_ID":5384,"DEST_AIRPORT_SEQ_ID":9178,"DEST_CITY_MARKET_ID":8789,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7068,"DEST_STATE_NM":"UA","DEST_WAC":5839,"DEP_DELAY":22.0,"TAXI_OUT":6.0,"WHEELS_OFF":27.0,"WHEELS_ON":106.0,"TAXI_IN":96.0,"ARR_DELAY":-4.0,"AIR_TIME":NaN,"DISTANCE":64.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":6036,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":7051,"ORIGIN_AIRPORT_ID":8465,"ORIGIN_AIRPORT_SEQ_ID":9809,"ORIGIN_CITY_MARKET_ID":1159,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8631,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8147,"DEST_AIRPORT_ID":5679,"DEST_AIRPORT_SEQ_ID":1956,"DEST_CITY_MARKET_ID":7331,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4983,"DEST_STATE_NM":"DL","DEST_WAC":2293,"DEP_DELAY":160.0,"TAXI_OUT":-9.0,"WHEELS_OFF":128.0,"WHEELS_ON":149.0,"TAXI_IN":143.0,"ARR_DELAY":26.0,"AIR_TIME":122.0,"DISTANCE":43.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":7061,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":8075,"ORIGIN_AIRPORT_ID":5896,"ORIGIN_AIRPORT_SEQ_ID":8242,"ORIGIN_CITY_MARKET_ID":4781,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9273,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2128,"DEST_AIRPORT_ID":8338,"DEST_AIRPORT_SEQ_ID":3821,"DEST_CITY_MARKET_ID":7013,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5927,"DEST_STATE_NM":"UA","DEST_WAC":8531,"DEP_DELAY":160.0,"TAXI_OUT":-16.0,"WHEELS_OFF":41.0,"WHEELS_ON":114.0,"TAXI_IN":122.0,"ARR_DELAY":180.0,"AIR_TIME":36.0,"DISTANCE":116.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":2546,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":405,"ORIGIN_AIRPORT_ID":2332,"ORIGIN_AIRPORT_SEQ_ID":8923,"ORIGIN_CITY_MARKET_ID":4366,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2258,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4192,"DEST_AIRPORT_ID":6761,"DEST_AIRPORT_SEQ_ID":5827,"DEST_CITY_MARKET_ID":9730,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7509,"DEST_STATE_NM":"AA","DEST_WAC":5153,"DEP_DELAY":56.0,"TAXI_OUT":169.0,"WHEELS_OFF":58.0,"WHEELS_ON":103.0,"TAXI_IN":10.0,"ARR_DELAY":155.0,"AIR_TIME":162.0,"DISTANCE":-2.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":2017,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4025,"ORIGIN_AIRPORT_ID":7688,"ORIGIN_AIRPORT_SEQ_ID":1162,"ORIGIN_CITY_MARKET_ID":3485,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4682,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7621,"DEST_AIRPORT_ID":9148,"DEST_AIRPORT_SEQ_ID":9391,"DEST_CITY_MARKET_ID":8347,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6169,"DEST_STATE_NM":"AA","DEST_WAC":506,"DEP_DELAY":NaN,"TAXI_OUT":139.0,"WHEELS_OFF":164.0,"WHEELS_ON":86.0,"TAXI_IN":144.0,"ARR_DELAY":150.0,"AIR_TIME":196.0,"DISTANCE":98.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":4042,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":4795,"ORIGIN_AIRPORT_ID":4397,"ORIGIN_AIRPORT_SEQ_ID":7769,"ORIGIN_CITY_MARKET_ID":8086,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1965,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7316,"DEST_AIRPORT_ID":6358,"DEST_AIRPORT_SEQ_ID":3523,"DEST_CITY_MARKET_ID":6900,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6333,"DEST_STATE_NM":"DL","DEST_WAC":6121,"DEP_DELAY":184.0,"TAXI_OUT":NaN,"WHEELS_OFF":20.0,"WHEELS_ON":NaN,"TAXI_IN":174.0,"ARR_DELAY":164.0,"AIR_TIME":59.0,"DISTANCE":14.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":7393,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":9482,"ORIGIN_AIRPORT_ID":5654,"ORIGIN_AIRPORT_SEQ_ID":7139,"ORIGIN_CITY_MARKET_ID":5953,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7556,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7763,"DEST_AIRPORT_ID":4447,"DEST_AIRPORT_SEQ_ID":6807,"DEST_CITY_MARKET_ID":4662,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1822,"DEST_STATE_NM":"DL","DEST_WAC":7336,"DEP_DELAY":153.0,"TAXI_OUT":112.0,"WHEELS_OFF":194.0,"WHEELS_ON":61.0,"TAXI_IN":20.0,"ARR_DELAY":190.0,"AIR_TIME":195.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":6523,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":1179,"ORIGIN_AIRPORT_ID":1390,"ORIGIN_AIRPORT_SEQ_ID":2708,"ORIGIN_CITY_MARKET_ID":7680,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3603,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9893,"DEST_AIRPORT_ID":6411,"DEST_AIRPORT_SEQ_ID":4397,"DEST_CITY_MARKET_ID":130,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7062,"DEST_STATE_NM":"DL","DEST_WAC":4931,"DEP_DELAY":121.0,"TAXI_OUT":NaN,"WHEELS_OFF":18.0,"WHEELS_ON":NaN,"TAXI_IN":112.0,"ARR_DELAY":90.0,"AIR_TIME":-6.0,"DISTANCE":61.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":590,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":516,"ORIGIN_AIRPORT_ID":5639,"ORIGIN_AIRPORT_SEQ_ID":4661,"ORIGIN_CITY_MARKET_ID":9156,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4487,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4702,"DEST_AIRPORT_ID":8382,"DEST_AIRPORT_SEQ_ID":5542,"DEST_CITY_MARKET_ID":9100,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2109,"DEST_STATE_NM":"AA","DEST_WAC":6287,"DEP_DELAY":193.0,"TAXI_OUT":22.0,"WHEELS_OFF":173.0,"WHEELS_ON":-16.0,"TAXI_IN":136.0,"ARR_DELAY":87.0,"AIR_TIME":98.0,"DISTANCE":-14.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":8343,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":2040,"ORIGIN_AIRPORT_ID":9409,"ORIGIN_AIRPORT_SEQ_ID":9331,"ORIGIN_CITY_MARKET_ID":271,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3520,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9593,"DEST_AIRPORT_ID":533,"DEST_AIRPORT_SEQ_ID":6714,"DEST_CITY_MARKET_ID":7735,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":138,"DEST_STATE_NM":"AA","DEST_WAC":7732,"DEP_DELAY":90.0,"TAXI_OUT":5.0,"WHEELS_OFF":121.0,"WHEELS_ON":180.0,"TAXI_IN":NaN,"ARR_DELAY":88.0,"AIR_TIME":69.0,"DISTANCE":193.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":1357,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":1816,"ORIGIN_AIRPORT_ID":9707,"ORIGIN_AIRPORT_SEQ_ID":9929,"ORIGIN_CITY_MARKET_ID":5427,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9869,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2600,"DEST_AIRPORT_ID":2630,"DEST_AIRPORT_SEQ_ID":5414,"DEST_CITY_MARKET_ID":1337,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9126,"DEST_STATE_NM":"UA","DEST_WAC":1079,"DEP_DELAY":98.0,"TAXI_OUT":93.0,"WHEELS_OFF":113.0,"WHEELS_ON":114.0,"TAXI_IN":187.0,"ARR_DELAY":153.0,"AIR_TIME":16.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":2904,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2458,"ORIGIN_AIRPORT_ID":3399,"ORIGIN_AIRPORT_SEQ_ID":2202,"ORIGIN_CITY_MARKET_ID":3996,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7937,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8980,"DEST_AIRPORT_ID":6383,"DEST_AIRPORT_SEQ_ID":6461,"DEST_CITY_MARKET_ID":6949,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7146,"DEST_STATE_NM":"DL","DEST_WAC":4590,"DEP_DELAY":151.0,"TAXI_OUT":76.0,"WHEELS_OFF":NaN,"WHEELS_ON":136.0,"TAXI_IN":92.0,"ARR_DELAY":79.0,"AIR_TIME":152.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":3702,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4681,"ORIGIN_AIRPORT_ID":9712,"ORIGIN_AIRPORT_SEQ_ID":9321,"ORIGIN_CITY_MARKET_ID":8024,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1057,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6446,"DEST_AIRPORT_ID":1199,"DEST_AIRPORT_SEQ_ID":1216,"DEST_CITY_MARKET_ID":4,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1431,"DEST_STATE_NM":"AA","DEST_WAC":8985,"DEP_DELAY":33.0,"TAXI_OUT":90.0,"WHEELS_OFF":51.0,"WHEELS_ON":70.0,"TAXI_IN":155.0,"ARR_DELAY":84.0,"AIR_TIME":NaN,"DISTANCE":95.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":5465,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":169,"ORIGIN_AIRPORT_ID":917,"ORIGIN_AIRPORT_SEQ_ID":2429,"ORIGIN_CITY_MARKET_ID":6681,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3307,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2626,"DEST_AIRPORT_ID":7462,"DEST_AIRPORT_SEQ_ID":8418,"DEST_CITY_MARKET_ID":389,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4826,"DEST_STATE_NM":"UA","DEST_WAC":5085,"DEP_DELAY":95.0,"TAXI_OUT":NaN,"WHEELS_OFF":175.0,"WHEELS_ON":139.0,"TAXI_IN":196.0,"ARR_DELAY":7.0,"AIR_TIME":180.0,"DISTANCE":197.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":8105,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":1268,"ORIGIN_AIRPORT_ID":2145,"ORIGIN_AIRPORT_SEQ_ID":4680,"ORIGIN_CITY_MARKET_ID":494,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2866,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9699,"DEST_AIRPORT_ID":7539,"DEST_AIRPORT_SEQ_ID":1761,"DEST_CITY_MARKET_ID":57,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2796,"DEST_STATE_NM":"DL","DEST_WAC":1553,"DEP_DELAY":NaN,"TAXI_OUT":191.0,"WHEELS_OFF":119.0,"WHEELS_ON":57.0,"TAXI_IN":191.0,"ARR_DELAY":116.0,"AIR_TIME":56.0,"DISTANCE":177.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":3420,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":1603,"ORIGIN_AIRPORT_ID":498,"ORIGIN_AIRPORT_SEQ_ID":6478,"ORIGIN_CITY_MARKET_ID":7812,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":7690,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6047,"DEST_AIRPORT_ID":2952,"DEST_AIRPORT_SEQ_ID":3430,"DEST_CITY_MARKET_ID":7819,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8756,"DEST_STATE_NM":"UA","DEST_WAC":3711,"DEP_DELAY":158.0,"TAXI_OUT":30.0,"WHEELS_OFF":105.0,"WHEELS_ON":42.0,"TAXI_IN":72.0,"ARR_DELAY":NaN,"AIR_TIME":NaN,"DISTANCE":168.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":7363,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":9758,"ORIGIN_AIRPORT_ID":7358,"ORIGIN_AIRPORT_SEQ_ID":6081,"ORIGIN_CITY_MARKET_ID":643,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2135,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1774,"DEST_AIRPORT_ID":6801,"DEST_AIRPORT_SEQ_ID":3277,"DEST_CITY_MARKET_ID":5368,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3659,"DEST_STATE_NM":"AA","DEST_WAC":6295,"DEP_DELAY":188.0,"TAXI_OUT":179.0,"WHEELS_OFF":39.0,"WHEELS_ON":153.0,"TAXI_IN":43.0,"ARR_DELAY":58.0,"AIR_TIME":150.0,"DISTANCE":-17.0}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":2530,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":6384,"ORIGIN_AIRPORT_ID":8047,"ORIGIN_AIRPORT_SEQ_ID":7457,"ORIGIN_CITY_MARKET_ID":1841,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1012,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3956,"DEST_AIRPORT_ID":2814,"DEST_AIRPORT_SEQ_ID":3233,"DEST_CITY_MARKET_ID":7007,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6569,"DEST_STATE_NM":"UA","DEST_WAC":5770,"DEP_DELAY":1.0,"TAXI_OUT":NaN,"WHEELS_OFF":96.0,"WHEELS_ON":191.0,"TAXI_IN":53.0,"ARR_DELAY":170.0,"AIR_TIME":75.0,"DISTANCE":-18.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":1873,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":4479,"ORIGIN_AIRPORT_ID":958,"ORIGIN_AIRPORT_SEQ_ID":8383,"ORIGIN_CITY_MARKET_ID":7861,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5206,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7018,"DEST_AIRPORT_ID":7467,"DEST_AIRPORT_SEQ_ID":9533,"DEST_CITY_MARKET_ID":9202,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8381,"DEST_STATE_NM":"AA","DEST_WAC":6570,"DEP_DELAY":60.0,"TAXI_OUT":8.0,"WHEELS_OFF":87.0,"WHEELS_ON":44.0,"TAXI_IN":13.0,"ARR_DELAY":NaN,"AIR_TIME":51.0,"DISTANCE":27.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":6974,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":5002,"ORIGIN_AIRPORT_ID":8361,"ORIGIN_AIRPORT_SEQ_ID":2270,"ORIGIN_CITY_MARKET_ID":2328,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8314,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8120,"DEST_AIRPORT_ID":8482,"DEST_AIRPORT_SEQ_ID":733,"DEST_CITY_MARKET_ID":6340,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4819,"DEST_STATE_NM":"DL","DEST_WAC":7592,"DEP_DELAY":116.0,"TAXI_OUT":85.0,"WHEELS_OFF":NaN,"WHEELS_ON":-5.0,"TAXI_IN":63.0,"ARR_DELAY":-13.0,"AIR_TIME":-6.0,"DISTANCE":169.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":2686,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":6765,"ORIGIN_AIRPORT_ID":8513,"ORIGIN_AIRPORT_SEQ_ID":2349,"ORIGIN_CITY_MARKET_ID":1300,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1033,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5989,"DEST_AIRPORT_ID":2451,"DEST_AIRPORT_SEQ_ID":7546,"DEST_CITY_MARKET_ID":6656,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4621,"DEST_STATE_NM":"DL","DEST_WAC":9089,"DEP_DELAY":NaN,"TAXI_OUT":141.0,"WHEELS_OFF":NaN,"WHEELS_ON":32.0,"TAXI_IN":200.0,"ARR_DELAY":102.0,"AIR_TIME":176.0,"DISTANCE":159.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":6958,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":5834,"ORIGIN_AIRPORT_ID":5112,"ORIGIN_AIRPORT_SEQ_ID":4116,"ORIGIN_CITY_MARKET_ID":5905,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6531,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7181,"DEST_AIRPORT_ID":6036,"DEST_AIRPORT_SEQ_ID":5344,"DEST_CITY_MARKET_ID":6762,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7829,"DEST_STATE_NM":"DL","DEST_WAC":4143,"DEP_DELAY":127.0,"TAXI_OUT":-8.0,"WHEELS_OFF":186.0,"WHEELS_ON":106.0,"TAXI_IN":17.0,"ARR_DELAY":158.0,"AIR_TIME":196.0,"DISTANCE":39.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":1149,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":9218,"ORIGIN_AIRPORT_ID":9631,"ORIGIN_AIRPORT_SEQ_ID":5984,"ORIGIN_CITY_MARKET_ID":2785,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4987,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3618,"DEST_AIRPORT_ID":165,"DEST_AIRPORT_SEQ_ID":7862,"DEST_CITY_MARKET_ID":5857,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6437,"DEST_STATE_NM":"DL","DEST_WAC":748,"DEP_DELAY":104.0,"TAXI_OUT":62.0,"WHEELS_OFF":168.0,"WHEELS_ON":8.0,"TAXI_IN":62.0,"ARR_DELAY":140.0,"AIR_TIME":94.0,"DISTANCE":114.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":8094,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":3104,"ORIGIN_AIRPORT_ID":6531,"ORIGIN_AIRPORT_SEQ_ID":5480,"ORIGIN_CITY_MARKET_ID":4240,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7143,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3516,"DEST_AIRPORT_ID":438,"DEST_AIRPORT_SEQ_ID":9430,"DEST_CITY_MARKET_ID":5244,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4920,"DEST_STATE_NM":"DL","DEST_WAC":5735,"DEP_DELAY":63.0,"TAXI_OUT":170.0,"WHEELS_OFF":152.0,"WHEELS_ON":190.0,"TAXI_IN":165.0,"ARR_DELAY":134.0,"AIR_TIME":46.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":1809,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":4832,"ORIGIN_AIRPORT_ID":8949,"ORIGIN_AIRPORT_SEQ_ID":4582,"ORIGIN_CITY_MARKET_ID":6107,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1711,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7282,"DEST_AIRPORT_ID":5129,"DEST_AIRPORT_SEQ_ID":114,"DEST_CITY_MARKET_ID":7648,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5138,"DEST_STATE_NM":"AA","DEST_WAC":3341,"DEP_DELAY":23.0,"TAXI_OUT":68.0,"WHEELS_OFF":176.0,"WHEELS_ON":33.0,"TAXI_IN":-5.0,"ARR_DELAY":183.0,"AIR_TIME":153.0,"DISTANCE":100.0}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":7000,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":3688,"ORIGIN_AIRPORT_ID":5645,"ORIGIN_AIRPORT_SEQ_ID":910,"ORIGIN_CITY_MARKET_ID":5325,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8932,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8190,"DEST_AIRPORT_ID":5422,"DEST_AIRPORT_SEQ_ID":2336,"DEST_CITY_MARKET_ID":3328,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7972,"DEST_STATE_NM":"DL","DEST_WAC":5221,"DEP_DELAY":0.0,"TAXI_OUT":51.0,"WHEELS_OFF":194.0,"WHEELS_ON":161.0,"TAXI_IN":188.0,"ARR_DELAY":86.0,"AIR_TIME":NaN,"DISTANCE":188.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":1578,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":9125,"ORIGIN_AIRPORT_ID":3576,"ORIGIN_AIRPORT_SEQ_ID":2403,"ORIGIN_CITY_MARKET_ID":63,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1843,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1343,"DEST_AIRPORT_ID":5413,"DEST_AIRPORT_SEQ_ID":2038,"DEST_CITY_MARKET_ID":9552,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6829,"DEST_STATE_NM":"UA","DEST_WAC":6465,"DEP_DELAY":NaN,"TAXI_OUT":197.0,"WHEELS_OFF":95.0,"WHEELS_ON":179.0,"TAXI_IN":92.0,"ARR_DELAY":119.0,"AIR_TIME":97.0,"DISTANCE":79.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":1737,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":2313,"ORIGIN_AIRPORT_ID":4338,"ORIGIN_AIRPORT_SEQ_ID":714,"ORIGIN_CITY_MARKET_ID":1551,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":584,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5357,"DEST_AIRPORT_ID":5537,"DEST_AIRPORT_SEQ_ID":675,"DEST_CITY_MARKET_ID":2652,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":284,"DEST_STATE_NM":"DL","DEST_WAC":9003,"DEP_DELAY":11.0,"TAXI_OUT":81.0,"WHEELS_OFF":NaN,"WHEELS_ON":109.0,"TAXI_IN":79.0,"ARR_DELAY":12.0,"AIR_TIME":15.0,"DISTANCE":198.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":9078,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":9642,"ORIGIN_AIRPORT_ID":3883,"ORIGIN_AIRPORT_SEQ_ID":3251,"ORIGIN_CITY_MARKET_ID":503,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7504,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7696,"DEST_AIRPORT_ID":7014,"DEST_AIRPORT_SEQ_ID":8701,"DEST_CITY_MARKET_ID":9,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6210,"DEST_STATE_NM":"DL","DEST_WAC":440,"DEP_DELAY":198.0,"TAXI_OUT":186.0,"WHEELS_OFF":190.0,"WHEELS_ON":193.0,"TAXI_IN":89.0,"ARR_DELAY":113.0,"AIR_TIME":175.0,"DISTANCE":44.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":1494,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":6635,"ORIGIN_AIRPORT_ID":7241,"ORIGIN_AIRPORT_SEQ_ID":5976,"ORIGIN_CITY_MARKET_ID":6912,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8188,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8795,"DEST_AIRPORT_ID":462,"DEST_AIRPORT_SEQ_ID":785,"DEST_CITY_MARKET_ID":7996,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":321,"DEST_STATE_NM":"DL","DEST_WAC":1263,"DEP_DELAY":157.0,"TAXI_OUT":39.0,"WHEELS_OFF":169.0,"WHEELS_ON":22.0,"TAXI_IN":173.0,"ARR_DELAY":157.0,"AIR_TIME":27.0,"DISTANCE":54.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":7267,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":7426,"ORIGIN_AIRPORT_ID":9754,"ORIGIN_AIRPORT_SEQ_ID":4619,"ORIGIN_CITY_MARKET_ID":4026,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2438,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3228,"DEST_AIRPORT_ID":2974,"DEST_AIRPORT_SEQ_ID":5018,"DEST_CITY_MARKET_ID":1181,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9601,"DEST_STATE_NM":"DL","DEST_WAC":2964,"DEP_DELAY":81.0,"TAXI_OUT":188.0,"WHEELS_OFF":71.0,"WHEELS_ON":39.0,"TAXI_IN":NaN,"ARR_DELAY":138.0,"AIR_TIME":96.0,"DISTANCE":52.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":2436,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":4106,"ORIGIN_AIRPORT_ID":53,"ORIGIN_AIRPORT_SEQ_ID":2350,"ORIGIN_CITY_MARKET_ID":3083,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":103,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":596,"DEST_AIRPORT_ID":7526,"DEST_AIRPORT_SEQ_ID":4662,"DEST_CITY_MARKET_ID":3645,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1278,"DEST_STATE_NM":"UA","DEST_WAC":2452,"DEP_DELAY":25.0,"TAXI_OUT":91.0,"WHEELS_OFF":92.0,"WHEELS_ON":-7.0,"TAXI_IN":108.0,"ARR_DELAY":53.0,"AIR_TIME":119.0,"DISTANCE":137.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":864,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":7409,"ORIGIN_AIRPORT_ID":8055,"ORIGIN_AIRPORT_SEQ_ID":3765,"ORIGIN_CITY_MARKET_ID":8421,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5013,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4366,"DEST_AIRPORT_ID":6878,"DEST_AIRPORT_SEQ_ID":4344,"DEST_CITY_MARKET_ID":1881,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":8223,"DEST_STATE_NM":"AA","DEST_WAC":932,"DEP_DELAY":-10.0,"TAXI_OUT":NaN,"WHEELS_OFF":-13.0,"WHEELS_ON":103.0,"TAXI_IN":133.0,"ARR_DELAY":107.0,"AIR_TIME":2.0,"DISTANCE":69.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":1463,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":5899,"ORIGIN_AIRPORT_ID":3177,"ORIGIN_AIRPORT_SEQ_ID":7565,"ORIGIN_CITY_MARKET_ID":6205,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9620,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4044,"DEST_AIRPORT_ID":3824,"DEST_AIRPORT_SEQ_ID":1559,"DEST_CITY_MARKET_ID":3866,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":8564,"DEST_STATE_NM":"DL","DEST_WAC":1329,"DEP_DELAY":192.0,"TAXI_OUT":43.0,"WHEELS_OFF":178.0,"WHEELS_ON":141.0,"TAXI_IN":11.0,"ARR_DELAY":163.0,"AIR_TIME":98.0,"DISTANCE":178.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":1301,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":6245,"ORIGIN_AIRPORT_ID":2523,"ORIGIN_AIRPORT_SEQ_ID":9345,"ORIGIN_CITY_MARKET_ID":3997,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8382,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9396,"DEST_AIRPORT_ID":7848,"DEST_AIRPORT_SEQ_ID":6330,"DEST_CITY_MARKET_ID":1923,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7444,"DEST_STATE_NM":"DL","DEST_WAC":6467,"DEP_DELAY":130.0,"TAXI_OUT":18.0,"WHEELS_OFF":63.0,"WHEELS_ON":30.0,"TAXI_IN":-9.0,"ARR_DELAY":83.0,"AIR_TIME":186.0,"DISTANCE":13.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":6118,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5318,"ORIGIN_AIRPORT_ID":9244,"ORIGIN_AIRPORT_SEQ_ID":708,"ORIGIN_CITY_MARKET_ID":902,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7443,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8346,"DEST_AIRPORT_ID":3496,"DEST_AIRPORT_SEQ_ID":4557,"DEST_CITY_MARKET_ID":4219,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1948,"DEST_STATE_NM":"DL","DEST_WAC":3663,"DEP_DELAY":30.0,"TAXI_OUT":198.0,"WHEELS_OFF":87.0,"WHEELS_ON":111.0,"TAXI_IN":2.0,"ARR_DELAY":-13.0,"AIR_TIME":80.0,"DISTANCE":174.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":6498,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":1528,"ORIGIN_AIRPORT_ID":8574,"ORIGIN_AIRPORT_SEQ_ID":3782,"ORIGIN_CITY_MARKET_ID":3270,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5205,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9133,"DEST_AIRPORT_ID":146,"DEST_AIRPORT_SEQ_ID":8658,"DEST_CITY_MARKET_ID":8586,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4269,"DEST_STATE_NM":"AA","DEST_WAC":6246,"DEP_DELAY":80.0,"TAXI_OUT":136.0,"WHEELS_OFF":84.0,"WHEELS_ON":102.0,"TAXI_IN":-7.0,"ARR_DELAY":124.0,"AIR_TIME":NaN,"DISTANCE":78.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":5628,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":4110,"ORIGIN_AIRPORT_ID":3958,"ORIGIN_AIRPORT_SEQ_ID":6716,"ORIGIN_CITY_MARKET_ID":2251,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":761,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3080,"DEST_AIRPORT_ID":9305,"DEST_AIRPORT_SEQ_ID":2419,"DEST_CITY_MARKET_ID":9293,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3413,"DEST_STATE_NM":"DL","DEST_WAC":862,"DEP_DELAY":65.0,"TAXI_OUT":173.0,"WHEELS_OFF":69.0,"WHEELS_ON":91.0,"TAXI_IN":69.0,"ARR_DELAY":77.0,"AIR_TIME":NaN,"DISTANCE":99.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":5847,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":1514,"ORIGIN_AIRPORT_ID":7587,"ORIGIN_AIRPORT_SEQ_ID":8446,"ORIGIN_CITY_MARKET_ID":6849,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7501,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2444,"DEST_AIRPORT_ID":4320,"DEST_AIRPORT_SEQ_ID":233,"DEST_CITY_MARKET_ID":8645,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5754,"DEST_STATE_NM":"UA","DEST_WAC":7631,"DEP_DELAY":92.0,"TAXI_OUT":-18.0,"WHEELS_OFF":163.0,"WHEELS_ON":181.0,"TAXI_IN":37.0,"ARR_DELAY":37.0,"AIR_TIME":27.0,"DISTANCE":71.0}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":639,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2991,"ORIGIN_AIRPORT_ID":6369,"ORIGIN_AIRPORT_SEQ_ID":8714,"ORIGIN_CITY_MARKET_ID":5789,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9359,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4952,"DEST_AIRPORT_ID":8342,"DEST_AIRPORT_SEQ_ID":4265,"DEST_CITY_MARKET_ID":7509,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9125,"DEST_STATE_NM":"DL","DEST_WAC":5074,"DEP_DELAY":34.0,"TAXI_OUT":129.0,"WHEELS_OFF":31.0,"WHEELS_ON":3.0,"TAXI_IN":154.0,"ARR_DELAY":53.0,"AIR_TIME":134.0,"DISTANCE":188.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":1513,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":3276,"ORIGIN_AIRPORT_ID":7891,"ORIGIN_AIRPORT_SEQ_ID":1989,"ORIGIN_CITY_MARKET_ID":8433,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1367,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1339,"DEST_AIRPORT_ID":5296,"DEST_AIRPORT_SEQ_ID":4004,"DEST_CITY_MARKET_ID":7252,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7231,"DEST_STATE_NM":"AA","DEST_WAC":1403,"DEP_DELAY":-4.0,"TAXI_OUT":-8.0,"WHEELS_OFF":12.0,"WHEELS_ON":91.0,"TAXI_IN":-18.0,"ARR_DELAY":119.0,"AIR_TIME":132.0,"DISTANCE":198.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":8750,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":5985,"ORIGIN_AIRPORT_ID":549,"ORIGIN_AIRPORT_SEQ_ID":3822,"ORIGIN_CITY_MARKET_ID":8833,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":358,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":687,"DEST_AIRPORT_ID":2171,"DEST_AIRPORT_SEQ_ID":5464,"DEST_CITY_MARKET_ID":6278,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7380,"DEST_STATE_NM":"DL","DEST_WAC":5372,"DEP_DELAY":89.0,"TAXI_OUT":-4.0,"WHEELS_OFF":174.0,"WHEELS_ON":193.0,"TAXI_IN":146.0,"ARR_DELAY":6.0,"AIR_TIME":189.0,"DISTANCE":127.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":216,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":9629,"ORIGIN_AIRPORT_ID":1476,"ORIGIN_AIRPORT_SEQ_ID":3990,"ORIGIN_CITY_MARKET_ID":1026,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9064,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8266,"DEST_AIRPORT_ID":534,"DEST_AIRPORT_SEQ_ID":2355,"DEST_CITY_MARKET_ID":8093,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2458,"DEST_STATE_NM":"UA","DEST_WAC":1909,"DEP_DELAY":118.0,"TAXI_OUT":107.0,"WHEELS_OFF":130.0,"WHEELS_ON":17.0,"TAXI_IN":93.0,"ARR_DELAY":135.0,"AIR_TIME":131.0,"DISTANCE":74.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":6502,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":9428,"ORIGIN_AIRPORT_ID":1375,"ORIGIN_AIRPORT_SEQ_ID":359,"ORIGIN_CITY_MARKET_ID":3535,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9988,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5693,"DEST_AIRPORT_ID":7100,"DEST_AIRPORT_SEQ_ID":9121,"DEST_CITY_MARKET_ID":1575,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5432,"DEST_STATE_NM":"AA","DEST_WAC":3289,"DEP_DELAY":120.0,"TAXI_OUT":NaN,"WHEELS_OFF":56.0,"WHEELS_ON":130.0,"TAXI_IN":154.0,"ARR_DELAY":69.0,"AIR_TIME":176.0,"DISTANCE":136.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":8178,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":6245,"ORIGIN_AIRPORT_ID":33,"ORIGIN_AIRPORT_SEQ_ID":2987,"ORIGIN_CITY_MARKET_ID":275,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6667,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3101,"DEST_AIRPORT_ID":3990,"DEST_AIRPORT_SEQ_ID":6851,"DEST_CITY_MARKET_ID":9613,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6218,"DEST_STATE_NM":"AA","DEST_WAC":2803,"DEP_DELAY":-20.0,"TAXI_OUT":33.0,"WHEELS_OFF":54.0,"WHEELS_ON":80.0,"TAXI_IN":27.0,"ARR_DELAY":175.0,"AIR_TIME":21.0,"DISTANCE":189.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":8189,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":7332,"ORIGIN_AIRPORT_ID":2995,"ORIGIN_AIRPORT_SEQ_ID":4718,"ORIGIN_CITY_MARKET_ID":4377,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9380,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":713,"DEST_AIRPORT_ID":3749,"DEST_AIRPORT_SEQ_ID":3568,"DEST_CITY_MARKET_ID":4405,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7050,"DEST_STATE_NM":"UA","DEST_WAC":4587,"DEP_DELAY":40.0,"TAXI_OUT":180.0,"WHEELS_OFF":85.0,"WHEELS_ON":97.0,"TAXI_IN":115.0,"ARR_DELAY":-9.0,"AIR_TIME":118.0,"DISTANCE":11.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":1204,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":8399,"ORIGIN_AIRPORT_ID":6242,"ORIGIN_AIRPORT_SEQ_ID":9846,"ORIGIN_CITY_MARKET_ID":7506,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6402,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8933,"DEST_AIRPORT_ID":3458,"DEST_AIRPORT_SEQ_ID":7082,"DEST_CITY_MARKET_ID":8611,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8391,"DEST_STATE_NM":"UA","DEST_WAC":7725,"DEP_DELAY":143.0,"TAXI_OUT":76.0,"WHEELS_OFF":153.0,"WHEELS_ON":110.0,"TAXI_IN":74.0,"ARR_DELAY":25.0,"AIR_TIME":87.0,"DISTANCE":118.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":3119,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":1401,"ORIGIN_AIRPORT_ID":4171,"ORIGIN_AIRPORT_SEQ_ID":6884,"ORIGIN_CITY_MARKET_ID":3656,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":551,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5648,"DEST_AIRPORT_ID":6579,"DEST_AIRPORT_SEQ_ID":7607,"DEST_CITY_MARKET_ID":6830,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3807,"DEST_STATE_NM":"AA","DEST_WAC":2343,"DEP_DELAY":148.0,"TAXI_OUT":170.0,"WHEELS_OFF":153.0,"WHEELS_ON":128.0,"TAXI_IN":88.0,"ARR_DELAY":75.0,"AIR_TIME":46.0,"DISTANCE":80.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":5402,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":3449,"ORIGIN_AIRPORT_ID":1562,"ORIGIN_AIRPORT_SEQ_ID":2235,"ORIGIN_CITY_MARKET_ID":4049,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8203,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6539,"DEST_AIRPORT_ID":4108,"DEST_AIRPORT_SEQ_ID":207,"DEST_CITY_MARKET_ID":6828,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1134,"DEST_STATE_NM":"AA","DEST_WAC":6330,"DEP_DELAY":137.0,"TAXI_OUT":3.0,"WHEELS_OFF":99.0,"WHEELS_ON":8.0,"TAXI_IN":77.0,"ARR_DELAY":78.0,"AIR_TIME":130.0,"DISTANCE":184.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":4016,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":8905,"ORIGIN_AIRPORT_ID":1341,"ORIGIN_AIRPORT_SEQ_ID":2652,"ORIGIN_CITY_MARKET_ID":96,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7530,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8191,"DEST_AIRPORT_ID":6287,"DEST_AIRPORT_SEQ_ID":3307,"DEST_CITY_MARKET_ID":3094,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3223,"DEST_STATE_NM":"DL","DEST_WAC":4593,"DEP_DELAY":120.0,"TAXI_OUT":170.0,"WHEELS_OFF":86.0,"WHEELS_ON":19.0,"TAXI_IN":194.0,"ARR_DELAY":157.0,"AIR_TIME":NaN,"DISTANCE":76.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":8363,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":2258,"ORIGIN_AIRPORT_ID":2798,"ORIGIN_AIRPORT_SEQ_ID":4889,"ORIGIN_CITY_MARKET_ID":8334,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":7350,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3465,"DEST_AIRPORT_ID":8331,"DEST_AIRPORT_SEQ_ID":3185,"DEST_CITY_MARKET_ID":854,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":5370,"DEST_STATE_NM":"DL","DEST_WAC":6277,"DEP_DELAY":152.0,"TAXI_OUT":20.0,"WHEELS_OFF":70.0,"WHEELS_ON":26.0,"TAXI_IN":NaN,"ARR_DELAY":71.0,"AIR_TIME":138.0,"DISTANCE":118.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":8909,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":6792,"ORIGIN_AIRPORT_ID":1036,"ORIGIN_AIRPORT_SEQ_ID":3931,"ORIGIN_CITY_MARKET_ID":4213,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5480,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7256,"DEST_AIRPORT_ID":268,"DEST_AIRPORT_SEQ_ID":8059,"DEST_CITY_MARKET_ID":7994,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6346,"DEST_STATE_NM":"AA","DEST_WAC":4683,"DEP_DELAY":76.0,"TAXI_OUT":131.0,"WHEELS_OFF":185.0,"WHEELS_ON":-14.0,"TAXI_IN":103.0,"ARR_DELAY":72.0,"AIR_TIME":0.0,"DISTANCE":-6.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":5167,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":868,"ORIGIN_AIRPORT_ID":5928,"ORIGIN_AIRPORT_SEQ_ID":7742,"ORIGIN_CITY_MARKET_ID":3961,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":698,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":237,"DEST_AIRPORT_ID":7821,"DEST_AIRPORT_SEQ_ID":7515,"DEST_CITY_MARKET_ID":7652,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2882,"DEST_STATE_NM":"AA","DEST_WAC":3978,"DEP_DELAY":38.0,"TAXI_OUT":NaN,"WHEELS_OFF":150.0,"WHEELS_ON":106.0,"TAXI_IN":183.0,"ARR_DELAY":8.0,"AIR_TIME":15.0,"DISTANCE":181.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":9618,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":584,"ORIGIN_AIRPORT_ID":4867,"ORIGIN_AIRPORT_SEQ_ID":3223,"ORIGIN_CITY_MARKET_ID":4181,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8700,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":56,"DEST_AIRPORT_ID":5132,"DEST_AIRPORT_SEQ_ID":7482,"DEST_CITY_MARKET_ID":1817,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4135,"DEST_STATE_NM":"AA","DEST_WAC":2294,"DEP_DELAY":146.0,"TAXI_OUT":75.0,"WHEELS_OFF":82.0,"WHEELS_ON":179.0,"TAXI_IN":NaN,"ARR_DELAY":21.0,"AIR_TIME":188.0,"DISTANCE":139.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":8945,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":5118,"ORIGIN_AIRPORT_ID":1497,"ORIGIN_AIRPORT_SEQ_ID":7522,"ORIGIN_CITY_MARKET_ID":2664,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2297,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1035,"DEST_AIRPORT_ID":509,"DEST_AIRPORT_SEQ_ID":9146,"DEST_CITY_MARKET_ID":8749,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8824,"DEST_STATE_NM":"AA","DEST_WAC":3913,"DEP_DELAY":NaN,"TAXI_OUT":57.0,"WHEELS_OFF":155.0,"WHEELS_ON":126.0,"TAXI_IN":98.0,"ARR_DELAY":69.0,"AIR_TIME":112.0,"DISTANCE":-12.0}
+{"FL_DATE":"2017-01-06","AIRLINE_ID":7000,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":6085,"ORIGIN_AIRPORT_ID":4147,"ORIGIN_AIRPORT_SEQ_ID":3984,"ORIGIN_CITY_MARKET_ID":1083,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8416,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4811,"DEST_AIRPORT_ID":7835,"DEST_AIRPORT_SEQ_ID":7893,"DEST_CITY_MARKET_ID":2681,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8691,"DEST_STATE_NM":"UA","DEST_WAC":3263,"DEP_DELAY":NaN,"TAXI_OUT":66.0,"WHEELS_OFF":122.0,"WHEELS_ON":131.0,"TAXI_IN":17.0,"ARR_DELAY":90.0,"AIR_TIME":60.0,"DISTANCE":161.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":9926,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":3033,"ORIGIN_AIRPORT_ID":15,"ORIGIN_AIRPORT_SEQ_ID":3314,"ORIGIN_CITY_MARKET_ID":831,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5924,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3076,"DEST_AIRPORT_ID":2642,"DEST_AIRPORT_SEQ_ID":81,"DEST_CITY_MARKET_ID":6978,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6438,"DEST_STATE_NM":"AA","DEST_WAC":6056,"DEP_DELAY":195.0,"TAXI_OUT":14.0,"WHEELS_OFF":113.0,"WHEELS_ON":170.0,"TAXI_IN":141.0,"ARR_DELAY":NaN,"AIR_TIME":83.0,"DISTANCE":90.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":9852,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":313,"ORIGIN_AIRPORT_ID":5640,"ORIGIN_AIRPORT_SEQ_ID":8433,"ORIGIN_CITY_MARKET_ID":4805,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6623,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":817,"DEST_AIRPORT_ID":1012,"DEST_AIRPORT_SEQ_ID":6680,"DEST_CITY_MARKET_ID":9930,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2377,"DEST_STATE_NM":"DL","DEST_WAC":3124,"DEP_DELAY":85.0,"TAXI_OUT":177.0,"WHEELS_OFF":NaN,"WHEELS_ON":72.0,"TAXI_IN":180.0,"ARR_DELAY":13.0,"AIR_TIME":-11.0,"DISTANCE":-8.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":5059,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":665,"ORIGIN_AIRPORT_ID":1298,"ORIGIN_AIRPORT_SEQ_ID":2092,"ORIGIN_CITY_MARKET_ID":2250,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2580,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3263,"DEST_AIRPORT_ID":6694,"DEST_AIRPORT_SEQ_ID":6103,"DEST_CITY_MARKET_ID":2158,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7539,"DEST_STATE_NM":"AA","DEST_WAC":9407,"DEP_DELAY":140.0,"TAXI_OUT":171.0,"WHEELS_OFF":148.0,"WHEELS_ON":173.0,"TAXI_IN":-2.0,"ARR_DELAY":114.0,"AIR_TIME":118.0,"DISTANCE":161.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":4400,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":9159,"ORIGIN_AIRPORT_ID":7226,"ORIGIN_AIRPORT_SEQ_ID":7628,"ORIGIN_CITY_MARKET_ID":9497,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5621,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4916,"DEST_AIRPORT_ID":3756,"DEST_AIRPORT_SEQ_ID":730,"DEST_CITY_MARKET_ID":3893,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6438,"DEST_STATE_NM":"DL","DEST_WAC":2111,"DEP_DELAY":39.0,"TAXI_OUT":32.0,"WHEELS_OFF":156.0,"WHEELS_ON":144.0,"TAXI_IN":169.0,"ARR_DELAY":9.0,"AIR_TIME":71.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":7888,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":961,"ORIGIN_AIRPORT_ID":4084,"ORIGIN_AIRPORT_SEQ_ID":9995,"ORIGIN_CITY_MARKET_ID":4652,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7683,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5210,"DEST_AIRPORT_ID":1418,"DEST_AIRPORT_SEQ_ID":4277,"DEST_CITY_MARKET_ID":8521,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8924,"DEST_STATE_NM":"UA","DEST_WAC":973,"DEP_DELAY":17.0,"TAXI_OUT":159.0,"WHEELS_OFF":150.0,"WHEELS_ON":137.0,"TAXI_IN":-5.0,"ARR_DELAY":NaN,"AIR_TIME":102.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":8598,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":8747,"ORIGIN_AIRPORT_ID":1270,"ORIGIN_AIRPORT_SEQ_ID":7531,"ORIGIN_CITY_MARKET_ID":7446,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4516,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7351,"DEST_AIRPORT_ID":1317,"DEST_AIRPORT_SEQ_ID":5688,"DEST_CITY_MARKET_ID":1055,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":72,"DEST_STATE_NM":"UA","DEST_WAC":6467,"DEP_DELAY":151.0,"TAXI_OUT":19.0,"WHEELS_OFF":69.0,"WHEELS_ON":152.0,"TAXI_IN":105.0,"ARR_DELAY":164.0,"AIR_TIME":118.0,"DISTANCE":108.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":1595,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":1909,"ORIGIN_AIRPORT_ID":9363,"ORIGIN_AIRPORT_SEQ_ID":5280,"ORIGIN_CITY_MARKET_ID":8806,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9519,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7205,"DEST_AIRPORT_ID":4729,"DEST_AIRPORT_SEQ_ID":8296,"DEST_CITY_MARKET_ID":7196,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2449,"DEST_STATE_NM":"DL","DEST_WAC":9542,"DEP_DELAY":194.0,"TAXI_OUT":NaN,"WHEELS_OFF":53.0,"WHEELS_ON":NaN,"TAXI_IN":163.0,"ARR_DELAY":129.0,"AIR_TIME":190.0,"DISTANCE":199.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":5300,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":1992,"ORIGIN_AIRPORT_ID":9468,"ORIGIN_AIRPORT_SEQ_ID":4742,"ORIGIN_CITY_MARKET_ID":7140,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8856,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1195,"DEST_AIRPORT_ID":6590,"DEST_AIRPORT_SEQ_ID":2071,"DEST_CITY_MARKET_ID":4159,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3853,"DEST_STATE_NM":"DL","DEST_WAC":1321,"DEP_DELAY":77.0,"TAXI_OUT":41.0,"WHEELS_OFF":62.0,"WHEELS_ON":178.0,"TAXI_IN":NaN,"ARR_DELAY":-11.0,"AIR_TIME":80.0,"DISTANCE":154.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":4268,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2098,"ORIGIN_AIRPORT_ID":2184,"ORIGIN_AIRPORT_SEQ_ID":6188,"ORIGIN_CITY_MARKET_ID":906,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7222,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5669,"DEST_AIRPORT_ID":8438,"DEST_AIRPORT_SEQ_ID":7298,"DEST_CITY_MARKET_ID":5351,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3426,"DEST_STATE_NM":"UA","DEST_WAC":7222,"DEP_DELAY":34.0,"TAXI_OUT":79.0,"WHEELS_OFF":161.0,"WHEELS_ON":50.0,"TAXI_IN":151.0,"ARR_DELAY":NaN,"AIR_TIME":120.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":7858,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":8919,"ORIGIN_AIRPORT_ID":3993,"ORIGIN_AIRPORT_SEQ_ID":1567,"ORIGIN_CITY_MARKET_ID":8187,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8929,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1849,"DEST_AIRPORT_ID":5321,"DEST_AIRPORT_SEQ_ID":8549,"DEST_CITY_MARKET_ID":6183,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1571,"DEST_STATE_NM":"DL","DEST_WAC":3746,"DEP_DELAY":175.0,"TAXI_OUT":NaN,"WHEELS_OFF":127.0,"WHEELS_ON":57.0,"TAXI_IN":65.0,"ARR_DELAY":154.0,"AIR_TIME":42.0,"DISTANCE":108.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":7353,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":4203,"ORIGIN_AIRPORT_ID":6710,"ORIGIN_AIRPORT_SEQ_ID":8856,"ORIGIN_CITY_MARKET_ID":9454,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2004,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1942,"DEST_AIRPORT_ID":4382,"DEST_AIRPORT_SEQ_ID":6197,"DEST_CITY_MARKET_ID":527,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1224,"DEST_STATE_NM":"DL","DEST_WAC":7699,"DEP_DELAY":171.0,"TAXI_OUT":144.0,"WHEELS_OFF":-10.0,"WHEELS_ON":152.0,"TAXI_IN":95.0,"ARR_DELAY":NaN,"AIR_TIME":117.0,"DISTANCE":107.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":3433,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":7568,"ORIGIN_AIRPORT_ID":3218,"ORIGIN_AIRPORT_SEQ_ID":6624,"ORIGIN_CITY_MARKET_ID":6656,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":359,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7969,"DEST_AIRPORT_ID":6856,"DEST_AIRPORT_SEQ_ID":2143,"DEST_CITY_MARKET_ID":9758,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8264,"DEST_STATE_NM":"DL","DEST_WAC":4651,"DEP_DELAY":0.0,"TAXI_OUT":85.0,"WHEELS_OFF":99.0,"WHEELS_ON":56.0,"TAXI_IN":NaN,"ARR_DELAY":54.0,"AIR_TIME":NaN,"DISTANCE":55.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":7989,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":9757,"ORIGIN_AIRPORT_ID":6280,"ORIGIN_AIRPORT_SEQ_ID":8079,"ORIGIN_CITY_MARKET_ID":4324,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":573,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":805,"DEST_AIRPORT_ID":5686,"DEST_AIRPORT_SEQ_ID":3269,"DEST_CITY_MARKET_ID":5609,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1492,"DEST_STATE_NM":"AA","DEST_WAC":1546,"DEP_DELAY":58.0,"TAXI_OUT":131.0,"WHEELS_OFF":133.0,"WHEELS_ON":78.0,"TAXI_IN":77.0,"ARR_DELAY":114.0,"AIR_TIME":176.0,"DISTANCE":86.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":6321,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":139,"ORIGIN_AIRPORT_ID":9768,"ORIGIN_AIRPORT_SEQ_ID":9364,"ORIGIN_CITY_MARKET_ID":9214,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9143,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3580,"DEST_AIRPORT_ID":2174,"DEST_AIRPORT_SEQ_ID":7162,"DEST_CITY_MARKET_ID":2895,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4881,"DEST_STATE_NM":"AA","DEST_WAC":5764,"DEP_DELAY":176.0,"TAXI_OUT":21.0,"WHEELS_OFF":200.0,"WHEELS_ON":159.0,"TAXI_IN":-2.0,"ARR_DELAY":110.0,"AIR_TIME":147.0,"DISTANCE":122.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":4305,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":2148,"ORIGIN_AIRPORT_ID":931,"ORIGIN_AIRPORT_SEQ_ID":7583,"ORIGIN_CITY_MARKET_ID":5843,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4989,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":680,"DEST_AIRPORT_ID":6953,"DEST_AIRPORT_SEQ_ID":7319,"DEST_CITY_MARKET_ID":8074,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9180,"DEST_STATE_NM":"DL","DEST_WAC":8166,"DEP_DELAY":60.0,"TAXI_OUT":20.0,"WHEELS_OFF":196.0,"WHEELS_ON":166.0,"TAXI_IN":3.0,"ARR_DELAY":89.0,"AIR_TIME":159.0,"DISTANCE":70.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":1082,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":8754,"ORIGIN_AIRPORT_ID":5090,"ORIGIN_AIRPORT_SEQ_ID":705,"ORIGIN_CITY_MARKET_ID":9333,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6310,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1573,"DEST_AIRPORT_ID":37,"DEST_AIRPORT_SEQ_ID":38,"DEST_CITY_MARKET_ID":9402,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3548,"DEST_STATE_NM":"DL","DEST_WAC":1089,"DEP_DELAY":82.0,"TAXI_OUT":197.0,"WHEELS_OFF":111.0,"WHEELS_ON":160.0,"TAXI_IN":26.0,"ARR_DELAY":18.0,"AIR_TIME":145.0,"DISTANCE":143.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":2643,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4705,"ORIGIN_AIRPORT_ID":1754,"ORIGIN_AIRPORT_SEQ_ID":807,"ORIGIN_CITY_MARKET_ID":9872,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3527,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7246,"DEST_AIRPORT_ID":3141,"DEST_AIRPORT_SEQ_ID":6164,"DEST_CITY_MARKET_ID":4867,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6205,"DEST_STATE_NM":"AA","DEST_WAC":3182,"DEP_DELAY":88.0,"TAXI_OUT":29.0,"WHEELS_OFF":108.0,"WHEELS_ON":39.0,"TAXI_IN":1.0,"ARR_DELAY":NaN,"AIR_TIME":165.0,"DISTANCE":43.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":3925,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":5916,"ORIGIN_AIRPORT_ID":8529,"ORIGIN_AIRPORT_SEQ_ID":8556,"ORIGIN_CITY_MARKET_ID":306,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7371,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1618,"DEST_AIRPORT_ID":2856,"DEST_AIRPORT_SEQ_ID":6735,"DEST_CITY_MARKET_ID":2107,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3764,"DEST_STATE_NM":"AA","DEST_WAC":922,"DEP_DELAY":200.0,"TAXI_OUT":150.0,"WHEELS_OFF":189.0,"WHEELS_ON":48.0,"TAXI_IN":175.0,"ARR_DELAY":181.0,"AIR_TIME":31.0,"DISTANCE":40.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":8938,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":5012,"ORIGIN_AIRPORT_ID":9114,"ORIGIN_AIRPORT_SEQ_ID":2926,"ORIGIN_CITY_MARKET_ID":2063,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4660,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":382,"DEST_AIRPORT_ID":8747,"DEST_AIRPORT_SEQ_ID":4060,"DEST_CITY_MARKET_ID":470,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3354,"DEST_STATE_NM":"DL","DEST_WAC":1621,"DEP_DELAY":161.0,"TAXI_OUT":83.0,"WHEELS_OFF":121.0,"WHEELS_ON":179.0,"TAXI_IN":153.0,"ARR_DELAY":175.0,"AIR_TIME":146.0,"DISTANCE":45.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":4304,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":6332,"ORIGIN_AIRPORT_ID":301,"ORIGIN_AIRPORT_SEQ_ID":3136,"ORIGIN_CITY_MARKET_ID":8277,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9272,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7829,"DEST_AIRPORT_ID":9159,"DEST_AIRPORT_SEQ_ID":2425,"DEST_CITY_MARKET_ID":7410,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6469,"DEST_STATE_NM":"DL","DEST_WAC":905,"DEP_DELAY":54.0,"TAXI_OUT":166.0,"WHEELS_OFF":122.0,"WHEELS_ON":-11.0,"TAXI_IN":120.0,"ARR_DELAY":62.0,"AIR_TIME":162.0,"DISTANCE":89.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":4077,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2575,"ORIGIN_AIRPORT_ID":4541,"ORIGIN_AIRPORT_SEQ_ID":9643,"ORIGIN_CITY_MARKET_ID":4366,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6137,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5892,"DEST_AIRPORT_ID":6961,"DEST_AIRPORT_SEQ_ID":8298,"DEST_CITY_MARKET_ID":6947,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1611,"DEST_STATE_NM":"AA","DEST_WAC":8471,"DEP_DELAY":138.0,"TAXI_OUT":-6.0,"WHEELS_OFF":82.0,"WHEELS_ON":82.0,"TAXI_IN":28.0,"ARR_DELAY":105.0,"AIR_TIME":152.0,"DISTANCE":132.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":8840,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":9665,"ORIGIN_AIRPORT_ID":204,"ORIGIN_AIRPORT_SEQ_ID":3890,"ORIGIN_CITY_MARKET_ID":8006,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4370,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2657,"DEST_AIRPORT_ID":6455,"DEST_AIRPORT_SEQ_ID":1607,"DEST_CITY_MARKET_ID":842,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2852,"DEST_STATE_NM":"DL","DEST_WAC":9245,"DEP_DELAY":194.0,"TAXI_OUT":177.0,"WHEELS_OFF":NaN,"WHEELS_ON":17.0,"TAXI_IN":14.0,"ARR_DELAY":120.0,"AIR_TIME":65.0,"DISTANCE":31.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":642,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3127,"ORIGIN_AIRPORT_ID":2889,"ORIGIN_AIRPORT_SEQ_ID":5412,"ORIGIN_CITY_MARKET_ID":8290,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6944,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5346,"DEST_AIRPORT_ID":9542,"DEST_AIRPORT_SEQ_ID":9310,"DEST_CITY_MARKET_ID":4415,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8248,"DEST_STATE_NM":"DL","DEST_WAC":6272,"DEP_DELAY":83.0,"TAXI_OUT":NaN,"WHEELS_OFF":46.0,"WHEELS_ON":135.0,"TAXI_IN":98.0,"ARR_DELAY":100.0,"AIR_TIME":NaN,"DISTANCE":11.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":3064,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":6723,"ORIGIN_AIRPORT_ID":4822,"ORIGIN_AIRPORT_SEQ_ID":4893,"ORIGIN_CITY_MARKET_ID":3267,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2135,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9783,"DEST_AIRPORT_ID":3523,"DEST_AIRPORT_SEQ_ID":8838,"DEST_CITY_MARKET_ID":1707,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":8753,"DEST_STATE_NM":"UA","DEST_WAC":3879,"DEP_DELAY":185.0,"TAXI_OUT":-3.0,"WHEELS_OFF":-7.0,"WHEELS_ON":94.0,"TAXI_IN":200.0,"ARR_DELAY":-6.0,"AIR_TIME":-6.0,"DISTANCE":42.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":5804,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":2958,"ORIGIN_AIRPORT_ID":3139,"ORIGIN_AIRPORT_SEQ_ID":3073,"ORIGIN_CITY_MARKET_ID":9992,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8466,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6694,"DEST_AIRPORT_ID":8096,"DEST_AIRPORT_SEQ_ID":982,"DEST_CITY_MARKET_ID":8867,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1769,"DEST_STATE_NM":"DL","DEST_WAC":6985,"DEP_DELAY":198.0,"TAXI_OUT":78.0,"WHEELS_OFF":-13.0,"WHEELS_ON":67.0,"TAXI_IN":107.0,"ARR_DELAY":165.0,"AIR_TIME":91.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":8601,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":9318,"ORIGIN_AIRPORT_ID":787,"ORIGIN_AIRPORT_SEQ_ID":510,"ORIGIN_CITY_MARKET_ID":6293,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6391,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9991,"DEST_AIRPORT_ID":7659,"DEST_AIRPORT_SEQ_ID":2925,"DEST_CITY_MARKET_ID":3709,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2695,"DEST_STATE_NM":"DL","DEST_WAC":7427,"DEP_DELAY":144.0,"TAXI_OUT":-20.0,"WHEELS_OFF":125.0,"WHEELS_ON":-2.0,"TAXI_IN":114.0,"ARR_DELAY":16.0,"AIR_TIME":156.0,"DISTANCE":82.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":3411,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":6374,"ORIGIN_AIRPORT_ID":5190,"ORIGIN_AIRPORT_SEQ_ID":538,"ORIGIN_CITY_MARKET_ID":9807,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5767,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":700,"DEST_AIRPORT_ID":7004,"DEST_AIRPORT_SEQ_ID":9698,"DEST_CITY_MARKET_ID":5010,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":8273,"DEST_STATE_NM":"AA","DEST_WAC":2765,"DEP_DELAY":111.0,"TAXI_OUT":148.0,"WHEELS_OFF":-17.0,"WHEELS_ON":91.0,"TAXI_IN":36.0,"ARR_DELAY":4.0,"AIR_TIME":NaN,"DISTANCE":53.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":7571,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3046,"ORIGIN_AIRPORT_ID":9382,"ORIGIN_AIRPORT_SEQ_ID":6401,"ORIGIN_CITY_MARKET_ID":3148,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1883,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1939,"DEST_AIRPORT_ID":9205,"DEST_AIRPORT_SEQ_ID":1943,"DEST_CITY_MARKET_ID":7928,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":5825,"DEST_STATE_NM":"UA","DEST_WAC":906,"DEP_DELAY":48.0,"TAXI_OUT":NaN,"WHEELS_OFF":92.0,"WHEELS_ON":59.0,"TAXI_IN":12.0,"ARR_DELAY":197.0,"AIR_TIME":131.0,"DISTANCE":145.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":7019,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":1405,"ORIGIN_AIRPORT_ID":6929,"ORIGIN_AIRPORT_SEQ_ID":5832,"ORIGIN_CITY_MARKET_ID":9169,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9435,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8181,"DEST_AIRPORT_ID":9956,"DEST_AIRPORT_SEQ_ID":8320,"DEST_CITY_MARKET_ID":6794,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3965,"DEST_STATE_NM":"AA","DEST_WAC":9655,"DEP_DELAY":29.0,"TAXI_OUT":50.0,"WHEELS_OFF":175.0,"WHEELS_ON":94.0,"TAXI_IN":24.0,"ARR_DELAY":119.0,"AIR_TIME":1.0,"DISTANCE":27.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":1479,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":2794,"ORIGIN_AIRPORT_ID":6674,"ORIGIN_AIRPORT_SEQ_ID":2757,"ORIGIN_CITY_MARKET_ID":3494,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2513,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3802,"DEST_AIRPORT_ID":6793,"DEST_AIRPORT_SEQ_ID":5379,"DEST_CITY_MARKET_ID":188,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2797,"DEST_STATE_NM":"UA","DEST_WAC":4792,"DEP_DELAY":NaN,"TAXI_OUT":153.0,"WHEELS_OFF":NaN,"WHEELS_ON":112.0,"TAXI_IN":NaN,"ARR_DELAY":133.0,"AIR_TIME":NaN,"DISTANCE":165.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":6939,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5968,"ORIGIN_AIRPORT_ID":6569,"ORIGIN_AIRPORT_SEQ_ID":3695,"ORIGIN_CITY_MARKET_ID":9228,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4577,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8227,"DEST_AIRPORT_ID":4724,"DEST_AIRPORT_SEQ_ID":387,"DEST_CITY_MARKET_ID":4807,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4689,"DEST_STATE_NM":"AA","DEST_WAC":1512,"DEP_DELAY":9.0,"TAXI_OUT":95.0,"WHEELS_OFF":161.0,"WHEELS_ON":NaN,"TAXI_IN":49.0,"ARR_DELAY":69.0,"AIR_TIME":51.0,"DISTANCE":105.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":1108,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":6237,"ORIGIN_AIRPORT_ID":7700,"ORIGIN_AIRPORT_SEQ_ID":2657,"ORIGIN_CITY_MARKET_ID":6766,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7481,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1342,"DEST_AIRPORT_ID":8319,"DEST_AIRPORT_SEQ_ID":6465,"DEST_CITY_MARKET_ID":6225,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2183,"DEST_STATE_NM":"AA","DEST_WAC":2344,"DEP_DELAY":69.0,"TAXI_OUT":184.0,"WHEELS_OFF":184.0,"WHEELS_ON":183.0,"TAXI_IN":44.0,"ARR_DELAY":41.0,"AIR_TIME":59.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-22","AIRLINE_ID":4181,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":4350,"ORIGIN_AIRPORT_ID":5584,"ORIGIN_AIRPORT_SEQ_ID":1364,"ORIGIN_CITY_MARKET_ID":204,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2534,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9788,"DEST_AIRPORT_ID":6086,"DEST_AIRPORT_SEQ_ID":6310,"DEST_CITY_MARKET_ID":81,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2871,"DEST_STATE_NM":"AA","DEST_WAC":1964,"DEP_DELAY":29.0,"TAXI_OUT":29.0,"WHEELS_OFF":39.0,"WHEELS_ON":NaN,"TAXI_IN":67.0,"ARR_DELAY":152.0,"AIR_TIME":NaN,"DISTANCE":132.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":993,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":1640,"ORIGIN_AIRPORT_ID":592,"ORIGIN_AIRPORT_SEQ_ID":3075,"ORIGIN_CITY_MARKET_ID":5792,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9785,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5217,"DEST_AIRPORT_ID":6409,"DEST_AIRPORT_SEQ_ID":4769,"DEST_CITY_MARKET_ID":2811,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4576,"DEST_STATE_NM":"UA","DEST_WAC":5938,"DEP_DELAY":10.0,"TAXI_OUT":76.0,"WHEELS_OFF":52.0,"WHEELS_ON":132.0,"TAXI_IN":71.0,"ARR_DELAY":114.0,"AIR_TIME":NaN,"DISTANCE":66.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":8611,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":3945,"ORIGIN_AIRPORT_ID":5000,"ORIGIN_AIRPORT_SEQ_ID":8512,"ORIGIN_CITY_MARKET_ID":4679,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5287,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2438,"DEST_AIRPORT_ID":8794,"DEST_AIRPORT_SEQ_ID":1642,"DEST_CITY_MARKET_ID":2487,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4957,"DEST_STATE_NM":"DL","DEST_WAC":6913,"DEP_DELAY":47.0,"TAXI_OUT":139.0,"WHEELS_OFF":150.0,"WHEELS_ON":59.0,"TAXI_IN":-6.0,"ARR_DELAY":85.0,"AIR_TIME":NaN,"DISTANCE":56.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":8211,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":1194,"ORIGIN_AIRPORT_ID":1848,"ORIGIN_AIRPORT_SEQ_ID":3919,"ORIGIN_CITY_MARKET_ID":5946,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4743,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":4547,"DEST_AIRPORT_ID":1678,"DEST_AIRPORT_SEQ_ID":2113,"DEST_CITY_MARKET_ID":8011,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5773,"DEST_STATE_NM":"AA","DEST_WAC":913,"DEP_DELAY":27.0,"TAXI_OUT":155.0,"WHEELS_OFF":83.0,"WHEELS_ON":NaN,"TAXI_IN":-2.0,"ARR_DELAY":141.0,"AIR_TIME":42.0,"DISTANCE":168.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":3538,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":9081,"ORIGIN_AIRPORT_ID":9513,"ORIGIN_AIRPORT_SEQ_ID":6650,"ORIGIN_CITY_MARKET_ID":2166,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2565,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":918,"DEST_AIRPORT_ID":6095,"DEST_AIRPORT_SEQ_ID":481,"DEST_CITY_MARKET_ID":8131,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7341,"DEST_STATE_NM":"AA","DEST_WAC":6267,"DEP_DELAY":48.0,"TAXI_OUT":-11.0,"WHEELS_OFF":-11.0,"WHEELS_ON":137.0,"TAXI_IN":114.0,"ARR_DELAY":127.0,"AIR_TIME":-11.0,"DISTANCE":102.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":4165,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":1378,"ORIGIN_AIRPORT_ID":5390,"ORIGIN_AIRPORT_SEQ_ID":2174,"ORIGIN_CITY_MARKET_ID":3777,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7215,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9280,"DEST_AIRPORT_ID":185,"DEST_AIRPORT_SEQ_ID":9312,"DEST_CITY_MARKET_ID":1079,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9016,"DEST_STATE_NM":"AA","DEST_WAC":237,"DEP_DELAY":147.0,"TAXI_OUT":132.0,"WHEELS_OFF":23.0,"WHEELS_ON":105.0,"TAXI_IN":72.0,"ARR_DELAY":109.0,"AIR_TIME":73.0,"DISTANCE":121.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":8185,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":6690,"ORIGIN_AIRPORT_ID":1603,"ORIGIN_AIRPORT_SEQ_ID":1240,"ORIGIN_CITY_MARKET_ID":1618,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":617,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9881,"DEST_AIRPORT_ID":9627,"DEST_AIRPORT_SEQ_ID":978,"DEST_CITY_MARKET_ID":9717,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6836,"DEST_STATE_NM":"DL","DEST_WAC":845,"DEP_DELAY":90.0,"TAXI_OUT":165.0,"WHEELS_OFF":172.0,"WHEELS_ON":149.0,"TAXI_IN":128.0,"ARR_DELAY":-2.0,"AIR_TIME":197.0,"DISTANCE":79.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":2603,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":6872,"ORIGIN_AIRPORT_ID":7733,"ORIGIN_AIRPORT_SEQ_ID":3100,"ORIGIN_CITY_MARKET_ID":434,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3245,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3007,"DEST_AIRPORT_ID":1326,"DEST_AIRPORT_SEQ_ID":9792,"DEST_CITY_MARKET_ID":431,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":4219,"DEST_STATE_NM":"AA","DEST_WAC":6530,"DEP_DELAY":190.0,"TAXI_OUT":170.0,"WHEELS_OFF":95.0,"WHEELS_ON":34.0,"TAXI_IN":-13.0,"ARR_DELAY":141.0,"AIR_TIME":92.0,"DISTANCE":152.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":6889,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":5962,"ORIGIN_AIRPORT_ID":5931,"ORIGIN_AIRPORT_SEQ_ID":1415,"ORIGIN_CITY_MARKET_ID":8475,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9137,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":124,"DEST_AIRPORT_ID":3212,"DEST_AIRPORT_SEQ_ID":4572,"DEST_CITY_MARKET_ID":5846,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4030,"DEST_STATE_NM":"DL","DEST_WAC":5319,"DEP_DELAY":152.0,"TAXI_OUT":92.0,"WHEELS_OFF":162.0,"WHEELS_ON":164.0,"TAXI_IN":167.0,"ARR_DELAY":-11.0,"AIR_TIME":33.0,"DISTANCE":-1.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":4140,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3991,"ORIGIN_AIRPORT_ID":950,"ORIGIN_AIRPORT_SEQ_ID":5097,"ORIGIN_CITY_MARKET_ID":1542,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7050,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8480,"DEST_AIRPORT_ID":1363,"DEST_AIRPORT_SEQ_ID":5019,"DEST_CITY_MARKET_ID":1184,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3924,"DEST_STATE_NM":"UA","DEST_WAC":18,"DEP_DELAY":30.0,"TAXI_OUT":33.0,"WHEELS_OFF":132.0,"WHEELS_ON":NaN,"TAXI_IN":110.0,"ARR_DELAY":147.0,"AIR_TIME":150.0,"DISTANCE":76.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":4616,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":3120,"ORIGIN_AIRPORT_ID":2295,"ORIGIN_AIRPORT_SEQ_ID":8823,"ORIGIN_CITY_MARKET_ID":4884,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":7986,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6497,"DEST_AIRPORT_ID":3028,"DEST_AIRPORT_SEQ_ID":542,"DEST_CITY_MARKET_ID":1392,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6434,"DEST_STATE_NM":"AA","DEST_WAC":9505,"DEP_DELAY":15.0,"TAXI_OUT":-3.0,"WHEELS_OFF":123.0,"WHEELS_ON":80.0,"TAXI_IN":158.0,"ARR_DELAY":24.0,"AIR_TIME":131.0,"DISTANCE":39.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":9681,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":8513,"ORIGIN_AIRPORT_ID":133,"ORIGIN_AIRPORT_SEQ_ID":4797,"ORIGIN_CITY_MARKET_ID":4714,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3373,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":638,"DEST_AIRPORT_ID":4440,"DEST_AIRPORT_SEQ_ID":1882,"DEST_CITY_MARKET_ID":1438,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1091,"DEST_STATE_NM":"DL","DEST_WAC":2217,"DEP_DELAY":137.0,"TAXI_OUT":154.0,"WHEELS_OFF":NaN,"WHEELS_ON":54.0,"TAXI_IN":-9.0,"ARR_DELAY":147.0,"AIR_TIME":33.0,"DISTANCE":21.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":2072,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":283,"ORIGIN_AIRPORT_ID":6639,"ORIGIN_AIRPORT_SEQ_ID":6028,"ORIGIN_CITY_MARKET_ID":5912,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5288,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5563,"DEST_AIRPORT_ID":963,"DEST_AIRPORT_SEQ_ID":5305,"DEST_CITY_MARKET_ID":7427,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":438,"DEST_STATE_NM":"DL","DEST_WAC":1699,"DEP_DELAY":139.0,"TAXI_OUT":190.0,"WHEELS_OFF":8.0,"WHEELS_ON":91.0,"TAXI_IN":NaN,"ARR_DELAY":35.0,"AIR_TIME":NaN,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":4807,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":5487,"ORIGIN_AIRPORT_ID":5658,"ORIGIN_AIRPORT_SEQ_ID":9595,"ORIGIN_CITY_MARKET_ID":6579,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4411,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3356,"DEST_AIRPORT_ID":215,"DEST_AIRPORT_SEQ_ID":2631,"DEST_CITY_MARKET_ID":7316,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6741,"DEST_STATE_NM":"UA","DEST_WAC":1789,"DEP_DELAY":-12.0,"TAXI_OUT":161.0,"WHEELS_OFF":149.0,"WHEELS_ON":-4.0,"TAXI_IN":NaN,"ARR_DELAY":195.0,"AIR_TIME":-20.0,"DISTANCE":110.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":9701,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":9786,"ORIGIN_AIRPORT_ID":7134,"ORIGIN_AIRPORT_SEQ_ID":1768,"ORIGIN_CITY_MARKET_ID":7982,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3485,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1376,"DEST_AIRPORT_ID":3565,"DEST_AIRPORT_SEQ_ID":2707,"DEST_CITY_MARKET_ID":4934,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3414,"DEST_STATE_NM":"AA","DEST_WAC":1234,"DEP_DELAY":178.0,"TAXI_OUT":72.0,"WHEELS_OFF":24.0,"WHEELS_ON":41.0,"TAXI_IN":75.0,"ARR_DELAY":24.0,"AIR_TIME":178.0,"DISTANCE":-9.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":108,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":9598,"ORIGIN_AIRPORT_ID":7821,"ORIGIN_AIRPORT_SEQ_ID":6820,"ORIGIN_CITY_MARKET_ID":3146,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":5490,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8256,"DEST_AIRPORT_ID":9687,"DEST_AIRPORT_SEQ_ID":9878,"DEST_CITY_MARKET_ID":4235,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4662,"DEST_STATE_NM":"DL","DEST_WAC":7987,"DEP_DELAY":109.0,"TAXI_OUT":89.0,"WHEELS_OFF":-4.0,"WHEELS_ON":-4.0,"TAXI_IN":87.0,"ARR_DELAY":75.0,"AIR_TIME":2.0,"DISTANCE":192.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":9135,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":7220,"ORIGIN_AIRPORT_ID":8259,"ORIGIN_AIRPORT_SEQ_ID":6842,"ORIGIN_CITY_MARKET_ID":3685,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6792,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5109,"DEST_AIRPORT_ID":2834,"DEST_AIRPORT_SEQ_ID":686,"DEST_CITY_MARKET_ID":1850,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1994,"DEST_STATE_NM":"UA","DEST_WAC":7790,"DEP_DELAY":200.0,"TAXI_OUT":10.0,"WHEELS_OFF":77.0,"WHEELS_ON":22.0,"TAXI_IN":116.0,"ARR_DELAY":184.0,"AIR_TIME":2.0,"DISTANCE":124.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":5272,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":9027,"ORIGIN_AIRPORT_ID":3993,"ORIGIN_AIRPORT_SEQ_ID":8116,"ORIGIN_CITY_MARKET_ID":3974,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2729,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":256,"DEST_AIRPORT_ID":7021,"DEST_AIRPORT_SEQ_ID":5434,"DEST_CITY_MARKET_ID":4994,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4029,"DEST_STATE_NM":"DL","DEST_WAC":2395,"DEP_DELAY":179.0,"TAXI_OUT":175.0,"WHEELS_OFF":NaN,"WHEELS_ON":179.0,"TAXI_IN":NaN,"ARR_DELAY":174.0,"AIR_TIME":91.0,"DISTANCE":47.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":2639,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":8633,"ORIGIN_AIRPORT_ID":3036,"ORIGIN_AIRPORT_SEQ_ID":2866,"ORIGIN_CITY_MARKET_ID":3917,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4617,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":5312,"DEST_AIRPORT_ID":2637,"DEST_AIRPORT_SEQ_ID":5235,"DEST_CITY_MARKET_ID":8894,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3946,"DEST_STATE_NM":"AA","DEST_WAC":2733,"DEP_DELAY":52.0,"TAXI_OUT":NaN,"WHEELS_OFF":91.0,"WHEELS_ON":NaN,"TAXI_IN":94.0,"ARR_DELAY":89.0,"AIR_TIME":20.0,"DISTANCE":71.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":2854,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4295,"ORIGIN_AIRPORT_ID":6087,"ORIGIN_AIRPORT_SEQ_ID":5500,"ORIGIN_CITY_MARKET_ID":793,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2549,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9845,"DEST_AIRPORT_ID":7873,"DEST_AIRPORT_SEQ_ID":850,"DEST_CITY_MARKET_ID":7628,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1437,"DEST_STATE_NM":"AA","DEST_WAC":135,"DEP_DELAY":-9.0,"TAXI_OUT":NaN,"WHEELS_OFF":74.0,"WHEELS_ON":95.0,"TAXI_IN":NaN,"ARR_DELAY":NaN,"AIR_TIME":31.0,"DISTANCE":25.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":9385,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":8708,"ORIGIN_AIRPORT_ID":3521,"ORIGIN_AIRPORT_SEQ_ID":2220,"ORIGIN_CITY_MARKET_ID":9301,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2627,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7613,"DEST_AIRPORT_ID":8177,"DEST_AIRPORT_SEQ_ID":379,"DEST_CITY_MARKET_ID":8887,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7443,"DEST_STATE_NM":"DL","DEST_WAC":9384,"DEP_DELAY":71.0,"TAXI_OUT":16.0,"WHEELS_OFF":7.0,"WHEELS_ON":148.0,"TAXI_IN":63.0,"ARR_DELAY":196.0,"AIR_TIME":-3.0,"DISTANCE":109.0}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":4,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2209,"ORIGIN_AIRPORT_ID":4857,"ORIGIN_AIRPORT_SEQ_ID":4607,"ORIGIN_CITY_MARKET_ID":4980,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1008,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":2448,"DEST_AIRPORT_ID":15,"DEST_AIRPORT_SEQ_ID":8145,"DEST_CITY_MARKET_ID":9764,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1909,"DEST_STATE_NM":"UA","DEST_WAC":6367,"DEP_DELAY":117.0,"TAXI_OUT":129.0,"WHEELS_OFF":-19.0,"WHEELS_ON":41.0,"TAXI_IN":163.0,"ARR_DELAY":51.0,"AIR_TIME":165.0,"DISTANCE":34.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":7027,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":7416,"ORIGIN_AIRPORT_ID":8231,"ORIGIN_AIRPORT_SEQ_ID":809,"ORIGIN_CITY_MARKET_ID":2120,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":560,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6493,"DEST_AIRPORT_ID":1565,"DEST_AIRPORT_SEQ_ID":789,"DEST_CITY_MARKET_ID":8108,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1825,"DEST_STATE_NM":"UA","DEST_WAC":8005,"DEP_DELAY":-5.0,"TAXI_OUT":98.0,"WHEELS_OFF":NaN,"WHEELS_ON":99.0,"TAXI_IN":20.0,"ARR_DELAY":168.0,"AIR_TIME":156.0,"DISTANCE":56.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":7929,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":4948,"ORIGIN_AIRPORT_ID":8563,"ORIGIN_AIRPORT_SEQ_ID":477,"ORIGIN_CITY_MARKET_ID":2890,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6375,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1986,"DEST_AIRPORT_ID":4839,"DEST_AIRPORT_SEQ_ID":1619,"DEST_CITY_MARKET_ID":4159,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5923,"DEST_STATE_NM":"AA","DEST_WAC":7368,"DEP_DELAY":NaN,"TAXI_OUT":-4.0,"WHEELS_OFF":91.0,"WHEELS_ON":NaN,"TAXI_IN":99.0,"ARR_DELAY":45.0,"AIR_TIME":101.0,"DISTANCE":4.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":5469,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":172,"ORIGIN_AIRPORT_ID":1133,"ORIGIN_AIRPORT_SEQ_ID":2847,"ORIGIN_CITY_MARKET_ID":8068,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":6362,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8311,"DEST_AIRPORT_ID":9801,"DEST_AIRPORT_SEQ_ID":5410,"DEST_CITY_MARKET_ID":650,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":15,"DEST_STATE_NM":"DL","DEST_WAC":8683,"DEP_DELAY":57.0,"TAXI_OUT":-1.0,"WHEELS_OFF":137.0,"WHEELS_ON":89.0,"TAXI_IN":178.0,"ARR_DELAY":80.0,"AIR_TIME":-13.0,"DISTANCE":165.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":9144,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":6639,"ORIGIN_AIRPORT_ID":8943,"ORIGIN_AIRPORT_SEQ_ID":2538,"ORIGIN_CITY_MARKET_ID":4173,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":2256,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8985,"DEST_AIRPORT_ID":1690,"DEST_AIRPORT_SEQ_ID":2592,"DEST_CITY_MARKET_ID":9761,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":317,"DEST_STATE_NM":"DL","DEST_WAC":619,"DEP_DELAY":119.0,"TAXI_OUT":NaN,"WHEELS_OFF":20.0,"WHEELS_ON":44.0,"TAXI_IN":62.0,"ARR_DELAY":114.0,"AIR_TIME":34.0,"DISTANCE":138.0}
+{"FL_DATE":"2017-01-18","AIRLINE_ID":1781,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":4132,"ORIGIN_AIRPORT_ID":1984,"ORIGIN_AIRPORT_SEQ_ID":3316,"ORIGIN_CITY_MARKET_ID":726,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8534,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9549,"DEST_AIRPORT_ID":7431,"DEST_AIRPORT_SEQ_ID":9119,"DEST_CITY_MARKET_ID":1888,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2911,"DEST_STATE_NM":"DL","DEST_WAC":6911,"DEP_DELAY":22.0,"TAXI_OUT":NaN,"WHEELS_OFF":-17.0,"WHEELS_ON":173.0,"TAXI_IN":17.0,"ARR_DELAY":199.0,"AIR_TIME":149.0,"DISTANCE":-10.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":6861,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5349,"ORIGIN_AIRPORT_ID":9605,"ORIGIN_AIRPORT_SEQ_ID":3511,"ORIGIN_CITY_MARKET_ID":3992,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9600,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8497,"DEST_AIRPORT_ID":8279,"DEST_AIRPORT_SEQ_ID":9303,"DEST_CITY_MARKET_ID":8216,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1078,"DEST_STATE_NM":"UA","DEST_WAC":4087,"DEP_DELAY":76.0,"TAXI_OUT":158.0,"WHEELS_OFF":168.0,"WHEELS_ON":NaN,"TAXI_IN":123.0,"ARR_DELAY":136.0,"AIR_TIME":98.0,"DISTANCE":106.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":4643,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":6246,"ORIGIN_AIRPORT_ID":7844,"ORIGIN_AIRPORT_SEQ_ID":1952,"ORIGIN_CITY_MARKET_ID":1439,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":7133,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3854,"DEST_AIRPORT_ID":8638,"DEST_AIRPORT_SEQ_ID":2518,"DEST_CITY_MARKET_ID":1131,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4739,"DEST_STATE_NM":"AA","DEST_WAC":1660,"DEP_DELAY":48.0,"TAXI_OUT":71.0,"WHEELS_OFF":170.0,"WHEELS_ON":6.0,"TAXI_IN":30.0,"ARR_DELAY":188.0,"AIR_TIME":-10.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":6183,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":1257,"ORIGIN_AIRPORT_ID":7521,"ORIGIN_AIRPORT_SEQ_ID":7664,"ORIGIN_CITY_MARKET_ID":5440,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8552,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":8361,"DEST_AIRPORT_ID":1411,"DEST_AIRPORT_SEQ_ID":2112,"DEST_CITY_MARKET_ID":2712,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3348,"DEST_STATE_NM":"UA","DEST_WAC":7078,"DEP_DELAY":143.0,"TAXI_OUT":7.0,"WHEELS_OFF":114.0,"WHEELS_ON":136.0,"TAXI_IN":35.0,"ARR_DELAY":32.0,"AIR_TIME":165.0,"DISTANCE":38.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":5690,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5204,"ORIGIN_AIRPORT_ID":801,"ORIGIN_AIRPORT_SEQ_ID":7459,"ORIGIN_CITY_MARKET_ID":3278,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2547,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6178,"DEST_AIRPORT_ID":3400,"DEST_AIRPORT_SEQ_ID":5142,"DEST_CITY_MARKET_ID":5559,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6536,"DEST_STATE_NM":"UA","DEST_WAC":72,"DEP_DELAY":70.0,"TAXI_OUT":142.0,"WHEELS_OFF":66.0,"WHEELS_ON":NaN,"TAXI_IN":135.0,"ARR_DELAY":152.0,"AIR_TIME":161.0,"DISTANCE":-5.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":7580,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4957,"ORIGIN_AIRPORT_ID":2672,"ORIGIN_AIRPORT_SEQ_ID":7389,"ORIGIN_CITY_MARKET_ID":3459,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4960,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6427,"DEST_AIRPORT_ID":112,"DEST_AIRPORT_SEQ_ID":3085,"DEST_CITY_MARKET_ID":9255,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4800,"DEST_STATE_NM":"UA","DEST_WAC":4350,"DEP_DELAY":46.0,"TAXI_OUT":NaN,"WHEELS_OFF":79.0,"WHEELS_ON":NaN,"TAXI_IN":158.0,"ARR_DELAY":NaN,"AIR_TIME":101.0,"DISTANCE":175.0}
+{"FL_DATE":"2017-01-07","AIRLINE_ID":6467,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":7979,"ORIGIN_AIRPORT_ID":8389,"ORIGIN_AIRPORT_SEQ_ID":4198,"ORIGIN_CITY_MARKET_ID":4320,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6622,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9124,"DEST_AIRPORT_ID":3697,"DEST_AIRPORT_SEQ_ID":3857,"DEST_CITY_MARKET_ID":6662,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6345,"DEST_STATE_NM":"AA","DEST_WAC":23,"DEP_DELAY":198.0,"TAXI_OUT":7.0,"WHEELS_OFF":100.0,"WHEELS_ON":-7.0,"TAXI_IN":60.0,"ARR_DELAY":NaN,"AIR_TIME":45.0,"DISTANCE":185.0}
+{"FL_DATE":"2017-01-14","AIRLINE_ID":8629,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":2943,"ORIGIN_AIRPORT_ID":4190,"ORIGIN_AIRPORT_SEQ_ID":739,"ORIGIN_CITY_MARKET_ID":2383,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9698,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3535,"DEST_AIRPORT_ID":2869,"DEST_AIRPORT_SEQ_ID":5370,"DEST_CITY_MARKET_ID":2296,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9494,"DEST_STATE_NM":"AA","DEST_WAC":46,"DEP_DELAY":194.0,"TAXI_OUT":109.0,"WHEELS_OFF":174.0,"WHEELS_ON":NaN,"TAXI_IN":177.0,"ARR_DELAY":98.0,"AIR_TIME":NaN,"DISTANCE":49.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":302,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":9554,"ORIGIN_AIRPORT_ID":9181,"ORIGIN_AIRPORT_SEQ_ID":9575,"ORIGIN_CITY_MARKET_ID":3282,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9410,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4970,"DEST_AIRPORT_ID":3284,"DEST_AIRPORT_SEQ_ID":9259,"DEST_CITY_MARKET_ID":8500,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3401,"DEST_STATE_NM":"AA","DEST_WAC":3856,"DEP_DELAY":30.0,"TAXI_OUT":61.0,"WHEELS_OFF":134.0,"WHEELS_ON":6.0,"TAXI_IN":99.0,"ARR_DELAY":167.0,"AIR_TIME":NaN,"DISTANCE":157.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":4039,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":808,"ORIGIN_AIRPORT_ID":6466,"ORIGIN_AIRPORT_SEQ_ID":1576,"ORIGIN_CITY_MARKET_ID":3793,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6062,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":1580,"DEST_AIRPORT_ID":4517,"DEST_AIRPORT_SEQ_ID":4600,"DEST_CITY_MARKET_ID":2512,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9931,"DEST_STATE_NM":"AA","DEST_WAC":7824,"DEP_DELAY":NaN,"TAXI_OUT":-13.0,"WHEELS_OFF":NaN,"WHEELS_ON":56.0,"TAXI_IN":164.0,"ARR_DELAY":88.0,"AIR_TIME":23.0,"DISTANCE":41.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":2374,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":5234,"ORIGIN_AIRPORT_ID":6476,"ORIGIN_AIRPORT_SEQ_ID":8870,"ORIGIN_CITY_MARKET_ID":8880,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8695,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6014,"DEST_AIRPORT_ID":7996,"DEST_AIRPORT_SEQ_ID":2309,"DEST_CITY_MARKET_ID":3433,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1329,"DEST_STATE_NM":"AA","DEST_WAC":241,"DEP_DELAY":-15.0,"TAXI_OUT":NaN,"WHEELS_OFF":125.0,"WHEELS_ON":NaN,"TAXI_IN":182.0,"ARR_DELAY":24.0,"AIR_TIME":86.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":44,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5979,"ORIGIN_AIRPORT_ID":6615,"ORIGIN_AIRPORT_SEQ_ID":2358,"ORIGIN_CITY_MARKET_ID":9566,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3878,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":5349,"DEST_AIRPORT_ID":3094,"DEST_AIRPORT_SEQ_ID":8695,"DEST_CITY_MARKET_ID":8740,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3387,"DEST_STATE_NM":"UA","DEST_WAC":7437,"DEP_DELAY":-7.0,"TAXI_OUT":21.0,"WHEELS_OFF":105.0,"WHEELS_ON":118.0,"TAXI_IN":82.0,"ARR_DELAY":102.0,"AIR_TIME":190.0,"DISTANCE":36.0}
+{"FL_DATE":"2017-01-28","AIRLINE_ID":3187,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":256,"ORIGIN_AIRPORT_ID":2551,"ORIGIN_AIRPORT_SEQ_ID":8110,"ORIGIN_CITY_MARKET_ID":9884,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4407,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2025,"DEST_AIRPORT_ID":8288,"DEST_AIRPORT_SEQ_ID":1146,"DEST_CITY_MARKET_ID":1606,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7005,"DEST_STATE_NM":"DL","DEST_WAC":6708,"DEP_DELAY":177.0,"TAXI_OUT":42.0,"WHEELS_OFF":-12.0,"WHEELS_ON":NaN,"TAXI_IN":75.0,"ARR_DELAY":175.0,"AIR_TIME":95.0,"DISTANCE":24.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":7050,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5996,"ORIGIN_AIRPORT_ID":9480,"ORIGIN_AIRPORT_SEQ_ID":6116,"ORIGIN_CITY_MARKET_ID":8198,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2025,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":879,"DEST_AIRPORT_ID":3487,"DEST_AIRPORT_SEQ_ID":5869,"DEST_CITY_MARKET_ID":2929,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":4696,"DEST_STATE_NM":"DL","DEST_WAC":9170,"DEP_DELAY":74.0,"TAXI_OUT":75.0,"WHEELS_OFF":-13.0,"WHEELS_ON":26.0,"TAXI_IN":182.0,"ARR_DELAY":100.0,"AIR_TIME":94.0,"DISTANCE":29.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":5259,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":269,"ORIGIN_AIRPORT_ID":7021,"ORIGIN_AIRPORT_SEQ_ID":3645,"ORIGIN_CITY_MARKET_ID":7193,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1303,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3253,"DEST_AIRPORT_ID":7418,"DEST_AIRPORT_SEQ_ID":1830,"DEST_CITY_MARKET_ID":628,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9387,"DEST_STATE_NM":"AA","DEST_WAC":3926,"DEP_DELAY":NaN,"TAXI_OUT":64.0,"WHEELS_OFF":192.0,"WHEELS_ON":157.0,"TAXI_IN":140.0,"ARR_DELAY":4.0,"AIR_TIME":95.0,"DISTANCE":197.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":1017,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":1376,"ORIGIN_AIRPORT_ID":7600,"ORIGIN_AIRPORT_SEQ_ID":3648,"ORIGIN_CITY_MARKET_ID":2612,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3438,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":4793,"DEST_AIRPORT_ID":9643,"DEST_AIRPORT_SEQ_ID":9394,"DEST_CITY_MARKET_ID":7698,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1621,"DEST_STATE_NM":"UA","DEST_WAC":4159,"DEP_DELAY":21.0,"TAXI_OUT":171.0,"WHEELS_OFF":89.0,"WHEELS_ON":57.0,"TAXI_IN":81.0,"ARR_DELAY":22.0,"AIR_TIME":123.0,"DISTANCE":118.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":3999,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":4714,"ORIGIN_AIRPORT_ID":1227,"ORIGIN_AIRPORT_SEQ_ID":1235,"ORIGIN_CITY_MARKET_ID":3922,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":175,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6650,"DEST_AIRPORT_ID":6482,"DEST_AIRPORT_SEQ_ID":923,"DEST_CITY_MARKET_ID":2044,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7625,"DEST_STATE_NM":"DL","DEST_WAC":4787,"DEP_DELAY":100.0,"TAXI_OUT":129.0,"WHEELS_OFF":44.0,"WHEELS_ON":86.0,"TAXI_IN":128.0,"ARR_DELAY":52.0,"AIR_TIME":148.0,"DISTANCE":187.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":530,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":8721,"ORIGIN_AIRPORT_ID":2524,"ORIGIN_AIRPORT_SEQ_ID":9571,"ORIGIN_CITY_MARKET_ID":155,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8992,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":563,"DEST_AIRPORT_ID":5681,"DEST_AIRPORT_SEQ_ID":7880,"DEST_CITY_MARKET_ID":8942,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5332,"DEST_STATE_NM":"UA","DEST_WAC":3023,"DEP_DELAY":152.0,"TAXI_OUT":185.0,"WHEELS_OFF":149.0,"WHEELS_ON":43.0,"TAXI_IN":-9.0,"ARR_DELAY":187.0,"AIR_TIME":97.0,"DISTANCE":198.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":2986,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":1425,"ORIGIN_AIRPORT_ID":596,"ORIGIN_AIRPORT_SEQ_ID":4690,"ORIGIN_CITY_MARKET_ID":8162,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5113,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":6080,"DEST_AIRPORT_ID":5665,"DEST_AIRPORT_SEQ_ID":3917,"DEST_CITY_MARKET_ID":3471,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":5566,"DEST_STATE_NM":"DL","DEST_WAC":5296,"DEP_DELAY":-11.0,"TAXI_OUT":NaN,"WHEELS_OFF":80.0,"WHEELS_ON":33.0,"TAXI_IN":98.0,"ARR_DELAY":69.0,"AIR_TIME":106.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":4133,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":956,"ORIGIN_AIRPORT_ID":6627,"ORIGIN_AIRPORT_SEQ_ID":6667,"ORIGIN_CITY_MARKET_ID":6124,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":4992,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3201,"DEST_AIRPORT_ID":1472,"DEST_AIRPORT_SEQ_ID":4980,"DEST_CITY_MARKET_ID":485,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":95,"DEST_STATE_NM":"DL","DEST_WAC":3325,"DEP_DELAY":193.0,"TAXI_OUT":45.0,"WHEELS_OFF":133.0,"WHEELS_ON":33.0,"TAXI_IN":155.0,"ARR_DELAY":175.0,"AIR_TIME":64.0,"DISTANCE":141.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":5428,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":4751,"ORIGIN_AIRPORT_ID":285,"ORIGIN_AIRPORT_SEQ_ID":7667,"ORIGIN_CITY_MARKET_ID":423,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":2838,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":4068,"DEST_AIRPORT_ID":307,"DEST_AIRPORT_SEQ_ID":6632,"DEST_CITY_MARKET_ID":9951,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3519,"DEST_STATE_NM":"AA","DEST_WAC":6831,"DEP_DELAY":127.0,"TAXI_OUT":197.0,"WHEELS_OFF":-4.0,"WHEELS_ON":36.0,"TAXI_IN":12.0,"ARR_DELAY":198.0,"AIR_TIME":68.0,"DISTANCE":171.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":6956,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":5824,"ORIGIN_AIRPORT_ID":3735,"ORIGIN_AIRPORT_SEQ_ID":1228,"ORIGIN_CITY_MARKET_ID":7448,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":169,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9821,"DEST_AIRPORT_ID":5220,"DEST_AIRPORT_SEQ_ID":3100,"DEST_CITY_MARKET_ID":5885,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":6132,"DEST_STATE_NM":"UA","DEST_WAC":3232,"DEP_DELAY":69.0,"TAXI_OUT":121.0,"WHEELS_OFF":48.0,"WHEELS_ON":2.0,"TAXI_IN":168.0,"ARR_DELAY":127.0,"AIR_TIME":35.0,"DISTANCE":92.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":792,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":8368,"ORIGIN_AIRPORT_ID":6379,"ORIGIN_AIRPORT_SEQ_ID":1164,"ORIGIN_CITY_MARKET_ID":4812,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5285,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":6328,"DEST_AIRPORT_ID":7795,"DEST_AIRPORT_SEQ_ID":9247,"DEST_CITY_MARKET_ID":2393,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6178,"DEST_STATE_NM":"UA","DEST_WAC":9343,"DEP_DELAY":138.0,"TAXI_OUT":-8.0,"WHEELS_OFF":109.0,"WHEELS_ON":158.0,"TAXI_IN":-19.0,"ARR_DELAY":107.0,"AIR_TIME":-16.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":7138,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":3358,"ORIGIN_AIRPORT_ID":6961,"ORIGIN_AIRPORT_SEQ_ID":6093,"ORIGIN_CITY_MARKET_ID":7058,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1032,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2989,"DEST_AIRPORT_ID":8413,"DEST_AIRPORT_SEQ_ID":3505,"DEST_CITY_MARKET_ID":3046,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":5920,"DEST_STATE_NM":"AA","DEST_WAC":2948,"DEP_DELAY":157.0,"TAXI_OUT":162.0,"WHEELS_OFF":16.0,"WHEELS_ON":20.0,"TAXI_IN":185.0,"ARR_DELAY":120.0,"AIR_TIME":184.0,"DISTANCE":189.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":1300,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":7160,"ORIGIN_AIRPORT_ID":8064,"ORIGIN_AIRPORT_SEQ_ID":628,"ORIGIN_CITY_MARKET_ID":5267,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1383,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2986,"DEST_AIRPORT_ID":7826,"DEST_AIRPORT_SEQ_ID":3863,"DEST_CITY_MARKET_ID":5798,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3261,"DEST_STATE_NM":"DL","DEST_WAC":2741,"DEP_DELAY":177.0,"TAXI_OUT":8.0,"WHEELS_OFF":-13.0,"WHEELS_ON":116.0,"TAXI_IN":6.0,"ARR_DELAY":52.0,"AIR_TIME":98.0,"DISTANCE":169.0}
+{"FL_DATE":"2017-01-01","AIRLINE_ID":6807,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":7626,"ORIGIN_AIRPORT_ID":7404,"ORIGIN_AIRPORT_SEQ_ID":7401,"ORIGIN_CITY_MARKET_ID":9166,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":4526,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9820,"DEST_AIRPORT_ID":1428,"DEST_AIRPORT_SEQ_ID":9416,"DEST_CITY_MARKET_ID":6542,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1710,"DEST_STATE_NM":"DL","DEST_WAC":5786,"DEP_DELAY":102.0,"TAXI_OUT":32.0,"WHEELS_OFF":190.0,"WHEELS_ON":186.0,"TAXI_IN":168.0,"ARR_DELAY":126.0,"AIR_TIME":163.0,"DISTANCE":27.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":5632,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":1466,"ORIGIN_AIRPORT_ID":3442,"ORIGIN_AIRPORT_SEQ_ID":8984,"ORIGIN_CITY_MARKET_ID":2310,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3908,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":9328,"DEST_AIRPORT_ID":4900,"DEST_AIRPORT_SEQ_ID":8569,"DEST_CITY_MARKET_ID":6822,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":5844,"DEST_STATE_NM":"AA","DEST_WAC":8583,"DEP_DELAY":38.0,"TAXI_OUT":33.0,"WHEELS_OFF":170.0,"WHEELS_ON":119.0,"TAXI_IN":163.0,"ARR_DELAY":188.0,"AIR_TIME":198.0,"DISTANCE":-13.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":563,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":699,"ORIGIN_AIRPORT_ID":8217,"ORIGIN_AIRPORT_SEQ_ID":7558,"ORIGIN_CITY_MARKET_ID":9473,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8261,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8911,"DEST_AIRPORT_ID":6544,"DEST_AIRPORT_SEQ_ID":6622,"DEST_CITY_MARKET_ID":5415,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":329,"DEST_STATE_NM":"AA","DEST_WAC":5177,"DEP_DELAY":NaN,"TAXI_OUT":-5.0,"WHEELS_OFF":62.0,"WHEELS_ON":15.0,"TAXI_IN":39.0,"ARR_DELAY":67.0,"AIR_TIME":NaN,"DISTANCE":83.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":7709,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":9736,"ORIGIN_AIRPORT_ID":7637,"ORIGIN_AIRPORT_SEQ_ID":4324,"ORIGIN_CITY_MARKET_ID":277,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8649,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3572,"DEST_AIRPORT_ID":9765,"DEST_AIRPORT_SEQ_ID":5999,"DEST_CITY_MARKET_ID":7167,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9280,"DEST_STATE_NM":"DL","DEST_WAC":9048,"DEP_DELAY":113.0,"TAXI_OUT":NaN,"WHEELS_OFF":171.0,"WHEELS_ON":166.0,"TAXI_IN":NaN,"ARR_DELAY":-4.0,"AIR_TIME":4.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-12","AIRLINE_ID":3746,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":5452,"ORIGIN_AIRPORT_ID":2114,"ORIGIN_AIRPORT_SEQ_ID":3987,"ORIGIN_CITY_MARKET_ID":5760,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8349,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9517,"DEST_AIRPORT_ID":600,"DEST_AIRPORT_SEQ_ID":237,"DEST_CITY_MARKET_ID":4261,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1906,"DEST_STATE_NM":"DL","DEST_WAC":6750,"DEP_DELAY":194.0,"TAXI_OUT":NaN,"WHEELS_OFF":74.0,"WHEELS_ON":133.0,"TAXI_IN":89.0,"ARR_DELAY":23.0,"AIR_TIME":172.0,"DISTANCE":74.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":9213,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":7697,"ORIGIN_AIRPORT_ID":6033,"ORIGIN_AIRPORT_SEQ_ID":3311,"ORIGIN_CITY_MARKET_ID":5408,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7296,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4108,"DEST_AIRPORT_ID":8941,"DEST_AIRPORT_SEQ_ID":2095,"DEST_CITY_MARKET_ID":3627,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":38,"DEST_STATE_NM":"AA","DEST_WAC":2275,"DEP_DELAY":13.0,"TAXI_OUT":-8.0,"WHEELS_OFF":15.0,"WHEELS_ON":100.0,"TAXI_IN":-16.0,"ARR_DELAY":77.0,"AIR_TIME":NaN,"DISTANCE":14.0}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":8345,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":2478,"ORIGIN_AIRPORT_ID":9421,"ORIGIN_AIRPORT_SEQ_ID":5470,"ORIGIN_CITY_MARKET_ID":1648,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":8342,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":201,"DEST_AIRPORT_ID":3165,"DEST_AIRPORT_SEQ_ID":8603,"DEST_CITY_MARKET_ID":5895,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3093,"DEST_STATE_NM":"AA","DEST_WAC":9607,"DEP_DELAY":182.0,"TAXI_OUT":122.0,"WHEELS_OFF":6.0,"WHEELS_ON":153.0,"TAXI_IN":NaN,"ARR_DELAY":120.0,"AIR_TIME":118.0,"DISTANCE":46.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":2884,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":9236,"ORIGIN_AIRPORT_ID":3097,"ORIGIN_AIRPORT_SEQ_ID":3081,"ORIGIN_CITY_MARKET_ID":2834,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5889,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5058,"DEST_AIRPORT_ID":1811,"DEST_AIRPORT_SEQ_ID":9779,"DEST_CITY_MARKET_ID":2743,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3827,"DEST_STATE_NM":"AA","DEST_WAC":6911,"DEP_DELAY":16.0,"TAXI_OUT":110.0,"WHEELS_OFF":105.0,"WHEELS_ON":NaN,"TAXI_IN":107.0,"ARR_DELAY":98.0,"AIR_TIME":157.0,"DISTANCE":66.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":7589,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":6115,"ORIGIN_AIRPORT_ID":7635,"ORIGIN_AIRPORT_SEQ_ID":7856,"ORIGIN_CITY_MARKET_ID":8098,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3140,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5488,"DEST_AIRPORT_ID":7638,"DEST_AIRPORT_SEQ_ID":738,"DEST_CITY_MARKET_ID":3058,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":3982,"DEST_STATE_NM":"DL","DEST_WAC":7086,"DEP_DELAY":24.0,"TAXI_OUT":-10.0,"WHEELS_OFF":189.0,"WHEELS_ON":103.0,"TAXI_IN":159.0,"ARR_DELAY":121.0,"AIR_TIME":51.0,"DISTANCE":76.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":8554,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":5056,"ORIGIN_AIRPORT_ID":4532,"ORIGIN_AIRPORT_SEQ_ID":9354,"ORIGIN_CITY_MARKET_ID":5224,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":3982,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":1363,"DEST_AIRPORT_ID":8127,"DEST_AIRPORT_SEQ_ID":2714,"DEST_CITY_MARKET_ID":6105,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":2611,"DEST_STATE_NM":"UA","DEST_WAC":9798,"DEP_DELAY":NaN,"TAXI_OUT":155.0,"WHEELS_OFF":61.0,"WHEELS_ON":NaN,"TAXI_IN":35.0,"ARR_DELAY":157.0,"AIR_TIME":70.0,"DISTANCE":112.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":8936,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":3137,"ORIGIN_AIRPORT_ID":9612,"ORIGIN_AIRPORT_SEQ_ID":3352,"ORIGIN_CITY_MARKET_ID":3383,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6794,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":7529,"DEST_AIRPORT_ID":6723,"DEST_AIRPORT_SEQ_ID":5424,"DEST_CITY_MARKET_ID":474,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3791,"DEST_STATE_NM":"DL","DEST_WAC":9077,"DEP_DELAY":110.0,"TAXI_OUT":190.0,"WHEELS_OFF":-16.0,"WHEELS_ON":25.0,"TAXI_IN":119.0,"ARR_DELAY":NaN,"AIR_TIME":84.0,"DISTANCE":197.0}
+{"FL_DATE":"2017-01-09","AIRLINE_ID":3122,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":7187,"ORIGIN_AIRPORT_ID":8012,"ORIGIN_AIRPORT_SEQ_ID":7596,"ORIGIN_CITY_MARKET_ID":9848,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9381,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1676,"DEST_AIRPORT_ID":5515,"DEST_AIRPORT_SEQ_ID":5578,"DEST_CITY_MARKET_ID":1041,"DEST":"DL","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6353,"DEST_STATE_NM":"DL","DEST_WAC":6461,"DEP_DELAY":57.0,"TAXI_OUT":146.0,"WHEELS_OFF":17.0,"WHEELS_ON":138.0,"TAXI_IN":11.0,"ARR_DELAY":83.0,"AIR_TIME":54.0,"DISTANCE":115.0}
+{"FL_DATE":"2017-01-05","AIRLINE_ID":6522,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":6232,"ORIGIN_AIRPORT_ID":5939,"ORIGIN_AIRPORT_SEQ_ID":3741,"ORIGIN_CITY_MARKET_ID":215,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6251,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":477,"DEST_AIRPORT_ID":9342,"DEST_AIRPORT_SEQ_ID":6014,"DEST_CITY_MARKET_ID":5805,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2716,"DEST_STATE_NM":"AA","DEST_WAC":3439,"DEP_DELAY":36.0,"TAXI_OUT":98.0,"WHEELS_OFF":37.0,"WHEELS_ON":-16.0,"TAXI_IN":NaN,"ARR_DELAY":-8.0,"AIR_TIME":61.0,"DISTANCE":198.0}
+{"FL_DATE":"2017-01-04","AIRLINE_ID":6843,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":651,"ORIGIN_AIRPORT_ID":4467,"ORIGIN_AIRPORT_SEQ_ID":9467,"ORIGIN_CITY_MARKET_ID":5853,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5619,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2242,"DEST_AIRPORT_ID":4633,"DEST_AIRPORT_SEQ_ID":4763,"DEST_CITY_MARKET_ID":365,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":9843,"DEST_STATE_NM":"AA","DEST_WAC":3808,"DEP_DELAY":123.0,"TAXI_OUT":55.0,"WHEELS_OFF":104.0,"WHEELS_ON":-3.0,"TAXI_IN":27.0,"ARR_DELAY":-19.0,"AIR_TIME":109.0,"DISTANCE":17.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":837,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":3673,"ORIGIN_AIRPORT_ID":2466,"ORIGIN_AIRPORT_SEQ_ID":3671,"ORIGIN_CITY_MARKET_ID":8751,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9373,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":8468,"DEST_AIRPORT_ID":6944,"DEST_AIRPORT_SEQ_ID":3828,"DEST_CITY_MARKET_ID":9273,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9585,"DEST_STATE_NM":"AA","DEST_WAC":2876,"DEP_DELAY":108.0,"TAXI_OUT":148.0,"WHEELS_OFF":115.0,"WHEELS_ON":29.0,"TAXI_IN":22.0,"ARR_DELAY":100.0,"AIR_TIME":NaN,"DISTANCE":-5.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":2049,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":8274,"ORIGIN_AIRPORT_ID":8770,"ORIGIN_AIRPORT_SEQ_ID":6508,"ORIGIN_CITY_MARKET_ID":6423,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":3199,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":9253,"DEST_AIRPORT_ID":4068,"DEST_AIRPORT_SEQ_ID":4383,"DEST_CITY_MARKET_ID":6239,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":7884,"DEST_STATE_NM":"DL","DEST_WAC":1323,"DEP_DELAY":90.0,"TAXI_OUT":91.0,"WHEELS_OFF":138.0,"WHEELS_ON":NaN,"TAXI_IN":-15.0,"ARR_DELAY":163.0,"AIR_TIME":152.0,"DISTANCE":48.0}
+{"FL_DATE":"2017-01-21","AIRLINE_ID":2615,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":3139,"ORIGIN_AIRPORT_ID":4526,"ORIGIN_AIRPORT_SEQ_ID":6104,"ORIGIN_CITY_MARKET_ID":6384,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":1184,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7107,"DEST_AIRPORT_ID":4844,"DEST_AIRPORT_SEQ_ID":17,"DEST_CITY_MARKET_ID":4902,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":2029,"DEST_STATE_NM":"DL","DEST_WAC":3646,"DEP_DELAY":137.0,"TAXI_OUT":136.0,"WHEELS_OFF":NaN,"WHEELS_ON":76.0,"TAXI_IN":20.0,"ARR_DELAY":118.0,"AIR_TIME":141.0,"DISTANCE":134.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":6451,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":5899,"ORIGIN_AIRPORT_ID":7326,"ORIGIN_AIRPORT_SEQ_ID":4024,"ORIGIN_CITY_MARKET_ID":4601,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":7354,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":7295,"DEST_AIRPORT_ID":3187,"DEST_AIRPORT_SEQ_ID":6468,"DEST_CITY_MARKET_ID":1150,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":3047,"DEST_STATE_NM":"DL","DEST_WAC":843,"DEP_DELAY":NaN,"TAXI_OUT":19.0,"WHEELS_OFF":16.0,"WHEELS_ON":28.0,"TAXI_IN":114.0,"ARR_DELAY":NaN,"AIR_TIME":180.0,"DISTANCE":180.0}
+{"FL_DATE":"2017-01-26","AIRLINE_ID":9480,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":3106,"ORIGIN_AIRPORT_ID":6887,"ORIGIN_AIRPORT_SEQ_ID":716,"ORIGIN_CITY_MARKET_ID":538,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":8132,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":1418,"DEST_AIRPORT_ID":5324,"DEST_AIRPORT_SEQ_ID":9279,"DEST_CITY_MARKET_ID":2320,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2993,"DEST_STATE_NM":"DL","DEST_WAC":5543,"DEP_DELAY":-10.0,"TAXI_OUT":11.0,"WHEELS_OFF":104.0,"WHEELS_ON":76.0,"TAXI_IN":37.0,"ARR_DELAY":73.0,"AIR_TIME":159.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":6564,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":3760,"ORIGIN_AIRPORT_ID":897,"ORIGIN_AIRPORT_SEQ_ID":1268,"ORIGIN_CITY_MARKET_ID":4351,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":3493,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":3517,"DEST_AIRPORT_ID":8977,"DEST_AIRPORT_SEQ_ID":3204,"DEST_CITY_MARKET_ID":604,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1107,"DEST_STATE_NM":"UA","DEST_WAC":51,"DEP_DELAY":187.0,"TAXI_OUT":NaN,"WHEELS_OFF":17.0,"WHEELS_ON":-8.0,"TAXI_IN":-9.0,"ARR_DELAY":176.0,"AIR_TIME":30.0,"DISTANCE":95.0}
+{"FL_DATE":"2017-01-08","AIRLINE_ID":6954,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":2381,"ORIGIN_AIRPORT_ID":6007,"ORIGIN_AIRPORT_SEQ_ID":936,"ORIGIN_CITY_MARKET_ID":8591,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":574,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":137,"DEST_AIRPORT_ID":3614,"DEST_AIRPORT_SEQ_ID":7856,"DEST_CITY_MARKET_ID":9360,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":7709,"DEST_STATE_NM":"DL","DEST_WAC":2775,"DEP_DELAY":74.0,"TAXI_OUT":7.0,"WHEELS_OFF":NaN,"WHEELS_ON":119.0,"TAXI_IN":122.0,"ARR_DELAY":125.0,"AIR_TIME":140.0,"DISTANCE":13.0}
+{"FL_DATE":"2017-01-24","AIRLINE_ID":2675,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5904,"ORIGIN_AIRPORT_ID":741,"ORIGIN_AIRPORT_SEQ_ID":4644,"ORIGIN_CITY_MARKET_ID":3177,"ORIGIN":"DL","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":1221,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":790,"DEST_AIRPORT_ID":2521,"DEST_AIRPORT_SEQ_ID":829,"DEST_CITY_MARKET_ID":2549,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":2448,"DEST_STATE_NM":"AA","DEST_WAC":9295,"DEP_DELAY":127.0,"TAXI_OUT":11.0,"WHEELS_OFF":8.0,"WHEELS_ON":25.0,"TAXI_IN":138.0,"ARR_DELAY":158.0,"AIR_TIME":56.0,"DISTANCE":-19.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":2855,"CARRIER":"DL","TAIL_NUM":"AA","FL_NUM":7065,"ORIGIN_AIRPORT_ID":210,"ORIGIN_AIRPORT_SEQ_ID":2014,"ORIGIN_CITY_MARKET_ID":2946,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5506,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":9945,"DEST_AIRPORT_ID":7373,"DEST_AIRPORT_SEQ_ID":4433,"DEST_CITY_MARKET_ID":7901,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9208,"DEST_STATE_NM":"UA","DEST_WAC":4068,"DEP_DELAY":175.0,"TAXI_OUT":102.0,"WHEELS_OFF":NaN,"WHEELS_ON":163.0,"TAXI_IN":31.0,"ARR_DELAY":80.0,"AIR_TIME":25.0,"DISTANCE":-4.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":3571,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":67,"ORIGIN_AIRPORT_ID":1610,"ORIGIN_AIRPORT_SEQ_ID":5619,"ORIGIN_CITY_MARKET_ID":482,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4094,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3296,"DEST_AIRPORT_ID":8609,"DEST_AIRPORT_SEQ_ID":5707,"DEST_CITY_MARKET_ID":3445,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":6791,"DEST_STATE_NM":"DL","DEST_WAC":2774,"DEP_DELAY":75.0,"TAXI_OUT":47.0,"WHEELS_OFF":183.0,"WHEELS_ON":70.0,"TAXI_IN":158.0,"ARR_DELAY":127.0,"AIR_TIME":188.0,"DISTANCE":115.0}
+{"FL_DATE":"2017-01-17","AIRLINE_ID":4293,"CARRIER":"UA","TAIL_NUM":"AA","FL_NUM":3666,"ORIGIN_AIRPORT_ID":7624,"ORIGIN_AIRPORT_SEQ_ID":3377,"ORIGIN_CITY_MARKET_ID":4106,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":8059,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2815,"DEST_AIRPORT_ID":6042,"DEST_AIRPORT_SEQ_ID":5080,"DEST_CITY_MARKET_ID":65,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":9811,"DEST_STATE_NM":"DL","DEST_WAC":6699,"DEP_DELAY":159.0,"TAXI_OUT":70.0,"WHEELS_OFF":12.0,"WHEELS_ON":9.0,"TAXI_IN":NaN,"ARR_DELAY":2.0,"AIR_TIME":188.0,"DISTANCE":72.0}
+{"FL_DATE":"2017-01-27","AIRLINE_ID":899,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":6743,"ORIGIN_AIRPORT_ID":6810,"ORIGIN_AIRPORT_SEQ_ID":8971,"ORIGIN_CITY_MARKET_ID":4148,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":224,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":8731,"DEST_AIRPORT_ID":5662,"DEST_AIRPORT_SEQ_ID":7526,"DEST_CITY_MARKET_ID":9399,"DEST":"DL","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9520,"DEST_STATE_NM":"UA","DEST_WAC":1744,"DEP_DELAY":52.0,"TAXI_OUT":178.0,"WHEELS_OFF":153.0,"WHEELS_ON":97.0,"TAXI_IN":182.0,"ARR_DELAY":75.0,"AIR_TIME":28.0,"DISTANCE":112.0}
+{"FL_DATE":"2017-01-11","AIRLINE_ID":514,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":1744,"ORIGIN_AIRPORT_ID":1264,"ORIGIN_AIRPORT_SEQ_ID":3427,"ORIGIN_CITY_MARKET_ID":237,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":7712,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2831,"DEST_AIRPORT_ID":9832,"DEST_AIRPORT_SEQ_ID":5417,"DEST_CITY_MARKET_ID":3987,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":406,"DEST_STATE_NM":"AA","DEST_WAC":85,"DEP_DELAY":94.0,"TAXI_OUT":61.0,"WHEELS_OFF":62.0,"WHEELS_ON":NaN,"TAXI_IN":47.0,"ARR_DELAY":178.0,"AIR_TIME":-1.0,"DISTANCE":61.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":5275,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":5099,"ORIGIN_AIRPORT_ID":681,"ORIGIN_AIRPORT_SEQ_ID":4617,"ORIGIN_CITY_MARKET_ID":6929,"ORIGIN":"AA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":9808,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":2263,"DEST_AIRPORT_ID":1581,"DEST_AIRPORT_SEQ_ID":8779,"DEST_CITY_MARKET_ID":9528,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":1628,"DEST_STATE_NM":"AA","DEST_WAC":5842,"DEP_DELAY":143.0,"TAXI_OUT":78.0,"WHEELS_OFF":NaN,"WHEELS_ON":198.0,"TAXI_IN":118.0,"ARR_DELAY":9.0,"AIR_TIME":40.0,"DISTANCE":160.0}
+{"FL_DATE":"2017-01-10","AIRLINE_ID":7835,"CARRIER":"DL","TAIL_NUM":"UA","FL_NUM":5889,"ORIGIN_AIRPORT_ID":6475,"ORIGIN_AIRPORT_SEQ_ID":7226,"ORIGIN_CITY_MARKET_ID":7465,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":4862,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4784,"DEST_AIRPORT_ID":7955,"DEST_AIRPORT_SEQ_ID":1086,"DEST_CITY_MARKET_ID":2542,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8690,"DEST_STATE_NM":"DL","DEST_WAC":2916,"DEP_DELAY":178.0,"TAXI_OUT":-3.0,"WHEELS_OFF":89.0,"WHEELS_ON":-16.0,"TAXI_IN":177.0,"ARR_DELAY":125.0,"AIR_TIME":188.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-15","AIRLINE_ID":813,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":5383,"ORIGIN_AIRPORT_ID":1823,"ORIGIN_AIRPORT_SEQ_ID":2331,"ORIGIN_CITY_MARKET_ID":3814,"ORIGIN":"UA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":2712,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":4628,"DEST_AIRPORT_ID":3323,"DEST_AIRPORT_SEQ_ID":9334,"DEST_CITY_MARKET_ID":4287,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":7430,"DEST_STATE_NM":"AA","DEST_WAC":4921,"DEP_DELAY":103.0,"TAXI_OUT":103.0,"WHEELS_OFF":NaN,"WHEELS_ON":72.0,"TAXI_IN":NaN,"ARR_DELAY":156.0,"AIR_TIME":19.0,"DISTANCE":NaN}
+{"FL_DATE":"2017-01-03","AIRLINE_ID":5117,"CARRIER":"DL","TAIL_NUM":"DL","FL_NUM":5149,"ORIGIN_AIRPORT_ID":4331,"ORIGIN_AIRPORT_SEQ_ID":8458,"ORIGIN_CITY_MARKET_ID":4429,"ORIGIN":"AA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1365,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":2261,"DEST_AIRPORT_ID":2935,"DEST_AIRPORT_SEQ_ID":9189,"DEST_CITY_MARKET_ID":8445,"DEST":"UA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":4637,"DEST_STATE_NM":"AA","DEST_WAC":2656,"DEP_DELAY":174.0,"TAXI_OUT":35.0,"WHEELS_OFF":54.0,"WHEELS_ON":65.0,"TAXI_IN":172.0,"ARR_DELAY":135.0,"AIR_TIME":54.0,"DISTANCE":159.0}
+{"FL_DATE":"2017-01-25","AIRLINE_ID":5851,"CARRIER":"UA","TAIL_NUM":"DL","FL_NUM":4654,"ORIGIN_AIRPORT_ID":4213,"ORIGIN_AIRPORT_SEQ_ID":7272,"ORIGIN_CITY_MARKET_ID":3535,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":6272,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":58,"DEST_AIRPORT_ID":9132,"DEST_AIRPORT_SEQ_ID":1830,"DEST_CITY_MARKET_ID":6138,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":1092,"DEST_STATE_NM":"UA","DEST_WAC":565,"DEP_DELAY":114.0,"TAXI_OUT":166.0,"WHEELS_OFF":85.0,"WHEELS_ON":64.0,"TAXI_IN":56.0,"ARR_DELAY":NaN,"AIR_TIME":96.0,"DISTANCE":132.0}
+{"FL_DATE":"2017-01-19","AIRLINE_ID":6383,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":4550,"ORIGIN_AIRPORT_ID":631,"ORIGIN_AIRPORT_SEQ_ID":8639,"ORIGIN_CITY_MARKET_ID":3861,"ORIGIN":"DL","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":6232,"ORIGIN_STATE_NM":"UA","ORIGIN_WAC":3555,"DEST_AIRPORT_ID":5556,"DEST_AIRPORT_SEQ_ID":7438,"DEST_CITY_MARKET_ID":4562,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":8922,"DEST_STATE_NM":"UA","DEST_WAC":3086,"DEP_DELAY":112.0,"TAXI_OUT":-16.0,"WHEELS_OFF":123.0,"WHEELS_ON":NaN,"TAXI_IN":61.0,"ARR_DELAY":NaN,"AIR_TIME":175.0,"DISTANCE":38.0}
+{"FL_DATE":"2017-01-16","AIRLINE_ID":9179,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":1347,"ORIGIN_AIRPORT_ID":5725,"ORIGIN_AIRPORT_SEQ_ID":7081,"ORIGIN_CITY_MARKET_ID":2774,"ORIGIN":"UA","ORIGIN_CITY_NAME":"UA","ORIGIN_STATE_ABR":"UA","ORIGIN_STATE_FIPS":5734,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":5411,"DEST_AIRPORT_ID":1130,"DEST_AIRPORT_SEQ_ID":3472,"DEST_CITY_MARKET_ID":828,"DEST":"AA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3349,"DEST_STATE_NM":"UA","DEST_WAC":5384,"DEP_DELAY":15.0,"TAXI_OUT":59.0,"WHEELS_OFF":179.0,"WHEELS_ON":17.0,"TAXI_IN":120.0,"ARR_DELAY":102.0,"AIR_TIME":169.0,"DISTANCE":194.0}
+{"FL_DATE":"2017-01-13","AIRLINE_ID":1324,"CARRIER":"AA","TAIL_NUM":"UA","FL_NUM":8995,"ORIGIN_AIRPORT_ID":5805,"ORIGIN_AIRPORT_SEQ_ID":2138,"ORIGIN_CITY_MARKET_ID":5357,"ORIGIN":"DL","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":5725,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":996,"DEST_AIRPORT_ID":5747,"DEST_AIRPORT_SEQ_ID":4093,"DEST_CITY_MARKET_ID":3353,"DEST":"UA","DEST_CITY_NAME":"AA","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":6262,"DEST_STATE_NM":"DL","DEST_WAC":8631,"DEP_DELAY":146.0,"TAXI_OUT":-10.0,"WHEELS_OFF":194.0,"WHEELS_ON":198.0,"TAXI_IN":37.0,"ARR_DELAY":78.0,"AIR_TIME":62.0,"DISTANCE":95.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":6018,"CARRIER":"AA","TAIL_NUM":"AA","FL_NUM":2010,"ORIGIN_AIRPORT_ID":1369,"ORIGIN_AIRPORT_SEQ_ID":9716,"ORIGIN_CITY_MARKET_ID":1122,"ORIGIN":"AA","ORIGIN_CITY_NAME":"AA","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":1614,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6690,"DEST_AIRPORT_ID":5196,"DEST_AIRPORT_SEQ_ID":9611,"DEST_CITY_MARKET_ID":3991,"DEST":"UA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":3239,"DEST_STATE_NM":"DL","DEST_WAC":7402,"DEP_DELAY":82.0,"TAXI_OUT":NaN,"WHEELS_OFF":180.0,"WHEELS_ON":53.0,"TAXI_IN":200.0,"ARR_DELAY":44.0,"AIR_TIME":124.0,"DISTANCE":174.0}
+{"FL_DATE":"2017-01-23","AIRLINE_ID":5695,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":8819,"ORIGIN_AIRPORT_ID":3287,"ORIGIN_AIRPORT_SEQ_ID":6788,"ORIGIN_CITY_MARKET_ID":2608,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9252,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":6384,"DEST_AIRPORT_ID":177,"DEST_AIRPORT_SEQ_ID":5313,"DEST_CITY_MARKET_ID":6210,"DEST":"AA","DEST_CITY_NAME":"UA","DEST_STATE_ABR":"DL","DEST_STATE_FIPS":9498,"DEST_STATE_NM":"AA","DEST_WAC":8389,"DEP_DELAY":102.0,"TAXI_OUT":NaN,"WHEELS_OFF":59.0,"WHEELS_ON":160.0,"TAXI_IN":60.0,"ARR_DELAY":163.0,"AIR_TIME":38.0,"DISTANCE":175.0}
+{"FL_DATE":"2017-01-20","AIRLINE_ID":6297,"CARRIER":"AA","TAIL_NUM":"DL","FL_NUM":3731,"ORIGIN_AIRPORT_ID":4207,"ORIGIN_AIRPORT_SEQ_ID":6577,"ORIGIN_CITY_MARKET_ID":8939,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"DL","ORIGIN_STATE_FIPS":9098,"ORIGIN_STATE_NM":"AA","ORIGIN_WAC":3379,"DEST_AIRPORT_ID":2892,"DEST_AIRPORT_SEQ_ID":8837,"DEST_CITY_MARKET_ID":3188,"DEST":"AA","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"UA","DEST_STATE_FIPS":1219,"DEST_STATE_NM":"AA","DEST_WAC":4295,"DEP_DELAY":128.0,"TAXI_OUT":197.0,"WHEELS_OFF":19.0,"WHEELS_ON":96.0,"TAXI_IN":114.0,"ARR_DELAY":33.0,"AIR_TIME":97.0,"DISTANCE":-6.0}
+{"FL_DATE":"2017-01-02","AIRLINE_ID":3401,"CARRIER":"UA","TAIL_NUM":"UA","FL_NUM":2455,"ORIGIN_AIRPORT_ID":3416,"ORIGIN_AIRPORT_SEQ_ID":9707,"ORIGIN_CITY_MARKET_ID":2155,"ORIGIN":"UA","ORIGIN_CITY_NAME":"DL","ORIGIN_STATE_ABR":"AA","ORIGIN_STATE_FIPS":9573,"ORIGIN_STATE_NM":"DL","ORIGIN_WAC":7471,"DEST_AIRPORT_ID":3780,"DEST_AIRPORT_SEQ_ID":3270,"DEST_CITY_MARKET_ID":1439,"DEST":"DL","DEST_CITY_NAME":"DL","DEST_STATE_ABR":"AA","DEST_STATE_FIPS":382,"DEST_STATE_NM":"DL","DEST_WAC":8511,"DEP_DELAY":63.0,"TAXI_OUT":100.0,"WHEELS_OFF":98.0,"WHEELS_ON":56.0,"TAXI_IN":35.0,"ARR_DELAY":164.0,"AIR_TIME":195.0,"DISTANCE":176.0}
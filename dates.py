@@ -0,0 +1,71 @@
+# coding: utf-8
+
+# Parsing of flight dates memoized by their text. Datasets span a few years
+# at most, so there are a few thousand distinct dates in millions of rows.
+
+import datetime
+
+from functools import lru_cache
+
+from schematics.types import DateType
+
+from schemas import Flight
+
+
+# Number of distinct dates kept parsed, ten years of days
+DATE_CACHE_SIZE = 4096
+
+DATE_FIELDS = tuple(
+    name
+    for name, field in Flight.fields.items()
+    if isinstance(field, DateType)
+)
+
+
+def make_date_parser(formats, cache_size=DATE_CACHE_SIZE):
+    """
+    Make function parsing string to `datetime.date` with the first of
+    `formats` matching it. Results are cached, dates are immutable, so they
+    are shared by all records having the same date. Raise `ValueError` if
+    no format matches.
+
+    """
+    formats = tuple(formats)
+
+    @lru_cache(maxsize=cache_size)
+    def parse(value):
+        for fmt in formats:
+            try:
+                return datetime.datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+
+        raise ValueError(
+            "Date '{}' does not match any of formats: {}".format(
+                value, ', '.join(formats),
+            )
+        )
+
+    return parse
+
+
+# Parsers of date fields of Flight, shared by all decoders of a process
+DATE_PARSERS = tuple(
+    (name, make_date_parser(Flight.fields[name].formats))
+    for name in DATE_FIELDS
+)
+
+
+def to_typed(item):
+    """
+    Replace strings of date fields of `item` by dates in place and return
+    the item.
+
+    """
+    for name, parse in DATE_PARSERS:
+        value = item.get(name)
+
+        if type(value) is str:
+            item[name] = parse(value)
+
+    return item
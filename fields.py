@@ -0,0 +1,83 @@
+# coding: utf-8
+
+from functools import lru_cache
+from operator import attrgetter
+
+from schemas import Flight
+from utils import to_camel
+
+
+FIELD_NAMES = tuple(Flight.fields.keys())
+
+
+class FieldMapping:
+    """
+    Precomputed mapping between names of Flight fields and names of
+    attributes of objects of another format along with accessors of these
+    attributes.
+
+    """
+
+    def __init__(self, names, foreign_names):
+        self.names = tuple(names)
+        self.foreign_names = tuple(foreign_names)
+
+        self.to_foreign = dict(zip(self.names, self.foreign_names))
+
+        self.getters = {
+            name: attrgetter(foreign_name)
+            for name, foreign_name in zip(self.names, self.foreign_names)
+        }
+        self.get_values = attrgetter(*self.foreign_names)
+
+    def get_fields(self, obj):
+        """
+        Get values of all fields of `obj` as a dict keyed by Flight names.
+
+        """
+        return dict(zip(self.names, self.get_values(obj)))
+
+
+def check_columns(columns):
+    """
+    Get projection `columns` as a tuple, checking that all of them are
+    Flight fields.
+
+    """
+    columns = tuple(columns)
+    unknown = [name for name in columns if name not in Flight.fields]
+
+    if unknown:
+        raise ValueError("Unknown columns: {}".format(', '.join(unknown)))
+
+    return columns
+
+
+def check_names(foreign_names, expected_names, format_name):
+    missing = set(expected_names) - set(foreign_names)
+
+    if missing:
+        raise ValueError(
+            "Fields are missing in {} schema: {}".format(
+                format_name, ', '.join(sorted(missing)),
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def get_capnp_mapping():
+    from schema_cache import get_capnp_schemas
+
+    camel_names = [to_camel(name) for name in FIELD_NAMES]
+    check_names(
+        get_capnp_schemas().Flight.schema.fieldnames, camel_names, 'capnp',
+    )
+    return FieldMapping(FIELD_NAMES, camel_names)
+
+
+@lru_cache(maxsize=None)
+def get_protobuf_mapping():
+    from schema_cache import get_protobuf_field_names
+
+    check_names(get_protobuf_field_names(), FIELD_NAMES, 'protobuf')
+    return FieldMapping(FIELD_NAMES, FIELD_NAMES)
@@ -0,0 +1,592 @@
+#! /usr/bin/env python
+# coding: utf-8
+
+# Synthetic flights resembling BTS on-time performance data, so benchmarks
+# can run at any scale without the private source file:
+#
+#     ./generate.py --rows 1000000 --seed 1 -o synthetic.csv
+#
+# Existing files, e.g. the real `source.csv`, are overwritten only with
+# --force.
+#
+# Rows are generated by chunks, each of them from its own seed derived
+# from the seed of the dataset, so output depends only on the seed and
+# number of rows, not on the number of workers. Only `Random.random()` is
+# used, which is the only method whose output Python keeps stable between
+# versions.
+
+import argparse
+import csv
+import datetime
+import io
+import math
+import random
+
+from bisect import bisect
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+
+import psutil
+
+from compression import COMPRESSIONS, get_available, open_file
+from fields import FIELD_NAMES
+
+
+DATA_ROOT = Path(__file__).absolute().parent
+
+# Number of rows generated from a single seed, by a single task
+CHUNK_ROWS = 100000
+
+DEFAULT_SEED = 0
+DEFAULT_START_DATE = datetime.date(2017, 1, 1)
+DEFAULT_DAYS = 365
+
+# Number of aircraft of every carrier, tail numbers are drawn from them
+TAILS_PER_CARRIER = 400
+
+CANCELLED_RATE = 0.015
+DIVERTED_RATE = 0.0025
+
+# Share of flights leaving on time or early, others are delayed by minutes
+# distributed exponentially
+ON_TIME_RATE = 0.62
+MEAN_DELAY = 35.0
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+Carrier = namedtuple('Carrier', ['code', 'airline_id', 'weight'])
+
+# Weights are rough shares of domestic flights
+CARRIERS = [
+    Carrier('WN', 19393, 22),
+    Carrier('DL', 19790, 16),
+    Carrier('AA', 19805, 16),
+    Carrier('OO', 20304, 12),
+    Carrier('UA', 19977, 10),
+    Carrier('EV', 20366, 6),
+    Carrier('B6', 20409, 5),
+    Carrier('AS', 19930, 3),
+    Carrier('NK', 20416, 3),
+    Carrier('F9', 20436, 2),
+    Carrier('HA', 19690, 1),
+    Carrier('VX', 21171, 1),
+]
+
+Airport = namedtuple('Airport', [
+    'code', 'airport_id', 'seq_id', 'city_market_id', 'city_name',
+    'state_abr', 'state_fips', 'state_nm', 'wac',
+    'latitude', 'longitude', 'weight',
+])
+
+# Weights are rough numbers of departures in thousands per year
+AIRPORTS = [
+    Airport(
+        'ATL', 10397, 1039705, 30397, 'Atlanta, GA',
+        'GA', 13, 'Georgia', 34, 33.64, -84.43, 390,
+    ),
+    Airport(
+        'ORD', 13930, 1393004, 30977, 'Chicago, IL',
+        'IL', 17, 'Illinois', 41, 41.98, -87.90, 300,
+    ),
+    Airport(
+        'DFW', 11298, 1129804, 30194, 'Dallas/Fort Worth, TX',
+        'TX', 48, 'Texas', 74, 32.90, -97.04, 270,
+    ),
+    Airport(
+        'DEN', 11292, 1129202, 30325, 'Denver, CO',
+        'CO', 8, 'Colorado', 82, 39.86, -104.67, 250,
+    ),
+    Airport(
+        'LAX', 12892, 1289204, 32575, 'Los Angeles, CA',
+        'CA', 6, 'California', 91, 33.94, -118.41, 220,
+    ),
+    Airport(
+        'SFO', 14771, 1477104, 32457, 'San Francisco, CA',
+        'CA', 6, 'California', 91, 37.62, -122.38, 170,
+    ),
+    Airport(
+        'PHX', 14107, 1410702, 30466, 'Phoenix, AZ',
+        'AZ', 4, 'Arizona', 81, 33.43, -112.01, 160,
+    ),
+    Airport(
+        'IAH', 12266, 1226603, 31453, 'Houston, TX',
+        'TX', 48, 'Texas', 74, 29.98, -95.34, 150,
+    ),
+    Airport(
+        'LAS', 12889, 1288903, 32211, 'Las Vegas, NV',
+        'NV', 32, 'Nevada', 85, 36.08, -115.15, 150,
+    ),
+    Airport(
+        'MSP', 13487, 1348702, 31650, 'Minneapolis, MN',
+        'MN', 27, 'Minnesota', 63, 44.88, -93.22, 140,
+    ),
+    Airport(
+        'SEA', 14747, 1474703, 30559, 'Seattle, WA',
+        'WA', 53, 'Washington', 93, 47.45, -122.31, 140,
+    ),
+    Airport(
+        'MCO', 13204, 1320402, 31454, 'Orlando, FL',
+        'FL', 12, 'Florida', 33, 28.43, -81.31, 130,
+    ),
+    Airport(
+        'DTW', 11433, 1143302, 31295, 'Detroit, MI',
+        'MI', 26, 'Michigan', 43, 42.21, -83.35, 130,
+    ),
+    Airport(
+        'BOS', 10721, 1072102, 30721, 'Boston, MA',
+        'MA', 25, 'Massachusetts', 13, 42.36, -71.01, 130,
+    ),
+    Airport(
+        'CLT', 11057, 1105703, 31057, 'Charlotte, NC',
+        'NC', 37, 'North Carolina', 36, 35.21, -80.94, 120,
+    ),
+    Airport(
+        'EWR', 11618, 1161802, 31703, 'Newark, NJ',
+        'NJ', 34, 'New Jersey', 21, 40.69, -74.17, 110,
+    ),
+    Airport(
+        'LGA', 12953, 1295302, 31703, 'New York, NY',
+        'NY', 36, 'New York', 22, 40.78, -73.87, 110,
+    ),
+    Airport(
+        'JFK', 12478, 1247805, 31703, 'New York, NY',
+        'NY', 36, 'New York', 22, 40.64, -73.78, 100,
+    ),
+    Airport(
+        'SLC', 14869, 1486903, 34614, 'Salt Lake City, UT',
+        'UT', 49, 'Utah', 87, 40.79, -111.98, 100,
+    ),
+    Airport(
+        'BWI', 10821, 1082103, 30852, 'Baltimore, MD',
+        'MD', 24, 'Maryland', 35, 39.18, -76.67, 90,
+    ),
+    Airport(
+        'DCA', 11278, 1127805, 30852, 'Washington, DC',
+        'VA', 51, 'Virginia', 38, 38.85, -77.04, 90,
+    ),
+    Airport(
+        'MDW', 13232, 1323202, 30977, 'Chicago, IL',
+        'IL', 17, 'Illinois', 41, 41.79, -87.75, 80,
+    ),
+    Airport(
+        'SAN', 14679, 1467903, 33570, 'San Diego, CA',
+        'CA', 6, 'California', 91, 32.73, -117.19, 80,
+    ),
+    Airport(
+        'PHL', 14100, 1410005, 34100, 'Philadelphia, PA',
+        'PA', 42, 'Pennsylvania', 23, 39.87, -75.24, 80,
+    ),
+    Airport(
+        'MIA', 13303, 1330303, 32467, 'Miami, FL',
+        'FL', 12, 'Florida', 33, 25.79, -80.29, 70,
+    ),
+    Airport(
+        'TPA', 15304, 1530402, 33195, 'Tampa, FL',
+        'FL', 12, 'Florida', 33, 27.98, -82.53, 70,
+    ),
+    Airport(
+        'PDX', 14057, 1405702, 34057, 'Portland, OR',
+        'OR', 41, 'Oregon', 92, 45.59, -122.60, 60,
+    ),
+    Airport(
+        'HNL', 12173, 1217302, 32134, 'Honolulu, HI',
+        'HI', 15, 'Hawaii', 2, 21.32, -157.92, 50,
+    ),
+]
+
+# Fields in order of values of generated rows
+GENERATED_FIELDS = (
+    'FL_DATE', 'AIRLINE_ID', 'CARRIER', 'TAIL_NUM', 'FL_NUM',
+    'ORIGIN_AIRPORT_ID', 'ORIGIN_AIRPORT_SEQ_ID', 'ORIGIN_CITY_MARKET_ID',
+    'ORIGIN', 'ORIGIN_CITY_NAME', 'ORIGIN_STATE_ABR', 'ORIGIN_STATE_FIPS',
+    'ORIGIN_STATE_NM', 'ORIGIN_WAC',
+    'DEST_AIRPORT_ID', 'DEST_AIRPORT_SEQ_ID', 'DEST_CITY_MARKET_ID',
+    'DEST', 'DEST_CITY_NAME', 'DEST_STATE_ABR', 'DEST_STATE_FIPS',
+    'DEST_STATE_NM', 'DEST_WAC',
+    'DEP_DELAY', 'TAXI_OUT', 'WHEELS_OFF', 'WHEELS_ON', 'TAXI_IN',
+    'ARR_DELAY', 'AIR_TIME', 'DISTANCE',
+)
+
+if GENERATED_FIELDS != FIELD_NAMES:
+    raise ValueError("Generated fields do not match fields of Flight")
+
+
+def get_cum_weights(items):
+    return list(accumulate(x.weight for x in items))
+
+
+def pick(random, items, cum_weights):
+    # Like `Random.choices()`, which may change between Python versions
+    return items[bisect(cum_weights, random() * cum_weights[-1])]
+
+
+def draw_int(random, low, high):
+    """
+    Draw integer from `low` to `high` inclusive.
+
+    """
+    return low + int(random() * (high - low + 1))
+
+
+def draw_exponential(random, mean):
+    return -math.log(1.0 - random()) * mean
+
+
+def get_distance(origin, dest):
+    """
+    Get great-circle distance between airports in whole miles.
+
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, (
+        origin.latitude, origin.longitude, dest.latitude, dest.longitude,
+    ))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2 +
+        math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return float(round(2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))))
+
+
+def to_clock(minutes):
+    """
+    Convert minutes since midnight to time of day written as number hhmm,
+    like times of BTS data.
+
+    """
+    minutes = int(minutes) % 1440
+    return float(minutes // 60 * 100 + minutes % 60)
+
+
+def make_random(seed, chunk=None):
+    """
+    Make generator of random numbers of dataset `seed` or of its chunk.
+
+    """
+    if chunk is None:
+        return random.Random(seed)
+
+    return random.Random((seed << 32) | chunk)
+
+
+def make_tail_number(random):
+    letters = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
+    return 'N{}{}{}'.format(
+        draw_int(random, 100, 999),
+        letters[draw_int(random, 0, len(letters) - 1)],
+        letters[draw_int(random, 0, len(letters) - 1)],
+    )
+
+
+@lru_cache(maxsize=None)
+def get_tail_numbers(seed):
+    """
+    Get tail numbers of aircraft of every carrier for dataset `seed`.
+
+    """
+    random = make_random(seed).random
+    return {
+        carrier.code: [
+            make_tail_number(random)
+            for i in range(TAILS_PER_CARRIER)
+        ]
+        for carrier in CARRIERS
+    }
+
+
+def get_dates(start_date, days):
+    return [
+        (start_date + datetime.timedelta(days=i)).isoformat()
+        for i in range(days)
+    ]
+
+
+def generate_chunk(
+    chunk, rows, seed=DEFAULT_SEED, start_date=DEFAULT_START_DATE,
+    days=DEFAULT_DAYS,
+):
+    """
+    Generate `rows` rows of chunk number `chunk` of dataset `seed`. Rows
+    are tuples of values of `GENERATED_FIELDS`.
+
+    """
+    random = make_random(seed, chunk).random
+    tail_numbers = get_tail_numbers(seed)
+    dates = get_dates(start_date, days)
+    carrier_weights = get_cum_weights(CARRIERS)
+    airport_weights = get_cum_weights(AIRPORTS)
+    distances = {}
+    result = []
+
+    for i in range(rows):
+        carrier = pick(random, CARRIERS, carrier_weights)
+        origin = pick(random, AIRPORTS, airport_weights)
+        dest = origin
+
+        while dest is origin:
+            dest = pick(random, AIRPORTS, airport_weights)
+
+        route = (origin.code, dest.code)
+        distance = distances.get(route)
+
+        if distance is None:
+            distance = distances[route] = get_distance(origin, dest)
+
+        tails = tail_numbers[carrier.code]
+        departure = draw_int(random, 300, 1380)
+        outcome = random()
+
+        dep_delay = taxi_out = wheels_off = wheels_on = None
+        taxi_in = arr_delay = air_time = None
+
+        if outcome >= CANCELLED_RATE:
+            if random() < ON_TIME_RATE:
+                dep_delay = float(-draw_int(random, 0, 15))
+            else:
+                dep_delay = float(
+                    1 + int(draw_exponential(random, MEAN_DELAY))
+                )
+
+            taxi_out = float(8 + int(draw_exponential(random, 9.0)))
+            wheels_off = to_clock(departure + dep_delay + taxi_out)
+
+        if outcome >= CANCELLED_RATE + DIVERTED_RATE:
+            air_time = float(
+                int(distance / 8.0) + 15 + draw_int(random, -10, 10)
+            )
+            taxi_in = float(2 + int(draw_exponential(random, 5.0)))
+            wheels_on = to_clock(
+                departure + dep_delay + taxi_out + air_time
+            )
+            arr_delay = (
+                dep_delay + taxi_out + taxi_in - 23.0 +
+                draw_int(random, -15, 10)
+            )
+
+        result.append((
+            dates[draw_int(random, 0, days - 1)],
+            carrier.airline_id,
+            carrier.code,
+            tails[draw_int(random, 0, len(tails) - 1)],
+            draw_int(random, 1, 7000),
+            origin.airport_id,
+            origin.seq_id,
+            origin.city_market_id,
+            origin.code,
+            origin.city_name,
+            origin.state_abr,
+            origin.state_fips,
+            origin.state_nm,
+            origin.wac,
+            dest.airport_id,
+            dest.seq_id,
+            dest.city_market_id,
+            dest.code,
+            dest.city_name,
+            dest.state_abr,
+            dest.state_fips,
+            dest.state_nm,
+            dest.wac,
+            dep_delay,
+            taxi_out,
+            wheels_off,
+            wheels_on,
+            taxi_in,
+            arr_delay,
+            air_time,
+            distance,
+        ))
+
+    return result
+
+
+def iter_chunk_sizes(rows, chunk_rows=CHUNK_ROWS):
+    for start in range(0, rows, chunk_rows):
+        yield min(chunk_rows, rows - start)
+
+
+def iter_rows(rows, seed=DEFAULT_SEED, **kwargs):
+    for chunk, size in enumerate(iter_chunk_sizes(rows)):
+        yield from generate_chunk(chunk, size, seed, **kwargs)
+
+
+def generate_flights(rows, seed=DEFAULT_SEED, **kwargs):
+    """
+    Generate `rows` flights of dataset `seed` as dicts, like records read
+    from the source file.
+
+    """
+    return [
+        dict(zip(FIELD_NAMES, row))
+        for row in iter_rows(rows, seed, **kwargs)
+    ]
+
+
+def format_chunk(chunk, rows, seed, start_date, days):
+    """
+    Generate chunk and format it as CSV text without header. Nulls are
+    written as empty values.
+
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerows(generate_chunk(chunk, rows, seed, start_date, days))
+    return buffer.getvalue()
+
+
+def write_csv(
+    path, rows, seed=DEFAULT_SEED, start_date=DEFAULT_START_DATE,
+    days=DEFAULT_DAYS, max_workers=None,
+):
+    """
+    Write `rows` flights of dataset `seed` to CSV file `path`, compressed if
+    it has a suffix of compression. Chunks are generated by `max_workers`
+    processes, at most two of them per worker are kept in memory.
+
+    """
+    if max_workers is None:
+        max_workers = psutil.cpu_count(logical=True)
+
+    chunk_sizes = enumerate(iter_chunk_sizes(rows))
+
+    with open_file(str(path), 'w') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(FIELD_NAMES)
+
+        if max_workers == 1:
+            for chunk, size in chunk_sizes:
+                f.write(format_chunk(chunk, size, seed, start_date, days))
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            pending = deque()
+
+            for chunk, size in chunk_sizes:
+                if len(pending) >= max_workers * 2:
+                    f.write(pending.popleft().result())
+
+                pending.append(pool.submit(
+                    format_chunk, chunk, size, seed, start_date, days,
+                ))
+
+            while pending:
+                f.write(pending.popleft().result())
+
+
+def parse_date(value):
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "invalid date '{}', expected YYYY-MM-DD".format(value)
+        )
+
+
+def load_args():
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic flights"
+    )
+    parser.add_argument(
+        '-n', '--rows',
+        dest='rows',
+        type=int,
+        default=CHUNK_ROWS,
+        help="Number of flights. Default: {}".format(CHUNK_ROWS),
+    )
+    parser.add_argument(
+        '-s', '--seed',
+        dest='seed',
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed of the dataset, equal seeds give equal files. "
+             "Default: {}".format(DEFAULT_SEED),
+    )
+    parser.add_argument(
+        '--start-date',
+        dest='start_date',
+        type=parse_date,
+        default=DEFAULT_START_DATE,
+        metavar='YYYY-MM-DD',
+        help="First date of flights. Default: {}".format(DEFAULT_START_DATE),
+    )
+    parser.add_argument(
+        '--days',
+        dest='days',
+        type=int,
+        default=DEFAULT_DAYS,
+        help="Number of days flights are spread over. "
+             "Default: {}".format(DEFAULT_DAYS),
+    )
+    parser.add_argument(
+        '-o', '--output',
+        dest='output',
+        default=str(DATA_ROOT / 'synthetic.csv'),
+        metavar='PATH',
+        help="Write flights to CSV file PATH, compressed if its suffix is "
+             "one of: {}. Default: synthetic.csv next to benchmarks".format(
+                 ', '.join(COMPRESSIONS.values()),
+             ),
+    )
+    parser.add_argument(
+        '-f', '--force',
+        dest='force',
+        action='store_true',
+        help="Overwrite PATH if it exists",
+    )
+    parser.add_argument(
+        '-j', '--workers',
+        dest='workers',
+        type=int,
+        help="Number of generating processes. Default: number of CPUs",
+    )
+    args = parser.parse_args()
+
+    if args.rows < 0:
+        parser.error("number of rows must not be negative")
+
+    if args.seed < 0:
+        parser.error("seed must not be negative")
+
+    if args.days < 1:
+        parser.error("number of days must be positive")
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("number of workers must be positive")
+
+    if Path(args.output).exists() and not args.force:
+        parser.error(
+            "{} exists, use --force to overwrite it".format(args.output)
+        )
+
+    unavailable = [
+        name
+        for name, suffix in COMPRESSIONS.items()
+        if suffix in Path(args.output).suffixes
+        and name not in get_available()
+    ]
+    if unavailable:
+        parser.error(
+            "compression is not available, install its package: {}".format(
+                ', '.join(unavailable),
+            )
+        )
+
+    return args
+
+
+def main():
+    args = load_args()
+    write_csv(
+        args.output, args.rows,
+        seed=args.seed,
+        start_date=args.start_date,
+        days=args.days,
+        max_workers=args.workers,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,524 @@
+# coding: utf-8
+
+# Sidecar indexes of record streams. An index stores where every record (or
+# block of records for avro) starts along with numbers of records having
+# each value of key fields, so single records can be read without decoding
+# the whole file.
+#
+# Offsets of `data.jl` are stored in `data.jl.idx` as an array of unsigned
+# 64-bit integers after a header holding size and time of modification of
+# the data file. Looking a record up seeks into the array instead of loading
+# it, so it takes the same time however many records there are. Numbers of
+# records by values of key fields are stored as JSON in `data.jl.idx.keys`,
+# which is loaded once per process when a key is first looked up. Stale
+# indexes are ignored.
+
+import json
+import os
+import struct
+import sys
+
+from array import array
+from bisect import bisect_right
+from functools import partial
+from io import BytesIO
+
+from utils import read_varint
+
+
+INDEX_FIELDS = ('FL_DATE', 'CARRIER', 'ORIGIN')
+
+INDEX_SUFFIX = '.idx'
+
+KEYS_SUFFIX = '.keys'
+
+MAGIC = b'FIDX'
+
+# Magic, kind of index, size and time of modification of the data file,
+# number of records and number of blocks
+HEADER = struct.Struct('<4sB3xQqQQ')
+
+OFFSET = struct.Struct('<Q')
+
+# Key indexes loaded by this process by their paths, along with stamps of
+# data files they were loaded for
+KEYS_CACHE = {}
+
+
+class KeyIndex:
+    """
+    Numbers of records having each value of key fields. Nulls are not
+    indexed.
+
+    """
+
+    def __init__(self, fields=INDEX_FIELDS, values=None):
+        self.fields = tuple(fields)
+        self.values = values or {name: {} for name in self.fields}
+
+    def add(self, number, item):
+        for name in self.fields:
+            value = item.get(name)
+
+            if value is not None:
+                self.values[name].setdefault(str(value), []).append(number)
+
+    def find(self, name, value):
+        return self.values[name].get(str(value), [])
+
+    def to_dict(self):
+        return {
+            'fields': list(self.fields),
+            'values': self.values,
+        }
+
+    @classmethod
+    def from_dict(cls, value):
+        return cls(value['fields'], value['values'])
+
+
+class OffsetArray:
+    """
+    Read-only sequence of offsets stored in binary file `f` from byte
+    `position`. Every item is read from the file when it is accessed.
+
+    """
+
+    def __init__(self, f, position, length):
+        self.f = f
+        self.position = position
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, number):
+        if not 0 <= number < self.length:
+            raise IndexError("Offset {} is out of range".format(number))
+
+        self.f.seek(self.position + number * OFFSET.size)
+        return OFFSET.unpack(self.f.read(OFFSET.size))[0]
+
+
+def write_offsets(f, offsets):
+    values = array('Q', offsets)
+
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    values.tofile(f)
+
+
+class Index:
+    """
+    Base of indexes. Indexes being built keep offsets in lists, loaded
+    ones read them from the index file until they are closed. Key index
+    is loaded by `load_keys()` when it is first needed.
+
+    """
+    kind = None
+
+    def __init__(self, keys=None, load_keys=None, f=None):
+        self.key_index = keys
+        self.load_keys = load_keys
+        self.f = f
+
+    @property
+    def keys(self):
+        if self.key_index is None:
+            if self.load_keys is None:
+                self.key_index = KeyIndex()
+            else:
+                self.key_index = self.load_keys()
+
+        return self.key_index
+
+    def find(self, name, value):
+        return self.keys.find(name, value)
+
+    def close(self):
+        if self.f is not None:
+            self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RecordIndex(Index):
+    """
+    Index of file storing records one after another. Record N takes bytes
+    from `offsets[N]` to `offsets[N + 1]`.
+
+    """
+    kind = 0
+
+    def __init__(self, offsets=None, **kwargs):
+        super().__init__(**kwargs)
+        self.offsets = offsets or [0]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def add(self, item, size):
+        self.keys.add(len(self), item)
+        self.offsets.append(self.offsets[-1] + size)
+
+    def read(self, f, numbers, decode):
+        """
+        Read records `numbers` from binary file `f` decoding bytes of every
+        one of them by `decode`.
+
+        """
+        offsets = self.offsets
+
+        for number in numbers:
+            start = offsets[number]
+            f.seek(start)
+            yield decode(f.read(offsets[number + 1] - start))
+
+    def get_counts(self):
+        return len(self), 0
+
+    def write_offsets(self, f):
+        write_offsets(f, self.offsets)
+
+    @classmethod
+    def from_file(cls, f, count, blocks, **kwargs):
+        return cls(OffsetArray(f, HEADER.size, count + 1), f=f, **kwargs)
+
+
+class BlockIndex(Index):
+    """
+    Index of file storing records by blocks, like avro container files.
+    Block N starts at byte `offsets[N]` with record `starts[N]`.
+
+    """
+    kind = 1
+
+    def __init__(self, offsets=None, starts=None, count=0, **kwargs):
+        super().__init__(**kwargs)
+        self.offsets = offsets or []
+        self.starts = starts or []
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def add_block(self, offset, items):
+        self.offsets.append(offset)
+        self.starts.append(self.count)
+
+        for item in items:
+            self.keys.add(self.count, item)
+            self.count += 1
+
+    def locate(self, number):
+        """
+        Get number of block containing record `number` and position of the
+        record in the block.
+
+        """
+        if not 0 <= number < self.count:
+            raise IndexError("Record {} is out of range".format(number))
+
+        block = bisect_right(self.starts, number) - 1
+        return block, number - self.starts[block]
+
+    def read(self, f, numbers, read_block):
+        """
+        Read records `numbers` from binary file `f`. `read_block` gets file
+        and offset of a block and returns sequence of its records. Every
+        block is read at most once for consecutive numbers in it.
+
+        """
+        current = None
+        records = None
+
+        for number in numbers:
+            block, position = self.locate(number)
+
+            if block != current:
+                records = read_block(f, self.offsets[block])
+                current = block
+
+            yield records[position]
+
+    def get_counts(self):
+        return self.count, len(self.offsets)
+
+    def write_offsets(self, f):
+        write_offsets(f, self.starts)
+        write_offsets(f, self.offsets)
+
+    @classmethod
+    def from_file(cls, f, count, blocks, **kwargs):
+        return cls(
+            OffsetArray(f, HEADER.size + blocks * OFFSET.size, blocks),
+            OffsetArray(f, HEADER.size, blocks),
+            count, f=f, **kwargs
+        )
+
+
+INDEX_CLASSES = {
+    cls.kind: cls
+    for cls in (RecordIndex, BlockIndex)
+}
+
+
+def get_index_path(path):
+    return str(path) + INDEX_SUFFIX
+
+
+def get_keys_path(path):
+    return get_index_path(path) + KEYS_SUFFIX
+
+
+def get_file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def replace_file(path, write, mode='wb'):
+    """
+    Write file `path` by `write(f)` to a temporary file moved in place of
+    it, so readers running in parallel never see it partially written.
+
+    """
+    temp_path = "{}.{}".format(path, os.getpid())
+
+    with open(temp_path, mode) as f:
+        write(f)
+
+    os.replace(temp_path, path)
+
+
+def write_index(path, index):
+    """
+    Write `index` of data file `path` to its sidecar files. Must be called
+    after the data file is closed, so its stamp is final.
+
+    """
+    stamp = get_file_stamp(path)
+    count, blocks = index.get_counts()
+    keys = {
+        'stamp': stamp,
+        'keys': index.keys.to_dict(),
+    }
+
+    def write_offsets(f):
+        f.write(HEADER.pack(MAGIC, index.kind, *stamp, count, blocks))
+        index.write_offsets(f)
+
+    # Offsets are checked first, so keys are written before them
+    replace_file(
+        get_keys_path(path),
+        partial(json.dump, keys, separators=(',', ':')),
+        mode='w',
+    )
+    replace_file(get_index_path(path), write_offsets)
+
+
+def load_keys(path):
+    """
+    Load key index of data file `path`, or get the one loaded before if
+    the file has not changed since.
+
+    """
+    keys_path = get_keys_path(path)
+    stamp = get_file_stamp(path)
+    cached = KEYS_CACHE.get(keys_path)
+
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(keys_path) as f:
+        value = json.load(f)
+
+    if value['stamp'] != stamp:
+        raise ValueError("Key index of {} is stale".format(path))
+
+    keys = KeyIndex.from_dict(value['keys'])
+    KEYS_CACHE[keys_path] = (stamp, keys)
+    return keys
+
+
+def load_index(path):
+    """
+    Open index of data file `path`. Return `None` if there is no index or
+    it was built for another version of the file. The index reads offsets
+    from its file, so it has to be closed.
+
+    """
+    try:
+        f = open(get_index_path(path), 'rb')
+    except FileNotFoundError:
+        return None
+
+    header = f.read(HEADER.size)
+
+    if len(header) == HEADER.size:
+        magic, kind, size, mtime, count, blocks = HEADER.unpack(header)
+    else:
+        magic = None
+
+    if (
+        magic != MAGIC or [size, mtime] != get_file_stamp(path) or
+        not os.path.exists(get_keys_path(path))
+    ):
+        f.close()
+        return None
+
+    return INDEX_CLASSES[kind].from_file(
+        f, count, blocks, load_keys=partial(load_keys, path),
+    )
+
+
+def remove_index(path):
+    KEYS_CACHE.pop(get_keys_path(path), None)
+
+    for index_path in (get_index_path(path), get_keys_path(path)):
+        try:
+            os.remove(index_path)
+        except FileNotFoundError:
+            pass
+
+
+def get_index(path, build):
+    """
+    Open index of data file `path` or build it with `build(path)` and write
+    it if there is no valid one.
+
+    """
+    index = load_index(path)
+
+    if index is None:
+        index = build(path)
+        write_index(path, index)
+
+    return index
+
+
+def build_lines_index(path, decode):
+    """
+    Build index of file storing one record per line, e.g. JSON lines.
+
+    """
+    index = RecordIndex()
+
+    with open(path, 'rb') as f:
+        for line in f:
+            index.add(decode(line), len(line))
+
+    return index
+
+
+def build_msgpack_index(path):
+    import msgpack
+
+    index = RecordIndex()
+
+    with open(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        offset = 0
+
+        for item in unpacker:
+            position = unpacker.tell()
+            index.add(item, position - offset)
+            offset = position
+
+    return index
+
+
+def build_avro_index(path):
+    from fastavro import block_reader
+
+    index = BlockIndex()
+
+    with open(path, 'rb') as f:
+        for block in block_reader(f):
+            index.add_block(block.offset, block)
+
+    return index
+
+
+def read_avro_long(f):
+    value = read_varint(f)
+
+    if value is None:
+        raise EOFError("Unexpected end of file inside of avro block")
+
+    # Avro longs are zigzag encoded
+    return (value >> 1) ^ -(value & 1)
+
+
+class LazyBlock:
+    """
+    Records of a block decoded one after another only as far as they are
+    accessed, e.g. a single record is looked up at the start of a block.
+
+    """
+
+    def __init__(self, data, count, decode):
+        self.data = data
+        self.count = count
+        self.decode = decode
+        self.records = []
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.count:
+            raise IndexError("Record {} is out of block".format(position))
+
+        records = self.records
+
+        while len(records) <= position:
+            records.append(self.decode(self.data))
+
+        return records[position]
+
+
+def make_avro_block_reader(f, reader_schema=None):
+    """
+    Make function reading avro block of file `f` starting at given offset,
+    for `BlockIndex.read()`.
+
+    """
+    import zlib
+
+    from fastavro import parse_schema, reader, schemaless_reader
+
+    header = reader(f, reader_schema=reader_schema)
+    codec = header.codec
+
+    if codec not in ('null', 'deflate'):
+        raise ValueError("Unsupported avro codec '{}'".format(codec))
+
+    # Schemas are parsed once instead of for every record, and resolution
+    # is skipped if the file is written with the schema it is read by
+    writer_schema = parse_schema(header.writer_schema)
+
+    if reader_schema is not None:
+        reader_schema = parse_schema(reader_schema)
+
+        if reader_schema == writer_schema:
+            reader_schema = None
+
+    def decode(data):
+        return schemaless_reader(data, writer_schema, reader_schema)
+
+    def read_block(f, offset):
+        f.seek(offset)
+        count = read_avro_long(f)
+        data = f.read(read_avro_long(f))
+
+        if codec == 'deflate':
+            data = zlib.decompress(data, -15)
+
+        return LazyBlock(BytesIO(data), count, decode)
+
+    return read_block
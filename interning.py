@@ -0,0 +1,90 @@
+# coding: utf-8
+
+# Deduplication of values of low-cardinality string fields of decoded
+# flights. Decoders create a new str for every occurrence of a value, so
+# e.g. every record holds its own copy of its carrier code.
+
+import sys
+
+from utils import load_mapped
+
+
+# Fields with a few hundred distinct values at most
+INTERNED_FIELDS = (
+    'FL_DATE', 'CARRIER',
+    'ORIGIN', 'ORIGIN_CITY_NAME', 'ORIGIN_STATE_ABR', 'ORIGIN_STATE_NM',
+    'DEST', 'DEST_CITY_NAME', 'DEST_STATE_ABR', 'DEST_STATE_NM',
+)
+
+
+class Interner:
+    """
+    Tables of distinct values of `fields`, one per field. Values of these
+    fields in records passed to `intern()` are replaced by equal values from
+    the tables, so all records share a single object per distinct value.
+
+    Tables are never cleared, an interner should be shared only by records
+    of the same dataset.
+
+    """
+
+    def __init__(self, fields=INTERNED_FIELDS):
+        self.tables = [(name, {}) for name in fields]
+
+    def __len__(self):
+        return sum(len(table) for _, table in self.tables)
+
+    def intern(self, item):
+        """
+        Replace values of `item` in place and return it.
+
+        """
+        for name, table in self.tables:
+            value = item.get(name)
+
+            if value is not None:
+                item[name] = table.setdefault(value, value)
+
+        return item
+
+    def intern_all(self, items):
+        intern = self.intern
+
+        for item in items:
+            yield intern(item)
+
+
+def get_strings_size(items, fields=INTERNED_FIELDS):
+    """
+    Get number of bytes taken by distinct string objects of `fields` of
+    `items`. Objects shared by several records are counted once.
+
+    """
+    seen = set()
+    size = 0
+
+    for item in items:
+        for name in fields:
+            value = item.get(name)
+
+            if type(value) is str and id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+
+    return size
+
+
+def get_memory_saved(iter_load, *args, **kwargs):
+    """
+    Get number of bytes of strings which interning saves for records
+    loaded by `iter_load`.
+
+    """
+    plain = list(iter_load(*args, **kwargs))
+    plain_size = get_strings_size(plain)
+    del plain
+
+    # Records are interned while they are decoded, so duplicates are freed
+    # right away
+    interned = load_mapped(Interner().intern, iter_load, *args, **kwargs)
+    return plain_size - get_strings_size(interned)
@@ -0,0 +1,237 @@
+# coding: utf-8
+
+# Parallel parsing of formats storing one record per line. A file is split
+# into byte ranges at line boundaries and every range is parsed by a
+# separate worker process.
+#
+# Records must not contain line breaks, e.g. quoted multiline CSV values
+# are not supported.
+#
+# Parsing processes are started once per process using them and reused by
+# later calls. Benchmarks run in as many workers as there are CPUs already,
+# so the default number of parsing processes is small.
+
+import io
+import os
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.util import Finalize
+
+
+# Default number of parsing processes
+MAX_WORKERS = 2
+
+# Number of ranges per worker. More ranges than workers even out differences
+# in parsing speed of ranges and let streaming start sooner.
+RANGES_PER_WORKER = 4
+
+# Number of ranges per worker submitted ahead of the consumer, parsed
+# records of at most that many ranges are kept in memory
+PENDING_PER_WORKER = 2
+
+# Pool of parsing processes, the number of them and ID of the process which
+# started it. Forked processes do not inherit working pools.
+POOL = None
+POOL_WORKERS = 0
+POOL_PID = None
+
+
+def read_header(path):
+    """
+    Get the first line of file `path` along with its length in bytes.
+
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+
+    return header, len(header)
+
+
+def split_ranges(path, count, start=0):
+    """
+    Split file `path` from offset `start` into at most `count` byte ranges
+    ending at line boundaries. Return list of `(start, end)` tuples.
+
+    """
+    size = os.path.getsize(path)
+    step = max((size - start) // count, 1)
+    ranges = []
+
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + step, size))
+
+            # Move the end to the beginning of the next line, unless the
+            # range is ended right after a line break already.
+            f.seek(f.tell() - 1)
+            f.readline()
+            end = f.tell()
+
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def read_range(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def parse_range(parse, path, start, end, header=b''):
+    """
+    Parse byte range of file `path` with function `parse` getting the text
+    of the range preceded by `header`.
+
+    """
+    return parse((header + read_range(path, start, end)).decode('utf-8'))
+
+
+def get_pool(max_workers):
+    """
+    Get pool of `max_workers` parsing processes of the current process,
+    starting it on first use or if the number of processes differs.
+
+    """
+    global POOL, POOL_WORKERS, POOL_PID
+
+    if POOL_PID == os.getpid() and POOL_WORKERS == max_workers:
+        return POOL
+
+    stop_pool()
+
+    POOL = ProcessPoolExecutor(max_workers=max_workers)
+    POOL_WORKERS = max_workers
+    POOL_PID = os.getpid()
+
+    # Worker processes, e.g. of benchmarks, join their children on exit and
+    # do not run atexit handlers, so the pool is stopped by a finalizer.
+    # It has to run before feeders of queues of the pool are stopped by
+    # their finalizers, which have priority 10.
+    Finalize(POOL, stop_pool, exitpriority=100)
+    return POOL
+
+
+def stop_pool():
+    global POOL, POOL_WORKERS, POOL_PID
+
+    if POOL is not None and POOL_PID == os.getpid():
+        POOL.shutdown()
+
+    POOL = None
+    POOL_WORKERS = 0
+    POOL_PID = None
+
+
+def iter_ranges(path, chunks, header=False):
+    if header:
+        header, start = read_header(path)
+    else:
+        header, start = b'', 0
+
+    for range_start, range_end in split_ranges(path, chunks, start):
+        yield range_start, range_end, header
+
+
+def iter_parallel(
+    parse, path, header=False, ordered=True, max_workers=MAX_WORKERS,
+    chunks=None,
+):
+    """
+    Parse file `path` in parallel and iterate over parsed records.
+
+    `parse` is a picklable function getting text of a range and returning
+    list of records. If `header` is true, the first line of the file is
+    prepended to every range, e.g. for CSV.
+
+    Records are yielded in order of the file if `ordered` is true. Otherwise
+    records of every range are yielded as soon as it is parsed. Ranges are
+    submitted as the consumer takes records of earlier ones, so a slow
+    consumer does not let parsed records pile up.
+
+    """
+    if chunks is None:
+        chunks = max_workers * RANGES_PER_WORKER
+
+    pool = get_pool(max_workers)
+    max_pending = max_workers * PENDING_PER_WORKER
+    ranges = iter_ranges(path, chunks, header=header)
+
+    def submit():
+        for args in ranges:
+            return pool.submit(parse_range, parse, path, *args)
+
+        return None
+
+    if ordered:
+        pending = deque()
+
+        while True:
+            while len(pending) < max_pending:
+                future = submit()
+
+                if future is None:
+                    break
+
+                pending.append(future)
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+    pending = set()
+
+    while True:
+        while len(pending) < max_pending:
+            future = submit()
+
+            if future is None:
+                break
+
+            pending.add(future)
+
+        if not pending:
+            return
+
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            yield from future.result()
+
+
+def load_parallel(parse, path, **kwargs):
+    return list(iter_parallel(parse, path, **kwargs))
+
+
+def parse_csv(text, quoting=None):
+    import csv
+
+    if quoting is None:
+        quoting = csv.QUOTE_MINIMAL
+
+    reader = csv.DictReader(io.StringIO(text), quoting=quoting)
+    return [
+        {
+            key: value if value != '' else None
+            for key, value in item.items()
+        }
+        for item in reader
+    ]
+
+
+def parse_csv_quote_nonnumeric(text):
+    import csv
+    return parse_csv(text, quoting=csv.QUOTE_NONNUMERIC)
+
+
+def parse_json_lines(text):
+    import json
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def parse_ujson_lines(text):
+    import ujson
+    return [ujson.loads(line) for line in text.splitlines()]
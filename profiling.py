@@ -0,0 +1,133 @@
+# coding: utf-8
+
+# Profiles of benchmarked functions. Every measured run is profiled by
+# cProfile in the process it runs in and dumps its own part file, parts are
+# merged into a single pstats file per benchmark once all runs are done:
+#
+#     python -m pstats profiles/csv.load_csv_and_validate.pstats
+#
+# cProfile sees only the thread it is enabled in, so work done by executor
+# threads of async loaders and by processes of parallel ones is missing.
+
+import cProfile
+import glob
+import itertools
+import os
+import pstats
+
+from pathlib import Path
+
+
+DEFAULT_PROFILE_DIR = 'profiles'
+
+# Number of functions printed as hotspots of a benchmark
+HOTSPOTS = 10
+
+PART_SUFFIX = '.part'
+
+# Numbers of part files written by current process
+PART_NUMBERS = itertools.count()
+
+
+def get_profile_path(directory, codec, benchmark):
+    return Path(directory) / '{}.{}.pstats'.format(codec.name, benchmark.name)
+
+
+def get_part_path(path):
+    return '{}.{}.{}{}'.format(
+        path, os.getpid(), next(PART_NUMBERS), PART_SUFFIX,
+    )
+
+
+def start_profile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def dump_profile(profiler, path):
+    """
+    Dump stats of stopped `profiler` to a new part of profile `path`.
+
+    """
+    profiler.dump_stats(get_part_path(path))
+
+
+def get_part_paths(path):
+    return sorted(glob.glob(
+        '{}.*{}'.format(glob.escape(str(path)), PART_SUFFIX)
+    ))
+
+
+def remove_parts(path):
+    for part_path in get_part_paths(path):
+        os.remove(part_path)
+
+
+def merge_profile(path):
+    """
+    Merge all parts of profile `path` into it and remove them. Return
+    merged `pstats.Stats` or `None` if there are no parts.
+
+    """
+    part_paths = get_part_paths(path)
+
+    if not part_paths:
+        return None
+
+    stats = pstats.Stats(*part_paths)
+    stats.dump_stats(str(path))
+
+    for part_path in part_paths:
+        os.remove(part_path)
+
+    return stats
+
+
+def format_function(function):
+    file_name, line, name = function
+
+    # Built-in functions have no file
+    if file_name == '~':
+        return name
+
+    path = Path(file_name)
+    return '{}:{}({})'.format(
+        Path(path.parent.name, path.name), line, name,
+    )
+
+
+def get_hotspots(stats, limit=HOTSPOTS):
+    """
+    Get `limit` functions taking the most time by themselves, without
+    functions they call, as `(function, calls, own time, cumulative time)`.
+
+    """
+    rows = [
+        (function, calls, own_time, cumulative_time)
+        for function, (_, calls, own_time, cumulative_time, _)
+        in stats.stats.items()
+    ]
+    rows.sort(key=lambda x: x[2], reverse=True)
+    return rows[:limit]
+
+
+def format_hotspots(stats, limit=HOTSPOTS):
+    total = stats.total_tt
+    lines = []
+
+    for function, calls, own_time, cumulative_time in get_hotspots(
+        stats, limit,
+    ):
+        lines.append(
+            "    {:5.1f}% {:9.3f} ms own {:9.3f} ms cumulative {:>9} calls "
+            "{}".format(
+                own_time / total * 100 if total else 0.0,
+                own_time * 1000,
+                cumulative_time * 1000,
+                calls,
+                format_function(function),
+            )
+        )
+
+    return '\n'.join(lines)
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+# Compact record type generated from schematics model, an alternative to
+# dicts for decoded flights. Records are tuples with named accessors, they
+# have no per-instance dict and no hash table of keys.
+
+import sys
+
+from collections import namedtuple
+from operator import itemgetter
+
+from schemas import Flight
+
+
+def make_record_class(model, name=None):
+    """
+    Make tuple subclass with fields of schematics `model` in their order.
+
+    """
+    if name is None:
+        name = '{}Record'.format(model.__name__)
+
+    fields = tuple(model.fields.keys())
+    base = namedtuple(name, fields)
+
+    class Record(base):
+        __slots__ = ()
+
+        @classmethod
+        def from_dict(cls, item):
+            """
+            Make record from dict, missing fields are `None`.
+
+            """
+            return cls._make(map(item.get, fields))
+
+        @classmethod
+        def make_row_reader(cls, header):
+            """
+            Make function converting CSV rows with columns named by `header`
+            to records. Empty strings are nulls.
+
+            """
+            make = cls._make
+
+            if tuple(header) == fields:
+                def read(row):
+                    return make([x if x != '' else None for x in row])
+            else:
+                get_values = itemgetter(*[header.index(x) for x in fields])
+
+                def read(row):
+                    return make([
+                        x if x != '' else None
+                        for x in get_values(row)
+                    ])
+
+            return read
+
+        def to_dict(self):
+            return dict(zip(fields, self))
+
+    Record.__name__ = Record.__qualname__ = name
+    return Record
+
+
+FlightRecord = make_record_class(Flight)
+
+
+def get_containers_size(items):
+    """
+    Get number of bytes taken by containers of `items` themselves, without
+    their values.
+
+    """
+    return sum(sys.getsizeof(x) for x in items)
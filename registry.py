@@ -0,0 +1,259 @@
+# coding: utf-8
+
+import inspect
+
+from collections import namedtuple
+from collections import OrderedDict
+from functools import partial
+
+from compression import COMPRESSIONS
+from dates import to_typed
+from interning import Interner
+from records import FlightRecord
+from utils import consume, load_mapped
+
+
+# `interned` is set for benchmarks loading records through an `Interner`,
+# `whole_file` is unset for ones processing only a part of records or of
+# their fields, so their throughput is not comparable to other ones
+Benchmark = namedtuple(
+    'Benchmark', ['name', 'fn', 'needs_data', 'interned', 'whole_file'],
+    defaults=(False, True),
+)
+
+
+def reads_part(fn):
+    """
+    Mark codec function `fn` as reading only a part of its file, e.g. a
+    single record or a few fields of every one.
+
+    """
+    fn.whole_file = False
+    return fn
+
+
+def is_whole_file(fn):
+    return getattr(fn, 'whole_file', True)
+
+
+class Codec:
+    """
+    Set of functions implementing a single serialization format.
+
+    Every format has an encoder (`save`) and possibly alternative encoders
+    writing the same file (`extra_saves`). It may have a decoder (`load`),
+    a streaming decoder returning an iterator (`iter_load`), a decoder
+    followed by validation (`load_and_validate`) and any number of extra
+    decoders (e.g. decoding into native objects instead of dicts). Formats
+    whose decoders return anything but dicts keyed by text, e.g. native
+    objects or raw bytes, have a decoder returning or iterating over such
+    dicts (`load_dicts`) for conversion to other formats. Formats which
+    need a schema may have a function parsing it from scratch
+    (`load_schema`) to measure the cost of parsing separately.
+
+    Files of a codec are named by `extension`, which is the suffix of the
+    default file name of `save` unless it marks a variant of a format
+    rather than the format itself, e.g. `data.csv.pandas` is plain CSV.
+
+    Codecs opening their files with `compression.open_file()` are marked as
+    `compressible`, their compressed variants are made by `compressed()`.
+    Codecs whose `save` writes records one by one as it iterates over them,
+    so it accepts any iterable, are marked as `streaming`.
+
+    """
+
+    def __init__(
+        self, name, save, extra_saves=(), load=None, iter_load=None,
+        load_and_validate=None, extra_loads=(), load_schema=None,
+        load_dicts=None, compressible=False, streaming=False, extension=None,
+    ):
+        self.name = name
+        self.load_schema = load_schema
+        self.save = save
+        self.extra_saves = tuple(extra_saves)
+        self.load = load
+        self.iter_load = iter_load
+        self.load_and_validate = load_and_validate
+        self.extra_loads = tuple(extra_loads)
+        self.load_dicts = load_dicts
+        self.compressible = compressible
+        self.streaming = streaming
+        self.file_name = get_default(save, 'file_name')
+
+        if extension is None and self.file_name is not None:
+            extension = get_extension(self.file_name)
+
+        self.extension = extension
+
+        # Codec this one is a compressed variant of
+        self.base = None
+
+    def __repr__(self):
+        return "<Codec '{}'>".format(self.name)
+
+    def prepare(self, data):
+        """
+        Write the file which is used by decoding benchmarks.
+
+        """
+        self.save(data, test=False)
+
+    def compressed(self, compression):
+        """
+        Make codec storing files of this one compressed with `compression`.
+        Only the main encoder and decoders are included, extra ones may
+        depend on plain files, e.g. to map them to memory.
+
+        """
+        if not self.compressible:
+            raise ValueError(
+                "Codec '{}' does not support compression".format(self.name)
+            )
+
+        file_name = self.file_name + COMPRESSIONS[compression]
+
+        def wrap(fn):
+            if fn is None:
+                return None
+
+            return WithFileName(fn, file_name, compression)
+
+        codec = Codec(
+            '{}_{}'.format(self.name, compression),
+            wrap(self.save),
+            load=wrap(self.load),
+            iter_load=wrap(self.iter_load),
+            load_and_validate=wrap(self.load_and_validate),
+            load_dicts=wrap(self.load_dicts),
+            streaming=self.streaming,
+            extension=self.extension,
+        )
+        codec.base = self
+        return codec
+
+    def benchmarks(self, intern=False, records=False, typed=False):
+        if self.load_schema is not None:
+            yield Benchmark(
+                self.load_schema.__name__, self.load_schema, False,
+                whole_file=False,
+            )
+
+        yield Benchmark(self.save.__name__, self.save, True)
+
+        for fn in self.extra_saves:
+            yield Benchmark(fn.__name__, fn, True)
+
+        if self.load is not None:
+            yield Benchmark(self.load.__name__, self.load, False)
+
+        if self.iter_load is not None:
+            yield Benchmark(
+                self.iter_load.__name__, partial(consume, self.iter_load),
+                False,
+            )
+
+            # Records converted while they are decoded. Benchmarks are
+            # pickled for every run, so every run gets empty tables of its
+            # own interner.
+            mapped = [
+                (intern, 'interned', Interner().intern, True),
+                (records, 'records', FlightRecord.from_dict, False),
+                (typed, 'typed', to_typed, False),
+            ]
+
+            for enabled, suffix, transform, interned in mapped:
+                if enabled:
+                    yield Benchmark(
+                        '{}_{}'.format(self.iter_load.__name__, suffix),
+                        partial(load_mapped, transform, self.iter_load),
+                        False, interned,
+                    )
+
+        loads = [self.load_and_validate]
+        loads.extend(self.extra_loads)
+
+        for fn in loads:
+            if fn is not None:
+                yield Benchmark(
+                    fn.__name__, fn, False, whole_file=is_whole_file(fn),
+                )
+
+
+CODECS = OrderedDict()
+
+
+def get_default(fn, name):
+    parameter = inspect.signature(fn).parameters.get(name)
+
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return None
+
+    return parameter.default
+
+
+def get_extension(file_name):
+    # Default file names are all 'data.<extension>'
+    return '.' + file_name.partition('.')[2]
+
+
+class WithFileName:
+    """
+    Codec function `fn` with default of its `file_name` argument replaced,
+    it may still be passed either by position or by keyword. Name of the
+    result is suffixed to tell its benchmarks apart.
+
+    """
+
+    def __init__(self, fn, file_name, suffix):
+        self.fn = fn
+        self.file_name = file_name
+        self.__name__ = '{}_{}'.format(fn.__name__, suffix)
+        self.whole_file = is_whole_file(fn)
+
+        # Position of the argument, it is bound only if fewer arguments
+        # are passed by position
+        self.position = list(
+            inspect.signature(fn).parameters
+        ).index('file_name')
+
+    def __call__(self, *args, **kwargs):
+        if len(args) <= self.position:
+            kwargs.setdefault('file_name', self.file_name)
+
+        return self.fn(*args, **kwargs)
+
+    def __repr__(self):
+        return "<{} file_name={!r}>".format(self.__name__, self.file_name)
+
+    @property
+    def __signature__(self):
+        signature = inspect.signature(self.fn)
+        parameters = [
+            x.replace(default=self.file_name) if x.name == 'file_name' else x
+            for x in signature.parameters.values()
+        ]
+        return signature.replace(parameters=parameters)
+
+
+def register(name, save, **kwargs):
+    if name in CODECS:
+        raise ValueError("Codec '{}' is already registered".format(name))
+
+    codec = Codec(name, save, **kwargs)
+    CODECS[name] = codec
+    return codec
+
+
+def get_codecs(names=None):
+    if not names:
+        return list(CODECS.values())
+
+    unknown = [name for name in names if name not in CODECS]
+    if unknown:
+        raise ValueError(
+            "Unknown codecs: {}. Available: {}".format(
+                ', '.join(unknown), ', '.join(CODECS),
+            )
+        )
+
+    return [CODECS[name] for name in names]
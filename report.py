@@ -0,0 +1,137 @@
+# coding: utf-8
+
+import csv
+import json
+import platform
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+
+from utils import format_rss, format_time
+
+
+MEGABYTE = 10 ** 6
+
+
+def make_result(
+    codec, benchmark, summary, records, file_size=None, raw_size=None,
+    memory_saved=None,
+):
+    """
+    Flatten benchmark summary into a record suitable for JSON and CSV.
+
+    Throughput is based on median time: `records` processed and
+    `file_size` bytes written or read per second. For compressed files
+    `raw_size` is size of the same file without compression.
+    `memory_saved` is number of bytes saved by interning of strings.
+    Throughput is `None` for benchmarks not processing the whole file.
+
+    """
+    result = OrderedDict([
+        ('codec', codec.name),
+        ('benchmark', benchmark.name),
+    ])
+    result.update(summary._asdict())
+    result.update([
+        ('records', records),
+        ('file_size', file_size),
+        ('compression_ratio', None),
+        ('memory_saved', memory_saved),
+        ('records_per_second', None),
+        ('mb_per_second', None),
+    ])
+
+    if raw_size is not None and file_size:
+        result['compression_ratio'] = raw_size / file_size
+
+    if benchmark.whole_file and summary.time_median > 0:
+        result['records_per_second'] = records / summary.time_median
+
+        if file_size is not None:
+            result['mb_per_second'] = (
+                file_size / MEGABYTE / summary.time_median
+            )
+
+    return result
+
+
+def format_result(result):
+    values = [
+        result['benchmark'],
+        "{} ± {}".format(
+            format_time(result['time_median']),
+            format_time(result['time_stddev']),
+        ),
+        "(min {}, p95 {}, {} outliers)".format(
+            format_time(result['time_min']),
+            format_time(result['time_p95']),
+            result['outliers'],
+        ),
+    ]
+
+    if result['records_per_second'] is not None:
+        values.append("{:.0f} rec/s".format(result['records_per_second']))
+
+    if result['mb_per_second'] is not None:
+        values.append("{:.3f} MB/s".format(result['mb_per_second']))
+
+    if result['compression_ratio'] is not None:
+        values.append("ratio {:.2f}".format(result['compression_ratio']))
+
+    if result['memory_saved'] is not None:
+        values.append("saved {}".format(format_rss(result['memory_saved'])))
+
+    values.extend([
+        format_rss(result['rss']),
+        "peak {}".format(format_rss(result['peak_rss'])),
+    ])
+
+    if result['traced_peak'] is not None:
+        values.append(
+            "traced peak {}".format(format_rss(result['traced_peak']))
+        )
+
+    values.append(
+        "{:.0f} retained blocks".format(result['retained_blocks'])
+    )
+    return ' '.join(values)
+
+
+def get_meta(**kwargs):
+    meta = OrderedDict([
+        ('time', time.strftime('%Y-%m-%dT%H:%M:%S%z')),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('machine', platform.machine()),
+    ])
+    meta.update(sorted(kwargs.items()))
+    return meta
+
+
+def write_results(path, results, meta=None):
+    """
+    Write benchmark results to `path`. Format is chosen by its extension:
+    JSON (with run metadata) or CSV (one row per benchmark).
+
+    """
+    path = Path(path)
+
+    if path.suffix == '.json':
+        with path.open('w') as f:
+            json.dump(
+                OrderedDict([('meta', meta), ('results', results)]),
+                f, indent=2,
+            )
+    elif path.suffix == '.csv':
+        with path.open('w', newline='') as f:
+            fieldnames = list(results[0].keys()) if results else []
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        raise ValueError(
+            "Unsupported results format '{}', use .json or .csv"
+            .format(path.suffix)
+        )
@@ -6,14 +6,66 @@ import os
 
 from pathlib import Path
 
+import aio
+
+from capnp_reader import iter_views
+from compression import COMPRESSIONS, get_available, open_file
+from converters import get_capnp_converter, get_protobuf_converter
+from fields import check_columns, get_protobuf_mapping
+from generate import DEFAULT_SEED, generate_flights
+from index import (
+    RecordIndex, build_avro_index, build_lines_index, build_msgpack_index,
+    get_index, make_avro_block_reader, remove_index, write_index,
+)
+from interning import get_memory_saved
+from parallel import (
+    iter_parallel, parse_csv, parse_csv_quote_nonnumeric, parse_json_lines,
+    parse_ujson_lines,
+)
+from profiling import (
+    DEFAULT_PROFILE_DIR, format_hotspots, get_profile_path, merge_profile,
+    remove_parts,
+)
+from records import FlightRecord, get_containers_size
+from registry import CODECS, get_codecs, reads_part, register
+from report import format_result, get_meta, make_result, write_results
+from schema_cache import (
+    get_avro_schema, get_capnp_schemas, get_fastavro_projection,
+    get_fastavro_schema,
+    load_avro_schema, load_capnp_schemas, load_fastavro_schema,
+)
+from scaling import DEFAULT_ROWS, run_scaling
 from schemas import Flight
 from utils import (
-    measure, validate, format_time, format_rss, to_camel, from_camel,
+    format_rss, measure, start_pool, stop_pool, validate, validate_batch,
+    iter_json_array, encode_varint, iter_length_delimited,
 )
 
 
 DATA_ROOT = Path(__file__).absolute().parent
 
+# Size of write buffer used by streaming savers
+FLUSH_SIZE = 2 ** 16
+
+# Fields read by projected loading benchmarks, like most of our queries do
+PROJECTED_FIELDS = ('CARRIER', 'DEP_DELAY', 'ARR_DELAY')
+
+
+def parse_counts(value):
+    try:
+        counts = sorted(set(int(x) for x in value.split(',')))
+    except ValueError:
+        counts = None
+
+    if not counts or counts[0] < 1:
+        raise argparse.ArgumentTypeError(
+            "expected comma separated positive numbers, got '{}'".format(
+                value,
+            )
+        )
+
+    return counts
+
 
 def load_args():
     parser = argparse.ArgumentParser(
@@ -26,22 +78,258 @@ def load_args():
         default=10,
         help="Number of cycles for benchmarks. Default: 10",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '-w', '--warmup',
+        dest='warmup',
+        type=int,
+        default=1,
+        help="Number of discarded warmup cycles run before measured ones. "
+             "Default: 1",
+    )
+    parser.add_argument(
+        '-o', '--output',
+        dest='output',
+        metavar='PATH',
+        help="Write results to PATH, format is chosen by extension: "
+             ".json or .csv",
+    )
+    parser.add_argument(
+        '--codec',
+        dest='codecs',
+        action='append',
+        choices=list(CODECS),
+        metavar='NAME',
+        help="Run benchmarks only for given codec. Can be repeated. "
+             "Default: all registered codecs",
+    )
+    parser.add_argument(
+        '-n', '--rows',
+        dest='rows',
+        type=int,
+        help="Benchmark ROWS synthetic flights instead of source.csv, see "
+             "generate.py",
+    )
+    parser.add_argument(
+        '-s', '--seed',
+        dest='seed',
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed of synthetic flights. Default: {}".format(DEFAULT_SEED),
+    )
+    parser.add_argument(
+        '--compression',
+        dest='compressions',
+        action='append',
+        choices=list(COMPRESSIONS),
+        metavar='NAME',
+        help="Also run compressible codecs with files compressed by NAME, "
+             "one of: {}. Can be repeated".format(', '.join(COMPRESSIONS)),
+    )
+    parser.add_argument(
+        '--intern',
+        dest='intern',
+        action='store_true',
+        help="Also load records of streaming codecs with low-cardinality "
+             "strings interned and report memory it saves",
+    )
+    parser.add_argument(
+        '--records',
+        dest='records',
+        action='store_true',
+        help="Also load records of streaming codecs as FlightRecord tuples "
+             "instead of dicts and compare their sizes",
+    )
+    parser.add_argument(
+        '--typed',
+        dest='typed',
+        action='store_true',
+        help="Also load records of streaming codecs with dates parsed "
+             "to datetime.date",
+    )
+    parser.add_argument(
+        '--scale',
+        dest='scale',
+        action='store_true',
+        help="Measure scaling curves of save and load of every codec with "
+             "synthetic flights instead of running all its benchmarks",
+    )
+    parser.add_argument(
+        '--scale-rows',
+        dest='scale_rows',
+        type=parse_counts,
+        default=list(DEFAULT_ROWS),
+        metavar='N,N,...',
+        help="Numbers of records swept by --scale. Default: {}".format(
+            ','.join(map(str, DEFAULT_ROWS)),
+        ),
+    )
+    parser.add_argument(
+        '--scale-workers',
+        dest='scale_workers',
+        type=parse_counts,
+        metavar='N,N,...',
+        help="Numbers of concurrent processes swept by --scale for the "
+             "biggest number of records. Default: powers of two up to "
+             "number of CPUs",
+    )
+    parser.add_argument(
+        '--memory',
+        dest='memory',
+        action='store_true',
+        help="Measure memory accurately: run every cycle in a fresh "
+             "process, one at a time",
+    )
+    parser.add_argument(
+        '--tracemalloc',
+        dest='tracemalloc',
+        action='store_true',
+        help="Trace peak size of Python allocations. Slows benchmarks "
+             "down, so their time is not comparable with plain runs",
+    )
+    parser.add_argument(
+        '--profile',
+        dest='profile',
+        nargs='?',
+        const=DEFAULT_PROFILE_DIR,
+        metavar='DIR',
+        help="Profile measured runs by cProfile, write merged stats of "
+             "every benchmark to DIR and print its hotspots. Slows "
+             "benchmarks down, so their time is not comparable with plain "
+             "runs. Default DIR: {}".format(DEFAULT_PROFILE_DIR),
+    )
+    parser.add_argument(
+        '--list-codecs',
+        dest='list_codecs',
+        action='store_true',
+        help="List names of registered codecs and exit",
+    )
+    args = parser.parse_args()
+
+    if args.output and Path(args.output).suffix not in ('.json', '.csv'):
+        parser.error("results can be written only to .json or .csv file")
+
+    if args.cycles < 1:
+        parser.error("number of cycles must be positive")
+
+    if args.warmup < 0:
+        parser.error("number of warmup cycles must not be negative")
+
+    if args.rows is not None and args.rows < 1:
+        parser.error("number of rows must be positive")
+
+    if args.scale and args.rows is not None:
+        parser.error("--scale sweeps --scale-rows, --rows is not used")
+
+    if args.scale and (args.memory or args.tracemalloc):
+        parser.error("--scale measures with reused workers only")
+
+    if args.scale and args.profile:
+        parser.error("--scale does not profile benchmarks")
+
+    unavailable = [
+        name
+        for name in args.compressions or ()
+        if name not in get_available()
+    ]
+    if unavailable:
+        parser.error(
+            "compression is not available, install its package: {}".format(
+                ', '.join(unavailable),
+            )
+        )
+
+    return args
+
+
+def select_middle(index):
+    return [len(index) // 2]
+
+
+def select_first_date(index):
+    # Date of the first record, so there is always something to find
+    dates = index.keys.values['FL_DATE']
+    return dates[next(iter(dates))] if dates else []
+
+
+def load_indexed(path, build, decode, select):
+    """
+    Read records chosen by `select(index)` from file `path` using its
+    sidecar index. Bytes of every record are decoded by `decode`.
 
+    """
+    with get_index(path, build) as index, open(path, 'rb') as f:
+        return list(index.read(f, select(index), decode))
 
-def load_csv(file_name='data.csv'):
+
+def iter_csv_columns(f, columns, **kwargs):
+    """
+    Iterate over dicts of fields `columns` of CSV file `f`. Other fields are
+    not put into dicts at all.
+
+    """
+    import csv
+
+    reader = csv.reader(f, **kwargs)
+    header = next(reader)
+    columns = check_columns(columns)
+    positions = [header.index(name) for name in columns]
+    columns = list(zip(columns, positions))
+
+    for row in reader:
+        yield {
+            name: row[i] if row[i] != '' else None
+            for name, i in columns
+        }
+
+
+def iter_csv(file_name='data.csv', columns=None):
     import csv
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
+    with open_file(path) as f:
+        if columns is not None:
+            yield from iter_csv_columns(f, columns)
+            return
+
         reader = csv.DictReader(f)
-        return [
-            {
+        for item in reader:
+            yield {
                 key: value if value != '' else None
                 for key, value in item.items()
             }
-            for item in reader
-        ]
+
+
+def load_csv(file_name='data.csv', columns=None):
+    return list(iter_csv(file_name, columns=columns))
+
+
+def iter_csv_records(file_name='data.csv', **kwargs):
+    import csv
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path) as f:
+        reader = csv.reader(f, **kwargs)
+        yield from map(FlightRecord.make_row_reader(next(reader)), reader)
+
+
+def load_csv_records(file_name='data.csv'):
+    return list(iter_csv_records(file_name))
+
+
+@reads_part
+def load_csv_projected(file_name='data.csv'):
+    return load_csv(file_name, columns=PROJECTED_FIELDS)
+
+
+def iter_csv_parallel(file_name='data.csv', ordered=True):
+    path = str(DATA_ROOT / file_name)
+    return iter_parallel(
+        parse_csv, path, header=True, ordered=ordered,
+    )
+
+
+def load_csv_parallel(file_name='data.csv'):
+    return list(iter_csv_parallel(file_name))
 
 
 def load_csv_and_validate(file_name='data.csv'):
@@ -61,7 +349,7 @@ def save_csv(data, file_name='data.csv', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(data)
@@ -70,19 +358,51 @@ def save_csv(data, file_name='data.csv', test=True):
             os.remove(path)
 
 
-def load_csv_quote_nonnumeric(file_name='data.csv.quoted'):
+def iter_csv_quote_nonnumeric(file_name='data.csv.quoted', columns=None):
     import csv
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
+    with open_file(path) as f:
+        if columns is not None:
+            yield from iter_csv_columns(
+                f, columns, quoting=csv.QUOTE_NONNUMERIC,
+            )
+            return
+
         reader = csv.DictReader(f, quoting=csv.QUOTE_NONNUMERIC)
-        return [
-            {
+        for item in reader:
+            yield {
                 key: value if value != '' else None
                 for key, value in item.items()
             }
-            for item in reader
-        ]
+
+
+def load_csv_quote_nonnumeric(file_name='data.csv.quoted', columns=None):
+    return list(iter_csv_quote_nonnumeric(file_name, columns=columns))
+
+
+def load_csv_quote_nonnumeric_records(file_name='data.csv.quoted'):
+    import csv
+
+    return list(iter_csv_records(file_name, quoting=csv.QUOTE_NONNUMERIC))
+
+
+@reads_part
+def load_csv_quote_nonnumeric_projected(file_name='data.csv.quoted'):
+    return load_csv_quote_nonnumeric(file_name, columns=PROJECTED_FIELDS)
+
+
+def iter_csv_quote_nonnumeric_parallel(
+    file_name='data.csv.quoted', ordered=True,
+):
+    path = str(DATA_ROOT / file_name)
+    return iter_parallel(
+        parse_csv_quote_nonnumeric, path, header=True, ordered=ordered,
+    )
+
+
+def load_csv_quote_nonnumeric_parallel(file_name='data.csv.quoted'):
+    return list(iter_csv_quote_nonnumeric_parallel(file_name))
 
 
 def load_csv_quote_nonnumeric_and_validate(file_name='data.csv.quoted'):
@@ -102,7 +422,7 @@ def save_csv_quote_nonnumeric(data, file_name='data.csv.quoted', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             writer = csv.DictWriter(
                 f, fieldnames=fieldnames, quoting=csv.QUOTE_NONNUMERIC,
             )
@@ -113,21 +433,75 @@ def save_csv_quote_nonnumeric(data, file_name='data.csv.quoted', test=True):
             os.remove(path)
 
 
-def load_csv_pandas(file_name='data.csv.pandas'):
+def load_csv_pandas(file_name='data.csv.pandas', columns=None):
     import pandas as pd
 
+    if columns is not None:
+        columns = check_columns(columns)
+
     path = str(DATA_ROOT / file_name)
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, usecols=columns)
     df = df.where((pd.notnull(df)), None)
     return df.to_dict('records')
 
 
+def iter_csv_pandas(
+    file_name='data.csv.pandas', chunk_size=10000, columns=None,
+):
+    import pandas as pd
+
+    if columns is not None:
+        columns = check_columns(columns)
+
+    path = str(DATA_ROOT / file_name)
+    for df in pd.read_csv(path, chunksize=chunk_size, usecols=columns):
+        df = df.where((pd.notnull(df)), None)
+        yield from df.to_dict('records')
+
+
+@reads_part
+def load_csv_pandas_projected(file_name='data.csv.pandas'):
+    return load_csv_pandas(file_name, columns=PROJECTED_FIELDS)
+
+
+def load_csv_pandas_batch(file_name='data.csv.pandas'):
+    import pandas as pd
+
+    from columnar import FlightBatch
+
+    path = str(DATA_ROOT / file_name)
+    return FlightBatch.from_dataframe(pd.read_csv(path))
+
+
+def iter_csv_pandas_batches(file_name='data.csv.pandas', chunk_size=10000):
+    import pandas as pd
+
+    from columnar import FlightBatch
+
+    path = str(DATA_ROOT / file_name)
+    for df in pd.read_csv(path, chunksize=chunk_size):
+        yield FlightBatch.from_dataframe(df)
+
+
+def load_csv_pandas_batches(file_name='data.csv.pandas'):
+    from columnar import FlightBatch
+
+    # Reads by chunks, for comparison with load_csv_pandas_batch()
+    return FlightBatch.concatenate(list(iter_csv_pandas_batches(file_name)))
+
+
 def load_csv_pandas_and_validate(file_name='data.csv.pandas'):
     data = load_csv_pandas(file_name)
     validate(data)
     return data
 
 
+def load_csv_pandas_batch_and_validate(file_name='data.csv.pandas'):
+    batch = load_csv_pandas_batch(file_name)
+    validate_batch(batch)
+    return batch
+
+
 def save_csv_pandas(data, file_name='data.csv.pandas', test=True):
     import csv
     import pandas as pd
@@ -145,14 +519,44 @@ def save_csv_pandas(data, file_name='data.csv.pandas', test=True):
             os.remove(path)
 
 
+def save_csv_pandas_batch(data, file_name='data.csv.pandas', test=True):
+    import csv
+
+    from columnar import FlightBatch
+
+    if test:
+        file_name = "{}.{}".format(file_name, os.getpid())
+
+    path = str(DATA_ROOT / file_name)
+
+    # Records are converted as a part of the benchmark, like they are by
+    # save_csv_pandas()
+    if isinstance(data, FlightBatch):
+        df = data.to_dataframe()
+    else:
+        df = FlightBatch.from_records(data).to_dataframe()
+
+    try:
+        df.to_csv(path, index=False, quoting=csv.QUOTE_NONNUMERIC)
+    finally:
+        if test:
+            os.remove(path)
+
+
 def load_json(file_name='data.json'):
     import json
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
+    with open_file(path) as f:
         return list(json.load(f))
 
 
+def iter_json(file_name='data.json'):
+    path = str(DATA_ROOT / file_name)
+    with open_file(path) as f:
+        yield from iter_json_array(f)
+
+
 def load_json_and_validate(file_name='data.json'):
     data = load_json(file_name)
     validate(data)
@@ -168,7 +572,7 @@ def save_json(data, file_name='data.json', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             json.dump(data, f, separators=(',', ':'))
     finally:
         if test:
@@ -179,7 +583,7 @@ def load_ujson(file_name='data.json.u'):
     import ujson
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
+    with open_file(path) as f:
         return list(ujson.load(f))
 
 
@@ -198,22 +602,40 @@ def save_ujson(data, file_name='data.json.u', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             ujson.dump(data, f)
     finally:
         if test:
             os.remove(path)
 
 
-def load_json_lines(file_name='data.jl'):
+def iter_json_lines(file_name='data.jl'):
     import json
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
-        return [
-            json.loads(line)
-            for line in f
-        ]
+    with open_file(path) as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def load_json_lines(file_name='data.jl'):
+    return list(iter_json_lines(file_name))
+
+
+def load_json_lines_async(file_name='data.jl'):
+    path = str(DATA_ROOT / file_name)
+    return aio.load(path, CODECS['json_lines'])
+
+
+def iter_json_lines_parallel(file_name='data.jl', ordered=True):
+    path = str(DATA_ROOT / file_name)
+    return iter_parallel(
+        parse_json_lines, path, ordered=ordered,
+    )
+
+
+def load_json_lines_parallel(file_name='data.jl'):
+    return list(iter_json_lines_parallel(file_name))
 
 
 def load_json_lines_and_validate(file_name='data.jl'):
@@ -222,32 +644,88 @@ def load_json_lines_and_validate(file_name='data.jl'):
     return data
 
 
-def save_json_lines(data, file_name='data.jl', test=True):
+def save_json_lines(data, file_name='data.jl', test=True, index=False):
     import json
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
 
     path = str(DATA_ROOT / file_name)
+    record_index = RecordIndex() if index else None
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             for item in data:
-                f.write(json.dumps(item, separators=(',', ':')) + '\n')
+                line = json.dumps(item, separators=(',', ':')) + '\n'
+                f.write(line)
+
+                if record_index is not None:
+                    record_index.add(item, len(line.encode('utf-8')))
+
+        if record_index is not None:
+            write_index(path, record_index)
     finally:
         if test:
             os.remove(path)
+            remove_index(path)
 
 
-def load_ujson_lines(file_name='data.jl.u'):
+def save_json_lines_with_index(data, file_name='data.jl', test=True):
+    save_json_lines(data, file_name, test=test, index=True)
+
+
+def build_json_lines_index(path):
+    import json
+    return build_lines_index(path, json.loads)
+
+
+@reads_part
+def load_json_lines_record(file_name='data.jl'):
+    import json
+
+    path = str(DATA_ROOT / file_name)
+    return load_indexed(
+        path, build_json_lines_index, json.loads, select_middle,
+    )
+
+
+@reads_part
+def load_json_lines_by_date(file_name='data.jl'):
+    import json
+
+    path = str(DATA_ROOT / file_name)
+    return load_indexed(
+        path, build_json_lines_index, json.loads, select_first_date,
+    )
+
+
+def iter_ujson_lines(file_name='data.jl.u'):
     import ujson
 
     path = str(DATA_ROOT / file_name)
-    with open(path) as f:
-        return [
-            ujson.loads(line)
-            for line in f
-        ]
+    with open_file(path) as f:
+        for line in f:
+            yield ujson.loads(line)
+
+
+def load_ujson_lines(file_name='data.jl.u'):
+    return list(iter_ujson_lines(file_name))
+
+
+def load_ujson_lines_async(file_name='data.jl.u'):
+    path = str(DATA_ROOT / file_name)
+    return aio.load(path, CODECS['ujson_lines'])
+
+
+def iter_ujson_lines_parallel(file_name='data.jl.u', ordered=True):
+    path = str(DATA_ROOT / file_name)
+    return iter_parallel(
+        parse_ujson_lines, path, ordered=ordered,
+    )
+
+
+def load_ujson_lines_parallel(file_name='data.jl.u'):
+    return list(iter_ujson_lines_parallel(file_name))
 
 
 def load_ujson_lines_and_validate(file_name='data.jl.u'):
@@ -256,21 +734,59 @@ def load_ujson_lines_and_validate(file_name='data.jl.u'):
     return data
 
 
-def save_ujson_lines(data, file_name='data.jl.u', test=True):
+def save_ujson_lines(data, file_name='data.jl.u', test=True, index=False):
     import ujson
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
 
     path = str(DATA_ROOT / file_name)
+    record_index = RecordIndex() if index else None
 
     try:
-        with open(path, 'w') as f:
+        with open_file(path, 'w') as f:
             for item in data:
-                f.write(ujson.dumps(item) + '\n')
+                line = ujson.dumps(item) + '\n'
+                f.write(line)
+
+                if record_index is not None:
+                    record_index.add(item, len(line.encode('utf-8')))
+
+        if record_index is not None:
+            write_index(path, record_index)
     finally:
         if test:
             os.remove(path)
+            remove_index(path)
+
+
+def save_ujson_lines_with_index(data, file_name='data.jl.u', test=True):
+    save_ujson_lines(data, file_name, test=test, index=True)
+
+
+def build_ujson_lines_index(path):
+    import ujson
+    return build_lines_index(path, ujson.loads)
+
+
+@reads_part
+def load_ujson_lines_record(file_name='data.jl.u'):
+    import ujson
+
+    path = str(DATA_ROOT / file_name)
+    return load_indexed(
+        path, build_ujson_lines_index, ujson.loads, select_middle,
+    )
+
+
+@reads_part
+def load_ujson_lines_by_date(file_name='data.jl.u'):
+    import ujson
+
+    path = str(DATA_ROOT / file_name)
+    return load_indexed(
+        path, build_ujson_lines_index, ujson.loads, select_first_date,
+    )
 
 
 def save_msgpack(data, file_name='data.msgpack', test=True):
@@ -282,7 +798,7 @@ def save_msgpack(data, file_name='data.msgpack', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'wb') as f:
+        with open_file(path, 'wb') as f:
             f.write(msgpack.packb(data))
     finally:
         if test:
@@ -293,10 +809,20 @@ def load_msgpack(file_name='data.msgpack'):
     import msgpack
 
     path = str(DATA_ROOT / file_name)
-    with open(path, 'rb') as f:
+    with open_file(path, 'rb') as f:
         return msgpack.unpackb(f.read())
 
 
+def iter_msgpack(file_name='data.msgpack'):
+    import msgpack
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f)
+        for i in range(unpacker.read_array_header()):
+            yield unpacker.unpack()
+
+
 def save_msgpack_utf(data, file_name='data.msgpack.utf', test=True):
     import msgpack
 
@@ -306,7 +832,7 @@ def save_msgpack_utf(data, file_name='data.msgpack.utf', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'wb') as f:
+        with open_file(path, 'wb') as f:
             f.write(msgpack.packb(data, use_bin_type=True))
     finally:
         if test:
@@ -317,40 +843,104 @@ def load_msgpack_utf(file_name='data.msgpack.utf'):
     import msgpack
 
     path = str(DATA_ROOT / file_name)
-    with open(path, 'rb') as f:
+    with open_file(path, 'rb') as f:
         return msgpack.unpackb(f.read(), encoding='utf-8')
 
 
+def iter_msgpack_utf(file_name='data.msgpack.utf'):
+    import msgpack
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f, encoding='utf-8')
+        for i in range(unpacker.read_array_header()):
+            yield unpacker.unpack()
+
+
 def load_msgpack_utf_and_validate(file_name='data.msgpack.utf'):
     data = load_msgpack_utf(file_name)
     validate(data)
     return data
 
 
-def save_msgpack_utf_stream(data, file_name='data.msgpack.utf.stream', test=True):
+def save_msgpack_utf_stream(
+    data, file_name='data.msgpack.utf.stream', test=True,
+    flush_size=FLUSH_SIZE, index=False,
+):
     import msgpack
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
 
     path = str(DATA_ROOT / file_name)
+    packer = msgpack.Packer(use_bin_type=True)
+    record_index = RecordIndex() if index else None
 
     try:
-        with open(path, 'wb') as f:
+        with open_file(path, 'wb', buffering=flush_size) as f:
             for item in data:
-                f.write(msgpack.packb(item, use_bin_type=True))
+                packed = packer.pack(item)
+                f.write(packed)
+
+                if record_index is not None:
+                    record_index.add(item, len(packed))
+
+        if record_index is not None:
+            write_index(path, record_index)
     finally:
         if test:
             os.remove(path)
+            remove_index(path)
 
 
-def load_msgpack_utf_stream(file_name='data.msgpack.utf.stream'):
+def save_msgpack_utf_stream_with_index(
+    data, file_name='data.msgpack.utf.stream', test=True,
+):
+    save_msgpack_utf_stream(data, file_name, test=test, index=True)
+
+
+def unpack_msgpack_utf(packed):
     import msgpack
+    return msgpack.unpackb(packed, encoding='utf-8')
 
+
+@reads_part
+def load_msgpack_utf_stream_record(file_name='data.msgpack.utf.stream'):
     path = str(DATA_ROOT / file_name)
-    with open(path, 'rb') as f:
-        unpacker = msgpack.Unpacker(f, encoding='utf-8')
-        return list(unpacker)
+    return load_indexed(
+        path, build_msgpack_index, unpack_msgpack_utf, select_middle,
+    )
+
+
+@reads_part
+def load_msgpack_utf_stream_by_date(file_name='data.msgpack.utf.stream'):
+    path = str(DATA_ROOT / file_name)
+    return load_indexed(
+        path, build_msgpack_index, unpack_msgpack_utf, select_first_date,
+    )
+
+
+def iter_msgpack_utf_stream(file_name='data.msgpack.utf.stream'):
+    import msgpack
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path, 'rb') as f:
+        yield from msgpack.Unpacker(f, encoding='utf-8')
+
+
+def load_msgpack_utf_stream(file_name='data.msgpack.utf.stream'):
+    return list(iter_msgpack_utf_stream(file_name))
+
+
+def load_msgpack_utf_stream_async(file_name='data.msgpack.utf.stream'):
+    path = str(DATA_ROOT / file_name)
+    return aio.load(path, CODECS['msgpack_utf_stream'])
+
+
+def load_msgpack_utf_stream_batch(file_name='data.msgpack.utf.stream'):
+    from columnar import FlightBatch
+
+    return FlightBatch.from_records(iter_msgpack_utf_stream(file_name))
 
 
 def load_msgpack_utf_stream_and_validate(file_name='data.msgpack.utf.stream'):
@@ -368,7 +958,7 @@ def save_umsgpack(data, file_name='data.msgpack.u', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'wb') as f:
+        with open_file(path, 'wb') as f:
             f.write(umsgpack.packb(data))
     finally:
         if test:
@@ -379,7 +969,7 @@ def load_umsgpack(file_name='data.msgpack.u'):
     import umsgpack
 
     path = str(DATA_ROOT / file_name)
-    with open(path, 'rb') as f:
+    with open_file(path, 'rb') as f:
         return umsgpack.unpackb(f.read())
 
 
@@ -389,36 +979,34 @@ def load_umsgpack_and_validate(file_name='data.msgpack.u'):
     return data
 
 
-def load_avro(file_name='data.avro'):
+def iter_avro(file_name='data.avro'):
     from avro.datafile import DataFileReader
     from avro.io import DatumReader
 
     path = str(DATA_ROOT / file_name)
-    reader = DataFileReader(open(path, "rb"), DatumReader())
+    reader = DataFileReader(open_file(path, "rb"), DatumReader())
 
     try:
-        return list(reader)
+        yield from reader
     finally:
         reader.close()
 
 
-def save_avro(data, file_name='data.avro', test=True):
-    import json
+def load_avro(file_name='data.avro'):
+    return list(iter_avro(file_name))
 
-    import avro.schema
 
+def save_avro(data, file_name='data.avro', test=True):
     from avro.datafile import DataFileWriter
     from avro.io import DatumWriter
 
-    schema_path = str(DATA_ROOT / 'schemas.avsc')
-    with open(schema_path) as f:
-        schema = avro.schema.SchemaFromJSONData(json.load(f))
+    schema = get_avro_schema()
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
 
     path = str(DATA_ROOT / file_name)
-    writer = DataFileWriter(open(path, "wb"), DatumWriter(), schema)
+    writer = DataFileWriter(open_file(path, "wb"), DatumWriter(), schema)
 
     try:
         for datum in data:
@@ -430,14 +1018,10 @@ def save_avro(data, file_name='data.avro', test=True):
             os.remove(path)
 
 
-def save_avro_fast(data, file_name='data.avro.fast', test=True):
-    import json
-
+def save_avro_fast(data, file_name='data.avro.fast', test=True, index=False):
     from fastavro import writer
 
-    schema_path = str(DATA_ROOT / 'schemas.avsc')
-    with open(schema_path) as f:
-        schema = json.load(f)
+    schema = get_fastavro_schema()
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
@@ -445,32 +1029,105 @@ def save_avro_fast(data, file_name='data.avro.fast', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'wb') as out:
+        with open_file(path, 'wb') as out:
             writer(out, schema, data)
+
+        # fastavro does not report where blocks are written, so they are
+        # found by scanning the file
+        if index:
+            write_index(path, build_avro_index(path))
     finally:
         if test:
             os.remove(path)
+            remove_index(path)
 
 
-def load_avro_fast(file_name='data.avro.fast'):
-    import json
+def save_avro_fast_with_index(data, file_name='data.avro.fast', test=True):
+    save_avro_fast(data, file_name, test=test, index=True)
+
+
+def load_avro_fast_indexed(path, select):
+    schema = get_fastavro_schema()
+
+    with get_index(path, build_avro_index) as index, open(path, 'rb') as f:
+        read_block = make_avro_block_reader(f, reader_schema=schema)
+        return list(index.read(f, select(index), read_block))
+
+
+@reads_part
+def load_avro_fast_record(file_name='data.avro.fast'):
+    path = str(DATA_ROOT / file_name)
+    return load_avro_fast_indexed(path, select_middle)
+
 
+@reads_part
+def load_avro_fast_by_date(file_name='data.avro.fast'):
+    path = str(DATA_ROOT / file_name)
+    return load_avro_fast_indexed(path, select_first_date)
+
+
+def iter_avro_fast(file_name='data.avro.fast', columns=None):
     import fastavro as avro
 
-    schema_path = str(DATA_ROOT / 'schemas.avsc')
-    with open(schema_path) as f:
-        schema = json.load(f)
+    if columns is None:
+        schema = get_fastavro_schema()
+    else:
+        schema = get_fastavro_projection(check_columns(columns))
 
     path = str(DATA_ROOT / file_name)
 
-    with open(path, 'rb') as f:
-        reader = avro.reader(f, reader_schema=schema)
-        return list(reader)
+    with open_file(path, 'rb') as f:
+        yield from avro.reader(f, reader_schema=schema)
+
+
+def load_avro_fast(file_name='data.avro.fast', columns=None):
+    return list(iter_avro_fast(file_name, columns=columns))
+
+
+@reads_part
+def load_avro_fast_projected(file_name='data.avro.fast'):
+    return load_avro_fast(file_name, columns=PROJECTED_FIELDS)
+
+
+def load_avro_fast_batch(file_name='data.avro.fast'):
+    from columnar import FlightBatch
+
+    return FlightBatch.from_records(iter_avro_fast(file_name))
 
 
 def save_protobuf(data, file_name='data.proto', test=True):
     import schemas_pb2
 
+    flight_book = schemas_pb2.FlightBook()
+    get_protobuf_converter().to_messages(data, flight_book.flights)
+
+    if test:
+        file_name = "{}.{}".format(file_name, os.getpid())
+
+    path = str(DATA_ROOT / file_name)
+
+    try:
+        with open_file(path, 'wb') as f:
+            f.write(flight_book.SerializeToString())
+    finally:
+        if test:
+            os.remove(path)
+
+
+def load_protobuf(file_name='data.proto'):
+    import schemas_pb2
+
+    flight_book = schemas_pb2.FlightBook()
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path, 'rb') as f:
+        flight_book.ParseFromString(f.read())
+        return list(flight_book.flights)
+
+
+def save_protobuf_setattr(data, file_name='data.proto', test=True):
+    import schemas_pb2
+
     flight_book = schemas_pb2.FlightBook()
 
     for item in data:
@@ -486,61 +1143,102 @@ def save_protobuf(data, file_name='data.proto', test=True):
     path = str(DATA_ROOT / file_name)
 
     try:
-        with open(path, 'wb') as f:
+        with open_file(path, 'wb') as f:
             f.write(flight_book.SerializeToString())
     finally:
         if test:
             os.remove(path)
 
 
-def load_protobuf(file_name='data.proto'):
-    import schemas_pb2
+def load_protobuf_to_dicts(file_name='data.proto', columns=None):
+    items = load_protobuf(file_name)
+    converter = get_protobuf_converter()
 
-    flight_book = schemas_pb2.FlightBook()
+    if columns is None:
+        return converter.from_messages(items)
+
+    read = converter.make_reader(check_columns(columns))
+    return [read(x) for x in items]
+
+
+def load_protobuf_records(file_name='data.proto'):
+    get_values = get_protobuf_converter().get_values
+    make = FlightRecord._make
+
+    return [
+        make(get_values(x))
+        for x in load_protobuf(file_name)
+    ]
 
-    path = str(DATA_ROOT / file_name)
-    with open(path, 'rb') as f:
-        flight_book.ParseFromString(f.read())
-        return list(flight_book.flights)
 
+@reads_part
+def load_protobuf_to_dicts_projected(file_name='data.proto'):
+    return load_protobuf_to_dicts(file_name, columns=PROJECTED_FIELDS)
 
-def load_protobuf_to_dicts(file_name='data.proto'):
-    from schemas import Flight
 
-    field_names = list(Flight.fields.keys())
+def load_protobuf_to_dicts_getattr(file_name='data.proto'):
+    get_fields = get_protobuf_mapping().get_fields
     items = load_protobuf(file_name)
 
     return [
-        {
-            file_name: getattr(x, file_name)
-            for file_name in field_names
-        }
+        get_fields(x)
         for x in items
     ]
 
 
-def save_capnp(data, file_name='data.capnp', test=True):
-    import capnp
-    capnp.remove_import_hook()
+def save_protobuf_stream(
+    data, file_name='data.proto.stream', test=True, flush_size=FLUSH_SIZE,
+):
+    import schemas_pb2
+
+    if test:
+        file_name = "{}.{}".format(file_name, os.getpid())
+
+    path = str(DATA_ROOT / file_name)
+    fill_message = get_protobuf_converter().fill_message
+    flight = schemas_pb2.Flight()
+
+    try:
+        with open_file(path, 'wb', buffering=flush_size) as f:
+            for item in data:
+                flight.Clear()
+                fill_message(flight, item)
 
-    schemas_path = str(DATA_ROOT / 'schemas.capnp')
-    schemas = capnp.load(schemas_path)
+                message = flight.SerializeToString()
+                f.write(encode_varint(len(message)))
+                f.write(message)
+    finally:
+        if test:
+            os.remove(path)
+
+
+def iter_protobuf_stream(file_name='data.proto.stream'):
+    import schemas_pb2
+
+    from_message = get_protobuf_converter().from_message
+    flight = schemas_pb2.Flight()
+
+    path = str(DATA_ROOT / file_name)
+    with open_file(path, 'rb') as f:
+        for message in iter_length_delimited(f):
+            flight.ParseFromString(message)
+            yield from_message(flight)
+
+
+def load_protobuf_stream(file_name='data.proto.stream'):
+    return list(iter_protobuf_stream(file_name))
+
+
+def save_capnp(data, file_name='data.capnp', test=True):
+    schemas = get_capnp_schemas()
 
     flight_book = schemas.FlightBook.new_message()
     flights = flight_book.init('flights', len(data))
 
-    for i, item in enumerate(data):
-        flight = flights[i]
-        for key, value in item.items():
-            key = to_camel(key)
+    fill_message = get_capnp_converter().fill_message
 
-            if value is None:
-                try:
-                    setattr(flight, key, -1)
-                except capnp.lib.capnp.KjException:
-                    setattr(flight, key, "")
-            else:
-                setattr(flight, key, value)
+    for i, item in enumerate(data):
+        fill_message(flights[i], item)
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
@@ -556,29 +1254,16 @@ def save_capnp(data, file_name='data.capnp', test=True):
 
 
 def save_capnp_packed(data, file_name='data.capnp.packed', test=True):
-    import capnp
-    capnp.remove_import_hook()
-
-    schemas_path = str(DATA_ROOT / 'schemas.capnp')
-    schemas = capnp.load(schemas_path)
+    schemas = get_capnp_schemas()
 
     count = len(data)
 
     flight_book = schemas.FlightBook.new_message()
     flights = flight_book.init('flights', len(data))
+    fill_message = get_capnp_converter().fill_message
 
     for i, item in zip(range(count), data):
-        flight = flights[i]
-        for key, value in item.items():
-            key = to_camel(key)
-
-            if value is None:
-                try:
-                    setattr(flight, key, -1)
-                except capnp.lib.capnp.KjException:
-                    setattr(flight, key, "")
-            else:
-                setattr(flight, key, value)
+        fill_message(flights[i], item)
 
     if test:
         file_name = "{}.{}".format(file_name, os.getpid())
@@ -594,11 +1279,7 @@ def save_capnp_packed(data, file_name='data.capnp.packed', test=True):
 
 
 def load_capnp(file_name='data.capnp'):
-    import capnp
-    capnp.remove_import_hook()
-
-    schemas_path = str(DATA_ROOT / 'schemas.capnp')
-    schemas = capnp.load(schemas_path)
+    schemas = get_capnp_schemas()
 
     path = str(DATA_ROOT / file_name)
     with open(path, 'rb') as f:
@@ -608,211 +1289,520 @@ def load_capnp(file_name='data.capnp'):
         return list(flight_book.flights)
 
 
-def load_capnp_to_dicts(file_name='data.capnp'):
-    import capnp
-    capnp.remove_import_hook()
+def load_capnp_to_dicts(file_name='data.capnp', columns=None):
+    schemas = get_capnp_schemas()
+    converter = get_capnp_converter()
 
-    schemas_path = str(DATA_ROOT / 'schemas.capnp')
-    schemas = capnp.load(schemas_path)
+    if columns is None:
+        from_message = converter.from_message
+    else:
+        from_message = converter.make_reader(check_columns(columns))
 
     path = str(DATA_ROOT / file_name)
     with open(path, 'rb') as f:
         flight_book = schemas.FlightBook.read(
             f, traversal_limit_in_words=2 ** 61,
         )
-        flights = flight_book.to_dict()['flights']
 
-    for flight in flights:
-        for key in flight.keys():
-            value = flight.pop(key)
+        return [
+            from_message(flight)
+            for flight in flight_book.flights
+        ]
 
-            if (value == -1) or (value == ""):
-                value = None
 
-            key = from_camel(key)
-            flight[key] = value
+def load_capnp_records(file_name='data.capnp'):
+    schemas = get_capnp_schemas()
+    get_values = get_capnp_converter().get_values
+    make = FlightRecord._make
+
+    path = str(DATA_ROOT / file_name)
+    with open(path, 'rb') as f:
+        flight_book = schemas.FlightBook.read(
+            f, traversal_limit_in_words=2 ** 61,
+        )
 
-    return flights
+        return [
+            make(get_values(flight))
+            for flight in flight_book.flights
+        ]
 
 
-def main():
-    args = load_args()
-    data = load_csv_pandas('source.csv')
+@reads_part
+def load_capnp_to_dicts_projected(file_name='data.capnp'):
+    return load_capnp_to_dicts(file_name, columns=PROJECTED_FIELDS)
+
+
+def load_capnp_batch(file_name='data.capnp'):
+    from columnar import FlightBatch
+
+    schemas = get_capnp_schemas()
+    converter = get_capnp_converter()
+    get_values = converter.mapping.get_values
+    get_nulls = converter.get_nulls
+
+    path = str(DATA_ROOT / file_name)
+    with open(path, 'rb') as f:
+        flight_book = schemas.FlightBook.read(
+            f, traversal_limit_in_words=2 ** 61,
+        )
+        nulls = []
+        rows = []
+
+        # Values of all fields of a flight are read by a single call, nulls
+        # are applied to whole columns by their bits
+        for flight in flight_book.flights:
+            nulls.append(get_nulls(flight))
+            rows.append(get_values(flight))
+
+    return FlightBatch.from_null_bits(
+        converter.mapping.names, zip(*rows), nulls,
+    )
+
+
+# Fields read by most analytics jobs
+DELAY_FIELDS = ('DEP_DELAY', 'ARR_DELAY')
 
-    # CSV pandas
-    save_csv_pandas(data, test=False)
 
-    time, rss = measure(args.cycles, save_csv_pandas, data)
-    print('save_csv_pandas', format_time(time), format_rss(rss))
+def load_capnp_mmap(file_name='data.capnp'):
+    path = str(DATA_ROOT / file_name)
+    return [view.to_dict() for view in iter_views(path)]
 
-    time, rss = measure(args.cycles, load_csv_pandas)
-    print('load_csv_pandas', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_csv_pandas_and_validate)
-    print('load_csv_pandas_and_validate', format_time(time), format_rss(rss))
+@reads_part
+def load_capnp_delays(file_name='data.capnp'):
+    path = str(DATA_ROOT / file_name)
+    return [
+        tuple(view[name] for name in DELAY_FIELDS)
+        for view in iter_views(path)
+    ]
 
-    # CSV default
-    save_csv(data, test=False)
 
-    time, rss = measure(args.cycles, save_csv, data)
-    print('save_csv', format_time(time), format_rss(rss))
+@reads_part
+def load_capnp_delays_from_dicts(file_name='data.capnp'):
+    # Decodes all fields to use only two of them, for comparison with
+    # load_capnp_delays()
+    return [
+        tuple(item[name] for name in DELAY_FIELDS)
+        for item in load_capnp_to_dicts(file_name)
+    ]
 
-    time, rss = measure(args.cycles, load_csv)
-    print('load_csv', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_csv_and_validate)
-    print('load_csv_and_validate', format_time(time), format_rss(rss))
+def load_capnp_packed_mmap(file_name='data.capnp.packed'):
+    path = str(DATA_ROOT / file_name)
+    return [view.to_dict() for view in iter_views(path, packed=True)]
 
-    # CSV quote_nonnumeric
-    save_csv_quote_nonnumeric(data, test=False)
 
-    time, rss = measure(args.cycles, save_csv_quote_nonnumeric, data)
-    print('save_csv_quote_nonnumeric', format_time(time), format_rss(rss))
+@reads_part
+def load_capnp_packed_delays(file_name='data.capnp.packed'):
+    path = str(DATA_ROOT / file_name)
+    return [
+        tuple(view[name] for name in DELAY_FIELDS)
+        for view in iter_views(path, packed=True)
+    ]
 
-    time, rss = measure(args.cycles, load_csv_quote_nonnumeric)
-    print('load_csv_quote_nonnumeric', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_csv_quote_nonnumeric_and_validate)
-    print('load_csv_quote_nonnumeric_and_validate', format_time(time), format_rss(rss))
+def save_capnp_stream(
+    data, file_name='data.capnp.stream', test=True, flush_size=FLUSH_SIZE,
+):
+    schemas = get_capnp_schemas()
 
-    # JSON default
-    save_json(data, test=False)
+    if test:
+        file_name = "{}.{}".format(file_name, os.getpid())
 
-    time, rss = measure(args.cycles, save_json, data)
-    print('save_json', format_time(time), format_rss(rss))
+    path = str(DATA_ROOT / file_name)
+    fill_message = get_capnp_converter().fill_message
 
-    time, rss = measure(args.cycles, load_json)
-    print('load_json', format_time(time), format_rss(rss))
+    try:
+        with open(path, 'wb', buffering=flush_size) as f:
+            for item in data:
+                # Unlike protobuf messages, builders are not reused: they
+                # cannot be cleared, so null fields of a record would keep
+                # values of the previous one, and text set again takes new
+                # space in the arena instead of the old one.
+                flight = schemas.Flight.new_message()
+                fill_message(flight, item)
+
+                # Every record is a separate message and messages are
+                # self-delimiting, so they are simply concatenated.
+                f.write(flight.to_bytes())
+    finally:
+        if test:
+            os.remove(path)
 
-    time, rss = measure(args.cycles, load_json_and_validate)
-    print('load_json_and_validate', format_time(time), format_rss(rss))
 
-    # uJSON default
-    save_ujson(data, test=False)
+def iter_capnp_stream(file_name='data.capnp.stream'):
+    schemas = get_capnp_schemas()
 
-    time, rss = measure(args.cycles, save_ujson, data)
-    print('save_ujson', format_time(time), format_rss(rss))
+    path = str(DATA_ROOT / file_name)
+    with open(path, 'rb') as f:
+        flights = schemas.Flight.read_multiple(
+            f, traversal_limit_in_words=2 ** 61,
+        )
+        from_message = get_capnp_converter().from_message
 
-    time, rss = measure(args.cycles, load_ujson)
-    print('load_ujson', format_time(time), format_rss(rss))
+        for flight in flights:
+            yield from_message(flight)
 
-    time, rss = measure(args.cycles, load_ujson_and_validate)
-    print('load_ujson_and_validate', format_time(time), format_rss(rss))
 
-    # JSON lines
-    save_json_lines(data, test=False)
+def load_capnp_stream(file_name='data.capnp.stream'):
+    return list(iter_capnp_stream(file_name))
 
-    time, rss = measure(args.cycles, save_json_lines, data)
-    print('save_json_lines', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_json_lines)
-    print('load_json_lines', format_time(time), format_rss(rss))
+# CSV pandas
+register(
+    'csv_pandas', save_csv_pandas,
+    extra_saves=[save_csv_pandas_batch],
+    load=load_csv_pandas,
+    iter_load=iter_csv_pandas,
+    load_and_validate=load_csv_pandas_and_validate,
+    extra_loads=[
+        load_csv_pandas_batch, load_csv_pandas_batches,
+        load_csv_pandas_batch_and_validate, load_csv_pandas_projected,
+    ],
+    extension='.csv',
+)
 
-    time, rss = measure(args.cycles, load_json_lines_and_validate)
-    print('load_json_lines_and_validate', format_time(time), format_rss(rss))
+# CSV default
+register(
+    'csv', save_csv,
+    load=load_csv,
+    iter_load=iter_csv,
+    load_and_validate=load_csv_and_validate,
+    extra_loads=[load_csv_parallel, load_csv_projected, load_csv_records],
+    compressible=True,
+    streaming=True,
+)
 
-    # uJSON lines
-    save_ujson_lines(data, test=False)
+# CSV quote_nonnumeric
+register(
+    'csv_quote_nonnumeric', save_csv_quote_nonnumeric,
+    load=load_csv_quote_nonnumeric,
+    iter_load=iter_csv_quote_nonnumeric,
+    load_and_validate=load_csv_quote_nonnumeric_and_validate,
+    extra_loads=[
+        load_csv_quote_nonnumeric_parallel,
+        load_csv_quote_nonnumeric_projected,
+        load_csv_quote_nonnumeric_records,
+    ],
+    compressible=True,
+    streaming=True,
+    extension='.csv',
+)
 
-    time, rss = measure(args.cycles, save_ujson_lines, data)
-    print('save_ujson_lines', format_time(time), format_rss(rss))
+# JSON default
+register(
+    'json', save_json,
+    load=load_json,
+    iter_load=iter_json,
+    load_and_validate=load_json_and_validate,
+    compressible=True,
+)
 
-    time, rss = measure(args.cycles, load_ujson_lines)
-    print('load_ujson_lines', format_time(time), format_rss(rss))
+# uJSON default. It has no incremental decoder, so there is no streaming
+# one: items would be decoded by the standard library.
+register(
+    'ujson', save_ujson,
+    load=load_ujson,
+    load_and_validate=load_ujson_and_validate,
+    compressible=True,
+    extension='.json',
+)
 
-    time, rss = measure(args.cycles, load_ujson_lines_and_validate)
-    print('load_ujson_lines_and_validate', format_time(time), format_rss(rss))
+# JSON lines
+register(
+    'json_lines', save_json_lines,
+    load=load_json_lines,
+    iter_load=iter_json_lines,
+    load_and_validate=load_json_lines_and_validate,
+    extra_saves=[save_json_lines_with_index],
+    extra_loads=[
+        load_json_lines_parallel, load_json_lines_record,
+        load_json_lines_by_date, load_json_lines_async,
+    ],
+    compressible=True,
+    streaming=True,
+)
 
-    # msgpack
-    save_msgpack(data, test=False)
+# uJSON lines
+register(
+    'ujson_lines', save_ujson_lines,
+    load=load_ujson_lines,
+    iter_load=iter_ujson_lines,
+    load_and_validate=load_ujson_lines_and_validate,
+    extra_saves=[save_ujson_lines_with_index],
+    extra_loads=[
+        load_ujson_lines_parallel, load_ujson_lines_record,
+        load_ujson_lines_by_date, load_ujson_lines_async,
+    ],
+    compressible=True,
+    streaming=True,
+    extension='.jl',
+)
 
-    time, rss = measure(args.cycles, save_msgpack, data)
-    print('save_msgpack', format_time(time), format_rss(rss))
+# msgpack
+register(
+    'msgpack', save_msgpack,
+    load=load_msgpack,
+    iter_load=iter_msgpack,
+    # Strings are packed as raw bytes, which are decoded back to text
+    load_dicts=iter_msgpack_utf,
+    compressible=True,
+)
+
+# msgpack utf
+register(
+    'msgpack_utf', save_msgpack_utf,
+    load=load_msgpack_utf,
+    iter_load=iter_msgpack_utf,
+    load_and_validate=load_msgpack_utf_and_validate,
+    compressible=True,
+    extension='.msgpack',
+)
+
+# msgpack utf stream
+register(
+    'msgpack_utf_stream', save_msgpack_utf_stream,
+    load=load_msgpack_utf_stream,
+    iter_load=iter_msgpack_utf_stream,
+    load_and_validate=load_msgpack_utf_stream_and_validate,
+    extra_saves=[save_msgpack_utf_stream_with_index],
+    extra_loads=[
+        load_msgpack_utf_stream_batch, load_msgpack_utf_stream_record,
+        load_msgpack_utf_stream_by_date, load_msgpack_utf_stream_async,
+    ],
+    compressible=True,
+    streaming=True,
+    extension='.msgpack.stream',
+)
+
+# umsgpack
+register(
+    'umsgpack', save_umsgpack,
+    load=load_umsgpack,
+    load_and_validate=load_umsgpack_and_validate,
+    compressible=True,
+    extension='.msgpack',
+)
+
+# avro. It is not compressible: DataFileReader seeks to the end of its
+# file to get its size, which decompresses the whole file once more.
+register(
+    'avro', save_avro,
+    load_schema=load_avro_schema,
+    load=load_avro,
+    iter_load=iter_avro,
+    streaming=True,
+)
+
+# avro fast
+register(
+    'avro_fast', save_avro_fast,
+    load_schema=load_fastavro_schema,
+    load=load_avro_fast,
+    iter_load=iter_avro_fast,
+    extra_saves=[save_avro_fast_with_index],
+    extra_loads=[
+        load_avro_fast_batch, load_avro_fast_record, load_avro_fast_by_date,
+        load_avro_fast_projected,
+    ],
+    compressible=True,
+    streaming=True,
+    extension='.avro',
+)
+
+# protobuf
+register(
+    'protobuf', save_protobuf,
+    extra_saves=[save_protobuf_setattr],
+    load=load_protobuf,
+    load_dicts=load_protobuf_to_dicts,
+    extra_loads=[
+        load_protobuf_to_dicts, load_protobuf_to_dicts_getattr,
+        load_protobuf_to_dicts_projected, load_protobuf_records,
+    ],
+    compressible=True,
+)
+
+# protobuf stream
+register(
+    'protobuf_stream', save_protobuf_stream,
+    load=load_protobuf_stream,
+    iter_load=iter_protobuf_stream,
+    compressible=True,
+    streaming=True,
+)
 
-    time, rss = measure(args.cycles, load_msgpack)
-    print('load_msgpack', format_time(time), format_rss(rss))
+# capnp. A message is read whole, records are streamed by 'capnp_stream'.
+register(
+    'capnp', save_capnp,
+    load_schema=load_capnp_schemas,
+    load=load_capnp,
+    load_dicts=load_capnp_to_dicts,
+    extra_loads=[
+        load_capnp_to_dicts, load_capnp_to_dicts_projected, load_capnp_records,
+        load_capnp_batch, load_capnp_mmap,
+        load_capnp_delays, load_capnp_delays_from_dicts,
+    ],
+)
+register(
+    'capnp_packed', save_capnp_packed,
+    load=load_capnp_packed_mmap,
+    extra_loads=[load_capnp_packed_delays],
+)
 
-    # msgpack utf
-    save_msgpack_utf(data, test=False)
+# capnp stream
+register(
+    'capnp_stream', save_capnp_stream,
+    load=load_capnp_stream,
+    iter_load=iter_capnp_stream,
+    streaming=True,
+)
 
-    time, rss = measure(args.cycles, save_msgpack_utf, data)
-    print('save_msgpack_utf', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_msgpack_utf)
-    print('load_msgpack_utf', format_time(time), format_rss(rss))
+def add_compressed(codecs, compressions):
+    """
+    Put compressed variants of every compressible codec right after it.
 
-    time, rss = measure(args.cycles, load_msgpack_utf_and_validate)
-    print('load_msgpack_utf_and_validate', format_time(time), format_rss(rss))
+    """
+    result = []
 
-    # msgpack utf stream
-    save_msgpack_utf_stream(data, test=False)
+    for codec in codecs:
+        result.append(codec)
 
-    time, rss = measure(args.cycles, save_msgpack_utf_stream, data)
-    print('save_msgpack_utf_stream', format_time(time), format_rss(rss))
+        if codec.compressible:
+            result.extend(codec.compressed(x) for x in compressions)
 
-    time, rss = measure(args.cycles, load_msgpack_utf_stream)
-    print('load_msgpack_utf_stream', format_time(time), format_rss(rss))
+    return result
 
-    time, rss = measure(args.cycles, load_msgpack_utf_stream_and_validate)
-    print('load_msgpack_utf_stream_and_validate', format_time(time), format_rss(rss))
 
-    # umsgpack
-    save_umsgpack(data, test=False)
+def print_containers_size(data):
+    if not data:
+        return
 
-    time, rss = measure(args.cycles, save_umsgpack, data)
-    print('save_umsgpack', format_time(time), format_rss(rss))
+    records = [FlightRecord.from_dict(x) for x in data]
 
-    time, rss = measure(args.cycles, load_umsgpack)
-    print('load_umsgpack', format_time(time), format_rss(rss))
+    print("Size of record container: dict {}, FlightRecord {}".format(
+        format_rss(get_containers_size(data) / len(data)),
+        format_rss(get_containers_size(records) / len(records)),
+    ))
 
-    time, rss = measure(args.cycles, load_umsgpack_and_validate)
-    print('load_umsgpack_and_validate', format_time(time), format_rss(rss))
 
-    # avro
-    save_avro(data, test=False)
+def get_file_size(file_name):
+    path = DATA_ROOT / file_name
+    return path.stat().st_size if path.exists() else None
 
-    time, rss = measure(args.cycles, save_avro, data)
-    print('save_avro', format_time(time), format_rss(rss))
 
-    time, rss = measure(args.cycles, load_avro)
-    print('load_avro', format_time(time), format_rss(rss))
+def main():
+    args = load_args()
+
+    if args.list_codecs:
+        for name in CODECS:
+            print(name)
+        return
 
-    # avro fast
-    save_avro_fast(data, test=False)
+    codecs = add_compressed(get_codecs(args.codecs), args.compressions or ())
 
-    time, rss = measure(args.cycles, save_avro_fast, data)
-    print('save_avro_fast', format_time(time), format_rss(rss))
+    if args.profile:
+        Path(args.profile).mkdir(parents=True, exist_ok=True)
 
-    time, rss = measure(args.cycles, load_avro_fast)
-    print('load_avro_fast', format_time(time), format_rss(rss))
+    if args.scale:
+        results = run_scaling(
+            codecs,
+            rows_counts=args.scale_rows,
+            workers_counts=args.scale_workers,
+            cycles=args.cycles,
+            warmup=args.warmup,
+            seed=args.seed,
+        )
 
-    # protobuf
-    save_protobuf(data, test=False)
+        if args.output:
+            meta = get_meta(
+                cycles=args.cycles,
+                warmup=args.warmup,
+                scale_rows=args.scale_rows,
+                scale_workers=sorted(set(
+                    result['workers'] for result in results
+                )),
+                seed=args.seed,
+                compressions=args.compressions or [],
+            )
+            write_results(args.output, results, meta)
 
-    time, rss = measure(args.cycles, save_protobuf, data)
-    print('save_protobuf', format_time(time), format_rss(rss))
+        return
 
-    time, rss = measure(args.cycles, load_protobuf)
-    print('load_protobuf', format_time(time), format_rss(rss))
+    if args.rows is None:
+        data = load_csv_pandas('source.csv')
+    else:
+        data = generate_flights(args.rows, args.seed)
 
-    time, rss = measure(args.cycles, load_protobuf_to_dicts)
-    print('load_protobuf_to_dicts', format_time(time), format_rss(rss))
+    results = []
+    file_sizes = {}
 
-    # capnp
-    save_capnp(data, test=False)
-    save_capnp_packed(data, test=False)
+    if args.records:
+        print_containers_size(data)
 
-    time, rss = measure(args.cycles, save_capnp, data)
-    print('save_capnp', format_time(time), format_rss(rss))
+    start_pool(data)
 
-    time, rss = measure(args.cycles, save_capnp_packed, data)
-    print('save_capnp_packed', format_time(time), format_rss(rss))
+    try:
+        for codec in codecs:
+            codec.prepare(data)
+            file_size = get_file_size(codec.file_name)
+            file_sizes[codec.name] = file_size
+            raw_size = file_sizes.get(codec.base.name) if codec.base else None
+
+            if args.intern and codec.iter_load is not None:
+                memory_saved = get_memory_saved(codec.iter_load)
+            else:
+                memory_saved = None
 
-    time, rss = measure(args.cycles, load_capnp)
-    print('load_capnp', format_time(time), format_rss(rss))
+            benchmarks = codec.benchmarks(
+                intern=args.intern, records=args.records, typed=args.typed,
+            )
 
-    time, rss = measure(args.cycles, load_capnp_to_dicts)
-    print('load_capnp_to_dicts', format_time(time), format_rss(rss))
+            for benchmark in benchmarks:
+                if args.profile:
+                    profile = get_profile_path(args.profile, codec, benchmark)
+                    remove_parts(profile)
+                else:
+                    profile = None
+
+                summary = measure(
+                    args.cycles, benchmark.fn,
+                    warmup=args.warmup,
+                    use_dataset=benchmark.needs_data,
+                    fresh=args.memory,
+                    trace=args.tracemalloc,
+                    profile=profile,
+                )
+                result = make_result(
+                    codec, benchmark, summary, len(data), file_size,
+                    raw_size, memory_saved if benchmark.interned else None,
+                )
+                results.append(result)
+                print(format_result(result))
+
+                stats = merge_profile(profile) if profile else None
+                if stats is not None:
+                    print(format_hotspots(stats))
+    finally:
+        stop_pool()
+
+    if args.output:
+        meta = get_meta(
+            cycles=args.cycles,
+            warmup=args.warmup,
+            records=len(data),
+            source='source.csv' if args.rows is None else 'generated',
+            seed=args.seed if args.rows is not None else None,
+            memory=args.memory,
+            tracemalloc=args.tracemalloc,
+            profile=args.profile is not None,
+            compressions=args.compressions or [],
+            intern=args.intern,
+            as_records=args.records,
+            typed=args.typed,
+        )
+        write_results(args.output, results, meta)
 
 
 if __name__ == '__main__':
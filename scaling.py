@@ -0,0 +1,414 @@
+# coding: utf-8
+
+# Scaling curves of codecs. Benchmarks are run for a series of numbers of
+# synthetic records, one at a time, to see how their time and memory grow
+# with size of data. Then they are run by a series of numbers of processes
+# at once, to see how their aggregate throughput grows with cores.
+#
+# Growth is summarized by exponent of the power law fitted to the curve:
+# time of a codec which scales linearly with records grows as rows ** 1.
+# Growth of memory is fitted to peaks traced by tracemalloc in a separate
+# run, RSS of reused workers grows by whole arenas and is too coarse.
+
+import math
+import statistics
+import time
+
+from collections import OrderedDict
+from functools import partial
+
+import psutil
+
+from generate import DEFAULT_SEED, generate_flights
+from registry import Benchmark
+from utils import (
+    consume, format_rss, format_time, measure, run_cycles, start_pool,
+    stop_pool,
+)
+
+
+DEFAULT_ROWS = (1000, 10000, 100000)
+
+# Exponent of growth with records above which a codec is flagged, it leaves
+# room for noise and for fixed costs becoming negligible
+SUPERLINEAR_EXPONENT = 1.15
+
+# Share of the ideal speedup below which a codec stops scaling with cores
+MIN_EFFICIENCY = 0.7
+
+# Slowdown of a single run by concurrent ones which is put down to
+# contention for shared resources
+CONTENTION_SLOWDOWN = 1.2
+
+
+def get_cpu_count():
+    """
+    Get number of CPUs the process may run on.
+
+    """
+    try:
+        return len(psutil.Process().cpu_affinity())
+    except AttributeError:
+        # Affinity is not supported on macOS
+        return psutil.cpu_count(logical=True)
+
+
+def get_default_workers():
+    """
+    Get powers of two up to the number of CPUs along with the number itself.
+
+    """
+    cpus = get_cpu_count()
+    workers = [1]
+
+    while workers[-1] * 2 < cpus:
+        workers.append(workers[-1] * 2)
+
+    if workers[-1] != cpus:
+        workers.append(cpus)
+
+    return workers
+
+
+def get_benchmarks(codec):
+    """
+    Get benchmarks of the main encoder and decoder of `codec`.
+
+    """
+    yield Benchmark(codec.save.__name__, codec.save, True)
+
+    if codec.load is not None:
+        yield Benchmark(codec.load.__name__, codec.load, False)
+    elif codec.iter_load is not None:
+        yield Benchmark(
+            codec.iter_load.__name__, partial(consume, codec.iter_load),
+            False,
+        )
+
+
+def get_exponent(xs, ys):
+    """
+    Get exponent `k` of power law `y = c * x ** k` fitted to points by least
+    squares in log-log scale. Points with non-positive values are skipped.
+    Return `None` if there are less than two points left.
+
+    """
+    points = [
+        (math.log(x), math.log(y))
+        for x, y in zip(xs, ys)
+        if x > 0 and y > 0
+    ]
+
+    if len(points) < 2:
+        return None
+
+    mean_x = statistics.mean(x for x, _ in points)
+    mean_y = statistics.mean(y for _, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    if variance == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def make_scaling_result(
+    codec, benchmark, sweep, rows, workers, time_median, peak_rss,
+    traced_peak=None, wall_time=None, speedup=None,
+):
+    """
+    Flatten a point of a scaling curve into a record suitable for JSON and
+    CSV. Throughput is aggregate: records processed by all `workers` per
+    second of `wall_time`, which is `time_median` for a single worker.
+
+    """
+    if wall_time is None:
+        wall_time = time_median
+
+    result = OrderedDict([
+        ('codec', codec.name),
+        ('benchmark', benchmark.name),
+        ('sweep', sweep),
+        ('rows', rows),
+        ('workers', workers),
+        ('time_median', time_median),
+        ('wall_time', wall_time),
+        ('time_per_row', time_median / rows),
+        ('records_per_second', None),
+        ('speedup', speedup),
+        ('efficiency', None),
+        ('peak_rss', peak_rss),
+        ('traced_peak', traced_peak),
+        ('traced_peak_per_row', None),
+    ])
+
+    if traced_peak is not None:
+        result['traced_peak_per_row'] = traced_peak / rows
+
+    if wall_time > 0:
+        result['records_per_second'] = rows * workers / wall_time
+
+    if speedup is not None:
+        result['efficiency'] = speedup / workers
+
+    return result
+
+
+def format_scaling_result(result):
+    values = [
+        result['benchmark'],
+        "{} rows".format(result['rows']),
+        "{} workers".format(result['workers']),
+        format_time(result['time_median']),
+        "{:.3f} us/row".format(result['time_per_row'] * 10 ** 6),
+    ]
+
+    if result['records_per_second'] is not None:
+        values.append("{:.0f} rec/s".format(result['records_per_second']))
+
+    if result['speedup'] is not None:
+        values.append("speedup {:.2f} ({:.0%})".format(
+            result['speedup'], result['efficiency'],
+        ))
+
+    values.append("peak {}".format(format_rss(result['peak_rss'])))
+
+    if result['traced_peak'] is not None:
+        values.append("traced peak {} ({:.0f} B/row)".format(
+            format_rss(result['traced_peak']),
+            result['traced_peak_per_row'],
+        ))
+
+    return ' '.join(values)
+
+
+def measure_concurrent(workers, cycles, fn, warmup=0, use_dataset=False):
+    """
+    Run `workers` copies of `fn` at once in the pool started for as many
+    workers, `cycles` times. Return median wall time of all copies, median
+    time of a single copy and the highest peak RSS of a copy.
+
+    """
+    kwargs = {'use_dataset': use_dataset}
+
+    # Warm up every worker, not just the first one free
+    if warmup:
+        run_cycles(warmup * workers, False, fn, **kwargs)
+
+    wall_times = []
+    samples = []
+
+    for i in range(cycles):
+        time_start = time.monotonic()
+        cycle_samples = run_cycles(workers, False, fn, **kwargs)
+        wall_times.append(time.monotonic() - time_start)
+        samples.extend(cycle_samples)
+
+    return (
+        statistics.median(wall_times),
+        statistics.median(x.time for x in samples),
+        max(x.peak_rss for x in samples),
+    )
+
+
+def sweep_rows(codecs, rows_counts, cycles, warmup=0, seed=DEFAULT_SEED):
+    """
+    Run benchmarks of `codecs` for every number of records in
+    `rows_counts`, one cycle at a time. Smaller datasets of the same seed
+    are beginnings of bigger ones.
+
+    """
+    results = []
+    data = None
+
+    for rows in rows_counts:
+        data = generate_flights(rows, seed)
+        start_pool(data, max_workers=1)
+
+        try:
+            for codec in codecs:
+                codec.prepare(data)
+
+                for benchmark in get_benchmarks(codec):
+                    summary = measure(
+                        cycles, benchmark.fn,
+                        warmup=warmup,
+                        use_dataset=benchmark.needs_data,
+                    )
+                    traced = measure(
+                        1, benchmark.fn,
+                        use_dataset=benchmark.needs_data,
+                        trace=True,
+                    )
+                    result = make_scaling_result(
+                        codec, benchmark, 'rows', rows, 1,
+                        summary.time_median, summary.peak_rss,
+                        traced_peak=traced.traced_peak,
+                    )
+                    results.append(result)
+                    print(format_scaling_result(result))
+        finally:
+            stop_pool()
+
+    return results, data
+
+
+def sweep_workers(codecs, data, workers_counts, cycles, warmup=0):
+    """
+    Run benchmarks of `codecs` by every number of processes at once in
+    `workers_counts`. Speedup is relative to throughput of a single worker
+    of the first one.
+
+    """
+    results = []
+    baselines = {}
+
+    for codec in codecs:
+        codec.prepare(data)
+
+    for workers in workers_counts:
+        start_pool(data, max_workers=workers)
+
+        try:
+            for codec in codecs:
+                for benchmark in get_benchmarks(codec):
+                    wall_time, time_median, peak_rss = measure_concurrent(
+                        workers, cycles, benchmark.fn,
+                        warmup=warmup,
+                        use_dataset=benchmark.needs_data,
+                    )
+                    throughput = workers / wall_time
+                    key = (codec.name, benchmark.name)
+                    baseline = baselines.setdefault(key, throughput / workers)
+                    result = make_scaling_result(
+                        codec, benchmark, 'workers', len(data), workers,
+                        time_median, peak_rss,
+                        wall_time=wall_time,
+                        speedup=throughput / baseline,
+                    )
+                    results.append(result)
+                    print(format_scaling_result(result))
+        finally:
+            stop_pool()
+
+    return results
+
+
+def analyze(results):
+    """
+    Summarize curves of every benchmark in `results`. Return list of
+    `(codec, benchmark, notes, flags)`, flags are problems found.
+
+    """
+    curves = OrderedDict()
+
+    for result in results:
+        key = (result['codec'], result['benchmark'])
+        curves.setdefault(key, {'rows': [], 'workers': []})
+        curves[key][result['sweep']].append(result)
+
+    summaries = []
+    cpus = get_cpu_count()
+
+    for (codec, benchmark), curve in curves.items():
+        notes = []
+        flags = []
+        by_rows = curve['rows']
+        by_workers = curve['workers']
+
+        if by_rows:
+            notes.append("{:.3f} us/row at {} rows".format(
+                by_rows[-1]['time_per_row'] * 10 ** 6, by_rows[-1]['rows'],
+            ))
+
+            rows = [x['rows'] for x in by_rows]
+            time_exponent = get_exponent(
+                rows, [x['time_median'] for x in by_rows],
+            )
+            memory_exponent = get_exponent(
+                rows, [x['traced_peak'] for x in by_rows],
+            )
+
+            if time_exponent is not None:
+                notes.append("time ~ rows^{:.2f}".format(time_exponent))
+
+                if time_exponent > SUPERLINEAR_EXPONENT:
+                    flags.append("time grows super-linearly with rows")
+
+            if memory_exponent is not None:
+                notes.append("memory ~ rows^{:.2f}, {:.0f} B/row".format(
+                    memory_exponent, by_rows[-1]['traced_peak_per_row'],
+                ))
+
+                if memory_exponent > SUPERLINEAR_EXPONENT:
+                    flags.append("memory grows super-linearly with rows")
+
+        if len(by_workers) > 1:
+            first = by_workers[0]
+            last = by_workers[-1]
+            scaled = [
+                x['workers']
+                for x in by_workers
+                if x['efficiency'] >= MIN_EFFICIENCY
+            ]
+            notes.append("x{:.2f} by {} workers ({:.0%})".format(
+                last['speedup'], last['workers'], last['efficiency'],
+            ))
+
+            if last['efficiency'] < MIN_EFFICIENCY:
+                # Every copy does the same work, so if it takes longer
+                # when more of them run, they compete for something shared.
+                # Otherwise copies simply do not run at the same time.
+                slowdown = last['time_median'] / first['time_median']
+
+                if last['workers'] > cpus:
+                    cause = "there are only {} CPUs".format(cpus)
+                elif slowdown >= CONTENTION_SLOWDOWN:
+                    cause = (
+                        "a single run is x{:.2f} slower, runs contend for "
+                        "memory bandwidth or shared locks".format(slowdown)
+                    )
+                else:
+                    cause = "runs do not overlap, fewer CPUs are free"
+
+                flags.append("stops scaling after {} workers: {}".format(
+                    max(scaled) if scaled else first['workers'], cause,
+                ))
+
+        summaries.append((codec, benchmark, notes, flags))
+
+    return summaries
+
+
+def format_summary(summary):
+    codec, benchmark, notes, flags = summary
+    lines = ["{} {}: {}".format(codec, benchmark, ', '.join(notes))]
+    lines.extend("    WARNING: {}".format(x) for x in flags)
+    return '\n'.join(lines)
+
+
+def run_scaling(
+    codecs, rows_counts=DEFAULT_ROWS, workers_counts=None, cycles=3,
+    warmup=0, seed=DEFAULT_SEED,
+):
+    """
+    Sweep numbers of records, then numbers of workers for the biggest
+    dataset, print summary of curves and return all their points.
+
+    """
+    if workers_counts is None:
+        workers_counts = get_default_workers()
+
+    results, data = sweep_rows(
+        codecs, rows_counts, cycles, warmup=warmup, seed=seed,
+    )
+    results.extend(sweep_workers(
+        codecs, data, workers_counts, cycles, warmup=warmup,
+    ))
+
+    print()
+
+    for summary in analyze(results):
+        print(format_summary(summary))
+
+    return results
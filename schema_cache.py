@@ -0,0 +1,89 @@
+# coding: utf-8
+
+# Schemas of binary formats are parsed lazily, once per process, and shared
+# by all codec functions.
+
+import json
+
+from functools import lru_cache
+from pathlib import Path
+
+
+SCHEMAS_ROOT = Path(__file__).absolute().parent
+
+
+def read_avro_schema_json():
+    with (SCHEMAS_ROOT / 'schemas.avsc').open() as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_avro_schema():
+    import avro.schema
+    return avro.schema.SchemaFromJSONData(read_avro_schema_json())
+
+
+@lru_cache(maxsize=None)
+def get_fastavro_schema():
+    from fastavro import parse_schema
+    return parse_schema(read_avro_schema_json())
+
+
+@lru_cache(maxsize=None)
+def get_fastavro_projection(columns):
+    """
+    Get parsed avro schema having only fields `columns`, a tuple. Used as
+    reader schema, it makes fastavro skip other fields.
+
+    """
+    from fastavro import parse_schema
+
+    schema = read_avro_schema_json()
+    fields = {
+        field['name']: field
+        for field in schema['fields']
+    }
+    schema['fields'] = [fields[name] for name in columns]
+
+    return parse_schema(schema)
+
+
+@lru_cache(maxsize=None)
+def get_capnp_schemas():
+    import capnp
+    capnp.remove_import_hook()
+
+    return capnp.load(str(SCHEMAS_ROOT / 'schemas.capnp'))
+
+
+@lru_cache(maxsize=None)
+def get_protobuf_descriptor():
+    import schemas_pb2
+    return schemas_pb2.Flight.DESCRIPTOR
+
+
+@lru_cache(maxsize=None)
+def get_protobuf_field_names():
+    return tuple(
+        field.name
+        for field in get_protobuf_descriptor().fields
+    )
+
+
+def load_avro_schema():
+    """
+    Parse avro schema from scratch. Used to measure cost of schema loading.
+
+    """
+    get_avro_schema.cache_clear()
+    return get_avro_schema()
+
+
+def load_fastavro_schema():
+    get_fastavro_schema.cache_clear()
+    return get_fastavro_schema()
+
+
+def load_capnp_schemas():
+    get_capnp_schemas.cache_clear()
+    return get_capnp_schemas()
@@ -0,0 +1,18 @@
+# coding: utf-8
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+
+# Modules of the benchmark are not packaged, they are imported from the root
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+
+@pytest.fixture(scope='session')
+def flights():
+    from generate import generate_flights
+
+    return generate_flights(200, seed=1)
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+import itertools
+import threading
+
+import pytest
+
+import aio
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from registry import CODECS, Codec
+
+
+def save_stub(data, file_name='stub', test=True):
+    pass
+
+
+class Source:
+    """
+    Codec reading endless records from any path but 'broken', which fails.
+    Tells which readers are still open.
+
+    """
+
+    def __init__(self):
+        self.open = set()
+        self.lock = threading.Lock()
+        self.codec = Codec('stub', save_stub, iter_load=self.iter_load)
+
+    def iter_load(self, file_name):
+        if file_name == 'broken':
+            raise ValueError("Broken file")
+
+        with self.lock:
+            self.open.add(file_name)
+
+        try:
+            for i in itertools.count():
+                yield {'path': file_name, 'number': i}
+        finally:
+            with self.lock:
+                self.open.discard(file_name)
+
+
+def run_in_thread(fn, timeout=10):
+    """
+    Run `fn` failing the test if it hangs. Return exception it raised.
+
+    """
+    result = []
+
+    def target():
+        try:
+            fn()
+        except Exception as e:
+            result.append(e)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    assert not thread.is_alive(), "Loading did not stop"
+    return result[0] if result else None
+
+
+def test_aload_stops_early():
+    source = Source()
+
+    async def take():
+        items = []
+        records = aio.aload('a', source.codec, chunk_size=10)
+
+        async for item in records:
+            items.append(item)
+
+            if len(items) == 25:
+                break
+
+        # Closing the iterator joins the reader
+        await records.aclose()
+        return items, set(source.open)
+
+    def fn():
+        items, still_open = aio.asyncio.run(take())
+        assert len(items) == 25
+        assert still_open == set()
+
+    assert run_in_thread(fn) is None
+
+
+def test_aload_many_stops_readers_on_failure():
+    source = Source()
+
+    async def read():
+        records = aio.aload_many(
+            ['a', 'b', 'broken', 'c'], source.codec,
+            chunk_size=10, max_chunks=1,
+        )
+
+        with pytest.raises(ValueError):
+            async for item in records:
+                pass
+
+        # Readers of other files are stopped before the error is raised,
+        # not when the loop is closed
+        return set(source.open)
+
+    def fn():
+        assert aio.asyncio.run(read()) == set()
+
+    assert run_in_thread(fn) is None
+
+
+def test_load(tmp_path, flights):
+    codec = CODECS['json_lines']
+    path = str(tmp_path / codec.file_name)
+    codec.save(flights, file_name=path, test=False)
+
+    assert aio.load(path, codec, chunk_size=7) == flights
+    assert aio.load(path, 'json_lines', chunk_size=1000) == flights
+
+
+def test_load_many(tmp_path, flights):
+    codec = CODECS['json_lines']
+    paths = [str(tmp_path / '{}.jl'.format(i)) for i in range(3)]
+
+    for path in paths:
+        codec.save(flights, file_name=path, test=False)
+
+    items = aio.load_many(paths, 'json_lines', chunk_size=7)
+
+    assert len(items) == len(flights) * len(paths)
+    assert sorted(items, key=repr) == sorted(flights * 3, key=repr)
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        aio.get_codec('unknown')
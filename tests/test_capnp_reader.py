@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import gc
+
+import pytest
+
+from capnp_reader import FlightView, iter_views
+from run import (
+    load_capnp_delays, load_capnp_mmap, load_capnp_packed_delays,
+    load_capnp_packed_mmap, save_capnp, save_capnp_packed,
+)
+
+
+@pytest.fixture(params=[False, True], ids=['plain', 'packed'])
+def packed(request):
+    return request.param
+
+
+@pytest.fixture
+def path(tmp_path, flights, packed):
+    if packed:
+        path = str(tmp_path / 'data.capnp.packed')
+        save_capnp_packed(flights, path, test=False)
+    else:
+        path = str(tmp_path / 'data.capnp')
+        save_capnp(flights, path, test=False)
+
+    return path
+
+
+def test_views(path, packed, flights):
+    views = list(iter_views(path, packed=packed))
+
+    assert all(isinstance(x, FlightView) for x in views)
+    assert [x.to_dict() for x in views] == flights
+    assert [dict(x) for x in views] == flights
+    assert len(views[0]) == len(flights[0])
+    assert list(views[0]) == list(flights[0])
+
+
+def test_nulls(path, packed, flights):
+    index, item = next(
+        (i, x) for i, x in enumerate(flights) if None in x.values()
+    )
+    view = list(iter_views(path, packed=packed))[index]
+
+    for name, value in item.items():
+        assert view[name] == value
+
+    with pytest.raises(KeyError):
+        view['unknown']
+
+
+def test_views_outlive_generator(path, packed, flights):
+    views = iter_views(path, packed=packed)
+    first = next(views)
+    second = next(views)
+    views.close()
+    del views
+    gc.collect()
+
+    assert first['CARRIER'] == flights[0]['CARRIER']
+    assert second.to_dict() == flights[1]
+
+
+def test_load(tmp_path, flights):
+    path = str(tmp_path / 'data.capnp')
+    save_capnp(flights, path, test=False)
+    packed_path = str(tmp_path / 'data.capnp.packed')
+    save_capnp_packed(flights, packed_path, test=False)
+    delays = [(x['DEP_DELAY'], x['ARR_DELAY']) for x in flights]
+
+    assert load_capnp_mmap(path) == flights
+    assert load_capnp_packed_mmap(packed_path) == flights
+    assert load_capnp_delays(path) == delays
+    assert load_capnp_packed_delays(packed_path) == delays
@@ -0,0 +1,50 @@
+# coding: utf-8
+
+import pytest
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from registry import CODECS
+
+
+# Codecs which decode every value to its original type, others decode to
+# strings or native objects
+LOSSLESS = {
+    'csv_quote_nonnumeric', 'json', 'ujson', 'json_lines', 'ujson_lines',
+    'msgpack_utf', 'msgpack_utf_stream', 'umsgpack', 'avro', 'avro_fast',
+}
+
+
+@pytest.mark.parametrize('name', [
+    name
+    for name, codec in CODECS.items()
+    if codec.load is not None
+])
+def test_round_trip(tmp_path, flights, name):
+    codec = CODECS[name]
+    path = str(tmp_path / codec.file_name)
+    codec.save(flights, file_name=path, test=False)
+    loaded = codec.load(path)
+
+    assert len(loaded) == len(flights)
+
+    if name in LOSSLESS:
+        assert loaded == flights
+
+
+@pytest.mark.parametrize('name', [
+    name
+    for name, codec in CODECS.items()
+    if codec.iter_load is not None
+])
+def test_iter_load(tmp_path, flights, name):
+    codec = CODECS[name]
+    path = str(tmp_path / codec.file_name)
+    codec.save(flights, file_name=path, test=False)
+    loaded = list(codec.iter_load(path))
+
+    assert len(loaded) == len(flights)
+
+    if name in LOSSLESS:
+        assert loaded == flights
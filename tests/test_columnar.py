@@ -0,0 +1,52 @@
+# coding: utf-8
+
+from columnar import DictionaryColumn, FlightBatch, NumericColumn
+from run import (
+    load_capnp_batch, load_csv_pandas_batch, load_csv_pandas_batches,
+    save_capnp, save_csv_pandas_batch,
+)
+
+
+def test_records_round_trip(flights):
+    batch = FlightBatch.from_records(flights, chunk_size=64)
+
+    assert len(batch) == len(flights)
+    assert list(batch.to_records()) == flights
+
+
+def test_columns():
+    numbers = NumericColumn.from_list([1, None, 3, float('nan')], float)
+    strings = DictionaryColumn.from_list(['a', None, 'b', 'a'])
+
+    assert numbers.to_list() == [1.0, None, 3.0, None]
+    assert strings.codes.tolist() == [0, -1, 1, 0]
+    assert strings.to_list() == ['a', None, 'b', 'a']
+
+    merged = DictionaryColumn.concatenate([
+        strings, DictionaryColumn.from_list(['b', 'c']),
+    ])
+    assert merged.to_list() == ['a', None, 'b', 'a', 'b', 'c']
+
+
+def test_empty_batch():
+    batch = FlightBatch.concatenate([])
+
+    assert len(batch) == 0
+    assert list(batch.to_records()) == []
+
+
+def test_csv_pandas_batch(tmp_path, flights):
+    path = str(tmp_path / 'data.csv.pandas')
+    save_csv_pandas_batch(flights, path, test=False)
+
+    assert list(load_csv_pandas_batch(path).to_records()) == flights
+
+    batch = load_csv_pandas_batches(path)
+    assert list(batch.to_records()) == flights
+
+
+def test_capnp_batch(tmp_path, flights):
+    path = str(tmp_path / 'data.capnp')
+    save_capnp(flights, path, test=False)
+
+    assert list(load_capnp_batch(path).to_records()) == flights
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+import inspect
+import pickle
+
+import pytest
+
+import aio
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from compression import (
+    COMPRESSIONS, get_available, get_compression, open_file,
+)
+from registry import CODECS
+
+
+@pytest.mark.parametrize('compression', get_available())
+def test_open_file(tmp_path, compression):
+    path = tmp_path / ('data.txt' + COMPRESSIONS[compression])
+
+    with open_file(path, 'w') as f:
+        f.write('flight\n' * 100)
+
+    with open(path, 'rb') as f:
+        assert f.read() != b'flight\n' * 100
+
+    with open_file(path) as f:
+        assert f.read() == 'flight\n' * 100
+
+
+def test_get_compression():
+    assert get_compression('data.jl') is None
+    assert get_compression('data.jl.gz') == 'gzip'
+    assert get_compression('data.jl.xz.1234') == 'xz'
+    assert get_compression('dir.bz2/data.jl') is None
+
+
+def test_not_compressible():
+    with pytest.raises(ValueError):
+        CODECS['avro'].compressed('gzip')
+
+
+def test_file_name():
+    codec = CODECS['json_lines'].compressed('gzip')
+    parameter = inspect.signature(codec.load).parameters['file_name']
+
+    assert codec.file_name == 'data.jl.gz'
+    assert parameter.default == 'data.jl.gz'
+    assert codec.load.__name__ == 'load_json_lines_gzip'
+
+
+@pytest.mark.parametrize('name', ['csv', 'json', 'json_lines', 'msgpack'])
+def test_round_trip(tmp_path, flights, name):
+    codec = CODECS[name].compressed('gzip')
+    path = str(tmp_path / codec.file_name)
+
+    codec.save(flights, file_name=path, test=False)
+
+    assert get_compression(path) == 'gzip'
+    assert codec.load(file_name=path) == codec.base.load(file_name=path)
+    assert list(codec.iter_load(path)) == codec.load(path)
+
+
+def test_pickle(tmp_path, flights):
+    codec = CODECS['json_lines'].compressed('xz')
+    path = str(tmp_path / codec.file_name)
+    codec.save(flights, path, test=False)
+    load = pickle.loads(pickle.dumps(codec.load))
+
+    assert load.__name__ == codec.load.__name__
+    assert load(path) == flights
+
+
+def test_aio(tmp_path, flights):
+    codec = CODECS['json_lines'].compressed('bz2')
+    path = str(tmp_path / codec.file_name)
+    codec.save(flights, file_name=path, test=False)
+
+    assert aio.load(path, codec, chunk_size=7) == flights
@@ -0,0 +1,125 @@
+# coding: utf-8
+
+import pytest
+
+from converters import (
+    ProtobufConverter, get_capnp_converter, get_protobuf_converter,
+)
+from fields import FIELD_NAMES
+from schema_cache import get_capnp_schemas
+
+
+PROJECTED = ('CARRIER', 'DEP_DELAY', 'ARR_DELAY')
+
+
+@pytest.fixture
+def with_nulls(flights):
+    return next(x for x in flights if None in x.values())
+
+
+def test_protobuf_round_trip(flights):
+    import schemas_pb2
+
+    converter = get_protobuf_converter()
+    flight_book = schemas_pb2.FlightBook()
+    converter.to_messages(flights, flight_book.flights)
+    data = flight_book.SerializeToString()
+
+    flight_book = schemas_pb2.FlightBook()
+    flight_book.ParseFromString(data)
+
+    assert converter.from_messages(flight_book.flights) == flights
+
+
+def test_protobuf_nulls(with_nulls):
+    converter = get_protobuf_converter()
+    message = converter.to_message(with_nulls)
+    values = converter.get_values(message)
+
+    assert converter.from_message(message) == with_nulls
+    assert values == [with_nulls[x] for x in FIELD_NAMES]
+    assert None in values
+
+
+def test_protobuf_missing_fields():
+    import schemas_pb2
+
+    with pytest.raises(ValueError) as info:
+        ProtobufConverter(schemas_pb2.Flight, FIELD_NAMES + ('UNKNOWN', ))
+
+    assert str(info.value) == "Fields are missing in protobuf schema: UNKNOWN"
+
+
+def test_protobuf_coercion(flights):
+    converter = get_protobuf_converter()
+
+    # pandas decodes integer columns with nulls as floats
+    item = dict(flights[0], AIRLINE_ID=float(flights[0]['AIRLINE_ID']))
+    message = converter.to_message(item)
+
+    assert type(message.AIRLINE_ID) is int
+    assert converter.from_message(message) == flights[0]
+
+
+def test_protobuf_reader(flights):
+    converter = get_protobuf_converter()
+    read = converter.make_reader(PROJECTED)
+
+    for item in flights:
+        assert read(converter.to_message(item)) == {
+            name: item[name] for name in PROJECTED
+        }
+
+
+def make_capnp_message(item):
+    return get_capnp_converter().fill_message(
+        get_capnp_schemas().Flight.new_message(), item,
+    )
+
+
+def test_capnp_round_trip(flights):
+    converter = get_capnp_converter()
+    flight_book = get_capnp_schemas().FlightBook.new_message()
+    messages = flight_book.init('flights', len(flights))
+
+    for message, item in zip(messages, flights):
+        converter.fill_message(message, item)
+
+    data = flight_book.to_bytes()
+
+    with get_capnp_schemas().FlightBook.from_bytes(data) as flight_book:
+        items = [converter.from_message(x) for x in flight_book.flights]
+
+    assert items == flights
+
+
+def test_capnp_nulls(with_nulls):
+    converter = get_capnp_converter()
+    message = make_capnp_message(with_nulls)
+    nulls = converter.get_nulls(message)
+
+    assert converter.from_message(message) == with_nulls
+    assert converter.get_values(message) == [
+        with_nulls[x] for x in converter.mapping.names
+    ]
+
+    for name, value in with_nulls.items():
+        assert bool(nulls & converter.bits[name]) == (value is None)
+        assert converter.get_value(message, name) == value
+
+
+def test_capnp_reader(flights):
+    converter = get_capnp_converter()
+    read = converter.make_reader(PROJECTED)
+    messages = [make_capnp_message(x) for x in flights]
+
+    assert [read(x) for x in messages] == [
+        {name: x[name] for name in PROJECTED}
+        for x in flights
+    ]
+
+    get_delay = converter.make_getter('ARR_DELAY')
+
+    assert [get_delay(x) for x in messages] == [
+        x['ARR_DELAY'] for x in flights
+    ]
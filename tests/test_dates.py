@@ -0,0 +1,97 @@
+# coding: utf-8
+
+import datetime
+
+import pytest
+
+from schematics.exceptions import DataError
+
+from dates import DATE_FIELDS, make_date_parser, to_typed
+from utils import load_mapped
+from validation import FLIGHT_VALIDATOR
+
+
+def test_parser():
+    parse = make_date_parser(['%Y-%m-%d', '%d.%m.%Y'])
+
+    assert parse('2017-01-05') == datetime.date(2017, 1, 5)
+    assert parse('05.01.2017') == datetime.date(2017, 1, 5)
+
+
+def test_parser_shares_dates():
+    parse = make_date_parser(['%Y-%m-%d'], cache_size=2)
+    first = parse('2017-01-05')
+
+    assert parse('2017-01-05') is first
+    assert parse.cache_info().hits == 1
+
+    parse('2017-01-06')
+    parse('2017-01-07')
+
+    assert parse.cache_info().currsize == 2
+
+
+@pytest.mark.parametrize('value', ['2017-02-30', '05.01.2017', '', 'x'])
+def test_invalid_date(value):
+    parse = make_date_parser(['%Y-%m-%d'])
+
+    with pytest.raises(ValueError) as info:
+        parse(value)
+
+    assert str(info.value) == (
+        "Date '{}' does not match any of formats: %Y-%m-%d".format(value)
+    )
+
+    # Errors are not cached
+    assert parse.cache_info().currsize == 0
+
+
+def test_to_typed():
+    assert DATE_FIELDS == ('FL_DATE', )
+
+    item = {'FL_DATE': '2017-01-05', 'CARRIER': 'WN'}
+    assert to_typed(item) is item
+    assert item == {'FL_DATE': datetime.date(2017, 1, 5), 'CARRIER': 'WN'}
+
+    # Converted and missing dates are left alone
+    assert to_typed(dict(item)) == item
+    assert to_typed({'FL_DATE': None}) == {'FL_DATE': None}
+
+
+def test_load_typed(flights):
+    def iter_load(count):
+        return (dict(x) for x in flights[:count])
+
+    items = load_mapped(to_typed, iter_load, 10)
+
+    assert len(items) == 10
+    assert all(type(x['FL_DATE']) is datetime.date for x in items)
+    assert [x['FL_DATE'].isoformat() for x in items] == [
+        x['FL_DATE'] for x in flights[:10]
+    ]
+
+    # Records of the same day share their date
+    same_day = {}
+
+    for item in load_mapped(to_typed, iter_load, len(flights)):
+        date = same_day.setdefault(item['FL_DATE'], item['FL_DATE'])
+        assert item['FL_DATE'] is date
+
+
+def test_validator_parses_dates(flights):
+    items = FLIGHT_VALIDATOR.validate_many(flights)
+
+    assert items[0]['FL_DATE'] == datetime.date.fromisoformat(
+        flights[0]['FL_DATE']
+    )
+
+
+@pytest.mark.parametrize('value', ['2017-02-30', '2017/01/05'])
+def test_validator_rejects_dates(flights, value):
+    item = dict(flights[0], FL_DATE=value)
+
+    with pytest.raises(DataError) as info:
+        FLIGHT_VALIDATOR.validate(item)
+
+    assert list(info.value.errors) == ['FL_DATE']
+    assert value in str(info.value.errors['FL_DATE'])
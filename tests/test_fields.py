@@ -0,0 +1,51 @@
+# coding: utf-8
+
+from types import SimpleNamespace
+
+import pytest
+
+from fields import (
+    FIELD_NAMES, FieldMapping, check_columns, check_names,
+    get_capnp_mapping, get_protobuf_mapping,
+)
+
+
+def test_mapping():
+    mapping = FieldMapping(['FL_DATE', 'ARR_DELAY'], ['flDate', 'arrDelay'])
+    obj = SimpleNamespace(flDate='2017-01-05', arrDelay=None)
+
+    assert mapping.to_foreign == {'FL_DATE': 'flDate', 'ARR_DELAY': 'arrDelay'}
+    assert mapping.get_fields(obj) == {
+        'FL_DATE': '2017-01-05', 'ARR_DELAY': None,
+    }
+    assert mapping.getters['FL_DATE'](obj) == '2017-01-05'
+
+
+def test_format_mappings():
+    capnp = get_capnp_mapping()
+    protobuf = get_protobuf_mapping()
+
+    assert capnp.names == protobuf.names == FIELD_NAMES
+    assert capnp.to_foreign['ORIGIN_CITY_NAME'] == 'originCityName'
+    assert protobuf.foreign_names == FIELD_NAMES
+    assert get_capnp_mapping() is capnp
+
+
+def test_check_columns():
+    assert check_columns(x for x in ['CARRIER', 'DEST']) == (
+        'CARRIER', 'DEST',
+    )
+
+    with pytest.raises(ValueError) as info:
+        check_columns(['CARRIER', 'carrier', 'DESTINATION'])
+
+    assert str(info.value) == "Unknown columns: carrier, DESTINATION"
+
+
+def test_check_names():
+    check_names(['a', 'b', 'c'], ['a', 'b'], 'stub')
+
+    with pytest.raises(ValueError) as info:
+        check_names(['a'], ['c', 'a', 'b'], 'stub')
+
+    assert str(info.value) == "Fields are missing in stub schema: b, c"
@@ -0,0 +1,55 @@
+# coding: utf-8
+
+import csv
+
+from functools import partial
+
+import pytest
+
+import generate
+
+from schemas import Flight
+from validation import FLIGHT_VALIDATOR
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(
+        generate, 'iter_chunk_sizes',
+        partial(generate.iter_chunk_sizes, chunk_rows=50),
+    )
+
+
+def test_same_seed_gives_same_flights():
+    assert generate.generate_flights(300, seed=5) == \
+        generate.generate_flights(300, seed=5)
+    assert generate.generate_flights(300, seed=5) != \
+        generate.generate_flights(300, seed=6)
+
+
+def test_smaller_datasets_are_prefixes(small_chunks):
+    big = generate.generate_flights(250, seed=3)
+
+    assert generate.generate_flights(120, seed=3) == big[:120]
+
+
+def test_flights_are_valid(flights):
+    assert list(flights[0]) == list(Flight.fields)
+    FLIGHT_VALIDATOR.validate_many(flights)
+
+
+def test_write_csv_does_not_depend_on_workers(tmp_path, small_chunks):
+    single = tmp_path / 'single.csv'
+    parallel = tmp_path / 'parallel.csv.gz'
+
+    generate.write_csv(single, 180, seed=2, max_workers=1)
+    generate.write_csv(parallel, 180, seed=2, max_workers=2)
+
+    with generate.open_file(str(parallel), 'r') as f:
+        assert f.read() == single.read_text()
+
+    with single.open() as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == 180
+    assert list(rows[0]) == list(generate.FIELD_NAMES)
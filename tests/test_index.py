@@ -0,0 +1,114 @@
+# coding: utf-8
+
+import json
+import os
+
+import pytest
+
+import index
+
+from run import (
+    build_json_lines_index, load_avro_fast_indexed, save_avro_fast,
+    save_json_lines, save_msgpack_utf_stream, select_first_date,
+    select_middle, unpack_msgpack_utf,
+)
+
+
+@pytest.fixture
+def lines_path(tmp_path, flights):
+    path = str(tmp_path / 'data.jl')
+    save_json_lines(flights, path, test=False, index=True)
+    yield path
+    index.remove_index(path)
+
+
+def read(path, build, decode, numbers):
+    with index.get_index(path, build) as record_index, open(path, 'rb') as f:
+        return list(record_index.read(f, numbers, decode))
+
+
+def test_record_index_round_trip(lines_path, flights):
+    with index.load_index(lines_path) as record_index:
+        assert isinstance(record_index, index.RecordIndex)
+        assert isinstance(record_index.offsets, index.OffsetArray)
+        assert len(record_index) == len(flights)
+
+    numbers = [0, len(flights) // 2, len(flights) - 1]
+    records = read(lines_path, build_json_lines_index, json.loads, numbers)
+
+    assert records == [flights[x] for x in numbers]
+
+
+def test_record_index_keys(lines_path, flights):
+    date = flights[0]['FL_DATE']
+    expected = [i for i, x in enumerate(flights) if x['FL_DATE'] == date]
+
+    with index.load_index(lines_path) as record_index:
+        assert select_first_date(record_index) == expected
+        assert record_index.find('FL_DATE', date) == expected
+        assert record_index.find('FL_DATE', '1900-01-01') == []
+
+
+def test_keys_are_loaded_once(lines_path):
+    with index.load_index(lines_path) as first:
+        keys = first.keys
+
+    with index.load_index(lines_path) as second:
+        assert second.keys is keys
+
+
+def test_offsets_out_of_range(lines_path, flights):
+    with index.load_index(lines_path) as record_index:
+        with pytest.raises(IndexError):
+            record_index.offsets[len(flights) + 1]
+
+
+def test_stale_index_is_rebuilt(lines_path, flights):
+    save_json_lines(flights[:10], lines_path, test=False)
+    assert index.load_index(lines_path) is None
+
+    records = read(lines_path, build_json_lines_index, json.loads, [9])
+
+    assert records == [flights[9]]
+
+    with index.load_index(lines_path) as record_index:
+        assert len(record_index) == 10
+
+
+def test_missing_keys_invalidate_index(lines_path):
+    os.remove(index.get_keys_path(lines_path))
+    assert index.load_index(lines_path) is None
+
+
+def test_msgpack_index(tmp_path, flights):
+    path = str(tmp_path / 'data.msgpack.utf.stream')
+    save_msgpack_utf_stream(flights, path, test=False, index=True)
+
+    numbers = [len(flights) - 1, 3]
+    records = read(
+        path, index.build_msgpack_index, unpack_msgpack_utf, numbers,
+    )
+
+    assert records == [flights[x] for x in numbers]
+
+
+def test_block_index(tmp_path, flights):
+    path = str(tmp_path / 'data.avro.fast')
+    save_avro_fast(flights, path, test=False, index=True)
+
+    with index.load_index(path) as block_index:
+        assert isinstance(block_index, index.BlockIndex)
+        assert len(block_index) == len(flights)
+        assert block_index.locate(0) == (0, 0)
+
+        with pytest.raises(IndexError):
+            block_index.locate(len(flights))
+
+    assert load_avro_fast_indexed(path, select_middle) == [
+        flights[len(flights) // 2],
+    ]
+
+    date = flights[-1]['FL_DATE']
+    assert load_avro_fast_indexed(
+        path, lambda x: x.find('FL_DATE', date),
+    ) == [x for x in flights if x['FL_DATE'] == date]
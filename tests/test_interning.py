@@ -0,0 +1,47 @@
+# coding: utf-8
+
+from interning import (
+    INTERNED_FIELDS, Interner, get_memory_saved, get_strings_size,
+)
+from utils import load_mapped
+
+
+def copy_strings(flights):
+    # Decoders make a new string for every value, copies stand for them
+    return [
+        {
+            key: ''.join(list(value)) if type(value) is str else value
+            for key, value in item.items()
+        }
+        for item in flights
+    ]
+
+
+def test_intern(flights):
+    items = copy_strings(flights)
+    interner = Interner()
+    interned = list(interner.intern_all(items))
+
+    assert interned == flights
+    assert len(interner) == len({
+        (name, x[name])
+        for x in flights
+        for name in INTERNED_FIELDS
+        if x[name] is not None
+    })
+
+    # Equal values are a single object
+    assert len({id(x['CARRIER']) for x in interned}) == len({
+        x['CARRIER'] for x in interned
+    })
+
+
+def test_load_interned(flights):
+    def iter_load(count):
+        return iter(copy_strings(flights[:count]))
+
+    items = load_mapped(Interner().intern, iter_load, 50)
+
+    assert items == flights[:50]
+    assert get_strings_size(items) < get_strings_size(iter_load(50))
+    assert get_memory_saved(iter_load, 50) > 0
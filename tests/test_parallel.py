@@ -0,0 +1,108 @@
+# coding: utf-8
+
+import csv
+import json
+import os
+
+import pytest
+
+import parallel
+
+
+@pytest.fixture
+def json_lines(tmp_path):
+    items = [{'id': i, 'name': 'flight {}'.format(i)} for i in range(100)]
+    path = tmp_path / 'data.jl'
+
+    with open(path, 'w') as f:
+        for item in items:
+            f.write(json.dumps(item) + '\n')
+
+    return str(path), items
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    items = [{'id': str(i), 'name': 'flight {}'.format(i)} for i in range(100)]
+    path = tmp_path / 'data.csv'
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, ['id', 'name'])
+        writer.writeheader()
+        writer.writerows(items)
+
+    return str(path), items
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    yield
+    parallel.stop_pool()
+
+
+def test_split_ranges_cover_file(json_lines):
+    path, _ = json_lines
+    ranges = parallel.split_ranges(path, 7)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == os.path.getsize(path)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    assert all(data[end - 1:end] == b'\n' for _, end in ranges)
+
+
+def test_ordered(json_lines):
+    path, items = json_lines
+    result = parallel.load_parallel(
+        parallel.parse_json_lines, path, chunks=9,
+    )
+
+    assert result == items
+
+
+def test_unordered(json_lines):
+    path, items = json_lines
+    result = parallel.load_parallel(
+        parallel.parse_json_lines, path, ordered=False, chunks=9,
+    )
+
+    assert sorted(result, key=lambda x: x['id']) == items
+
+
+def test_header(csv_file):
+    path, items = csv_file
+    result = parallel.load_parallel(
+        parallel.parse_csv, path, header=True, chunks=5,
+    )
+
+    assert result == items
+
+
+def test_pool_reused(json_lines):
+    path, _ = json_lines
+    parallel.load_parallel(parallel.parse_json_lines, path, max_workers=1)
+    pool = parallel.POOL
+    parallel.load_parallel(parallel.parse_json_lines, path, max_workers=1)
+
+    assert parallel.POOL is pool
+
+    parallel.load_parallel(parallel.parse_json_lines, path, max_workers=2)
+
+    assert parallel.POOL is not pool
+    assert parallel.POOL_WORKERS == 2
+
+
+def test_consumer_bounds_pending(json_lines):
+    path, items = json_lines
+    records = parallel.iter_parallel(
+        parallel.parse_json_lines, path, max_workers=1, chunks=20,
+    )
+
+    assert next(records) == items[0]
+    assert len(parallel.POOL._pending_work_items) <= (
+        parallel.PENDING_PER_WORKER
+    )
+    records.close()
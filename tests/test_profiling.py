@@ -0,0 +1,101 @@
+# coding: utf-8
+
+import os
+import pstats
+
+from types import SimpleNamespace
+
+import profiling
+
+from registry import Benchmark
+from utils import with_measurements
+
+
+def spin(count=10000):
+    total = 0
+
+    for i in range(count):
+        total += i * i
+
+    return total
+
+
+def get_calls(stats, name):
+    return sum(
+        calls
+        for (_, _, function), (_, calls, _, _, _) in stats.stats.items()
+        if function == name
+    )
+
+
+def test_merge_profile(tmp_path):
+    codec = SimpleNamespace(name='stub')
+    benchmark = Benchmark('spin', spin, False)
+    path = profiling.get_profile_path(tmp_path, codec, benchmark)
+
+    assert path == tmp_path / 'stub.spin.pstats'
+
+    for i in range(2):
+        profiler = profiling.start_profile()
+        spin()
+        profiler.disable()
+        profiling.dump_profile(profiler, path)
+
+    # Measured runs dump their parts the same way
+    with_measurements(spin, profile=path)
+
+    assert len(profiling.get_part_paths(path)) == 3
+
+    stats = profiling.merge_profile(path)
+
+    assert profiling.get_part_paths(path) == []
+    assert get_calls(stats, 'spin') == 3
+    assert get_calls(pstats.Stats(str(path)), 'spin') == 3
+
+    hotspots = profiling.format_hotspots(stats, limit=1).splitlines()
+
+    assert len(hotspots) == 1
+    assert hotspots[0].endswith('tests/test_profiling.py:14(spin)')
+
+
+def test_merge_without_parts(tmp_path):
+    path = tmp_path / 'stub.spin.pstats'
+
+    assert profiling.merge_profile(path) is None
+    assert not path.exists()
+
+
+def test_remove_parts(tmp_path):
+    path = tmp_path / 'stub.spin.pstats'
+    other = tmp_path / 'stub.spin_gzip.pstats'
+
+    for x in (path, other):
+        profiler = profiling.start_profile()
+        profiler.disable()
+        profiling.dump_profile(profiler, x)
+
+    profiling.remove_parts(path)
+
+    assert profiling.get_part_paths(path) == []
+    assert len(profiling.get_part_paths(other)) == 1
+
+
+def test_hotspots_are_sorted_by_own_time(tmp_path):
+    profiler = profiling.start_profile()
+    sum(spin() for i in range(10))
+    profiler.disable()
+    path = str(tmp_path / 'stub.pstats')
+    profiler.dump_stats(path)
+    stats = pstats.Stats(path)
+
+    hotspots = profiling.get_hotspots(stats)
+    own_times = [x[2] for x in hotspots]
+
+    assert own_times == sorted(own_times, reverse=True)
+    assert hotspots[0][0][2] == 'spin'
+    assert profiling.format_function(
+        ('~', 0, "<built-in method builtins.sum>"),
+    ) == "<built-in method builtins.sum>"
+    assert profiling.format_function(
+        (os.path.join('a', 'b', 'c.py'), 3, 'f'),
+    ) == os.path.join('b', 'c.py') + ':3(f)'
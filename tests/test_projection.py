@@ -0,0 +1,35 @@
+# coding: utf-8
+
+import pytest
+
+from run import PROJECTED_FIELDS, iter_csv, save_csv
+
+
+@pytest.fixture
+def csv_path(tmp_path, flights):
+    path = str(tmp_path / 'data.csv')
+    save_csv(flights, path, test=False)
+    return path
+
+
+def test_csv_columns(csv_path, flights):
+    items = list(iter_csv(csv_path, columns=PROJECTED_FIELDS))
+    full = list(iter_csv(csv_path))
+
+    assert len(items) == len(flights)
+    assert items == [
+        {name: x[name] for name in PROJECTED_FIELDS}
+        for x in full
+    ]
+
+
+def test_csv_columns_from_generator(csv_path):
+    items = list(iter_csv(csv_path, columns=(x for x in PROJECTED_FIELDS)))
+
+    assert items
+    assert all(tuple(x) == PROJECTED_FIELDS for x in items)
+
+
+def test_csv_unknown_columns(csv_path):
+    with pytest.raises(ValueError):
+        list(iter_csv(csv_path, columns=['CARRIER', 'unknown']))
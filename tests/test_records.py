@@ -0,0 +1,54 @@
+# coding: utf-8
+
+import csv
+import io
+
+from fields import FIELD_NAMES
+from records import FlightRecord, get_containers_size
+from utils import load_mapped
+
+
+def test_fields():
+    assert FlightRecord._fields == FIELD_NAMES
+    assert FlightRecord.__name__ == 'FlightRecord'
+    assert not hasattr(FlightRecord(*FIELD_NAMES), '__dict__')
+
+
+def test_dict_round_trip(flights):
+    records = [FlightRecord.from_dict(x) for x in flights]
+
+    assert [x.to_dict() for x in records] == flights
+    assert records[0].CARRIER == flights[0]['CARRIER']
+    assert get_containers_size(records) < get_containers_size(flights)
+
+
+def test_missing_fields():
+    record = FlightRecord.from_dict({'CARRIER': 'WN'})
+
+    assert record.CARRIER == 'WN'
+    assert record.FL_DATE is None
+
+
+def test_row_reader(flights):
+    f = io.StringIO()
+    header = list(reversed(FIELD_NAMES))
+    writer = csv.DictWriter(f, header)
+    writer.writeheader()
+    writer.writerows(flights)
+    f.seek(0)
+
+    reader = csv.reader(f)
+    read = FlightRecord.make_row_reader(next(reader))
+    records = [read(x) for x in reader]
+
+    assert len(records) == len(flights)
+
+    for record, item in zip(records, flights):
+        assert record.FL_DATE == item['FL_DATE']
+        assert (record.ARR_DELAY is None) == (item['ARR_DELAY'] is None)
+
+
+def test_load_records(flights):
+    assert load_mapped(FlightRecord.from_dict, iter, flights) == [
+        FlightRecord.from_dict(x) for x in flights
+    ]
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+import datetime
+import pickle
+
+import pytest
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from records import FlightRecord
+from registry import CODECS, get_codecs, register
+
+
+def test_get_codecs():
+    assert get_codecs() == list(CODECS.values())
+    assert get_codecs(['json', 'csv']) == [CODECS['json'], CODECS['csv']]
+
+    with pytest.raises(ValueError):
+        get_codecs(['csv', 'unknown'])
+
+
+def test_register_twice():
+    with pytest.raises(ValueError):
+        register('csv', CODECS['csv'].save)
+
+
+def test_default_file_names():
+    for codec in CODECS.values():
+        assert codec.file_name.startswith('data.'), codec
+
+
+def test_benchmark_names_are_unique():
+    for codec in CODECS.values():
+        names = [
+            x.name
+            for x in codec.benchmarks(intern=True, records=True, typed=True)
+        ]
+        assert len(names) == len(set(names)), codec
+
+
+def test_partial_benchmarks():
+    benchmarks = {
+        x.name: x
+        for codec in CODECS.values()
+        for x in codec.benchmarks()
+    }
+
+    assert benchmarks['load_csv'].whole_file
+    assert not benchmarks['load_fastavro_schema'].whole_file
+    assert not benchmarks['load_csv_projected'].whole_file
+    assert not benchmarks['load_avro_fast_by_date'].whole_file
+    assert not benchmarks['load_capnp_delays'].whole_file
+
+
+def test_compressed():
+    codec = CODECS['json_lines'].compressed('gzip')
+
+    assert codec.name == 'json_lines_gzip'
+    assert codec.base is CODECS['json_lines']
+    assert codec.file_name == 'data.jl.gz'
+    assert codec.streaming
+    assert codec.load.__name__ == 'load_json_lines_gzip'
+
+    with pytest.raises(ValueError):
+        CODECS['capnp'].compressed('gzip')
+
+
+def test_mapped_benchmarks(tmp_path, flights):
+    codec = CODECS['json_lines']
+    path = str(tmp_path / 'data.jl')
+    codec.save(flights, file_name=path, test=False)
+    benchmarks = {
+        x.name: x
+        for x in codec.benchmarks(intern=True, records=True, typed=True)
+    }
+
+    interned = benchmarks['iter_json_lines_interned']
+    records = benchmarks['iter_json_lines_records']
+    typed = benchmarks['iter_json_lines_typed']
+
+    assert interned.interned
+    assert not records.interned and not typed.interned
+
+    # Benchmarks are sent to workers
+    load = pickle.loads(pickle.dumps(interned.fn))
+
+    assert load(path) == flights
+    assert records.fn(path) == [FlightRecord.from_dict(x) for x in flights]
+    assert type(typed.fn(path)[0]['FL_DATE']) is datetime.date
@@ -0,0 +1,66 @@
+# coding: utf-8
+
+import pytest
+
+import report
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from registry import Benchmark, CODECS
+from utils import Measurement, summarize
+
+
+@pytest.fixture
+def summary():
+    return summarize([
+        Measurement(time, 0, 0, None, 0)
+        for time in (0.5, 0.4, 0.6)
+    ])
+
+
+def test_make_result(summary):
+    codec = CODECS['csv']
+    benchmark = Benchmark('load_csv', codec.load, False)
+
+    result = report.make_result(
+        codec, benchmark, summary, 1000,
+        file_size=10 ** 6, raw_size=4 * 10 ** 6,
+    )
+
+    assert result['time_median'] == 0.5
+    assert result['records_per_second'] == 2000
+    assert result['mb_per_second'] == 2
+    assert result['compression_ratio'] == 4
+    assert report.format_result(result).startswith('load_csv ')
+
+
+def test_make_result_of_part(summary):
+    codec = CODECS['json_lines']
+    benchmark = next(
+        x for x in codec.benchmarks() if x.name == 'load_json_lines_record'
+    )
+
+    result = report.make_result(codec, benchmark, summary, 1000, 10 ** 6)
+
+    assert not benchmark.whole_file
+    assert result['records_per_second'] is None
+    assert result['mb_per_second'] is None
+    assert 'rec/s' not in report.format_result(result)
+
+
+@pytest.mark.parametrize('file_name', ['results.json', 'results.csv'])
+def test_write_results(tmp_path, summary, file_name):
+    codec = CODECS['csv']
+    benchmark = Benchmark('load_csv', codec.load, False)
+    result = report.make_result(codec, benchmark, summary, 1000)
+    path = tmp_path / file_name
+
+    report.write_results(str(path), [result], report.get_meta(cycles=3))
+
+    assert 'load_csv' in path.read_text()
+
+
+def test_write_results_of_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        report.write_results(str(tmp_path / 'results.txt'), [])
@@ -0,0 +1,157 @@
+# coding: utf-8
+
+from types import SimpleNamespace
+
+import pytest
+
+import scaling
+
+from registry import Benchmark
+
+
+CODEC = SimpleNamespace(name='stub')
+BENCHMARK = Benchmark('load_stub', None, False)
+ROWS = (1000, 10000, 100000)
+
+
+def get_rows_results(time_exponent, memory_exponent=1.0):
+    return [
+        scaling.make_scaling_result(
+            CODEC, BENCHMARK, 'rows', rows, 1,
+            10 ** -6 * rows ** time_exponent, 0,
+            traced_peak=100 * rows ** memory_exponent,
+        )
+        for rows in ROWS
+    ]
+
+
+def get_workers_results(points, rows=1000):
+    """
+    Make results of a sweep of workers from `(workers, wall time, time of a
+    single run)` tuples.
+
+    """
+    results = []
+    baseline = None
+
+    for workers, wall_time, time_median in points:
+        throughput = workers / wall_time
+
+        if baseline is None:
+            baseline = throughput / workers
+
+        results.append(scaling.make_scaling_result(
+            CODEC, BENCHMARK, 'workers', rows, workers, time_median, 0,
+            wall_time=wall_time, speedup=throughput / baseline,
+        ))
+
+    return results
+
+
+def get_flags(results):
+    [(codec, benchmark, notes, flags)] = scaling.analyze(results)
+    assert (codec, benchmark) == ('stub', 'load_stub')
+    return flags
+
+
+@pytest.mark.parametrize('exponent', [0.5, 1.0, 2.0])
+def test_exponent(exponent):
+    xs = [10, 100, 1000]
+
+    assert scaling.get_exponent(
+        xs, [3 * x ** exponent for x in xs],
+    ) == pytest.approx(exponent)
+
+
+def test_exponent_of_too_few_points():
+    assert scaling.get_exponent([10, 0, 100], [1, 2, 0]) is None
+    assert scaling.get_exponent([10, 10], [1, 2]) is None
+
+
+def test_default_workers(monkeypatch):
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 6)
+    assert scaling.get_default_workers() == [1, 2, 4, 6]
+
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 8)
+    assert scaling.get_default_workers() == [1, 2, 4, 8]
+
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 1)
+    assert scaling.get_default_workers() == [1]
+
+
+def test_make_scaling_result():
+    result = scaling.make_scaling_result(
+        CODEC, BENCHMARK, 'workers', 1000, 4, 0.5, 0,
+        traced_peak=2000, wall_time=1.0, speedup=3.0,
+    )
+
+    assert result['time_per_row'] == 0.0005
+    assert result['records_per_second'] == 4000
+    assert result['efficiency'] == 0.75
+    assert result['traced_peak_per_row'] == 2
+    assert 'speedup 3.00 (75%)' in scaling.format_scaling_result(result)
+
+
+def test_linear_growth():
+    assert get_flags(get_rows_results(1.0)) == []
+
+
+def test_superlinear_growth():
+    assert get_flags(get_rows_results(1.3)) == [
+        "time grows super-linearly with rows",
+    ]
+    assert get_flags(get_rows_results(1.0, 1.3)) == [
+        "memory grows super-linearly with rows",
+    ]
+
+
+def test_threshold_leaves_room_for_noise():
+    exponent = scaling.SUPERLINEAR_EXPONENT - 0.05
+    assert get_flags(get_rows_results(exponent, exponent)) == []
+
+
+def test_scaling_with_workers(monkeypatch):
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 4)
+
+    # Wall time stays the same while workers do 4 times more work
+    assert get_flags(get_workers_results([
+        (1, 1.0, 1.0), (2, 1.0, 1.0), (4, 1.05, 1.0),
+    ])) == []
+
+
+def test_too_many_workers(monkeypatch):
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 2)
+
+    [flag] = get_flags(get_workers_results([
+        (1, 1.0, 1.0), (2, 1.0, 1.0), (4, 2.0, 1.0),
+    ]))
+
+    assert flag == (
+        "stops scaling after 2 workers: there are only 2 CPUs"
+    )
+
+
+def test_contention(monkeypatch):
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 4)
+
+    # Every run takes twice as long when 4 of them run at once
+    [flag] = get_flags(get_workers_results([
+        (1, 1.0, 1.0), (2, 1.1, 1.1), (4, 2.0, 2.0),
+    ]))
+
+    assert flag.startswith("stops scaling after 2 workers: a single run is")
+    assert "x2.00 slower" in flag
+
+
+def test_no_overlap(monkeypatch):
+    monkeypatch.setattr(scaling, 'get_cpu_count', lambda: 4)
+
+    # Runs take as long as alone, but they run one after another
+    [flag] = get_flags(get_workers_results([
+        (1, 1.0, 1.0), (2, 2.0, 1.0), (4, 4.0, 1.0),
+    ]))
+
+    assert flag == (
+        "stops scaling after 1 workers: runs do not overlap, fewer CPUs "
+        "are free"
+    )
@@ -0,0 +1,50 @@
+# coding: utf-8
+
+import pytest
+
+import schema_cache
+
+from run import load_capnp, save_capnp
+
+
+@pytest.mark.parametrize('get', [
+    schema_cache.get_avro_schema,
+    schema_cache.get_fastavro_schema,
+    schema_cache.get_capnp_schemas,
+    schema_cache.get_protobuf_descriptor,
+    schema_cache.get_protobuf_field_names,
+])
+def test_parsed_once(get):
+    assert get() is get()
+
+
+def test_projection_parsed_once():
+    columns = ('CARRIER', 'ARR_DELAY')
+    projection = schema_cache.get_fastavro_projection(columns)
+
+    assert schema_cache.get_fastavro_projection(columns) is projection
+    assert [x['name'] for x in projection['fields']] == list(columns)
+
+
+@pytest.mark.parametrize('load, get', [
+    (schema_cache.load_avro_schema, schema_cache.get_avro_schema),
+    (schema_cache.load_fastavro_schema, schema_cache.get_fastavro_schema),
+    (schema_cache.load_capnp_schemas, schema_cache.get_capnp_schemas),
+])
+def test_load_schema_parses_again(load, get):
+    cached = get()
+    loaded = load()
+
+    assert loaded is not cached
+
+    # Later calls get the new schema from the cache
+    assert get() is loaded
+
+
+def test_codec_after_reload(tmp_path, flights):
+    path = str(tmp_path / 'data.capnp')
+    schema_cache.load_capnp_schemas()
+    save_capnp(flights, path, test=False)
+    schema_cache.load_capnp_schemas()
+
+    assert len(load_capnp(path)) == len(flights)
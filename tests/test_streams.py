@@ -0,0 +1,30 @@
+# coding: utf-8
+
+import pytest
+
+from run import (
+    iter_capnp_stream, iter_protobuf_stream, save_capnp_stream,
+    save_protobuf_stream,
+)
+
+
+@pytest.mark.parametrize('save, iter_load', [
+    (save_protobuf_stream, iter_protobuf_stream),
+    (save_capnp_stream, iter_capnp_stream),
+])
+def test_round_trip(tmp_path, flights, save, iter_load):
+    path = str(tmp_path / 'data.stream')
+
+    # Writers take any iterable, not just lists
+    save(iter(flights), path, test=False, flush_size=1024)
+
+    assert list(iter_load(path)) == flights
+
+
+def test_truncated_protobuf_stream(tmp_path, flights):
+    path = tmp_path / 'data.proto.stream'
+    save_protobuf_stream(flights, str(path), test=False)
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(EOFError):
+        list(iter_protobuf_stream(str(path)))
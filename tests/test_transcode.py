@@ -0,0 +1,116 @@
+# coding: utf-8
+
+import pytest
+
+import transcode
+
+from registry import CODECS
+from run import load_json_lines
+
+
+@pytest.mark.parametrize('source_name', list(CODECS))
+def test_transcode_file(tmp_path, flights, source_name):
+    source = CODECS[source_name]
+    input_path = tmp_path / source.file_name
+    output_path = tmp_path / 'output.jl'
+    source.save(flights, file_name=str(input_path), test=False)
+
+    count, _, _ = transcode.transcode_file(
+        source_name, 'json_lines', str(input_path), str(output_path),
+    )
+
+    assert count == len(flights)
+    assert load_json_lines(str(output_path)) == flights
+
+
+def test_transcode_file_from_text(tmp_path, flights):
+    # Numbers read from CSV as strings are converted for binary formats
+    input_path = tmp_path / 'input.csv'
+    output_path = tmp_path / 'output.avro.fast'
+    CODECS['csv'].save(flights, file_name=str(input_path), test=False)
+
+    transcode.transcode_file(
+        'csv', 'avro_fast', str(input_path), str(output_path),
+    )
+
+    assert CODECS['avro_fast'].load(file_name=str(output_path)) == flights
+
+
+def test_get_output_path():
+    source = CODECS['csv']
+    target = CODECS['avro_fast']
+
+    assert transcode.get_output_path(
+        'drops/2017-01-05.csv.gz', source, target,
+    ).as_posix() == 'drops/2017-01-05.avro'
+    assert transcode.get_output_path(
+        'drops/2017-01-05.csv', source, target, 'out', 'xz',
+    ).as_posix() == 'out/2017-01-05.avro.xz'
+
+
+@pytest.mark.parametrize('source_name', ['csv_pandas', 'csv_quote_nonnumeric'])
+def test_get_output_path_of_variants(source_name):
+    source = CODECS[source_name]
+    stream = CODECS['protobuf_stream']
+    csv = CODECS['csv']
+
+    output_path = transcode.get_output_path('a.csv', source, stream)
+
+    assert output_path.as_posix() == 'a.proto.stream'
+    assert transcode.get_output_path(
+        output_path, stream, csv,
+    ).as_posix() == 'a.csv'
+
+    # Default files of variants are recognized too
+    assert transcode.get_output_path(
+        source.file_name, source, stream,
+    ).as_posix() == 'data.proto.stream'
+
+
+def test_transcode_variant_file_names(tmp_path, flights):
+    input_path = tmp_path / 'a.csv'
+    CODECS['csv'].save(flights, file_name=str(input_path), test=False)
+
+    assert transcode.transcode(
+        'csv_pandas', 'protobuf_stream', [str(input_path)], max_workers=1,
+    ) == 0
+    assert transcode.transcode(
+        'protobuf_stream', 'json_lines', [str(tmp_path / 'a.proto.stream')],
+        max_workers=1,
+    ) == 0
+    assert load_json_lines(str(tmp_path / 'a.jl')) == flights
+
+
+def test_transcode_refuses_to_overwrite_input(tmp_path):
+    with pytest.raises(ValueError):
+        transcode.transcode(
+            'json_lines', 'json_lines', [str(tmp_path / 'data.jl')],
+            max_workers=1,
+        )
+
+
+def test_transcode_counts_failures(tmp_path, flights, capsys):
+    input_path = tmp_path / 'data.csv'
+    CODECS['csv'].save(flights, file_name=str(input_path), test=False)
+
+    failures = transcode.transcode(
+        'csv', 'json_lines', [str(input_path), str(tmp_path / 'missing.csv')],
+        max_workers=1,
+    )
+
+    assert failures == 1
+    assert 'failed' in capsys.readouterr().out
+
+
+def test_transcode_relative_paths(tmp_path, flights, monkeypatch):
+    # Relative paths are relative to the working directory, not to the
+    # directory of data files
+    monkeypatch.chdir(tmp_path)
+    CODECS['csv'].save(flights, file_name=str(tmp_path / 'a.csv'), test=False)
+
+    failures = transcode.transcode(
+        'csv', 'json_lines', ['a.csv'], output_dir='out', max_workers=1,
+    )
+
+    assert failures == 0
+    assert load_json_lines(str(tmp_path / 'out' / 'a.jl')) == flights
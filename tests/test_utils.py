@@ -0,0 +1,138 @@
+# coding: utf-8
+
+import io
+import json
+import os
+
+import pytest
+
+import utils
+
+
+def get_pid():
+    return os.getpid()
+
+
+@pytest.fixture
+def pool():
+    yield utils.start_pool([{'a': 1}], max_workers=2)
+    utils.stop_pool()
+
+
+def test_measure(pool):
+    summary = utils.measure(3, len, warmup=1, use_dataset=True)
+
+    assert summary.cycles == 3
+    assert summary.time_min <= summary.time_median <= summary.time_p95
+
+
+def test_measure_in_fresh_processes(pool):
+    summary = utils.measure(2, len, use_dataset=True, fresh=True, trace=True)
+
+    assert summary.cycles == 2
+    assert summary.traced_peak is not None
+
+
+def test_measure_without_cycles(pool):
+    with pytest.raises(ValueError):
+        utils.measure(0, len, use_dataset=True)
+
+
+def test_warmup_runs_on_every_worker(pool, monkeypatch):
+    counts = []
+    run_cycles = utils.run_cycles
+
+    def count_cycles(cycles, *args, **kwargs):
+        counts.append(cycles)
+        return run_cycles(cycles, *args, **kwargs)
+
+    monkeypatch.setattr(utils, 'run_cycles', count_cycles)
+    utils.measure(1, get_pid, warmup=3)
+
+    assert counts == [6, 1]
+
+
+def test_pool_is_reused(pool):
+    utils.measure(2, get_pid)
+    utils.measure(2, get_pid)
+
+    assert utils.POOL is pool
+
+
+def test_percentile():
+    values = [3, 1, 2, 4]
+
+    assert utils.percentile(values, 0) == 1
+    assert utils.percentile(values, 50) == 2.5
+    assert utils.percentile(values, 100) == 4
+
+
+def test_count_outliers():
+    assert utils.count_outliers([1, 2, 2, 3, 100]) == 1
+    assert utils.count_outliers([1, 1, 1]) == 0
+
+
+def make_objects(count):
+    return [object() for _ in range(count)]
+
+
+def drop_objects(count):
+    make_objects(count)
+
+
+def test_retained_blocks():
+    kept = utils.with_measurements(make_objects, 10000)
+    dropped = utils.with_measurements(drop_objects, 10000)
+
+    assert kept.retained_blocks >= 10000
+    assert abs(dropped.retained_blocks) < 1000
+
+
+def test_consume():
+    assert utils.consume(iter, range(5)) == 5
+    assert utils.consume(iter, []) == 0
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 2 ** 16])
+def test_iter_json_array(chunk_size):
+    items = [{'a': 1, 'b': 'c, ]'}, [2, {}], 'd', None]
+    f = io.StringIO(json.dumps(items, indent=2))
+
+    assert list(utils.iter_json_array(f, chunk_size)) == items
+
+
+def test_iter_json_array_empty():
+    assert list(utils.iter_json_array(io.StringIO('[ ]'))) == []
+
+
+def test_iter_json_array_invalid():
+    with pytest.raises(ValueError):
+        list(utils.iter_json_array(io.StringIO('{}')))
+
+    with pytest.raises(ValueError):
+        list(utils.iter_json_array(io.StringIO('[{"a": 1}, {"b"')))
+
+
+@pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 2 ** 32, 2 ** 63])
+def test_varint_round_trip(value):
+    f = io.BytesIO(utils.encode_varint(value) + b'rest')
+
+    assert utils.read_varint(f) == value
+    assert f.read() == b'rest'
+
+
+def test_varint_end_of_file():
+    assert utils.read_varint(io.BytesIO()) is None
+
+    with pytest.raises(EOFError):
+        utils.read_varint(io.BytesIO(utils.encode_varint(300)[:1]))
+
+
+def test_length_delimited():
+    messages = [b'', b'a', b'b' * 200]
+    data = b''.join(utils.encode_varint(len(x)) + x for x in messages)
+
+    assert list(utils.iter_length_delimited(io.BytesIO(data))) == messages
+
+    with pytest.raises(EOFError):
+        list(utils.iter_length_delimited(io.BytesIO(data[:-1])))
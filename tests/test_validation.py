@@ -0,0 +1,81 @@
+# coding: utf-8
+
+import pytest
+
+from schematics.exceptions import DataError
+
+from columnar import FlightBatch
+from schemas import Flight
+from utils import validate, validate_batch
+from validation import FLIGHT_VALIDATOR
+
+
+def schematics_errors(item):
+    try:
+        Flight(item).validate()
+    except DataError as e:
+        return set(e.errors)
+
+    return set()
+
+
+def validator_errors(item):
+    try:
+        FLIGHT_VALIDATOR.validate(item)
+    except DataError as e:
+        return set(e.errors)
+
+    return set()
+
+
+@pytest.mark.parametrize('changes', [
+    {},
+    {'FL_NUM': '12'},
+    {'FL_NUM': 'twelve'},
+    {'FL_NUM': 1.5},
+    {'DEP_DELAY': 'late'},
+    {'FL_DATE': '2017-13-01'},
+    {'CARRIER': 7},
+    {'ROGUE': 1},
+])
+def test_same_errors_as_schematics(flights, changes):
+    item = dict(flights[0], **changes)
+
+    assert validator_errors(item) == schematics_errors(item)
+
+
+def test_validate_converts(flights):
+    item = dict(flights[0], FL_NUM='12', DEP_DELAY='1.5')
+    result = FLIGHT_VALIDATOR.validate(item)
+
+    assert result['FL_NUM'] == 12
+    assert result['DEP_DELAY'] == 1.5
+
+
+def test_validate_many(flights):
+    validate(flights)
+
+    items = list(flights[:5])
+    items[1] = dict(items[1], FL_NUM='x')
+    items[3] = dict(items[3], DISTANCE='far')
+
+    with pytest.raises(DataError) as info:
+        FLIGHT_VALIDATOR.validate_many(items)
+
+    assert set(info.value.errors) == {1, 3}
+
+
+def test_validate_columns(flights):
+    batch = FlightBatch.from_records(flights)
+    validate_batch(batch)
+
+    columns = batch.to_columns()
+    columns['FL_NUM'][2] = 'x'
+
+    with pytest.raises(DataError) as info:
+        FLIGHT_VALIDATOR.validate_columns(columns)
+
+    assert set(info.value.errors) == {2}
+
+    with pytest.raises(DataError):
+        FLIGHT_VALIDATOR.validate_columns({'ROGUE': [1]})
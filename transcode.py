@@ -0,0 +1,365 @@
+#! /usr/bin/env python
+# coding: utf-8
+
+# Conversion of flight files between registered codecs. Records are
+# streamed from the reader of the source codec to the writer of the target
+# one, so memory use does not grow with the size of a file when both codecs
+# stream. Sharded inputs, e.g. daily drops, are converted in parallel by
+# worker processes, one file per task.
+#
+#     ./transcode.py csv avro_fast drops/*.csv -o converted/ -j 4
+
+import argparse
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import psutil
+
+from schematics.types import FloatType, IntType
+
+# Codecs are registered along with benchmarks
+import run  # noqa: F401
+
+from compression import COMPRESSIONS, get_available, get_compression
+from registry import CODECS, get_extension
+from schemas import Flight
+from utils import format_rss, format_time, get_peak_rss
+from validation import make_float_converter, make_int_converter
+
+
+NUMERIC_CONVERTER_FACTORIES = {
+    IntType: make_int_converter,
+    FloatType: make_float_converter,
+}
+
+
+def make_coercer(model=Flight):
+    """
+    Make function converting values of numeric fields of a record to their
+    types in place, e.g. strings decoded from CSV. Binary formats need
+    numbers, while text ones get them formatted back, so records of any
+    reader suit any writer.
+
+    Dates are left alone, all formats store them as text. NaN stands for
+    null in records read by pandas, it is replaced by `None`.
+
+    """
+    converters = [
+        (name, NUMERIC_CONVERTER_FACTORIES[type(field)](field))
+        for name, field in model.fields.items()
+        if type(field) in NUMERIC_CONVERTER_FACTORIES
+    ]
+
+    def coerce(item):
+        for name, convert in converters:
+            value = item.get(name)
+
+            if value is None:
+                continue
+
+            if value != value:
+                item[name] = None
+            else:
+                item[name] = convert(value)
+
+        return item
+
+    return coerce
+
+
+class Counter:
+    """
+    Iterator passing records through while counting them.
+
+    """
+
+    def __init__(self, items):
+        self.items = iter(items)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self.items)
+        self.count += 1
+        return item
+
+
+def get_output_path(path, source, target, output_dir=None, compression=None):
+    """
+    Get path of the file `path` encoded by codec `source` is converted to:
+    extension of `source` is replaced by extension of `target`, e.g.
+    converting `2017-01-05.csv.gz` from 'csv' to 'avro_fast' gives
+    `2017-01-05.avro`.
+
+    """
+    path = Path(path)
+    name = path.name
+    input_compression = get_compression(name)
+
+    if input_compression is not None:
+        compression_suffix = COMPRESSIONS[input_compression]
+
+        if name.endswith(compression_suffix):
+            name = name[:-len(compression_suffix)]
+
+    # Default files of variants of a format have a suffix of their own,
+    # e.g. `data.csv.pandas`, so it is stripped too
+    for suffix in (get_extension(source.file_name), source.extension):
+        if name.endswith(suffix) and name != suffix:
+            name = name[:-len(suffix)]
+            break
+
+    name += target.extension
+
+    if compression is not None:
+        name += COMPRESSIONS[compression]
+
+    if output_dir is None:
+        output_dir = path.parent
+
+    return Path(output_dir) / name
+
+
+def iter_records(codec, path):
+    if codec.load_dicts is not None:
+        return iter(codec.load_dicts(file_name=str(path)))
+
+    if codec.iter_load is not None:
+        return codec.iter_load(file_name=str(path))
+
+    # Formats without streaming decoder are read whole
+    return iter(codec.load(file_name=str(path)))
+
+
+def transcode_file(source_name, target_name, input_path, output_path):
+    """
+    Convert file `input_path` encoded by codec `source_name` to file
+    `output_path` encoded by codec `target_name`. Return number of records,
+    time it took and peak RSS of the process.
+
+    """
+    source = CODECS[source_name]
+    target = CODECS[target_name]
+    coerce = make_coercer()
+
+    time_start = time.monotonic()
+    records = Counter(map(coerce, iter_records(source, input_path)))
+
+    if target.streaming:
+        target.save(records, file_name=str(output_path), test=False)
+    else:
+        target.save(list(records), file_name=str(output_path), test=False)
+
+    return records.count, time.monotonic() - time_start, get_peak_rss()
+
+
+def format_speed(records, elapsed):
+    if elapsed <= 0:
+        return "{} records".format(records)
+
+    return "{} records in {}, {:.0f} rec/s".format(
+        records, format_time(elapsed), records / elapsed,
+    )
+
+
+def iter_transcoded(tasks, max_workers):
+    """
+    Run `transcode_file()` for every tuple of its arguments in `tasks` and
+    iterate over `(task, result)` in order of completion. Result is an
+    exception if the task failed.
+
+    """
+    if max_workers == 1:
+        for task in tasks:
+            try:
+                yield task, transcode_file(*task)
+            except Exception as e:
+                yield task, e
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(transcode_file, *task): task
+            for task in tasks
+        }
+
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except Exception as e:
+                yield futures[future], e
+
+
+def transcode(
+    source_name, target_name, paths, output_dir=None, compression=None,
+    max_workers=None,
+):
+    """
+    Convert files `paths` from codec `source_name` to codec `target_name`
+    running at most `max_workers` conversions at once. Print speed of
+    every file and overall one. Return number of failed files.
+
+    """
+    source = CODECS[source_name]
+    target = CODECS[target_name]
+
+    if max_workers is None:
+        max_workers = psutil.cpu_count(logical=True)
+
+    max_workers = max(min(max_workers, len(paths)), 1)
+
+    # Codec functions resolve relative names against their data directory,
+    # so paths relative to the working one are made absolute
+    paths = [Path(x).resolve() for x in paths]
+
+    if output_dir is not None:
+        output_dir = Path(output_dir).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+
+    for path in paths:
+        output_path = get_output_path(
+            path, source, target, output_dir, compression,
+        )
+
+        if output_path == path:
+            raise ValueError(
+                "File {} would be overwritten by its conversion".format(path)
+            )
+
+        tasks.append((source_name, target_name, str(path), str(output_path)))
+
+    if not target.streaming:
+        print(
+            "Codec '{}' does not write records as they come, every file "
+            "is kept in memory whole".format(target_name)
+        )
+
+    failures = 0
+    total = 0
+    peak_rss = 0
+    time_start = time.monotonic()
+
+    for task, result in iter_transcoded(tasks, max_workers):
+        input_path, output_path = task[2:]
+
+        if isinstance(result, Exception):
+            failures += 1
+            print("{}: failed: {!r}".format(input_path, result))
+            continue
+
+        records, elapsed, rss = result
+        total += records
+        peak_rss = max(peak_rss, rss)
+        print("{} -> {}: {}".format(
+            input_path, output_path, format_speed(records, elapsed),
+        ))
+
+    # Workers are reused, so their peak RSS is the highest of all files
+    print("Total: {} files, {} by {} workers, peak RSS {}".format(
+        len(tasks) - failures,
+        format_speed(total, time.monotonic() - time_start),
+        max_workers,
+        format_rss(peak_rss),
+    ))
+
+    return failures
+
+
+def load_args():
+    parser = argparse.ArgumentParser(
+        description="Convert flight files between formats"
+    )
+    parser.add_argument(
+        'source',
+        choices=list(CODECS),
+        metavar='SOURCE',
+        help="Codec of input files",
+    )
+    parser.add_argument(
+        'target',
+        choices=list(CODECS),
+        metavar='TARGET',
+        help="Codec of output files",
+    )
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        metavar='PATH',
+        help="Input files, compressed ones are recognized by their suffix",
+    )
+    parser.add_argument(
+        '-o', '--output-dir',
+        dest='output_dir',
+        metavar='DIR',
+        help="Write output files to DIR. Default: next to input files",
+    )
+    parser.add_argument(
+        '-j', '--workers',
+        dest='workers',
+        type=int,
+        help="Number of files converted at once. Default: number of CPUs",
+    )
+    parser.add_argument(
+        '--compression',
+        dest='compression',
+        choices=list(COMPRESSIONS),
+        metavar='NAME',
+        help="Compress output files by NAME, one of: {}".format(
+            ', '.join(COMPRESSIONS),
+        ),
+    )
+    args = parser.parse_args()
+
+    source = CODECS[args.source]
+    target = CODECS[args.target]
+
+    if args.compression is not None:
+        if not target.compressible:
+            parser.error(
+                "codec '{}' does not support compression".format(args.target)
+            )
+
+        if args.compression not in get_available():
+            parser.error(
+                "compression is not available, install its package: "
+                "{}".format(args.compression)
+            )
+
+    if not source.compressible:
+        compressed = [x for x in args.paths if get_compression(x)]
+        if compressed:
+            parser.error(
+                "codec '{}' does not support compression: {}".format(
+                    args.source, ', '.join(compressed),
+                )
+            )
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("number of workers must be positive")
+
+    return args
+
+
+def main():
+    args = load_args()
+
+    failures = transcode(
+        args.source, args.target, args.paths,
+        output_dir=args.output_dir,
+        compression=args.compression,
+        max_workers=args.workers,
+    )
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
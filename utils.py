@@ -1,26 +1,92 @@
 # coding: utf-8
 
+import json
+import multiprocessing
+import re
+import resource
+import statistics
+import sys
 import time
+import tracemalloc
 
 import humanize
 import inflection
 import psutil
 
+from collections import namedtuple
 from concurrent.futures import as_completed
 from concurrent.futures import ProcessPoolExecutor
 
-from schemas import Flight
-
-
-def get_rss(process=None):
+from profiling import dump_profile, start_profile
+from validation import FLIGHT_VALIDATOR
+
+
+# Result of a single run of a benchmarked function. `rss` is growth of RSS
+# of the process running it along with its child processes, e.g. parallel
+# parsers, while `peak_rss` is growth of the peak of the process alone:
+# peaks of children which are still running are not available.
+# `traced_peak` is the peak size of Python allocations traced by
+# tracemalloc, it is `None` if tracing is disabled. `retained_blocks` is
+# the net number of memory blocks the function leaves allocated when it
+# returns, including its result: blocks allocated minus blocks freed. It is
+# not the number of allocations, temporary objects do not count.
+Measurement = namedtuple(
+    'Measurement',
+    ['time', 'rss', 'peak_rss', 'traced_peak', 'retained_blocks'],
+)
+
+# Statistics of a series of measurements. Time is reported as min, median,
+# mean, 95th percentile and standard deviation along with the number of
+# outliers. RSS delta and retained blocks are averaged, peaks are the
+# highest ones.
+Summary = namedtuple(
+    'Summary', [
+        'cycles', 'time_min', 'time_median', 'time_mean', 'time_p95',
+        'time_stddev', 'outliers', 'rss', 'peak_rss', 'traced_peak',
+        'retained_blocks',
+    ],
+)
+
+
+def get_rss(process=None, children=False):
+    """
+    Get RSS of `process`, the current one by default, along with all its
+    descendants if `children` is set.
+
+    """
     if process is None:
         process = psutil.Process()
 
-    mem = process.memory_info()
-    return mem.rss
+    rss = process.memory_info().rss
+
+    if children:
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+
+    return rss
+
+
+def get_peak_rss():
+    """
+    Get the highest RSS of current process over its whole lifetime.
+
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform != 'darwin':
+        peak *= 1024
+
+    return peak
 
 
 def format_time(value):
+    if abs(value) < 0.01:
+        return "{:.3f} ms".format(value * 1000)
+
     return "{:.3f} s".format(value)
 
 
@@ -31,50 +97,354 @@ def format_rss(rss=None):
     return humanize.naturalsize(rss, binary=True, format='%.3f')
 
 
-def measure(cycles, fn, *args, **kwargs):
-    total_time_delta = 0
-    total_rss_delta = 0
+# Pool of worker processes reused by all benchmarks, see `start_pool()`
+POOL = None
+
+# Number of workers of `POOL`
+POOL_WORKERS = 0
+
+# Dataset given to `start_pool()`, it is available in every worker
+DATASET = None
+
+
+def start_pool(dataset=None, max_workers=None):
+    """
+    Start pool of worker processes which is reused by all calls of
+    `measure()` until `stop_pool()` is called.
+
+    `dataset` is passed to workers once at their start: forked workers
+    inherit it, other ones get it pickled once per worker, not per task.
+
+    """
+    global POOL, POOL_WORKERS
+
+    stop_pool()
+
+    if max_workers is None:
+        max_workers = psutil.cpu_count(logical=True)
+
+    set_dataset(dataset)
+    POOL_WORKERS = max_workers
+
+    POOL = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=(dataset, ),
+    )
+    return POOL
+
+
+def stop_pool():
+    global POOL
+
+    if POOL is not None:
+        POOL.shutdown()
+        POOL = None
 
-    max_workers = psutil.cpu_count(logical=True)
-    left = cycles
 
-    while left > 0:
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
-            workers = min(max_workers, left)
+def set_dataset(dataset):
+    global DATASET
+    DATASET = dataset
 
-            futures = [
-                pool.submit(with_measurements, fn, *args, **kwargs)
-                for i in range(workers)
-            ]
 
-            for future in as_completed(futures):
-                time_delta, rss_delta = future.result()
-                total_time_delta += time_delta
-                total_rss_delta += rss_delta
+def init_worker(dataset):
+    set_dataset(dataset)
 
-            left -= workers
+    # Touch every record, so copy-on-write of pages shared with the parent
+    # process happens now and not while a benchmark is measured.
+    for item in dataset or ():
+        for value in item.values():
+            pass
 
-    time_delta = total_time_delta / cycles
-    rss_delta = total_rss_delta / cycles
 
-    return (time_delta, rss_delta)
+def reset_peak_rss():
+    """
+    Reset the highest RSS of current process to its current RSS.
 
+    Works on Linux only, return `False` if reset is not supported.
 
-def with_measurements(fn, *args, **kwargs):
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+
+    return True
+
+
+def measure(
+    cycles, fn, *args, warmup=0, use_dataset=False, fresh=False, trace=False,
+    profile=None, **kwargs
+):
+    """
+    Run `fn` for `warmup` cycles, which are discarded, then for `cycles`
+    times and return `Summary` of measurements. Warmup cycles are run by
+    every worker of the pool, tasks are not bound to workers, so `warmup`
+    is multiplied by their number.
+
+    If `use_dataset` is set, the dataset given to `start_pool()` is passed
+    to `fn` as the first positional argument.
+
+    By default runs are spread over the pool of reused workers. If `fresh`
+    is set, every run happens in a new process, one at a time, so memory
+    readings are not affected by other runs and by memory which allocator
+    of a reused worker keeps from previous tasks. If `trace` is set, peak of
+    Python allocations is traced too, which makes `fn` notably slower. If
+    `profile` is set, measured runs (not warmup ones) are profiled by
+    cProfile, which slows `fn` down as well, and their stats are dumped to
+    parts of profile `profile` to be merged by `profiling.merge_profile()`.
+
+    """
+    if cycles < 1:
+        raise ValueError("Number of cycles must be positive")
+
+    kwargs.update(use_dataset=use_dataset, trace=trace)
+
+    if warmup:
+        if not fresh:
+            if POOL is None:
+                start_pool()
+
+            warmup *= POOL_WORKERS
+
+        run_cycles(warmup, fresh, fn, *args, **kwargs)
+
+    samples = run_cycles(cycles, fresh, fn, *args, profile=profile, **kwargs)
+    return summarize(samples)
+
+
+def run_cycles(cycles, fresh, fn, *args, **kwargs):
+    if fresh:
+        return [
+            run_in_fresh_process(with_measurements, fn, *args, **kwargs)
+            for i in range(cycles)
+        ]
+
+    pool = POOL
+
+    if pool is None:
+        pool = start_pool()
+
+    futures = [
+        pool.submit(with_measurements, fn, *args, **kwargs)
+        for i in range(cycles)
+    ]
+    return [
+        future.result()
+        for future in as_completed(futures)
+    ]
+
+
+def percentile(values, q):
+    """
+    Get `q`-th percentile of `values` using linear interpolation between
+    the closest ranks.
+
+    """
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def count_outliers(values):
+    """
+    Count values lying outside of Tukey's fences: more than 1.5 IQR below
+    the first quartile or above the third one.
+
+    """
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    iqr = q3 - q1
+
+    low = q1 - 1.5 * iqr
+    high = q3 + 1.5 * iqr
+
+    return sum(1 for x in values if x < low or x > high)
+
+
+def summarize(samples):
+    times = [x.time for x in samples]
+    traced_peaks = [
+        x.traced_peak
+        for x in samples
+        if x.traced_peak is not None
+    ]
+    cycles = len(samples)
+
+    return Summary(
+        cycles=cycles,
+        time_min=min(times),
+        time_median=statistics.median(times),
+        time_mean=statistics.mean(times),
+        time_p95=percentile(times, 95),
+        time_stddev=statistics.stdev(times) if cycles > 1 else 0.0,
+        outliers=count_outliers(times),
+        rss=sum(x.rss for x in samples) / cycles,
+        peak_rss=max(x.peak_rss for x in samples),
+        traced_peak=max(traced_peaks) if traced_peaks else None,
+        retained_blocks=sum(x.retained_blocks for x in samples) / cycles,
+    )
+
+
+def run_in_fresh_process(fn, *args, **kwargs):
+    """
+    Run `fn` in a new forked process and return its result.
+
+    """
+    context = multiprocessing.get_context('fork')
+    reader, writer = context.Pipe(duplex=False)
+
+    process = context.Process(
+        target=fresh_process_main,
+        args=(writer, fn, args, kwargs),
+    )
+    process.start()
+    writer.close()
+
+    try:
+        result = reader.recv()
+    except EOFError:
+        result = RuntimeError(
+            "Process {} exited without result".format(process.pid)
+        )
+    finally:
+        reader.close()
+        process.join()
+
+    if isinstance(result, BaseException):
+        raise result
+
+    return result
+
+
+def fresh_process_main(writer, fn, args, kwargs):
+    init_worker(DATASET)
+
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        result = e
+
+    writer.send(result)
+    writer.close()
+
+
+def with_measurements(
+    fn, *args, use_dataset=False, trace=False, profile=None, **kwargs
+):
     process = psutil.Process()
 
-    rss_start = get_rss(process)
+    if use_dataset:
+        args = (DATASET, ) + args
+
+    # Workers are reused, so their lifetime peak RSS may come from previous
+    # tasks. Where it cannot be reset, only growth above that peak is seen.
+    reset_peak_rss()
+
+    if trace:
+        tracemalloc.start()
+
+    blocks_start = sys.getallocatedblocks()
+    rss_start = get_rss(process, children=True)
+    peak_rss_start = get_peak_rss()
     time_start = time.monotonic()
 
+    if profile is not None:
+        profiler = start_profile()
+
     result = fn(*args, **kwargs)
 
+    if profile is not None:
+        profiler.disable()
+
     time_end = time.monotonic()
-    rss_end = get_rss(process)
+    rss_end = get_rss(process, children=True)
+    peak_rss_end = get_peak_rss()
+    blocks_end = sys.getallocatedblocks()
+
+    if trace:
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        traced_peak = None
+
+    # Stats are written once measurements are taken, so writing them does
+    # not count
+    if profile is not None:
+        dump_profile(profiler, profile)
+
+    return Measurement(
+        time=time_end - time_start,
+        rss=rss_end - rss_start,
+        peak_rss=max(
+            max(peak_rss_end, rss_end) - max(peak_rss_start, rss_start), 0,
+        ),
+        traced_peak=traced_peak,
+        retained_blocks=blocks_end - blocks_start,
+    )
+
+
+def consume(fn, *args, **kwargs):
+    """
+    Exhaust iterator returned by `fn` without keeping its items.
+
+    """
+    count = 0
+
+    for count, item in enumerate(fn(*args, **kwargs), 1):
+        pass
+
+    return count
+
+
+def load_mapped(transform, iter_load, *args, **kwargs):
+    """
+    Load records with `iter_load` passing every one through `transform`
+    while they are decoded, e.g. to convert it to another type.
+
+    """
+    return [transform(x) for x in iter_load(*args, **kwargs)]
+
+
+JSON_SEPARATORS_RE = re.compile(r'[\s,]*')
+
+
+def iter_json_array(f, chunk_size=2 ** 16):
+    """
+    Iterate over objects of a JSON array stored in file `f`, reading it by
+    chunks of `chunk_size` characters instead of reading it all at once.
+
+    """
+    decoder = json.JSONDecoder()
+
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        raise ValueError("JSON array is expected")
+
+    position = 1
+    eof = False
+
+    while True:
+        position = JSON_SEPARATORS_RE.match(buffer, position).end()
+
+        if buffer.startswith(']', position):
+            return
 
-    time_delta = time_end - time_start
-    rss_delta = rss_end - rss_start
+        try:
+            item, position = decoder.raw_decode(buffer, position)
+        except ValueError:
+            if eof:
+                raise
 
-    return (time_delta, rss_delta)
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+        else:
+            yield item
 
 
 def to_camel(s):
@@ -87,5 +457,69 @@ def from_camel(s):
 
 
 def validate(items):
-    for item in items:
-        Flight(item).validate()
+    FLIGHT_VALIDATOR.validate_many(items)
+
+
+def validate_batch(batch):
+    FLIGHT_VALIDATOR.validate_columns(batch.to_columns())
+
+
+def encode_varint(value):
+    """
+    Encode non-negative integer as base 128 varint used by protobuf for
+    length-delimited messages.
+
+    """
+    result = bytearray()
+
+    while value > 0x7f:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    result.append(value)
+    return bytes(result)
+
+
+def read_varint(f):
+    """
+    Read base 128 varint from file `f`. Return `None` at the end of file.
+
+    """
+    result = 0
+    shift = 0
+
+    while True:
+        byte = f.read(1)
+
+        if not byte:
+            if shift:
+                raise EOFError("Unexpected end of file inside of varint")
+            return None
+
+        byte = byte[0]
+        result |= (byte & 0x7f) << shift
+
+        if not byte & 0x80:
+            return result
+
+        shift += 7
+
+
+def iter_length_delimited(f):
+    """
+    Iterate over messages stored in file `f`, each of them prefixed with
+    its size encoded as varint.
+
+    """
+    while True:
+        size = read_varint(f)
+
+        if size is None:
+            return
+
+        message = f.read(size)
+
+        if len(message) != size:
+            raise EOFError("Unexpected end of file inside of message")
+
+        yield message
@@ -0,0 +1,280 @@
+# coding: utf-8
+
+import datetime
+import numbers
+
+from schematics.exceptions import (
+    BaseError, ConversionError, DataError, ValidationError,
+)
+from schematics.types import DateType, FloatType, IntType, StringType
+
+from dates import make_date_parser
+from schemas import Flight
+
+
+# Options which make schematics types do more than conversion. Fields using
+# any of them are validated by schematics itself.
+CONSTRAINTS = (
+    'choices', 'min_value', 'max_value', 'strict', 'regex',
+    'min_length', 'max_length',
+)
+
+
+def is_plain(field):
+    return not any(
+        getattr(field, name, None)
+        for name in CONSTRAINTS
+    )
+
+
+def make_int_converter(field):
+    message = field.messages['number_coerce']
+
+    def convert(value):
+        if type(value) is int:
+            return value
+
+        if isinstance(value, bool):
+            value = int(value)
+
+        if isinstance(value, int):
+            return value
+
+        try:
+            native_value = int(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if native_value == value:
+                return native_value
+
+            if isinstance(value, (str, numbers.Integral)):
+                return native_value
+
+        raise ConversionError(message.format(value, 'int'))
+
+    return convert
+
+
+def make_float_converter(field):
+    message = field.messages['number_coerce']
+
+    def convert(value):
+        if type(value) is float:
+            return value
+
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ConversionError(message.format(value, 'float'))
+
+    return convert
+
+
+def make_string_converter(field):
+    convert_message = field.messages['convert']
+    decode_message = field.messages['decode']
+
+    def convert(value):
+        if isinstance(value, str):
+            return value
+
+        if isinstance(value, bytes):
+            try:
+                return str(value, 'utf-8')
+            except UnicodeError:
+                raise ConversionError(decode_message.format(value))
+
+        if isinstance(value, int) and not isinstance(value, bool):
+            return str(value)
+
+        raise ConversionError(convert_message.format(value))
+
+    return convert
+
+
+def make_date_converter(field):
+    formats = field.formats
+    message = field.conversion_errmsg
+    parse = make_date_parser(formats)
+
+    def convert(value):
+        if isinstance(value, datetime.datetime):
+            return value.date()
+
+        if isinstance(value, datetime.date):
+            return value
+
+        if isinstance(value, str):
+            try:
+                return parse(value)
+            except ValueError:
+                pass
+
+        raise ConversionError(message.format(value, ", ".join(formats)))
+
+    return convert
+
+
+def make_generic_converter(field):
+    return field.validate
+
+
+CONVERTER_FACTORIES = [
+    (IntType, make_int_converter),
+    (FloatType, make_float_converter),
+    (StringType, make_string_converter),
+    (DateType, make_date_converter),
+]
+
+
+def make_converter(field):
+    if is_plain(field):
+        for field_type, factory in CONVERTER_FACTORIES:
+            if type(field) is field_type:
+                return factory(field)
+
+    return make_generic_converter(field)
+
+
+class Validator:
+    """
+    Validator compiled once from a schematics model into per-field
+    converters.
+
+    It accepts and rejects the same values as `model(item).validate()` and
+    raises `DataError` with the same errors, but does not build model
+    instances.
+
+    """
+
+    def __init__(self, model=Flight):
+        self.model = model
+        self.converters = [
+            (name, make_converter(field))
+            for name, field in model.fields.items()
+        ]
+        self.field_names = frozenset(model.fields.keys())
+        self.required = {
+            name: field.messages['required']
+            for name, field in model.fields.items()
+            if field.required
+        }
+
+    def __call__(self, item):
+        return self.validate(item)
+
+    def validate(self, item):
+        """
+        Validate a single record and return its converted copy.
+
+        """
+        result = {}
+        errors = None
+
+        for name, convert in self.converters:
+            value = item.get(name)
+
+            if value is not None:
+                try:
+                    value = convert(value)
+                except BaseError as e:
+                    if errors is None:
+                        errors = {}
+                    errors[name] = e
+            elif name in self.required:
+                if errors is None:
+                    errors = {}
+                errors[name] = ValidationError(self.required[name])
+
+            result[name] = value
+
+        if not self.field_names.issuperset(item):
+            if errors is None:
+                errors = {}
+
+            for name in item:
+                if name not in self.field_names:
+                    errors[name] = 'Rogue field'
+
+        if errors:
+            raise DataError(errors)
+
+        return result
+
+    def validate_many(self, items):
+        """
+        Validate all records and return their converted copies. Errors of
+        all invalid records are raised at once as `DataError` keyed by
+        record index.
+
+        """
+        results = []
+        errors = {}
+
+        for i, item in enumerate(items):
+            try:
+                results.append(self.validate(item))
+            except DataError as e:
+                errors[i] = e
+
+        if errors:
+            raise DataError(errors)
+
+        return results
+
+    def validate_columns(self, columns):
+        """
+        Validate columnar block: a mapping of field names to sequences of
+        their values. Return mapping of field names to lists of converted
+        values. Errors are raised at once as `DataError` keyed by record
+        index, like in `validate_many()`.
+
+        """
+        rogue = set(columns) - self.field_names
+        if rogue:
+            raise DataError({
+                name: 'Rogue field'
+                for name in rogue
+            })
+
+        results = {}
+        errors = {}
+
+        for name, convert in self.converters:
+            values = columns.get(name)
+
+            if values is None:
+                if name in self.required:
+                    raise DataError({
+                        name: ValidationError(self.required[name]),
+                    })
+                continue
+
+            converted = []
+
+            for i, value in enumerate(values):
+                if value is not None:
+                    try:
+                        value = convert(value)
+                    except BaseError as e:
+                        errors.setdefault(i, {})[name] = e
+                elif name in self.required:
+                    errors.setdefault(i, {})[name] = ValidationError(
+                        self.required[name]
+                    )
+
+                converted.append(value)
+
+            results[name] = converted
+
+        if errors:
+            raise DataError({
+                i: DataError(item_errors)
+                for i, item_errors in sorted(errors.items())
+            })
+
+        return results
+
+
+FLIGHT_VALIDATOR = Validator(Flight)